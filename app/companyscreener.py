@@ -0,0 +1,59 @@
+"""
+Company Screener Entry Point
+============================
+Standalone Streamlit page for screening companies by overview metrics.
+URL: /companyscreener
+
+Usage:
+    cd app && streamlit run companyscreener.py
+
+Or with specific port:
+    cd app && streamlit run companyscreener.py --server.port 8505
+"""
+import streamlit as st
+
+# Configure page settings - MUST be first Streamlit command
+st.set_page_config(
+    page_title="Company Screener - Coresight Research",
+    page_icon="🔎",
+    layout="wide",
+    initial_sidebar_state="collapsed",
+)
+
+# Import after page config
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+# IMMEDIATELY hide sidebar to prevent skeleton flash
+from components.styles import hide_sidebar, set_page_layout
+hide_sidebar()
+
+from components.navigation import Page, render_header, render_coresight_footer
+from components.styles import render_styles
+from core.database import init_database
+
+# Import page content
+from pages.screener import render_page as render_screener_content
+
+
+def main():
+    """Company screener entry point."""
+    init_database()
+    render_styles()
+    set_page_layout(
+        header_full_width=True,
+        footer_full_width=True,
+        body_padding="0 20px",
+        max_content_width="1350px",
+        remove_top_padding=True,
+        footer_at_bottom=True
+    )
+    
+    render_header(Page.SCREENER, full_width=True)
+    render_screener_content()
+    render_coresight_footer(full_width=True, stick_to_bottom=True)
+
+
+if __name__ == "__main__":
+    main()
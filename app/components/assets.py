@@ -0,0 +1,416 @@
+"""
+Static assets (CSS bundles, images, icon sprite) served through Streamlit's
+static file serving.
+
+Page stylesheets used to be inlined through st.markdown on every rerun. They
+are now minified once per process, written to `static/css/<name>.<hash>.css`
+next to the main script, and referenced by URL, so a rerun only sends a
+one-line @import. The content hash in the file name makes every URL
+immutable: changed CSS gets a new URL and browsers never see stale styles.
+
+Logos and icons are self-hosted the same way: sources in app/assets are
+copied to fingerprinted files under static/img, and the social icons are
+combined into one SVG sprite addressed by fragment (`icons.<hash>.svg#name`),
+so pages never fetch from an external host. Large images are published as
+downscaled variants sized for where they are shown (IMAGE_VARIANTS).
+
+Falls back to inline <style> blocks / data URIs when
+server.enableStaticServing is off or the static directory is not writable.
+Data URIs are sent with every render, so only images up to
+MAX_INLINE_BYTES are inlined.
+
+Usage (pre-build bundles at deploy time):
+    cd app
+    python -m components.assets --static-dir static
+"""
+import argparse
+import base64
+import hashlib
+import importlib
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import streamlit as st
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Default static directory (app/static, next to the entry scripts)
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+CSS_SUBDIR = "css"
+IMG_SUBDIR = "img"
+
+# Source assets checked into the repo
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+ICONS_DIR = ASSETS_DIR / "icons"
+
+# Self-hosted images: name -> file under app/assets
+IMAGES: Dict[str, str] = {
+    "coresight-logo": "7432ad8f83c929fd2d42ba00d142c9dc16319120.png",
+}
+
+# Downscaled images: name -> (source name in IMAGES, display width in CSS px)
+IMAGE_VARIANTS: Dict[str, Tuple[str, int]] = {
+    "coresight-logo-header": ("coresight-logo", 132),
+    "coresight-logo-footer": ("coresight-logo", 247),
+}
+
+# Published variants are this many times their display width (high-DPI screens);
+# inlined ones are 1x
+VARIANT_SCALE = 2
+
+# Largest image inlined as a data URI when static serving is unavailable (bytes)
+MAX_INLINE_BYTES = 32 * 1024
+
+# Icons combined into the sprite sheet (app/assets/icons/<name>.svg)
+SPRITE_ICONS: List[str] = ["facebook", "twitter", "wechat", "linkedin"]
+SPRITE_FILL = "#ffffff"
+
+_SVG_NS = "http://www.w3.org/2000/svg"
+_MIME_TYPES = {".png": "image/png", ".svg": "image/svg+xml", ".jpg": "image/jpeg", ".webp": "image/webp"}
+
+# Bundles built by the CLI: name -> "module:function" returning a <style> block
+BUNDLES: Dict[str, str] = {
+    "global": "components.styles:get_global_css",
+    "toolbar": "components.toolbar:get_toolbar_css",
+    "header": "components.navigation:get_header_css",
+    "news": "pages.newsroom:get_news_css",
+    "earnings": "pages.earnings_calls:get_earnings_css",
+    "filings": "pages.company_filings:get_filings_css",
+    "sec-filing": "pages.sec_filing:get_sec_filing_css",
+    "company": "pages.company_profile:get_company_css",
+}
+
+_STYLE_RE = re.compile(r"<style[^>]*>(.*?)</style>", re.IGNORECASE | re.DOTALL)
+_STRING_OR_COMMENT_RE = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')|/\*.*?\*/", re.DOTALL)
+_IMPORT_RE = re.compile(r"@import\s[^;]+;")
+_PUNCT_SPACE_RE = re.compile(r"\s*([{};,>])\s*")
+
+# (name, source, static dir) -> written file path; guarded by _lock
+_built: Dict[Tuple[str, str, Path], str] = {}
+_lock = threading.Lock()
+
+
+def extract_css(css_html: str) -> str:
+    """Return the CSS inside the <style> blocks of an HTML snippet."""
+    blocks = _STYLE_RE.findall(css_html)
+    return "\n".join(blocks) if blocks else css_html
+
+
+def minify_css(css: str) -> str:
+    """
+    Minify CSS: strip comments and redundant whitespace, hoist @import rules.
+
+    String literals (e.g. `content: ''` or quoted font URLs) are left untouched.
+    """
+    css = _STRING_OR_COMMENT_RE.sub(lambda m: m.group(1) or "", css)
+    parts: List[str] = []
+    pos = 0
+    for match in _STRING_OR_COMMENT_RE.finditer(css):
+        parts.append(_minify_plain(css[pos:match.start()]))
+        parts.append(match.group(0))
+        pos = match.end()
+    parts.append(_minify_plain(css[pos:]))
+    css = "".join(parts).strip()
+
+    # @import is only valid at the top of a stylesheet
+    imports: List[str] = []
+    for rule in _IMPORT_RE.findall(css):
+        if rule not in imports:
+            imports.append(rule)
+    body = _IMPORT_RE.sub("", css)
+    return "".join(imports) + body
+
+
+def _minify_plain(css: str) -> str:
+    """Collapse whitespace in CSS text that contains no strings or comments."""
+    css = re.sub(r"\s+", " ", css)
+    css = _PUNCT_SPACE_RE.sub(r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}")
+
+
+def _static_dir() -> Path:
+    """Directory Streamlit serves at app/static (next to the main script)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        if ctx is not None and ctx.main_script_path:
+            return Path(ctx.main_script_path).resolve().parent / "static"
+    except ImportError:
+        pass
+    return STATIC_DIR
+
+
+def _write_fingerprinted(subdir: str, name: str, suffix: str, data: bytes, static_dir: Path) -> str:
+    """
+    Write data under a content-hashed file name (no-op if it already exists).
+
+    Returns:
+        File name relative to the static directory (e.g. css/global.1a2b3c4d5e.css)
+    """
+    digest = hashlib.sha1(data).hexdigest()[:10]
+    relative = f"{subdir}/{name}.{digest}{suffix}"
+    target = static_dir / relative
+    if target.exists():
+        return relative
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename so concurrent sessions never serve a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    logger.info(f"Wrote static asset {relative} ({len(data)} bytes)")
+    return relative
+
+
+def _memoized(key: Tuple[str, str, Path], build) -> str:
+    """Return the written path for key, building it once per process."""
+    with _lock:
+        cached = _built.get(key)
+    if cached:
+        return cached
+    relative = build()
+    with _lock:
+        _built[key] = relative
+    return relative
+
+
+def write_bundle(name: str, css_html: str, static_dir: Path = STATIC_DIR) -> str:
+    """
+    Minify a stylesheet and write it under a content-hashed file name.
+
+    Args:
+        name: Bundle name (file name prefix)
+        css_html: CSS, optionally wrapped in <style> tags
+        static_dir: Static directory to write into
+
+    Returns:
+        Bundle file name relative to the static directory (e.g. css/global.1a2b3c4d5e.css)
+    """
+    def build() -> str:
+        css = minify_css(extract_css(css_html))
+        return _write_fingerprinted(CSS_SUBDIR, name, ".css", css.encode("utf-8"), static_dir)
+    return _memoized(("css:" + name, css_html, static_dir), build)
+
+
+@lru_cache(maxsize=None)
+def image_data(name: str, scale: int = 1) -> Tuple[bytes, str]:
+    """
+    Bytes and file suffix of a registered image.
+
+    Args:
+        name: Image name from IMAGES or IMAGE_VARIANTS
+        scale: Multiple of a variant's display width to render (ignored for IMAGES)
+    """
+    if name in IMAGES:
+        source = ASSETS_DIR / IMAGES[name]
+        return source.read_bytes(), source.suffix
+    source_name, width = IMAGE_VARIANTS[name]
+    with Image.open(ASSETS_DIR / IMAGES[source_name]) as image:
+        width = min(width * scale, image.width)
+        height = round(image.height * width / image.width)
+        out = BytesIO()
+        image.resize((width, height), Image.LANCZOS).save(out, "PNG", optimize=True)
+    return out.getvalue(), ".png"
+
+
+def write_image(name: str, static_dir: Path = STATIC_DIR) -> str:
+    """
+    Write a registered image (variants at VARIANT_SCALE) to a fingerprinted file.
+
+    Args:
+        name: Image name from IMAGES or IMAGE_VARIANTS
+        static_dir: Static directory to write into
+
+    Returns:
+        File name relative to the static directory
+    """
+    def build() -> str:
+        data, suffix = image_data(name, VARIANT_SCALE)
+        return _write_fingerprinted(IMG_SUBDIR, name, suffix, data, static_dir)
+    return _memoized(("img:" + name, repr(IMAGE_VARIANTS.get(name, IMAGES.get(name))), static_dir), build)
+
+
+def _load_icon(name: str) -> Tuple[List[float], List[ET.Element]]:
+    """Parse an icon SVG into its viewBox and child elements."""
+    root = ET.parse(ICONS_DIR / f"{name}.svg").getroot()
+    view_box = [float(v) for v in root.get("viewBox", "0 0 0 0").split()]
+    return view_box, list(root)
+
+
+def build_sprite(names: Optional[List[str]] = None) -> bytes:
+    """
+    Build an SVG sprite stacking each icon vertically with a <view> per icon.
+
+    Icons are addressed as `sprite.svg#<name>`, which works from <img src>;
+    Streamlit's HTML sanitizer strips <use>, so <use href> sprites are not an
+    option. The fill is baked in because CSS cannot style an <img> SVG.
+    """
+    ET.register_namespace("", _SVG_NS)
+    sprite = ET.Element(f"{{{_SVG_NS}}}svg")
+    offset = 0.0
+    width = 0.0
+    for name in names or SPRITE_ICONS:
+        (x, y, w, h), children = _load_icon(name)
+        ET.SubElement(sprite, f"{{{_SVG_NS}}}view", id=name, viewBox=f"{x:g} {offset:g} {w:g} {h:g}")
+        group = ET.SubElement(
+            sprite, f"{{{_SVG_NS}}}g", fill=SPRITE_FILL, transform=f"translate({0 - x:g} {offset - y:g})"
+        )
+        group.extend(children)
+        offset += h
+        width = max(width, w)
+    sprite.set("viewBox", f"0 0 {width:g} {offset:g}")
+    return ET.tostring(sprite, encoding="utf-8")
+
+
+def write_sprite(static_dir: Path = STATIC_DIR) -> str:
+    """Write the icon sprite under a content-hashed file name."""
+    return _memoized(
+        ("sprite", ",".join(SPRITE_ICONS), static_dir),
+        lambda: _write_fingerprinted(IMG_SUBDIR, "icons", ".svg", build_sprite(), static_dir),
+    )
+
+
+def _data_uri(data: bytes, suffix: str) -> str:
+    """Inline data URI for an asset (fallback when static serving is off)."""
+    return f"data:{_MIME_TYPES.get(suffix, 'application/octet-stream')};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def _static_url(relative: str) -> str:
+    """Server-absolute URL of a file in the static directory."""
+    base = (st.get_option("server.baseUrlPath") or "").strip("/")
+    prefix = f"/{base}" if base else ""
+    return f"{prefix}/app/static/{relative}"
+
+
+def image_url(name: str) -> str:
+    """
+    URL of a registered self-hosted image.
+
+    Args:
+        name: Image name from IMAGES or IMAGE_VARIANTS
+
+    Returns:
+        Fingerprinted static URL, or a data URI if static serving is
+        unavailable (empty if the image is larger than MAX_INLINE_BYTES)
+    """
+    if st.get_option("server.enableStaticServing"):
+        try:
+            return _static_url(write_image(name, _static_dir()))
+        except OSError as e:
+            logger.warning(f"Could not publish image '{name}', inlining it: {e}")
+    data, suffix = image_data(name)
+    if len(data) > MAX_INLINE_BYTES:
+        logger.warning(f"Image '{name}' is too large to inline ({len(data)} bytes), omitting it")
+        return ""
+    return _data_uri(data, suffix)
+
+
+def icon_url(name: str) -> str:
+    """
+    URL of an icon in the sprite sheet, for use as <img src>.
+
+    Args:
+        name: Icon name from SPRITE_ICONS
+
+    Returns:
+        Sprite URL with the icon's fragment, or a single-icon data URI if
+        static serving is unavailable
+    """
+    if st.get_option("server.enableStaticServing"):
+        try:
+            return f"{_static_url(write_sprite(_static_dir()))}#{name}"
+        except OSError as e:
+            logger.warning(f"Could not publish icon sprite, inlining '{name}': {e}")
+    return _data_uri(build_sprite([name]), ".svg")
+
+
+def render_css(name: str, css_html: str) -> None:
+    """
+    Inject a stylesheet as a cached static bundle.
+
+    Args:
+        name: Bundle name (one file per distinct CSS content)
+        css_html: CSS, optionally wrapped in <style> tags
+    """
+    if st.get_option("server.enableStaticServing"):
+        try:
+            relative = write_bundle(name, css_html, _static_dir())
+            st.markdown(f"<style>@import url('{_static_url(relative)}');</style>", unsafe_allow_html=True)
+            return
+        except OSError as e:
+            logger.warning(f"Could not write CSS bundle '{name}', inlining it: {e}")
+
+    css = css_html if _STYLE_RE.search(css_html) else f"<style>{css_html}</style>"
+    st.markdown(css, unsafe_allow_html=True)
+
+
+def build_bundles(static_dir: Path = STATIC_DIR, names: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    Build the registered static CSS bundles.
+
+    Args:
+        static_dir: Static directory to write into
+        names: Bundle names to build (None = all of BUNDLES)
+
+    Returns:
+        Mapping of bundle name to written file name
+    """
+    built = {}
+    for name in names or list(BUNDLES):
+        module_name, func_name = BUNDLES[name].split(":")
+        css_func = getattr(importlib.import_module(module_name), func_name)
+        built[name] = write_bundle(name, css_func(), static_dir)
+    return built
+
+
+def build_assets(static_dir: Path = STATIC_DIR) -> Dict[str, str]:
+    """
+    Publish the registered images and the icon sprite.
+
+    Returns:
+        Mapping of asset name to written file name
+    """
+    built = {name: write_image(name, static_dir) for name in [*IMAGES, *IMAGE_VARIANTS]}
+    built["icons"] = write_sprite(static_dir)
+    return built
+
+
+def main(argv: List[str]) -> int:
+    """CLI entry point: pre-build static CSS bundles, images and the icon sprite."""
+    parser = argparse.ArgumentParser(description="Build fingerprinted static assets")
+    parser.add_argument("--static-dir", type=Path, default=STATIC_DIR, help="Static directory to write into")
+    parser.add_argument("names", nargs="*", help=f"Bundles to build (default: all of {', '.join(BUNDLES)})")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BUNDLES]
+    if unknown:
+        parser.error(f"unknown bundle(s): {', '.join(unknown)}")
+
+    logging.basicConfig(level=logging.INFO)
+    built = build_bundles(args.static_dir, args.names or None)
+    if not args.names:
+        built.update(build_assets(args.static_dir))
+    for name, relative in built.items():
+        print(f"{name}: {args.static_dir / relative}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -2,12 +2,14 @@
 Reusable chart components using Plotly.
 Consistent styling matching the design system.
 """
+import json
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Tuple, Union
 from datetime import date
 import sys
 from pathlib import Path
@@ -15,7 +17,12 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from data.models import MarketMetric
+from core.cache import cache, fingerprint
+from data.models import MarketMetric, PriceSeries
+from data.downsampling import (
+    DEFAULT_CHART_WIDTH, aggregate_ohlcv, downsample_line, max_candles,
+    max_line_points, visible_slice
+)
 from components.styles import COLORS, TYPOGRAPHY
 
 
@@ -33,34 +40,65 @@ CHART_LAYOUT = {
     "margin": {"l": 50, "r": 30, "t": 50, "b": 50},
 }
 
+# Serialized Plotly figure, as returned by cached_chart()
+FigureJSON = str
+
+
+def cached_chart(build: Callable[..., go.Figure], *args: Any, **kwargs: Any) -> FigureJSON:
+    """
+    Build a chart once per distinct input and return its JSON.
+    
+    The cache key is (builder, fingerprint of the data and options), so a
+    rerun with unchanged inputs skips figure construction entirely and
+    render_chart() sends the stored JSON. Inputs that cannot be
+    fingerprinted are built every time.
+    
+    Example:
+        render_chart(cached_chart(create_candlestick_chart, prices, height=400))
+    
+    Args:
+        build: One of the create_*_chart builders
+        *args, **kwargs: Builder arguments
+        
+    Returns:
+        Figure JSON
+    """
+    def compute() -> FigureJSON:
+        return build(*args, **kwargs).to_json()
+    
+    key = fingerprint(args, kwargs)
+    if key is None:
+        return compute()
+    return cache.get_or_compute(("chart_figure", build.__qualname__, key), compute)
+
 
 def create_candlestick_chart(
-    metrics: List[MarketMetric],
+    prices: Union[PriceSeries, List[MarketMetric]],
     title: str = "Price History",
-    height: int = 500
+    height: int = 500,
+    width: int = DEFAULT_CHART_WIDTH,
+    visible_range: Optional[Tuple[date, date]] = None
 ) -> go.Figure:
     """
     Create an interactive candlestick chart.
     
+    Only the bars within visible_range are drawn, merged into wider candles
+    when more of them would be shown than fit the chart width.
+    
     Args:
-        metrics: List of market metrics with OHLC data
+        prices: Price series (or a list of market metrics)
         title: Chart title
         height: Chart height in pixels
+        width: Approximate chart width in pixels (sets the resolution)
+        visible_range: Optional (start, end) dates to show
         
     Returns:
         Plotly Figure object
     """
-    df = pd.DataFrame([
-        {
-            "date": m.date,
-            "open": m.open_price,
-            "high": m.high_price,
-            "low": m.low_price,
-            "close": m.close_price,
-            "volume": m.volume,
-        }
-        for m in sorted(metrics, key=lambda x: x.date)
-    ])
+    bars = prices if isinstance(prices, PriceSeries) else PriceSeries.from_metrics(prices)
+    if visible_range is not None:
+        bars = bars.between(*visible_range)
+    bars = aggregate_ohlcv(bars, max_candles(width))
     
     fig = make_subplots(
         rows=2, cols=1,
@@ -73,11 +111,11 @@ def create_candlestick_chart(
     # Candlestick trace
     fig.add_trace(
         go.Candlestick(
-            x=df["date"],
-            open=df["open"],
-            high=df["high"],
-            low=df["low"],
-            close=df["close"],
+            x=bars.dates,
+            open=bars.open,
+            high=bars.high,
+            low=bars.low,
+            close=bars.close,
             name="OHLC",
             increasing_line_color=COLORS["chart_up"],
             decreasing_line_color=COLORS["chart_down"],
@@ -86,15 +124,12 @@ def create_candlestick_chart(
     )
     
     # Volume bars
-    colors = [
-        COLORS["chart_up"] if df["close"].iloc[i] >= df["open"].iloc[i] else COLORS["chart_down"]
-        for i in range(len(df))
-    ]
+    colors = np.where(bars.close >= bars.open, COLORS["chart_up"], COLORS["chart_down"])
     
     fig.add_trace(
         go.Bar(
-            x=df["date"],
-            y=df["volume"],
+            x=bars.dates,
+            y=bars.volume,
             name="Volume",
             marker_color=colors,
             opacity=0.7,
@@ -138,11 +173,17 @@ def create_line_chart(
     y_columns: List[str],
     title: str = "",
     height: int = 400,
-    show_markers: bool = True
+    show_markers: bool = True,
+    width: int = DEFAULT_CHART_WIDTH,
+    visible_range: Optional[Tuple[date, date]] = None
 ) -> go.Figure:
     """
     Create a multi-line chart.
     
+    Lines are cut to visible_range (data must be sorted by x_column) and
+    reduced with LTTB to about one point per pixel of width; markers are
+    dropped when a line is downsampled.
+    
     Args:
         data: DataFrame with data
         x_column: Column name for x-axis
@@ -150,12 +191,24 @@ def create_line_chart(
         title: Chart title
         height: Chart height
         show_markers: Whether to show markers on lines
+        width: Approximate chart width in pixels (sets the resolution)
+        visible_range: Optional (start, end) x values to show
         
     Returns:
         Plotly Figure object
     """
     fig = go.Figure()
     
+    x = data[x_column].to_numpy()
+    window = slice(None)
+    if visible_range is not None:
+        if not np.issubdtype(x.dtype, np.datetime64):
+            x = pd.to_datetime(x).to_numpy()
+        window = visible_slice(x, *visible_range)
+    x = x[window]
+    threshold = max_line_points(width)
+    show_markers = show_markers and len(x) <= threshold
+    
     colors = [
         COLORS["chart_primary"],
         COLORS["chart_secondary"],
@@ -164,9 +217,10 @@ def create_line_chart(
     ]
     
     for i, col in enumerate(y_columns):
+        line_x, line_y = downsample_line(x, data[col].to_numpy()[window], threshold)
         fig.add_trace(go.Scatter(
-            x=data[x_column],
-            y=data[col],
+            x=line_x,
+            y=line_y,
             mode="lines+markers" if show_markers else "lines",
             name=col,
             line=dict(color=colors[i % len(colors)], width=2),
@@ -363,8 +417,43 @@ def create_area_chart(
     return fig
 
 
+def select_visible_range(
+    first: date,
+    last: date,
+    key: str,
+    label: str = "Visible range"
+) -> Tuple[date, date]:
+    """
+    Date range slider that drives chart resolution.
+    
+    Narrowing the range reruns the page; the chart builders then re-sample
+    the shorter window from the full-resolution data, so zooming in shows
+    finer candles and more line points without ever shipping the whole
+    history to the browser.
+    
+    Args:
+        first: Earliest date with data
+        last: Latest date with data
+        key: Unique widget key
+        label: Slider label
+        
+    Returns:
+        Selected (start, end) dates
+    """
+    if first >= last:
+        return first, last
+    return st.slider(
+        label,
+        min_value=first,
+        max_value=last,
+        value=(first, last),
+        key=key,
+        label_visibility="collapsed",
+    )
+
+
 def render_chart(
-    fig: go.Figure,
+    fig: Union[go.Figure, FigureJSON],
     use_container_width: bool = True,
     key: Optional[str] = None
 ):
@@ -372,10 +461,13 @@ def render_chart(
     Render a Plotly chart in Streamlit with consistent configuration.
     
     Args:
-        fig: Plotly Figure object
+        fig: Plotly Figure object, or figure JSON from cached_chart()
         use_container_width: Whether to use full container width
         key: Optional unique key for the chart
     """
+    if isinstance(fig, str):
+        # Validated when it was first built
+        fig = go.Figure(json.loads(fig), _validate=False)
     st.plotly_chart(
         fig,
         use_container_width=use_container_width,
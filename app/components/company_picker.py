@@ -0,0 +1,67 @@
+"""
+Typeahead company picker.
+
+The company selectboxes used to list every company, which sent the whole
+universe to the browser on each rerun. A picker now pairs a search box with
+a selectbox holding only the current company and the top matches of the
+typed text (see data/company_search.py).
+"""
+from typing import Callable, List, Optional, Tuple
+
+import streamlit as st
+
+from data.company_search import get_company_search_index
+
+# Companies offered in a picker besides the current one
+PICKER_RESULTS = 12
+
+SEARCH_PLACEHOLDER = "Search company, ticker or CIK"
+
+
+def company_options(
+    current_ticker: str,
+    search_key: str,
+    source: Optional[str] = None,
+    limit: int = PICKER_RESULTS
+) -> Tuple[List[str], Callable[[str], str]]:
+    """
+    Selectbox options for a company picker.
+
+    The search text is read from st.session_state[search_key], so the
+    options can be built before the search box itself is rendered
+    (see render_company_search).
+
+    Args:
+        current_ticker: Selected company, always offered first
+        search_key: Session state key of the picker's search box
+        source: Data source of the companies (None = all)
+        limit: Number of matches offered besides the current company
+
+    Returns:
+        Tuple of (tickers, format_func showing each ticker's display name)
+    """
+    index = get_company_search_index(source)
+    query = st.session_state.get(search_key, "")
+    if query:
+        matches = index.search(query, limit)
+    else:
+        matches = list(index.companies[:limit])
+    tickers = [current_ticker] + [c.ticker for c in matches if c.ticker != current_ticker]
+
+    def format_func(ticker: str) -> str:
+        company = index.get(ticker)
+        return company.display_name if company else ticker
+
+    return tickers, format_func
+
+
+def render_company_search(search_key: str, option_count: int):
+    """Search box narrowing the options of a company picker."""
+    st.text_input(
+        "Search companies",
+        key=search_key,
+        placeholder=SEARCH_PLACEHOLDER,
+        label_visibility="collapsed",
+    )
+    if st.session_state.get(search_key) and option_count <= 1:
+        st.caption("No matching companies")
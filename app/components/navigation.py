@@ -4,6 +4,7 @@ Navigation components for the application.
 import streamlit as st
 from typing import List, Dict, Callable, Optional
 from enum import Enum
+from functools import lru_cache
 import sys
 from pathlib import Path
 
@@ -11,43 +12,70 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from components.styles import COLORS, TYPOGRAPHY, SPACING, BORDER_RADIUS
+from components.assets import icon_url, image_url, render_css
 
 
-def render_header(full_width: bool = True):
-    """
-    Render Coresight header based on Figma design - EXACT MATCH.
-    
-    Figma Reference: Header (Node ID: 20895:206587)
-    - Container: 1440x80px, background #f2f2f2
-    - Logo: 132x60px at x=390 (106px from left edge)
-    - Nav: Frame at x=568 with 48px gaps between items
-    - Nav items: Roboto 18px weight 500
-    - Nav text color: #2d2a29
-    
-    Parameters:
-    -----------
-    full_width : bool
-        If True, header takes full width
-    """
-    import inspect
-    
-    # Detect which page is calling this function
-    is_newsroom = False
-    is_company_profile = False
-    is_earnings_calls = False
-    for frame in inspect.stack():
-        if 'newsroom.py' in frame.filename:
-            is_newsroom = True
-            break
-        if 'company_profile.py' in frame.filename:
-            is_company_profile = True
-            break
-        if 'earningscalls.py' in frame.filename or 'earnings_calls.py' in frame.filename:
-            is_earnings_calls = True
-            break
-    
-    # Build header HTML - EXACT Figma specifications
-    header_html = '''<style>
+class Page(Enum):
+    """Application pages."""
+    HOME = "home"
+    MARKET_DATA = "market_data"
+    NEWSROOM = "newsroom"
+    EARNINGS_CALLS = "earnings_calls"
+    COMPANY_PROFILE = "company_profile"
+    COMPANY_FILINGS = "company_filings"
+    SEC_FILING = "sec_filing"
+    SCREENER = "screener"
+
+
+PAGE_CONFIG = {
+    Page.HOME: {
+        "label": "Home",
+        "icon": "🏠",
+        "description": "Coresight Research Portal"
+    },
+    Page.MARKET_DATA: {
+        "label": "Market Data",
+        "icon": "📈",
+        "description": "Real-time market data and analytics"
+    },
+    Page.NEWSROOM: {
+        "label": "Newsroom",
+        "icon": "📰",
+        "description": "Latest news and market updates"
+    },
+    Page.EARNINGS_CALLS: {
+        "label": "Earnings Calls",
+        "icon": "🎙️",
+        "description": "Earnings call transcripts"
+    },
+    Page.COMPANY_PROFILE: {
+        "label": "Company Profile",
+        "icon": "🏢",
+        "description": "Company overview and key metrics"
+    },
+    Page.COMPANY_FILINGS: {
+        "label": "Company Filings",
+        "icon": "📄",
+        "description": "SEC filings search and viewer"
+    },
+    Page.SEC_FILING: {
+        "label": "SEC Filing",
+        "icon": "📑",
+        "description": "SEC filing document viewer"
+    },
+    Page.SCREENER: {
+        "label": "Company Screener",
+        "icon": "🔎",
+        "description": "Filter companies by valuation and profitability"
+    },
+}
+
+# Pages whose own header nav link is highlighted; every other page highlights
+# Market Data Dashboard (company profile highlights nothing)
+_NAV_ACTIVE_PAGES = {Page.NEWSROOM, Page.EARNINGS_CALLS, Page.COMPANY_PROFILE, Page.SCREENER}
+
+
+_HEADER_CSS = """<style>
 /* Header full-width wrapper - background #f2f2f2 */
 .coresight-header-exact {
   background-color: #f2f2f2;
@@ -147,25 +175,59 @@ html, body {
   }
 }
 </style>
+"""
+
+
+def get_header_css() -> str:
+    """Get CSS for the Coresight header."""
+    return _HEADER_CSS
 
-<div class="coresight-header-exact">
+
+@lru_cache(maxsize=None)
+def _build_header_html(page: Page) -> str:
+    """Build the header HTML for a page (built once per page, then cached)."""
+    # Build header HTML - EXACT Figma specifications
+    return '''<div class="coresight-header-exact">
   <div class="coresight-header-container">
     <!-- Logo: 132x60 at x=390 (106px from left edge) -->
     <div class="coresight-header-logo">
       <a href="https://coresight.com/">
-        <img src="https://production-wordpress-cdn-dpa0g9bzd7b3h7gy.z03.azurefd.net/wp-content/uploads/2023/12/coresight-logo-1.png" 
+        <img src="''' + image_url("coresight-logo-header") + '''" 
              alt="Coresight Research" width="132" height="60">
       </a>
     </div>
     
     <!-- Navigation: at x=568, 48px gaps between items, Roboto 18px weight 500 -->
     <nav class="coresight-header-nav">
-      <a href="http://localhost:8502/marketdata" class="''' + ('active' if not is_newsroom and not is_company_profile and not is_earnings_calls else '') + '''">Market Data Dashboard</a>
-      <a href="http://localhost:8504/earningscalls" class="''' + ('active' if is_earnings_calls else '') + '''">Earnings Calls</a>
-      <a href="http://localhost:8503/newsroom" class="''' + ('active' if is_newsroom else '') + '''">News</a>
+      <a href="http://localhost:8502/marketdata" class="''' + ('active' if page not in _NAV_ACTIVE_PAGES else '') + '''">Market Data Dashboard</a>
+      <a href="http://localhost:8505/companyscreener" class="''' + ('active' if page == Page.SCREENER else '') + '''">Screener</a>
+      <a href="http://localhost:8504/earningscalls" class="''' + ('active' if page == Page.EARNINGS_CALLS else '') + '''">Earnings Calls</a>
+      <a href="http://localhost:8503/newsroom" class="''' + ('active' if page == Page.NEWSROOM else '') + '''">News</a>
     </nav>
   </div>
 </div>'''
+
+
+def render_header(page: Page = Page.MARKET_DATA, full_width: bool = True):
+    """
+    Render Coresight header based on Figma design - EXACT MATCH.
+    
+    Figma Reference: Header (Node ID: 20895:206587)
+    - Container: 1440x80px, background #f2f2f2
+    - Logo: 132x60px at x=390 (106px from left edge)
+    - Nav: Frame at x=568 with 48px gaps between items
+    - Nav items: Roboto 18px weight 500
+    - Nav text color: #2d2a29
+    
+    Parameters:
+    -----------
+    page : Page
+        Page being rendered; selects the active nav link
+    full_width : bool
+        If True, header takes full width
+    """
+    render_css("header", get_header_css())
+    header_html = _build_header_html(page)
     
     # Use st.html for proper rendering
     try:
@@ -174,18 +236,9 @@ html, body {
         st.markdown(header_html, unsafe_allow_html=True)
 
 
-def render_coresight_footer(full_width: bool = True, stick_to_bottom: bool = True):
-    """
-    Render Coresight footer based on Figma design - EXACT MATCH.
-    
-    Figma Reference: Advisory/Footer (Node ID: 20881:205174)
-    - Background: #f2f2f2
-    - Layout: 4 columns with 152px gap, horizontal
-    - Column Order: Logo/Socials | LEARN MORE | GET IN TOUCH | QUICK LINKS
-    - Link spacing: 16px vertical
-    - Terms/Privacy gap: 25px horizontal
-    - Copyright: centered with separator line above
-    """
+@lru_cache(maxsize=None)
+def _build_footer_html(full_width: bool, stick_to_bottom: bool) -> str:
+    """Build the footer HTML for a layout variant (built once, then cached)."""
     # Full width styles
     if full_width:
         outer_style = "width: 100vw; margin-left: calc(-50vw + 50%); margin-right: calc(-50vw + 50%); box-sizing: border-box;"
@@ -198,7 +251,7 @@ def render_coresight_footer(full_width: bool = True, stick_to_bottom: bool = Tru
     else:
         bottom_style = ""
     
-    footer_html = f'''<style>
+    return f'''<style>
 .coresight-footer-exact {{
   background-color: #f2f2f2;
   {outer_style}
@@ -243,10 +296,10 @@ def render_coresight_footer(full_width: bool = True, stick_to_bottom: bool = Tru
   align-items: center;
   justify-content: center;
 }}
-.footer-social-icon svg {{
+.footer-social-icon img {{
   width: 17px;
   height: 17px;
-  fill: #ffffff;
+  display: block;
 }}
 /* Legal links - 25px gap */
 .footer-legal-row {{
@@ -349,21 +402,21 @@ def render_coresight_footer(full_width: bool = True, stick_to_bottom: bool = Tru
       
       <!-- Column 1: Logo & Socials -->
       <div class="footer-col-logo">
-        <img src="https://production-wordpress-cdn-dpa0g9bzd7b3h7gy.z03.azurefd.net/wp-content/uploads/2023/12/coresight-logo.png" 
+        <img src="{image_url("coresight-logo-footer")}" 
              alt="Coresight Research" class="footer-logo-img" width="247" height="112">
         
         <div class="footer-socials-row">
           <a href="https://www.facebook.com/coresightresearch" target="_blank" class="footer-social-icon" aria-label="Facebook">
-            <svg viewBox="0 0 320 512" xmlns="http://www.w3.org/2000/svg"><path d="M279.14 288l14.22-92.66h-88.91v-60.13c0-25.35 12.42-50.06 52.24-50.06h40.42V6.26S260.43 0 225.36 0c-73.22 0-121.08 44.38-121.08 124.72v70.62H22.89V288h81.39v224h100.17V288z"/></svg>
+            <img src="{icon_url("facebook")}" alt="" width="17" height="17">
           </a>
           <a href="https://twitter.com/coresightnews" target="_blank" class="footer-social-icon" aria-label="Twitter">
-            <svg viewBox="0 0 512 512" xmlns="http://www.w3.org/2000/svg"><path d="M459.37 151.716c.325 4.548.325 9.097.325 13.645 0 138.72-105.583 298.558-298.558 298.558-59.452 0-114.68-17.219-161.137-47.106 8.447.974 16.568 1.299 25.34 1.299 49.055 0 94.213-16.568 130.274-44.832-46.132-.975-84.792-31.188-98.112-72.772 6.498.974 12.995 1.624 19.818 1.624 9.421 0 18.843-1.3 27.614-3.573-48.081-9.747-84.143-51.98-84.143-102.985v-1.299c13.969 7.797 30.214 12.67 47.431 13.319-28.264-18.843-46.781-51.005-46.781-87.391 0-19.492 5.197-37.36 14.294-52.954 51.655 63.675 129.3 105.258 216.365 109.807-1.624-7.797-2.599-15.918-2.599-24.04 0-57.828 46.782-104.934 104.934-104.934 30.213 0 57.502 12.67 76.67 33.137 23.715-4.548 46.456-13.32 66.599-25.34-7.798 24.366-24.366 44.833-46.132 57.827 21.117-2.273 41.584-8.122 60.426-16.243-14.292 20.791-32.161 39.308-52.628 54.253z"/></svg>
+            <img src="{icon_url("twitter")}" alt="" width="17" height="17">
           </a>
           <a href="#" target="_blank" class="footer-social-icon" aria-label="WeChat">
-            <svg viewBox="0 0 576 512" xmlns="http://www.w3.org/2000/svg"><path d="M385.2 167.6c6.4 0 12.6.3 18.8 1.1C387.4 90.3 303.3 32 207.7 32 100.5 32 13 104.8 13 197.4c0 53.4 29.3 97.5 77.9 131.6l-19.3 58.6 68-34.1c24.4 4.8 43.8 9.7 68.2 9.7 6.2 0 12.1-.3 18.3-.8-4-12.9-6.2-26.6-6.2-40.8-.1-84.9 72.9-154 165.3-154zm-104.5-52.9c14.5 0 24.2 9.7 24.2 24.4 0 14.5-9.7 24.2-24.2 24.2-14.8 0-29.3-9.7-29.3-24.2.1-14.7 14.6-24.4 29.3-24.4zm-136.4 48.6c-14.5 0-29.3-9.7-29.3-24.2 0-14.8 14.8-24.4 29.3-24.4 14.8 0 24.4 9.7 24.4 24.4 0 14.6-9.6 24.2-24.4 24.2zM563 319.4c0-77.9-77.9-141.3-165.4-141.3-92.7 0-165.4 63.4-165.4 141.3S305 460.7 397.6 460.7c19.3 0 38.9-5.1 58.6-9.9l53.4 29.3-14.8-48.6C534 402.1 563 363.2 563 319.4zm-219.1-24.5c-9.7 0-19.3-9.7-19.3-19.6 0-9.7 9.7-19.3 19.3-19.3 14.8 0 24.4 9.7 24.4 19.3 0 10-9.7 19.6-24.4 19.6zm107.1 0c-9.7 0-19.3-9.7-19.3-19.6 0-9.7 9.7-19.3 19.3-19.3 14.5 0 24.4 9.7 24.4 19.3.1 10-9.9 19.6-24.4 19.6z"/></svg>
+            <img src="{icon_url("wechat")}" alt="" width="17" height="17">
           </a>
           <a href="https://www.linkedin.com/company/coresight-research/" target="_blank" class="footer-social-icon" aria-label="LinkedIn">
-            <svg viewBox="0 0 448 512" xmlns="http://www.w3.org/2000/svg"><path d="M100.28 448H7.4V148.9h92.88zM53.79 108.1C24.09 108.1 0 83.5 0 53.8a53.79 53.79 0 0 1 107.58 0c0 29.7-24.1 54.3-53.79 54.3zM447.9 448h-92.68V302.4c0-34.7-.7-79.2-48.29-79.2-48.29 0-55.69 37.7-55.69 76.7V448h-92.78V148.9h89.08v40.8h1.3c12.4-23.5 42.69-48.3 87.88-48.3 94 0 111.28 61.9 111.28 142.3V448z"/></svg>
+            <img src="{icon_url("linkedin")}" alt="" width="17" height="17">
           </a>
         </div>
         
@@ -413,6 +466,21 @@ def render_coresight_footer(full_width: bool = True, stick_to_bottom: bool = Tru
     </div>
   </div>
 </div>'''
+
+
+def render_coresight_footer(full_width: bool = True, stick_to_bottom: bool = True):
+    """
+    Render Coresight footer based on Figma design - EXACT MATCH.
+    
+    Figma Reference: Advisory/Footer (Node ID: 20881:205174)
+    - Background: #f2f2f2
+    - Layout: 4 columns with 152px gap, horizontal
+    - Column Order: Logo/Socials | LEARN MORE | GET IN TOUCH | QUICK LINKS
+    - Link spacing: 16px vertical
+    - Terms/Privacy gap: 25px horizontal
+    - Copyright: centered with separator line above
+    """
+    footer_html = _build_footer_html(full_width, stick_to_bottom)
     
     # Use st.html for raw HTML rendering (Streamlit 1.54+)
     try:
@@ -444,10 +512,10 @@ def render_company_header(company_name: str, ticker: str, exchange: str = "NYSE"
     Usage:
     ------
     from components.navigation import render_company_header
-    from data.repository import CompanyRepository
+    from data.repository import CompanyOverviewRepository
     
     # Get company data
-    companies = CompanyRepository.get_companies()
+    company = CompanyOverviewRepository.get_company_overview(ticker)
     
     # Render header
     render_company_header(
@@ -456,7 +524,7 @@ def render_company_header(company_name: str, ticker: str, exchange: str = "NYSE"
         exchange=company.exchange or "NYSE"
     )
     """
-    from data.repository import CompanyRepository
+    from components.company_picker import company_options, render_company_search
     
     # CSS for the company header component
     header_css = """
@@ -590,20 +658,14 @@ def render_company_header(company_name: str, ticker: str, exchange: str = "NYSE"
     # Render the HTML header
     st.markdown(header_html, unsafe_allow_html=True)
     
-    # Get all companies for the dropdown
-    companies = CompanyRepository.get_companies()
-    company_options = {f"{c['name']} ({c['ticker']})": c['ticker'] for c in companies}
-    current_display = f"{company_name} ({ticker})"
-    
-    # Find current index
-    option_list = list(company_options.keys())
-    current_index = option_list.index(current_display) if current_display in option_list else 0
+    # Dropdown options: the current company and the top matches of the search box
+    option_list, format_company = company_options(ticker, "company_search_header")
     
     # Hidden Streamlit selectbox for functionality
     # Use a callback to handle selection change
     def on_company_change():
-        selected = st.session_state.company_selector_header
-        selected_ticker = company_options[selected]
+        selected_ticker = st.session_state.company_selector_header
+        st.session_state.company_search_header = ""
         # Update URL with new ticker - this automatically triggers a rerun
         st.query_params["ticker"] = selected_ticker
         # Note: st.rerun() is not needed here because:
@@ -614,31 +676,13 @@ def render_company_header(company_name: str, ticker: str, exchange: str = "NYSE"
     st.selectbox(
         "Select Company",
         options=option_list,
-        index=current_index,
+        index=0,
+        format_func=format_company,
         key="company_selector_header",
         on_change=on_company_change,
         label_visibility="collapsed"
     )
-
-
-class Page(Enum):
-    """Application pages."""
-    MARKET_DATA = "market_data"
-    NEWSROOM = "newsroom"
-
-
-PAGE_CONFIG = {
-    Page.MARKET_DATA: {
-        "label": "Market Data",
-        "icon": "📈",
-        "description": "Real-time market data and analytics"
-    },
-    Page.NEWSROOM: {
-        "label": "Newsroom",
-        "icon": "📰",
-        "description": "Latest news and market updates"
-    },
-}
+    render_company_search("company_search_header", len(option_list))
 
 
 def render_logo():
@@ -247,8 +247,8 @@ def get_global_css() -> str:
 
 def render_styles():
     """Render global CSS styles in Streamlit."""
-    import streamlit as st
-    st.markdown(get_global_css(), unsafe_allow_html=True)
+    from components.assets import render_css
+    render_css("global", get_global_css())
 
 
 def set_page_layout(
@@ -295,7 +295,7 @@ def set_page_layout(
     # Default behavior
     set_page_layout()  # Uses all defaults
     """
-    import streamlit as st
+    from components.assets import render_css
     
     css_parts = []
     
@@ -338,7 +338,7 @@ def set_page_layout(
         }
         """)
     
-    st.markdown("<style>" + "\n".join(css_parts) + "</style>", unsafe_allow_html=True)
+    render_css("layout", "<style>" + "\n".join(css_parts) + "</style>")
 
 
 def hide_sidebar():
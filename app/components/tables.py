@@ -1,9 +1,12 @@
 """
 Reusable table components with consistent styling.
 """
+import calendar
+import re
 import streamlit as st
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Union
 from datetime import datetime, date
 import sys
 from pathlib import Path
@@ -12,6 +15,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from components.styles import COLORS, TYPOGRAPHY, SPACING, BORDER_RADIUS
+from core.cache import cache, fingerprint
 
 
 def format_currency(value: float, decimals: int = 2) -> str:
@@ -73,6 +77,168 @@ def format_date(d: date, format_str: str = "%b %d, %Y") -> str:
     return d.strftime(format_str)
 
 
+# Rows as a DataFrame (e.g. from db_manager.execute_frame) or a list of dicts
+TableData = Union[pd.DataFrame, List[Dict[str, Any]]]
+
+
+def to_frame(data: TableData) -> pd.DataFrame:
+    """Use a DataFrame as-is; build one only from row dictionaries."""
+    return data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+
+
+# ==================== VECTORIZED COLUMN FORMATTING ====================
+#
+# The scalar format_* helpers above are kept for single values. Whole table
+# columns go through format_frame(): every distinct value is formatted once
+# (pd.factorize), magnitude buckets and signs are chosen with NumPy over the
+# distinct values, and the labels are scattered back by index.
+
+_MISSING_LABEL = "-"
+
+# Magnitude buckets: (threshold, divisor, suffix), largest first
+_VOLUME_BUCKETS = [(1e9, 1e9, "B"), (1e6, 1e6, "M"), (1e3, 1e3, "K")]
+_MARKET_CAP_BUCKETS = [(1e12, 1e12, "T"), (1e9, 1e9, "B"), (1e6, 1e6, "M")]
+
+
+_MONTH_ABBR = np.array(calendar.month_abbr[1:])
+_MONTH_NAMES = np.array(calendar.month_name[1:])
+
+
+def _pad2(values: np.ndarray) -> np.ndarray:
+    return np.strings.zfill(values.astype(str), 2)
+
+
+# strftime codes rendered with NumPy string ufuncs (others fall back to pandas)
+_DATE_FIELDS: Dict[str, Callable[[pd.DatetimeIndex], np.ndarray]] = {
+    "%Y": lambda t: t.year.to_numpy().astype(str),
+    "%y": lambda t: _pad2(t.year.to_numpy() % 100),
+    "%m": lambda t: _pad2(t.month.to_numpy()),
+    "%b": lambda t: _MONTH_ABBR[t.month.to_numpy() - 1],
+    "%B": lambda t: _MONTH_NAMES[t.month.to_numpy() - 1],
+    "%d": lambda t: _pad2(t.day.to_numpy()),
+    "%H": lambda t: _pad2(t.hour.to_numpy()),
+    "%M": lambda t: _pad2(t.minute.to_numpy()),
+    "%S": lambda t: _pad2(t.second.to_numpy()),
+    "%%": lambda t: np.full(len(t), "%"),
+}
+
+
+def _strftime(values: np.ndarray, fmt: str) -> List[str]:
+    """Vectorized strftime over date/datetime values."""
+    stamps = pd.DatetimeIndex(pd.to_datetime(values))
+    parts = re.split(r"(%.)", fmt)
+    codes = parts[1::2]
+    if any(code not in _DATE_FIELDS for code in codes):
+        return stamps.strftime(fmt).tolist()
+    result = np.full(len(stamps), parts[0])
+    for code, literal in zip(codes, parts[2::2]):
+        result = np.strings.add(np.strings.add(result, _DATE_FIELDS[code](stamps)), literal)
+    return result.tolist()
+
+
+def _format_distinct(values: pd.Series, build: Callable[[np.ndarray], List[str]]) -> np.ndarray:
+    """
+    Format a column by labelling each distinct non-missing value once.
+    
+    Args:
+        values: Column to format (NaN/None/NaT become "-")
+        build: Maps the array of distinct values to their labels
+    """
+    codes, uniques = pd.factorize(values)
+    labels = build(np.asarray(uniques)) if len(uniques) else []
+    # Code -1 (missing) picks the trailing placeholder
+    return np.array(list(labels) + [_MISSING_LABEL], dtype=object)[codes]
+
+
+def _bucketed(
+    values: np.ndarray,
+    buckets: List[tuple],
+    template: str,
+    fallback: Callable[[np.ndarray], List[str]]
+) -> List[str]:
+    """Scale values into magnitude buckets; values below every bucket use fallback."""
+    conditions = [values >= threshold for threshold, _, _ in buckets]
+    divisors = np.select(conditions, [divisor for _, divisor, _ in buckets], 1.0)
+    suffixes = np.select(conditions, [suffix for _, _, suffix in buckets], "")
+    labels = np.array(list(map(template.format, (values / divisors).tolist(), suffixes)), dtype=object)
+    small = ~np.any(conditions, axis=0)
+    if small.any():
+        labels[small] = fallback(values[small])
+    return labels.tolist()
+
+
+def _numeric_builder(kind: str, decimals: int) -> Callable[[np.ndarray], List[str]]:
+    """Label builder for a numeric column type (see create_data_table)."""
+    if kind == "currency":
+        return lambda u: list(map(f"${{:,.{decimals}f}}".format, u.tolist()))
+    if kind == "number":
+        return lambda u: list(map(f"{{:,.{decimals}f}}".format, u.tolist()))
+    if kind == "percentage":
+        template = (
+            f"<span style='color: {{}}; font-weight: {TYPOGRAPHY['font_semibold']};'>"
+            f"{{}}{{:.{decimals}f}}%</span>"
+        )
+        return lambda u: list(map(
+            template.format,
+            np.where(u >= 0, COLORS["success"], COLORS["danger"]),
+            np.where(u > 0, "+", ""),
+            u.tolist(),
+        ))
+    if kind == "volume":
+        return lambda u: _bucketed(u, _VOLUME_BUCKETS, "{:.2f}{}", lambda v: [str(x) for x in v.tolist()])
+    if kind == "market_cap":
+        return lambda u: _bucketed(u, _MARKET_CAP_BUCKETS, "${:.2f}{}", _numeric_builder("currency", 2))
+    raise ValueError(f"Unknown column type: {kind}")
+
+
+def format_column(values: pd.Series, config: Dict[str, Any]) -> pd.Series:
+    """
+    Format one column for display according to its columns_config entry.
+    
+    Returns:
+        Series of display strings (the input unchanged if it has no type)
+    """
+    kind = config.get("type")
+    if kind in ("datetime", "date"):
+        default = "%b %d, %Y %H:%M" if kind == "datetime" else "%b %d, %Y"
+        fmt = config.get("format", default)
+        labels = _format_distinct(values, lambda u: _strftime(u, fmt))
+    elif kind in ("currency", "number", "percentage", "volume", "market_cap"):
+        decimals = config.get("decimals", 0 if kind == "number" else 2)
+        numeric = pd.to_numeric(values, errors="coerce")
+        labels = _format_distinct(numeric, _numeric_builder(kind, decimals))
+    else:
+        return values
+    return pd.Series(labels, index=values.index, name=values.name)
+
+
+def format_frame(data: pd.DataFrame, columns_config: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Return a display copy of a frame with typed columns formatted as strings.
+    
+    Results are cached by the frame's content hash, so reruns that rebuild
+    an identical frame skip formatting. The input is never modified; the
+    returned frame is shared through the cache and must not be mutated.
+    
+    Args:
+        data: Frame to format
+        columns_config: Column name -> config with "type" (currency,
+            percentage, number, volume, market_cap, datetime, date) and
+            optional "decimals" / "format"
+    """
+    def compute() -> pd.DataFrame:
+        formatted = data.copy()
+        for col_name, config in columns_config.items():
+            if col_name in formatted.columns:
+                formatted[col_name] = format_column(formatted[col_name], config)
+        return formatted
+    
+    key = fingerprint(data, columns_config)
+    if key is None:
+        return compute()
+    return cache.get_or_compute(("table_format", key), compute)
+
+
 def create_data_table(
     data: pd.DataFrame,
     columns_config: Optional[Dict[str, Dict[str, Any]]] = None,
@@ -87,7 +253,7 @@ def create_data_table(
     Create a styled data table with custom column configuration.
     
     Args:
-        data: DataFrame to display
+        data: DataFrame to display (not modified; formatting works on a copy)
         columns_config: Dict mapping column names to config dicts
         height: Table height in pixels
         use_container_width: Whether to use full width
@@ -107,29 +273,7 @@ def create_data_table(
     
     # Apply custom configurations
     if columns_config:
-        for col_name, config in columns_config.items():
-            if col_name in data.columns:
-                # Apply formatting based on column type
-                if config.get("type") == "currency":
-                    data[col_name] = data[col_name].apply(
-                        lambda x: format_currency(x, config.get("decimals", 2))
-                    )
-                elif config.get("type") == "percentage":
-                    data[col_name] = data[col_name].apply(
-                        lambda x: format_percentage(x, config.get("decimals", 2))
-                    )
-                elif config.get("type") == "volume":
-                    data[col_name] = data[col_name].apply(format_volume)
-                elif config.get("type") == "market_cap":
-                    data[col_name] = data[col_name].apply(format_market_cap)
-                elif config.get("type") == "datetime":
-                    data[col_name] = data[col_name].apply(
-                        lambda x: format_datetime(x, config.get("format", "%b %d, %Y %H:%M"))
-                    )
-                elif config.get("type") == "date":
-                    data[col_name] = data[col_name].apply(
-                        lambda x: format_date(x, config.get("format", "%b %d, %Y"))
-                    )
+        data = format_frame(data, columns_config)
     
     # Configure column display
     column_config = {}
@@ -163,7 +307,7 @@ def create_data_table(
 
 
 def create_sec_filings_table(
-    filings_data: List[Dict[str, Any]],
+    filings_data: TableData,
     key: Optional[str] = None,
     on_select: Optional[Callable] = None
 ) -> Any:
@@ -171,14 +315,14 @@ def create_sec_filings_table(
     Create a specialized table for SEC filings.
     
     Args:
-        filings_data: List of filing dictionaries
+        filings_data: Filing rows as a DataFrame or list of dicts
         key: Unique key for the table
         on_select: Callback when row is selected
         
     Returns:
         Streamlit data editor object
     """
-    df = pd.DataFrame(filings_data)
+    df = to_frame(filings_data)
     
     # Define columns to show
     display_columns = [
@@ -230,20 +374,20 @@ def create_sec_filings_table(
 
 
 def create_market_data_table(
-    market_data: List[Dict[str, Any]],
+    market_data: TableData,
     key: Optional[str] = None
 ) -> Any:
     """
     Create a specialized table for market data.
     
     Args:
-        market_data: List of market data dictionaries
+        market_data: Market data rows as a DataFrame or list of dicts
         key: Unique key for the table
         
     Returns:
         Streamlit data editor object
     """
-    df = pd.DataFrame(market_data)
+    df = to_frame(market_data)
     
     columns_config = {
         "ticker": {
@@ -299,20 +443,20 @@ def create_market_data_table(
 
 
 def create_news_table(
-    articles: List[Dict[str, Any]],
+    articles: TableData,
     key: Optional[str] = None
 ) -> Any:
     """
     Create a specialized table for news articles.
     
     Args:
-        articles: List of article dictionaries
+        articles: Article rows as a DataFrame or list of dicts
         key: Unique key for the table
         
     Returns:
         Streamlit data editor object
     """
-    df = pd.DataFrame(articles)
+    df = to_frame(articles)
     
     columns_config = {
         "published_at": {
@@ -4,32 +4,15 @@ Based on Figma design node 20862-187662
 """
 import streamlit as st
 
+from components.assets import render_css
 
-def inject_toolbar(active_page: str = "Company Profile") -> None:
-    """
-    Inject a sticky navigation toolbar for the Market Data section.
-    
-    Args:
-        active_page: The currently active page name. 
-                     Options: "Company Profile", "Key Stats", "Income Statement", "Balance Sheet", "Cash Flow"
-    """
-    
-    # Define pages and their corresponding URLs
-    # Market Data tabs use query parameters for tab switching
-    # Note: App runs at root /, not /marketdata
-    pages = [
-        ("Company Profile", "http://localhost:8504/company_profile"),
-        ("Key Stats", "http://localhost:8502/?tab=key_stats"),
-        ("Income Statement", "http://localhost:8502/?tab=income_statement"),
-        ("Balance Sheet", "http://localhost:8502/?tab=balance_sheet"),
-        ("Cash Flow", "http://localhost:8502/?tab=cash_flow"),
-    ]
-    
-    # Generate toolbar HTML
-    toolbar_html = f"""
+
+def get_toolbar_css() -> str:
+    """Get CSS for the Market Data navigation toolbar."""
+    return """
     <style>
         /* Toolbar Container - Sticky, full width with 110px side padding */
-        .toolbar-container {{
+        .toolbar-container {
             background-color: #FFFFFF;
             padding: 32px 110px 1px 110px;
             position: sticky;
@@ -42,19 +25,19 @@ def inject_toolbar(active_page: str = "Company Profile") -> None:
             gap: 8px;
             width: 100%;
             box-sizing: border-box;
-        }}
+        }
         
         /* Links Container - left aligned, matches Figma spec */
-        .toolbar-links {{
+        .toolbar-links {
             display: flex;
             gap: 105px;
             align-items: flex-start;
             width: 100%;
             max-width: 1220px;
-        }}
+        }
         
         /* Individual Link */
-        .toolbar-link {{
+        .toolbar-link {
             font-family: 'Roboto', sans-serif;
             font-weight: 600;
             font-size: 18px;
@@ -63,15 +46,15 @@ def inject_toolbar(active_page: str = "Company Profile") -> None:
             position: relative;
             padding-bottom: 2px;
             white-space: nowrap;
-        }}
+        }
         
         /* Active Link - Red color */
-        .toolbar-link.active {{
+        .toolbar-link.active {
             color: #D62E2F !important;
-        }}
+        }
         
         /* Active Link - Red underline */
-        .toolbar-link.active::after {{
+        .toolbar-link.active::after {
             content: '';
             position: absolute;
             bottom: -8px;
@@ -79,24 +62,48 @@ def inject_toolbar(active_page: str = "Company Profile") -> None:
             width: 100%;
             height: 4px;
             background-color: #D62E2F;
-        }}
+        }
         
         /* Hover effect */
-        .toolbar-link:hover {{
+        .toolbar-link:hover {
             color: #D62E2F !important;
             text-decoration: none !important;
-        }}
+        }
         
         /* Bottom border line (gray for inactive) */
-        .toolbar-border {{
+        .toolbar-border {
             height: 4px;
             width: 100%;
             max-width: 1220px;
             background-color: transparent;
             margin-top: -4px;
-        }}
+        }
     </style>
+    """
+
+
+def inject_toolbar(active_page: str = "Company Profile") -> None:
+    """
+    Inject a sticky navigation toolbar for the Market Data section.
+    
+    Args:
+        active_page: The currently active page name. 
+                     Options: "Company Profile", "Key Stats", "Income Statement", "Balance Sheet", "Cash Flow"
+    """
     
+    # Define pages and their corresponding URLs
+    # Market Data tabs use query parameters for tab switching
+    # Note: App runs at root /, not /marketdata
+    pages = [
+        ("Company Profile", "http://localhost:8504/company_profile"),
+        ("Key Stats", "http://localhost:8502/?tab=key_stats"),
+        ("Income Statement", "http://localhost:8502/?tab=income_statement"),
+        ("Balance Sheet", "http://localhost:8502/?tab=balance_sheet"),
+        ("Cash Flow", "http://localhost:8502/?tab=cash_flow"),
+    ]
+    
+    # Generate toolbar HTML
+    toolbar_html = f"""
     <div class="toolbar-container">
         <div class="toolbar-links">
             {''.join([
@@ -108,6 +115,7 @@ def inject_toolbar(active_page: str = "Company Profile") -> None:
     </div>
     """
     
+    render_css("toolbar", get_toolbar_css())
     st.markdown(toolbar_html, unsafe_allow_html=True)
 
 
@@ -0,0 +1,206 @@
+"""
+In-process TTL cache for computed data.
+
+Shared by all Streamlit sessions in the server process. Keys are tuples whose
+first element is a namespace (e.g. "ratios") so related entries can be
+invalidated together. Namespaces declare the tables they are derived from
+and are dropped when a TABLE_CHANGED event names one of them. Honors the
+ENABLE_CACHING / CACHE_TTL settings.
+
+Values without a natural key (frames, arrays, chart inputs) are keyed by a
+content hash from fingerprint().
+"""
+import dataclasses
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import config
+from .events import TABLE_CHANGED, event_bus
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[Hashable, ...]
+
+# Sentinel distinguishing "not cached" from a cached None
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with per-entry expiry.
+
+    Entries expire `ttl` seconds after they were stored; the least recently
+    used entry is evicted once `max_entries` is reached.
+    """
+
+    def __init__(self, ttl: int, max_entries: int = 2048, enabled: bool = True):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._table_namespaces: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey, default: Any = None) -> Any:
+        """Return a cached value, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: CacheKey, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value for `ttl` seconds (defaults to the cache TTL)."""
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: CacheKey, compute: Callable[[], Any], ttl: Optional[int] = None) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Concurrent misses may compute the value more than once; the compute
+        function runs outside the lock so slow queries never block readers.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            namespace: Only drop keys in this namespace (None = everything)
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            if namespace is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            stale = [key for key in self._entries if key and key[0] == namespace]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cache entries in '{namespace}'")
+        return len(stale)
+
+    def depends_on(self, namespace: str, *tables: str) -> None:
+        """Declare that entries in namespace are derived from the given tables."""
+        with self._lock:
+            for table in tables:
+                self._table_namespaces.setdefault(table, set()).add(namespace)
+
+    def invalidate_table(self, table: str) -> int:
+        """
+        Drop every namespace derived from a table.
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            namespaces = sorted(self._table_namespaces.get(table, ()))
+        return sum(self.invalidate(namespace) for namespace in namespaces)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cached(namespace: str, ttl: Optional[int] = None, tables: Tuple[str, ...] = ()) -> Callable:
+    """
+    Decorator caching a function's result in the global cache.
+
+    The cache key is (namespace, *args, *sorted kwargs); all arguments must
+    be hashable. Cached values are shared, so callers must not mutate them.
+    Entries are dropped when any of `tables` changes.
+    """
+    cache.depends_on(namespace, *tables)
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (namespace,) + args + tuple(sorted(kwargs.items()))
+            return cache.get_or_compute(key, lambda: func(*args, **kwargs), ttl)
+        return wrapper
+    return decorator
+
+
+def _digest_update(digest: Any, value: Any) -> None:
+    """Feed one value into a hash (see fingerprint)."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        if isinstance(value, pd.DataFrame):
+            header = (list(value.columns), [str(t) for t in value.dtypes])
+        else:
+            header = (value.name, str(value.dtype))
+        digest.update(repr(header).encode())
+    elif isinstance(value, np.ndarray):
+        if value.dtype == object:
+            _digest_update(digest, pd.Series(value.ravel()))
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}[{len(value)}]".encode())
+        for item in value:
+            _digest_update(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f"dict[{len(value)}]".encode())
+        for item in value.items():
+            _digest_update(digest, item)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        digest.update(type(value).__qualname__.encode())
+        for field in dataclasses.fields(value):
+            _digest_update(digest, getattr(value, field.name))
+    else:
+        digest.update(repr(value).encode())
+    digest.update(b"\x00")
+
+
+def fingerprint(*values: Any) -> Optional[str]:
+    """
+    Content hash of frames, arrays and plain values for use in cache keys.
+
+    Frames and Series hash their rows with pandas plus their column names
+    and dtypes, arrays their raw bytes, containers and dataclasses their
+    items, and anything else its repr.
+
+    Returns:
+        Hex digest, or None if a value cannot be hashed (frame cells holding
+        lists or dicts)
+    """
+    digest = hashlib.sha1()
+    try:
+        for value in values:
+            _digest_update(digest, value)
+    except TypeError:
+        return None
+    return digest.hexdigest()
+
+
+# Global cache instance
+cache = TTLCache(ttl=config.cache_ttl, enabled=config.enable_caching)
+event_bus.subscribe(TABLE_CHANGED, lambda table, **_: cache.invalidate_table(table))
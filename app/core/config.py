@@ -17,6 +17,13 @@ class Environment(Enum):
     PRODUCTION = "production"
 
 
+class DatabaseBackend(Enum):
+    """Supported database backends."""
+    MYSQL = "mysql"
+    SQLITE = "sqlite"
+    DUCKDB = "duckdb"
+
+
 @dataclass
 class DatabaseConfig:
     """Database connection configuration."""
@@ -30,9 +37,26 @@ class DatabaseConfig:
     pool_timeout: int = 30
     pool_recycle: int = 1800
     
+    # Embedded backends (SQLite/DuckDB) read from a local file instead of a server
+    backend: DatabaseBackend = DatabaseBackend.MYSQL
+    path: Optional[str] = None
+    read_only: bool = False
+    
+    @property
+    def is_embedded(self) -> bool:
+        """True when the backend is a local database file."""
+        return self.backend != DatabaseBackend.MYSQL
+    
     @property
     def connection_string(self) -> str:
-        """Generate MySQL connection string."""
+        """Generate SQLAlchemy connection string for the configured backend."""
+        if self.backend == DatabaseBackend.SQLITE:
+            if self.read_only:
+                return f"sqlite:///file:{self.path}?mode=ro&uri=true"
+            return f"sqlite:///{self.path}"
+        if self.backend == DatabaseBackend.DUCKDB:
+            # Requires the optional duckdb-engine package
+            return f"duckdb:///{self.path}"
         return f"mysql+pymysql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
 
@@ -49,6 +73,21 @@ class AppConfig:
     enable_caching: bool = True
     cache_ttl: int = 300
     
+    # Columnar DuckDB snapshot of the financial statement tables (None = disabled)
+    snapshot_path: Optional[str] = None
+    
+    # Background cache warming threads per process (0 = disabled)
+    prefetch_max_workers: int = 2
+    
+    # Seconds between checks of the ingestion watermarks for changed tables
+    change_poll_interval: int = 30
+    
+    # Byte budget of each session in the server-side session store
+    session_store_max_bytes: int = 262144
+    
+    # Directory of the compressed SEC filing texts (see data/filing_store.py)
+    filing_store_path: str = "data/filings"
+    
     # Pagination defaults
     default_page_size: int = 20
     max_page_size: int = 100
@@ -70,6 +109,9 @@ def load_config() -> AppConfig:
         password=os.getenv("DB_PASSWORD", "admin"),
         pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
         max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        backend=DatabaseBackend(os.getenv("DB_BACKEND", "mysql").lower()),
+        path=os.getenv("DB_PATH", "data/secfiling.db"),
+        read_only=os.getenv("DB_READ_ONLY", "false").lower() == "true",
     )
     
     return AppConfig(
@@ -80,6 +122,11 @@ def load_config() -> AppConfig:
         session_timeout=int(os.getenv("SESSION_TIMEOUT", "3600")),
         enable_caching=os.getenv("ENABLE_CACHING", "true").lower() == "true",
         cache_ttl=int(os.getenv("CACHE_TTL", "300")),
+        snapshot_path=os.getenv("SNAPSHOT_PATH") or None,
+        prefetch_max_workers=int(os.getenv("PREFETCH_MAX_WORKERS", "2")),
+        change_poll_interval=int(os.getenv("CHANGE_POLL_INTERVAL", "30")),
+        session_store_max_bytes=int(os.getenv("SESSION_STORE_MAX_BYTES", "262144")),
+        filing_store_path=os.getenv("FILING_STORE_PATH", "data/filings"),
         default_page_size=int(os.getenv("DEFAULT_PAGE_SIZE", "20")),
         max_page_size=int(os.getenv("MAX_PAGE_SIZE", "100")),
     )
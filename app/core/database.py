@@ -3,15 +3,26 @@ Database connector layer with connection pooling.
 """
 import logging
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Generator, Callable
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Generator, Callable, Sequence, Tuple
 from functools import wraps
+import sqlite3
 import threading
 
-from sqlalchemy import create_engine, text
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
-from .config import config, DatabaseConfig
+from .config import config, DatabaseConfig, DatabaseBackend
+from .dialect import SqlDialect, get_dialect
+from .events import ChangeWatcher, event_bus
+
+try:
+    import pyarrow as pa
+except ImportError:  # Optional dependency, see requirements.txt
+    pa = None
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +37,39 @@ class DatabaseQueryError(Exception):
     pass
 
 
+# Rows fetched per round trip by stream_query
+DEFAULT_STREAM_BATCH_SIZE = 5000
+
+
+@dataclass(frozen=True, slots=True)
+class RowBatch:
+    """A batch of raw result tuples sharing one column header."""
+    columns: Tuple[str, ...]
+    rows: List[Tuple[Any, ...]]
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def records(self) -> List[Dict[str, Any]]:
+        """Rows as dictionaries (for code that needs execute_query-style rows)."""
+        return [dict(zip(self.columns, row)) for row in self.rows]
+    
+    def column(self, name: str, dtype: Any = None) -> np.ndarray:
+        """One column as a NumPy array (NULL becomes NaN for float dtypes)."""
+        index = self.columns.index(name)
+        values = [row[index] for row in self.rows]
+        if dtype is not None and np.issubdtype(np.dtype(dtype), np.floating):
+            values = [np.nan if v is None else v for v in values]
+        return np.array(values, dtype=dtype)
+    
+    def to_numpy(self, columns: Optional[Sequence[str]] = None, dtype: Any = float) -> np.ndarray:
+        """Selected columns as a (row x column) array, NULL as NaN."""
+        names = list(columns or self.columns)
+        if not self.rows:
+            return np.empty((0, len(names)), dtype=dtype)
+        return np.column_stack([self.column(name, dtype) for name in names])
+
+
 class DatabaseManager:
     """
     Centralized database manager with connection pooling.
@@ -52,21 +96,42 @@ class DatabaseManager:
         self._config = config.database
         self._initialized = True
         self._local = threading.local()
-        logger.info(f"DatabaseManager initialized for environment: {config.env.value}")
+        self.dialect: SqlDialect = get_dialect(self._config.backend)
+        logger.info(
+            f"DatabaseManager initialized for environment: {config.env.value} "
+            f"(backend: {self._config.backend.value})"
+        )
+    
+    def _engine_options(self) -> Dict[str, Any]:
+        """Build create_engine() options for the configured backend."""
+        if self._config.backend == DatabaseBackend.SQLITE:
+            # Streamlit serves each session from its own thread; DATE/TIMESTAMP
+            # columns come back as date/datetime like they do from MySQL
+            return {"connect_args": {
+                "check_same_thread": False,
+                "detect_types": sqlite3.PARSE_DECLTYPES,
+            }}
+        if self._config.backend == DatabaseBackend.DUCKDB:
+            return {"connect_args": {"read_only": self._config.read_only}}
+        return {
+            "poolclass": QueuePool,
+            "pool_size": self._config.pool_size,
+            "max_overflow": self._config.max_overflow,
+            "pool_timeout": self._config.pool_timeout,
+            "pool_recycle": self._config.pool_recycle,
+        }
     
     def connect(self) -> None:
         """
         Initialize database connection pool.
         """
+        if self._engine is not None:
+            return
         try:
             self._engine = create_engine(
                 self._config.connection_string,
-                poolclass=QueuePool,
-                pool_size=self._config.pool_size,
-                max_overflow=self._config.max_overflow,
-                pool_timeout=self._config.pool_timeout,
-                pool_recycle=self._config.pool_recycle,
                 echo=config.debug,
+                **self._engine_options(),
             )
             self._session_factory = sessionmaker(bind=self._engine)
             logger.info("Database connection pool initialized successfully")
@@ -110,12 +175,124 @@ class DatabaseManager:
             result = session.execute(text(query), params or {})
             return [dict(row._mapping) for row in result]
     
+    def execute_frame(self, query: str, params: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """
+        Execute a query and return the result as a DataFrame.
+        
+        The frame is built column-wise from the driver's row tuples (DECIMAL
+        values coerced to float), skipping the per-row dicts and model
+        objects for callers that feed tables, charts or NumPy.
+        """
+        with self.get_session() as session:
+            result = session.execute(text(query), params or {})
+            columns = list(result.keys())
+            rows = result.fetchall()
+        return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+    
+    def execute_arrow(self, query: str, params: Optional[Dict[str, Any]] = None) -> "pa.Table":
+        """
+        Execute a query and return the result as an Arrow table (requires pyarrow).
+        
+        DuckDB hands its result over natively (the duckdb-engine cursor's
+        fetch_arrow_table); MySQL and SQLite have no Arrow fetch, so their
+        result is converted from execute_frame.
+        """
+        if pa is None:
+            raise RuntimeError("pyarrow is not installed; run `pip install pyarrow`")
+        if self._config.backend == DatabaseBackend.DUCKDB:
+            with self.get_session() as session:
+                result = session.execute(text(query), params or {})
+                return result.cursor.fetch_arrow_table()
+        return pa.Table.from_pandas(self.execute_frame(query, params), preserve_index=False)
+    
+    def stream_query(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+    ) -> Iterator[RowBatch]:
+        """
+        Execute a query and yield its rows in batches of raw tuples.
+        
+        Uses a server-side cursor where the driver supports one (PyMySQL's
+        SSCursor), so a full-table scan runs in constant memory instead of
+        materializing every row as a dict like execute_query. The connection
+        is held until the generator is exhausted or closed.
+        
+        Args:
+            query: SQL query string
+            params: Optional query parameters
+            batch_size: Rows per yielded batch
+            
+        Yields:
+            RowBatch objects sharing the same column tuple
+        """
+        with self._engine.connect() as connection:
+            try:
+                result = connection.execution_options(
+                    stream_results=True, yield_per=batch_size
+                ).execute(text(query), params or {})
+                columns = tuple(result.keys())
+                for partition in result.partitions(batch_size):
+                    yield RowBatch(columns, [tuple(row) for row in partition])
+            except Exception as e:
+                logger.error(f"Streaming query failed: {e}")
+                raise DatabaseQueryError(f"Query execution failed: {e}")
+    
     def execute_scalar(self, query: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Execute query returning single scalar value."""
         with self.get_session() as session:
             result = session.execute(text(query), params or {})
             return result.scalar()
     
+    def execute_many(self, query: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        Execute a statement once per parameter set in a single transaction.
+        
+        Args:
+            query: SQL statement with :named parameters
+            rows: Parameter dictionaries, one per execution
+            
+        Returns:
+            Number of parameter sets executed
+        """
+        if not rows:
+            return 0
+        with self.get_session() as session:
+            session.execute(text(query), rows)
+        return len(rows)
+    
+    def execute_statement(self, query: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Execute a DDL/DML statement that returns no rows."""
+        with self.get_session() as session:
+            session.execute(text(query), params or {})
+    
+    def execute_transaction(self, statements: List[Tuple[str, Any]]) -> None:
+        """
+        Execute several statements in a single transaction.
+        
+        Args:
+            statements: (SQL, parameters) pairs; parameters are a dictionary,
+                or a list of dictionaries to execute the statement once per
+                set (an empty list skips it)
+        """
+        with self.get_session() as session:
+            for query, params in statements:
+                if isinstance(params, list) and not params:
+                    continue
+                session.execute(text(query), params or {})
+    
+    def table_exists(self, table_name: str) -> bool:
+        """Check whether a table exists in the connected database."""
+        return inspect(self._engine).has_table(table_name)
+    
+    def index_exists(self, table_name: str, index_name: str) -> bool:
+        """Check whether a table has an index with the given name."""
+        return any(
+            index["name"] == index_name
+            for index in inspect(self._engine).get_indexes(table_name)
+        )
+    
     def health_check(self) -> bool:
         """Check database connectivity."""
         try:
@@ -153,6 +330,21 @@ class MockResult:
 # Global database manager instance
 db_manager = DatabaseManager()
 
+# Per-table high-water marks and versions maintained by data.ingest
+WATERMARK_TABLE = "coreiq_ingest_watermarks"
+
+
+def read_table_versions() -> Dict[str, int]:
+    """Return {table: version} from the ingestion watermarks (empty if none)."""
+    if not db_manager.table_exists(WATERMARK_TABLE):
+        return {}
+    rows = db_manager.execute_query(f"SELECT table_name, version FROM {WATERMARK_TABLE}")
+    return {row["table_name"]: int(row["version"]) for row in rows}
+
+
+# Publishes TABLE_CHANGED for tables loaded by the ingestion CLI
+change_watcher = ChangeWatcher(event_bus, read_table_versions, config.change_poll_interval)
+
 
 def with_db_session(func: Callable) -> Callable:
     """Decorator to inject database session into function."""
@@ -167,3 +359,4 @@ def with_db_session(func: Callable) -> Callable:
 def init_database():
     """Initialize database connection on application startup."""
     db_manager.connect()
+    change_watcher.poll()
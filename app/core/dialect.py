@@ -0,0 +1,93 @@
+"""
+Dialect-aware SQL fragments.
+
+Repository queries are written in portable SQL; the few places that need
+backend-specific functions (date truncation, JSON array lookups, upserts)
+ask the active dialect for the fragment instead of hard-coding MySQL syntax.
+"""
+from typing import Dict, Sequence
+
+from .config import DatabaseBackend
+
+
+class SqlDialect:
+    """MySQL SQL fragments (default backend)."""
+    name = "mysql"
+
+    def date(self, column: str) -> str:
+        """Truncate a DATETIME column to its date part."""
+        return f"DATE({column})"
+
+    def json_array_has_ticker(self, column: str, value: str) -> str:
+        """
+        Match rows whose JSON array column contains an object with the given ticker.
+
+        Args:
+            column: Column holding a JSON array of {"ticker": ...} objects
+            value: SQL expression for the ticker (bind parameter or column)
+        """
+        return f"""(
+            JSON_CONTAINS({column}, JSON_OBJECT('ticker', {value}))
+            OR {column} LIKE CONCAT('%"ticker": "', {value}, '"%')
+        )"""
+
+    def upsert(self, table: str, columns: Sequence[str], key_columns: Sequence[str]) -> str:
+        """
+        INSERT that updates the existing row when the key already exists.
+
+        Args:
+            table: Target table (must have a PRIMARY KEY/UNIQUE index on key_columns)
+            columns: Inserted columns, bound as :column parameters
+            key_columns: Columns identifying a row
+        """
+        updates = ", ".join(f"{c} = VALUES({c})" for c in columns if c not in key_columns)
+        return (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + c for c in columns)}) "
+            f"ON DUPLICATE KEY UPDATE {updates or f'{key_columns[0]} = {key_columns[0]}'}"
+        )
+
+
+class SQLiteDialect(SqlDialect):
+    """SQLite SQL fragments (requires the JSON1 functions, built in since 3.38)."""
+    name = "sqlite"
+
+    def json_array_has_ticker(self, column: str, value: str) -> str:
+        return f"""(
+            json_valid({column}) AND EXISTS (
+                SELECT 1 FROM json_each({column}) AS je
+                WHERE json_extract(je.value, '$.ticker') = {value}
+            )
+        )"""
+
+    def upsert(self, table: str, columns: Sequence[str], key_columns: Sequence[str]) -> str:
+        updates = ", ".join(f"{c} = excluded.{c}" for c in columns if c not in key_columns)
+        return (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + c for c in columns)}) "
+            f"ON CONFLICT ({', '.join(key_columns)}) "
+            + (f"DO UPDATE SET {updates}" if updates else "DO NOTHING")
+        )
+
+
+class DuckDBDialect(SQLiteDialect):
+    """DuckDB SQL fragments (uses the bundled json extension)."""
+    name = "duckdb"
+
+    def date(self, column: str) -> str:
+        return f"CAST({column} AS DATE)"
+
+    def json_array_has_ticker(self, column: str, value: str) -> str:
+        return f"list_contains(json_extract_string({column}, '$[*].ticker'), {value})"
+
+
+_DIALECTS: Dict[DatabaseBackend, SqlDialect] = {
+    DatabaseBackend.MYSQL: SqlDialect(),
+    DatabaseBackend.SQLITE: SQLiteDialect(),
+    DatabaseBackend.DUCKDB: DuckDBDialect(),
+}
+
+
+def get_dialect(backend: DatabaseBackend) -> SqlDialect:
+    """Return the SQL dialect for a database backend."""
+    return _DIALECTS[backend]
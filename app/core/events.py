@@ -0,0 +1,112 @@
+"""
+In-process publish/subscribe for data change events.
+
+The ingestion pipeline publishes TABLE_CHANGED after it writes to a table;
+caches subscribe and drop the entries derived from that table. Changes made
+by another process (e.g. the ingestion CLI run from cron) are picked up by a
+ChangeWatcher that polls per-table version numbers and republishes them here.
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Published with table=<name>, version=<int>
+TABLE_CHANGED = "table_changed"
+
+Handler = Callable[..., None]
+
+
+class EventBus:
+    """Thread-safe synchronous event bus."""
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, topic: str, handler: Handler) -> Callable[[], None]:
+        """
+        Call handler(**payload) for every event published on topic.
+
+        Returns:
+            Function that removes the subscription
+        """
+        with self._lock:
+            self._handlers.setdefault(topic, []).append(handler)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                handlers = self._handlers.get(topic, [])
+                if handler in handlers:
+                    handlers.remove(handler)
+        return unsubscribe
+
+    def publish(self, topic: str, **payload: Any) -> int:
+        """
+        Deliver an event to the topic's subscribers.
+
+        A failing handler is logged and does not stop the others.
+
+        Returns:
+            Number of handlers called
+        """
+        with self._lock:
+            handlers = list(self._handlers.get(topic, []))
+        for handler in handlers:
+            try:
+                handler(**payload)
+            except Exception as e:
+                logger.error(f"Handler for '{topic}' failed: {e}")
+        return len(handlers)
+
+
+class ChangeWatcher:
+    """
+    Republishes table changes made by other processes.
+
+    read_versions() returns the current {table: version} mapping; every
+    `interval` seconds poll() compares it with the last one seen and
+    publishes TABLE_CHANGED for each table whose version moved.
+    """
+
+    def __init__(self, bus: EventBus, read_versions: Callable[[], Dict[str, int]], interval: int):
+        self.bus = bus
+        self.interval = interval
+        self._read_versions = read_versions
+        self._versions: Optional[Dict[str, int]] = None
+        self._next_poll = 0.0
+        self._lock = threading.Lock()
+
+    def poll(self, force: bool = False) -> List[str]:
+        """
+        Check for changed tables unless the last check was too recent.
+
+        The first check only records the current versions.
+
+        Returns:
+            Names of the tables reported as changed
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.interval <= 0 or (not force and now < self._next_poll):
+                return []
+            self._next_poll = now + self.interval
+        try:
+            versions = self._read_versions()
+        except Exception as e:
+            logger.warning(f"Could not read table versions: {e}")
+            return []
+        with self._lock:
+            previous, self._versions = self._versions, versions
+        if previous is None:
+            return []
+        changed = [t for t, v in versions.items() if previous.get(t) != v]
+        for table in changed:
+            self.bus.publish(TABLE_CHANGED, table=table, version=versions[table])
+        return changed
+
+
+# Global event bus instance
+event_bus = EventBus()
@@ -0,0 +1,239 @@
+"""
+Typeahead company search over ticker, name, Coresight name and CIK.
+
+The company universe is loaded once into a CompanySearchIndex, kept in the
+shared cache and rebuilt after coreiq_companies changes. It holds two
+structures:
+
+- A prefix trie over search terms: the ticker, the CIK without leading
+  zeros and every name from each word onwards ("bank of america", "of
+  america", "america"). Each trie node keeps the best-ranked companies
+  below it, so a query walks len(query) nodes and reads its results off the
+  last one, independent of the number of companies. Terms are indexed up to
+  MAX_TRIE_DEPTH characters; longer queries check the candidates of the
+  deepest node against the full term.
+- A trigram index (trigram -> company positions) for fuzzy matching. When
+  prefixes give fewer than `limit` results, the companies sharing the most
+  trigrams with the query fill the list, which tolerates typos such as
+  "wallmart" or "amazn".
+
+Pickers ask for the top few matches of what the user typed instead of
+sending every company to the browser on each rerun.
+"""
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from core.cache import cached
+from core.database import db_manager
+from data.models import Company
+
+COMPANIES_TABLE = "coreiq_companies"
+
+# Companies remembered per trie node (enough for any picker)
+NODE_CAPACITY = 20
+
+# Characters of each term stored in the trie (bounds its size)
+MAX_TRIE_DEPTH = 10
+
+# Minimum share of the query's trigrams a fuzzy match must contain
+FUZZY_MIN_SCORE = 0.5
+
+# Seconds an index stays cached; changes to coreiq_companies drop it sooner
+INDEX_TTL = 24 * 3600
+
+# Term kinds, best first: matches on tickers rank above CIKs, then names
+_TICKER, _CIK, _NAME = 0, 1, 2
+
+_DROPPED = re.compile(r"['.]")
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+
+def normalize(text: Optional[str]) -> str:
+    """
+    Lowercase text with punctuation removed and words single-spaced.
+
+    Numbers lose their leading zeros so that padded and unpadded CIKs match.
+    """
+    if not text:
+        return ""
+    text = _SEPARATORS.sub(" ", _DROPPED.sub("", text.lower())).strip()
+    return (text.lstrip("0") or text) if text.isdigit() else text
+
+
+def trigrams(text: str) -> set:
+    """Trigrams of normalized text, padded so word starts and ends count."""
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _search_terms(company: Company) -> Iterator[Tuple[str, int]]:
+    """(term, kind) pairs under which a company can be found by prefix."""
+    yield normalize(company.ticker), _TICKER
+    yield normalize(company.cik), _CIK
+    for name in {normalize(company.name), normalize(company.name_coresight)}:
+        words = name.split(" ")
+        for i in range(len(words)):
+            yield " ".join(words[i:]), _NAME
+
+
+class _TrieNode:
+    """Trie node: children by character, best companies below and exact terms."""
+    __slots__ = ("children", "best", "exact")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.best: List[int] = []
+        self.exact: Tuple[int, ...] = ()
+
+
+class CompanySearchIndex:
+    """
+    Prefix and fuzzy search over a fixed list of companies.
+
+    Companies are kept in the order given (by display name); ties in ranking
+    keep that order. Build with build_search_index().
+    """
+
+    def __init__(self, companies: List[Company]):
+        self.companies: Tuple[Company, ...] = tuple(companies)
+        self._by_ticker: Dict[str, int] = {}
+        for position, company in enumerate(self.companies):
+            self._by_ticker.setdefault(company.ticker, position)
+        self._root = _TrieNode()
+        self._build_trie()
+        self._build_trigrams()
+
+    def _build_trie(self) -> None:
+        terms = sorted(
+            (kind, position, term)
+            for position, company in enumerate(self.companies)
+            for term, kind in _search_terms(company)
+            if term
+        )
+        # Inserting best-ranked terms first lets nodes fill in rank order
+        for _, position, term in terms:
+            node = self._root
+            for char in term[:MAX_TRIE_DEPTH]:
+                node = node.children.get(char) or node.children.setdefault(char, _TrieNode())
+                if len(node.best) < NODE_CAPACITY and position not in node.best:
+                    node.best.append(position)
+            if len(term) <= MAX_TRIE_DEPTH and position not in node.exact:
+                node.exact += (position,)
+
+    def _build_trigrams(self) -> None:
+        postings: Dict[str, List[int]] = {}
+        sizes = np.zeros(len(self.companies), dtype=np.int32)
+        for position, company in enumerate(self.companies):
+            grams = set()
+            for text in (company.ticker, company.name, company.name_coresight):
+                grams |= trigrams(normalize(text))
+            sizes[position] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(position)
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._trigram_counts = sizes
+
+    def __len__(self) -> int:
+        return len(self.companies)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._by_ticker
+
+    def get(self, ticker: Optional[str]) -> Optional[Company]:
+        """Company with the given ticker, if any."""
+        position = self._by_ticker.get(ticker)
+        return None if position is None else self.companies[position]
+
+    def _prefix_matches(self, query: str) -> List[int]:
+        node = self._root
+        for char in query[:MAX_TRIE_DEPTH]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        positions = list(node.exact) + [p for p in node.best if p not in node.exact]
+        if len(query) > MAX_TRIE_DEPTH:
+            positions = [
+                p for p in positions
+                if any(term.startswith(query) for term, _ in _search_terms(self.companies[p]))
+            ]
+        return positions
+
+    def _fuzzy_matches(self, query: str, limit: int) -> List[int]:
+        grams = trigrams(query)
+        hits = [self._postings[g] for g in grams if g in self._postings]
+        if not hits:
+            return []
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.companies))
+        candidates = np.flatnonzero(shared >= FUZZY_MIN_SCORE * len(grams))
+        # Most shared trigrams first; shorter names (fewer trigrams) break ties
+        order = np.lexsort((self._trigram_counts[candidates], -shared[candidates]))
+        return candidates[order[:limit]].tolist()
+
+    def search(self, query: str, limit: int = 10) -> List[Company]:
+        """
+        Companies matching a typed query, best first.
+
+        Prefix matches on ticker, CIK and any word of the name come first
+        (exact terms before longer ones); fuzzy trigram matches fill up the
+        remaining slots.
+
+        Args:
+            query: Text typed by the user
+            limit: Maximum number of companies to return
+
+        Returns:
+            Up to `limit` companies
+        """
+        query = normalize(query)
+        if not query or limit <= 0:
+            return []
+        positions = self._prefix_matches(query)[:limit]
+        if len(positions) < limit:
+            seen = set(positions)
+            for position in self._fuzzy_matches(query, limit):
+                if position not in seen:
+                    positions.append(position)
+                    seen.add(position)
+                    if len(positions) == limit:
+                        break
+        return [self.companies[p] for p in positions]
+
+
+def build_search_index(source: Optional[str] = None) -> CompanySearchIndex:
+    """
+    Load companies (optionally of one data source) into a search index.
+
+    Companies are ordered by display name; duplicate tickers keep the first row.
+    """
+    query = f"""
+        SELECT ticker, name, name_coresight, exchange, cik
+        FROM {COMPANIES_TABLE}
+        WHERE ticker IS NOT NULL
+    """
+    params = {}
+    if source is not None:
+        query += " AND source = :source"
+        params["source"] = source
+    query += " ORDER BY COALESCE(name_coresight, name), ticker"
+    companies = [Company(
+        ticker=row['ticker'],
+        name=row['name'] or row['ticker'],
+        name_coresight=row['name_coresight'],
+        exchange=row['exchange'],
+        cik=row['cik'],
+    ) for row in db_manager.execute_query(query, params)]
+    return CompanySearchIndex(companies)
+
+
+@cached("company_search", ttl=INDEX_TTL, tables=(COMPANIES_TABLE,))
+def get_company_search_index(source: Optional[str] = None) -> CompanySearchIndex:
+    """
+    The shared search index of a data source (None = all companies).
+
+    Kept for INDEX_TTL instead of CACHE_TTL, as rebuilding it is slow and
+    TABLE_CHANGED for coreiq_companies already invalidates it. Results are
+    shared through the process cache; do not mutate them.
+    """
+    return build_search_index(source)
@@ -0,0 +1,154 @@
+"""
+Downsampling of long price series for charts.
+
+A chart cannot show more points than it has pixels, so series are reduced to
+a resolution picked from the visible range and the chart width before they
+are handed to Plotly:
+
+- lttb() selects the points of a line (Largest-Triangle-Three-Buckets) that
+  keep its visual shape, peaks and troughs included.
+- aggregate_ohlcv() merges consecutive candles into wider ones (first open,
+  highest high, lowest low, last close, summed volume), which is what a
+  lower-frequency candle over the same bars would show.
+
+The figure payload is therefore bounded by the chart width, not by the
+length of the history. Charts slice the full-resolution series to the
+visible range first (visible_slice), so zooming in re-samples a shorter
+window at finer resolution.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from data.models import PriceSeries
+
+# Chart width assumed when the caller does not know it (pixels)
+DEFAULT_CHART_WIDTH = 1000
+
+# Line points per horizontal pixel; more are indistinguishable
+LINE_POINTS_PER_PIXEL = 1.0
+
+# Narrowest readable candle, including its gap (pixels)
+CANDLE_MIN_PIXELS = 4
+
+
+def max_line_points(width: int = DEFAULT_CHART_WIDTH) -> int:
+    """Number of points worth drawing in a line chart of the given width."""
+    return max(int(width * LINE_POINTS_PER_PIXEL), 3)
+
+
+def max_candles(width: int = DEFAULT_CHART_WIDTH) -> int:
+    """Number of candles that fit a chart of the given width."""
+    return max(width // CANDLE_MIN_PIXELS, 1)
+
+
+def visible_slice(
+    dates: np.ndarray,
+    start: Optional[np.datetime64] = None,
+    end: Optional[np.datetime64] = None
+) -> slice:
+    """
+    Index range of the sorted dates that fall within [start, end].
+
+    Args:
+        dates: Sorted datetime64 array
+        start: First visible date (None = from the beginning)
+        end: Last visible date (None = to the end)
+    """
+    lo = 0 if start is None else int(np.searchsorted(dates, np.datetime64(start), side="left"))
+    hi = len(dates) if end is None else int(np.searchsorted(dates, np.datetime64(end), side="right"))
+    return slice(lo, max(lo, hi))
+
+
+def _as_float(x: np.ndarray) -> np.ndarray:
+    """Numeric x coordinates (datetimes as nanoseconds, labels by position)."""
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    if np.issubdtype(x.dtype, np.number):
+        return x.astype(np.float64)
+    return np.arange(len(x), dtype=np.float64)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are kept; the rest are split into
+    threshold - 2 equal buckets and from each bucket the point forming the
+    largest triangle with the previously kept point and the average of the
+    next bucket is selected.
+
+    Args:
+        x: Sorted x values (numeric or datetime64)
+        y: Finite y values, same length as x
+        threshold: Number of points to keep
+
+    Returns:
+        Sorted indices of the kept points
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    xf = _as_float(x)
+    yf = np.asarray(y, dtype=np.float64)
+
+    # Bucket i spans edges[i]:edges[i + 1]; points 0 and n - 1 stand alone
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    bucket_x = np.add.reduceat(xf[1:n - 1], edges[:-1] - 1) / np.diff(edges)
+    bucket_y = np.add.reduceat(yf[1:n - 1], edges[:-1] - 1) / np.diff(edges)
+    next_x = np.append(bucket_x[1:], xf[-1])
+    next_y = np.append(bucket_y[1:], yf[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        ax, ay = xf[a], yf[a]
+        area = np.abs(
+            (ax - next_x[i]) * (yf[start:stop] - ay)
+            - (ax - xf[start:stop]) * (next_y[i] - ay)
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_line(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Drop missing values and reduce a line to at most `threshold` points.
+
+    Returns:
+        Tuple of (x, y) arrays to plot
+    """
+    y = np.asarray(y, dtype=np.float64)
+    finite = np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    keep = lttb(x, y, threshold)
+    if len(keep) == len(y):
+        return x, y
+    return x[keep], y[keep]
+
+
+def aggregate_ohlcv(bars: PriceSeries, max_bars: int) -> PriceSeries:
+    """
+    Merge consecutive bars so that at most max_bars remain.
+
+    Every output bar covers the same number of input bars (the last one may
+    be shorter) and is dated at its first input bar.
+    """
+    n = len(bars)
+    if n <= max_bars:
+        return bars
+    width = -(-n // max_bars)
+    starts = np.arange(0, n, width)
+    ends = np.append(starts[1:], n) - 1
+    return PriceSeries(
+        dates=bars.dates[starts],
+        open=bars.open[starts],
+        high=np.fmax.reduceat(bars.high, starts),
+        low=np.fmin.reduceat(bars.low, starts),
+        close=bars.close[ends],
+        volume=np.add.reduceat(bars.volume, starts),
+    )
@@ -0,0 +1,682 @@
+"""
+Full-text search over the SEC filing store with BM25 ranking and facets.
+
+Every section of every stored filing (see data.filing_store) is a search
+document. The inverted index is a list of immutable segments, each one .npz
+file under <FILING_STORE_PATH>/_index/:
+
+    terms              sorted vocabulary
+    term_offsets       postings of terms[i] are posting_*[term_offsets[i]:term_offsets[i + 1]]
+    posting_docs       segment-local section ids, posting_tfs their term counts
+    doc_*              per section: filing, seq, label and length in tokens
+    filing_*           per filing: accession number, ticker, form, date, stored_at
+
+New and re-stored filings go into a new small segment instead of rewriting
+the index. A section is live while its segment is the newest one holding the
+filing and the filing's stored_at still matches coreiq_sec_filings; stale
+copies are skipped by queries and dropped by merges. After each new segment
+the newest segment is merged into the one before it as long as that one is
+less than MERGE_RATIO times larger, which keeps the number of segments
+logarithmic in the corpus size; segments that are mostly dead are rewritten.
+
+A query scores the live sections containing any query term with BM25
+(statistics over all live sections), counts matching filings per company,
+form type, year and quarter, and reads back only the top sections to cut
+highlighted snippets.
+
+Only writers update the index: this module's CLI and the filing store CLI
+(data.filing_store), which hold an exclusive lock on <_index>/.lock while
+they index and merge, then bump the version of INDEX_TABLE. App processes
+never write; they reload the segment files after coreiq_sec_filings or
+INDEX_TABLE changes (TABLE_CHANGED).
+
+Build or update the index and try queries with:
+
+    cd app && python -m data.filing_search "supply chain" --form 10-K
+"""
+import argparse
+import logging
+import math
+import os
+import re
+import sys
+import threading
+import time
+import zlib
+from array import array
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from html import escape
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.config import config
+from core.database import db_manager, init_database
+from core.events import TABLE_CHANGED, event_bus
+from data.filing_store import FILINGS_TABLE, filing_tables_exist, load_section, read_sections
+from data.ingest import mark_table_changed
+from data.models import FilingSearchHit
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; writers are then not serialized
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Segment directory under FILING_STORE_PATH
+INDEX_DIR = "_index"
+
+# Writers lock this file (in INDEX_DIR) while they change segments
+LOCK_FILE = ".lock"
+
+# Version key bumped after the segments change (no such table exists)
+INDEX_TABLE = "coreiq_sec_filing_index"
+
+# Attempts at loading the segments while a writer removes merged files
+LOAD_ATTEMPTS = 5
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# A segment absorbs the newer one after it while it is less than this many times larger
+MERGE_RATIO = 4
+
+# Segments with a larger share of dead sections are rewritten
+MAX_DEAD_SHARE = 0.3
+
+# Filings indexed per new segment
+INDEX_BATCH_FILINGS = 200
+
+# Snippet length (characters)
+SNIPPET_CHARS = 240
+
+# Query term occurrences considered when placing a snippet
+MAX_SNIPPET_MATCHES = 200
+
+# Facets, in display order
+FACET_FIELDS = ("company", "form_type", "year", "quarter")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "this to was were which will with".split()
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_SEGMENT_NAME = re.compile(r"^seg_(\d+)\.npz$")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric words of text, without stopwords and single letters."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+@dataclass(frozen=True)
+class Segment:
+    """One immutable index segment (see the module docstring for the arrays)."""
+    number: int
+    terms: np.ndarray
+    term_offsets: np.ndarray
+    posting_docs: np.ndarray
+    posting_tfs: np.ndarray
+    doc_filing: np.ndarray
+    doc_seq: np.ndarray
+    doc_label: np.ndarray
+    doc_length: np.ndarray
+    filing_accession: np.ndarray
+    filing_ticker: np.ndarray
+    filing_form: np.ndarray
+    filing_date: np.ndarray
+    filing_stored_at: np.ndarray
+
+    @property
+    def doc_count(self) -> int:
+        return len(self.doc_filing)
+
+    def postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(section ids, term counts) of a term; empty arrays if absent."""
+        i = int(np.searchsorted(self.terms, term))
+        if i == len(self.terms) or self.terms[i] != term:
+            return self.posting_docs[:0], self.posting_tfs[:0]
+        lo, hi = self.term_offsets[i], self.term_offsets[i + 1]
+        return self.posting_docs[lo:hi], self.posting_tfs[lo:hi]
+
+
+_ARRAY_FIELDS = [name for name in Segment.__dataclass_fields__ if name != "number"]
+
+
+class SearchResults(NamedTuple):
+    """Result of FilingSearchIndex.search()."""
+    hits: List[FilingSearchHit]
+    total: int                                  # Matching sections
+    filing_count: int                           # Filings with a matching section
+    facets: Dict[str, List[Tuple[str, int]]]    # Field -> (value, matching filings), most first
+    elapsed_ms: float
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """Segments of the index with their statistics concatenated for queries."""
+    segments: Tuple[Segment, ...]
+    doc_bases: np.ndarray       # First global section id of each segment
+    doc_live: np.ndarray
+    doc_length: np.ndarray
+    doc_filing: np.ndarray      # Global filing id of each section
+    live_count: int
+    avg_length: float
+    facet_codes: Dict[str, np.ndarray]     # Field -> code of each global filing
+    facet_labels: Dict[str, np.ndarray]    # Field -> value of each code
+
+
+def _concat(parts: List[np.ndarray], dtype: Any) -> np.ndarray:
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=dtype)
+
+
+def _to_day(value: Any) -> np.datetime64:
+    return np.datetime64(str(value)[:10], "D")
+
+
+def _stored_filings() -> Dict[str, Dict[str, Any]]:
+    """Filings of the store by accession number (empty if the store is not set up)."""
+    if not filing_tables_exist():
+        return {}
+    rows = db_manager.execute_query(f"""
+        SELECT accession_number, ticker, form_type, filing_date, stored_at
+        FROM {FILINGS_TABLE}
+        ORDER BY filing_date, accession_number
+    """)
+    return {row["accession_number"]: {**row, "stored_at": str(row["stored_at"])} for row in rows}
+
+
+def _live_filings(segments: Sequence[Segment], stored: Dict[str, Dict[str, Any]]) -> List[np.ndarray]:
+    """Per segment, which of its filings are the current copy."""
+    seen = set()
+    masks = []
+    for segment in reversed(segments):
+        mask = np.zeros(len(segment.filing_accession), dtype=bool)
+        for i, (accession, stored_at) in enumerate(zip(
+            segment.filing_accession.tolist(), segment.filing_stored_at.tolist()
+        )):
+            row = stored.get(accession)
+            mask[i] = accession not in seen and row is not None and row["stored_at"] == stored_at
+            seen.add(accession)
+        masks.append(mask)
+    return masks[::-1]
+
+
+def _postings_arrays(
+    term_ids: np.ndarray,
+    docs: np.ndarray,
+    tfs: np.ndarray,
+    vocabulary: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Sorted vocabulary and postings grouped by term, from unordered postings."""
+    order = np.argsort(vocabulary, kind="stable")
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    terms = rank[term_ids]
+    postings = np.lexsort((docs, terms))
+    counts = np.bincount(terms, minlength=len(vocabulary))
+    used = counts > 0
+    return {
+        "terms": vocabulary[order][used],
+        "term_offsets": np.concatenate(([0], np.cumsum(counts[used]))).astype(np.int64),
+        "posting_docs": docs[postings].astype(np.int32),
+        "posting_tfs": tfs[postings].astype(np.int32),
+    }
+
+
+def index_filings(filings: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Segment arrays of a batch of stored filings.
+
+    Args:
+        filings: Rows of coreiq_sec_filings (see _stored_filings)
+    """
+    term_ids: Dict[str, int] = {}
+    posting_terms, posting_docs, posting_tfs = array("q"), array("q"), array("q")
+    doc_filing, doc_seq, doc_length, doc_label = [], [], [], []
+    for filing_id, filing in enumerate(filings):
+        try:
+            sections = list(read_sections(filing["accession_number"]))
+        except (OSError, zlib.error) as e:
+            logger.warning(f"Cannot index filing {filing['accession_number']}: {e}")
+            sections = []
+        for section, text in sections:
+            doc_id = len(doc_filing)
+            tokens = tokenize(text)
+            for term, tf in Counter(tokens).items():
+                posting_terms.append(term_ids.setdefault(term, len(term_ids)))
+                posting_docs.append(doc_id)
+                posting_tfs.append(tf)
+            doc_filing.append(filing_id)
+            doc_seq.append(section.seq)
+            doc_length.append(len(tokens))
+            doc_label.append(section.label)
+    arrays = _postings_arrays(
+        np.frombuffer(posting_terms, dtype=np.int64),
+        np.frombuffer(posting_docs, dtype=np.int64),
+        np.frombuffer(posting_tfs, dtype=np.int64),
+        np.array(list(term_ids), dtype=str),
+    )
+    arrays.update(
+        doc_filing=np.array(doc_filing, dtype=np.int32),
+        doc_seq=np.array(doc_seq, dtype=np.int32),
+        doc_label=np.array(doc_label, dtype=str),
+        doc_length=np.array(doc_length, dtype=np.int32),
+        filing_accession=np.array([f["accession_number"] for f in filings], dtype=str),
+        filing_ticker=np.array([f["ticker"] for f in filings], dtype=str),
+        filing_form=np.array([f["form_type"] for f in filings], dtype=str),
+        filing_date=np.array([_to_day(f["filing_date"]) for f in filings], dtype="datetime64[D]"),
+        filing_stored_at=np.array([f["stored_at"] for f in filings], dtype=str),
+    )
+    return arrays
+
+
+def merge_segments(segments: Sequence[Segment], live_filings: Sequence[np.ndarray]) -> Dict[str, np.ndarray]:
+    """Segment arrays holding the live filings of several segments, oldest first."""
+    vocabulary = np.unique(_concat([s.terms for s in segments], str))
+    term_parts, doc_parts, tf_parts = [], [], []
+    docs: Dict[str, List[np.ndarray]] = {"doc_filing": [], "doc_seq": [], "doc_label": [], "doc_length": []}
+    filings: Dict[str, List[np.ndarray]] = {name: [] for name in _ARRAY_FIELDS if name.startswith("filing_")}
+    doc_base = filing_base = 0
+    for segment, filing_live in zip(segments, live_filings):
+        doc_live = filing_live[segment.doc_filing]
+        new_doc = np.cumsum(doc_live) - 1 + doc_base
+        new_filing = np.cumsum(filing_live) - 1 + filing_base
+        posting_terms = np.repeat(np.searchsorted(vocabulary, segment.terms), np.diff(segment.term_offsets))
+        keep = doc_live[segment.posting_docs]
+        term_parts.append(posting_terms[keep])
+        doc_parts.append(new_doc[segment.posting_docs[keep]])
+        tf_parts.append(segment.posting_tfs[keep])
+        docs["doc_filing"].append(new_filing[segment.doc_filing[doc_live]])
+        for name in ("doc_seq", "doc_label", "doc_length"):
+            docs[name].append(getattr(segment, name)[doc_live])
+        for name in filings:
+            filings[name].append(getattr(segment, name)[filing_live])
+        doc_base += int(doc_live.sum())
+        filing_base += int(filing_live.sum())
+    arrays = _postings_arrays(
+        _concat(term_parts, np.int64),
+        _concat(doc_parts, np.int64),
+        _concat(tf_parts, np.int64),
+        vocabulary,
+    )
+    arrays.update({name: np.concatenate(parts) for name, parts in {**docs, **filings}.items()})
+    arrays["doc_filing"] = arrays["doc_filing"].astype(np.int32)
+    return arrays
+
+
+def _build_snapshot(segments: Sequence[Segment], live_filings: Sequence[np.ndarray]) -> _Snapshot:
+    doc_counts = [s.doc_count for s in segments]
+    filing_bases = np.cumsum([0] + [len(s.filing_accession) for s in segments])
+    doc_live = _concat([live[s.doc_filing] for s, live in zip(segments, live_filings)], bool)
+    doc_length = _concat([s.doc_length for s in segments], np.int32).astype(np.float64)
+    live_count = int(doc_live.sum())
+
+    dates = _concat([s.filing_date for s in segments], "datetime64[D]")
+    years = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    quarters = dates.astype("datetime64[M]").astype(np.int64) % 12 // 3 + 1
+    values = {
+        "company": _concat([s.filing_ticker for s in segments], str),
+        "form_type": _concat([s.filing_form for s in segments], str),
+        "year": years.astype(str),
+        "quarter": np.char.add("Q", quarters.astype(str)),
+    }
+    facet_labels, facet_codes = {}, {}
+    for field in FACET_FIELDS:
+        facet_labels[field], facet_codes[field] = np.unique(values[field], return_inverse=True)
+
+    return _Snapshot(
+        segments=tuple(segments),
+        doc_bases=np.cumsum([0] + doc_counts[:-1]).astype(np.int64),
+        doc_live=doc_live,
+        doc_length=doc_length,
+        doc_filing=_concat([s.doc_filing + base for s, base in zip(segments, filing_bases)], np.int64),
+        live_count=live_count,
+        avg_length=float(doc_length[doc_live].mean()) if live_count else 0.0,
+        facet_codes=facet_codes,
+        facet_labels=facet_labels,
+    )
+
+
+def make_snippet(text: str, terms: Sequence[str], width: int = SNIPPET_CHARS) -> str:
+    """
+    Excerpt of text around its densest cluster of query terms.
+
+    Returns:
+        HTML-escaped excerpt with the terms wrapped in <mark>
+    """
+    if not terms:
+        return escape(" ".join(text[:width].split()))
+    pattern = re.compile(r"\b(" + "|".join(map(re.escape, terms)) + r")\b", re.IGNORECASE)
+    matches = list(islice(pattern.finditer(text), MAX_SNIPPET_MATCHES))
+    start = 0
+    if matches:
+        # Window starting at a match with the most distinct terms, then the most matches
+        best = max(
+            range(len(matches)),
+            key=lambda i: (
+                len({m.group(1).lower() for m in matches[i:] if m.end() <= matches[i].start() + width}),
+                sum(1 for m in matches[i:] if m.end() <= matches[i].start() + width),
+            ),
+        )
+        start = max(0, matches[best].start() - width // 4)
+        if start:
+            space = text.rfind(" ", 0, start)
+            start = space + 1 if space >= 0 else 0
+    end = min(len(text), start + width)
+    if end < len(text):
+        space = text.find(" ", end)
+        end = space if space >= 0 else len(text)
+    parts = pattern.split(" ".join(text[start:end].split()))
+    # split() with one group alternates text and matched terms
+    snippet = "".join(escape(p) if i % 2 == 0 else f"<mark>{escape(p)}</mark>" for i, p in enumerate(parts))
+    return ("…" if start else "") + snippet + ("…" if end < len(text) else "")
+
+
+class FilingSearchIndex:
+    """
+    Segmented inverted index over the sections of stored filings.
+
+    Searches read an immutable snapshot of the segments. reload() (called by
+    search() after the filings or the index changed) reads the segment files
+    again; update() indexes new filings and merges segments, for writers only.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._segments: List[Segment] = []
+        self._snapshot = _build_snapshot([], [])
+        self._stale = True
+
+    def invalidate(self) -> None:
+        """Reload the segments before the next search."""
+        self._stale = True
+
+    def _segment_paths(self) -> List[Tuple[int, Path]]:
+        if not self.directory.is_dir():
+            return []
+        found = [(_SEGMENT_NAME.match(p.name), p) for p in self.directory.iterdir()]
+        return sorted((int(m.group(1)), p) for m, p in found if m)
+
+    def _load(self) -> List[Segment]:
+        for attempt in range(LOAD_ATTEMPTS):
+            try:
+                segments = []
+                for number, path in self._segment_paths():
+                    with np.load(path, allow_pickle=False) as data:
+                        segments.append(Segment(number=number, **{name: data[name] for name in _ARRAY_FIELDS}))
+                return segments
+            except FileNotFoundError:
+                # A writer merged the segment away after it was listed
+                if attempt == LOAD_ATTEMPTS - 1:
+                    raise
+        return []
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Hold the thread lock and the index lock file (blocks other writers)."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / LOCK_FILE, "w") as handle:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_EX)
+                yield
+
+    def _write(self, number: int, arrays: Dict[str, np.ndarray]) -> Segment:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        target = self.directory / f"seg_{number:06d}.npz"
+        temporary = target.with_suffix(".tmp")
+        with open(temporary, "wb") as out:
+            np.savez(out, **arrays)
+        os.replace(temporary, target)
+        return Segment(number=number, **arrays)
+
+    def _merge(self, stored: Dict[str, Dict[str, Any]]) -> int:
+        """Apply the merge policy; returns the number of merges."""
+        merges = 0
+        while self._segments:
+            live = _live_filings(self._segments, stored)
+            live_docs = [int(m[s.doc_filing].sum()) for s, m in zip(self._segments, live)]
+            dirty = next((
+                i for i, s in enumerate(self._segments)
+                if (len(live[i]) and not live[i].any())
+                or s.doc_count - live_docs[i] > MAX_DEAD_SHARE * s.doc_count
+            ), None)
+            if dirty is not None:
+                first = last = dirty
+            elif len(self._segments) > 1 and live_docs[-2] < MERGE_RATIO * max(live_docs[-1], 1):
+                first, last = len(self._segments) - 2, len(self._segments) - 1
+            else:
+                break
+            merging = self._segments[first:last + 1]
+            # The merged segment takes the newest number, so a crash before the
+            # old files are removed leaves only stale copies behind
+            arrays = merge_segments(merging, live[first:last + 1])
+            if len(arrays["filing_accession"]):
+                replaced, kept = merging[:-1], [self._write(merging[-1].number, arrays)]
+            else:
+                replaced, kept = merging, []
+            for segment in replaced:
+                (self.directory / f"seg_{segment.number:06d}.npz").unlink(missing_ok=True)
+            self._segments[first:last + 1] = kept
+            merges += 1
+        return merges
+
+    def reload(self, force: bool = False) -> None:
+        """Read the segment files again if the filings or the index changed."""
+        with self._lock:
+            if not (self._stale or force):
+                return
+            self._stale = False
+            self._segments = self._load()
+            self._snapshot = _build_snapshot(self._segments, _live_filings(self._segments, _stored_filings()))
+
+    def _index_pending(self) -> Tuple[int, int]:
+        """Index and merge under the write lock; returns (filings indexed, merges)."""
+        self._segments = self._load()
+        stored = _stored_filings()
+        live = _live_filings(self._segments, stored)
+        indexed = {a for s, m in zip(self._segments, live) for a in s.filing_accession[m].tolist()}
+        pending = [row for accession, row in stored.items() if accession not in indexed]
+        merges = 0
+        for i in range(0, len(pending), INDEX_BATCH_FILINGS):
+            number = self._segments[-1].number + 1 if self._segments else 1
+            self._segments.append(self._write(number, index_filings(pending[i:i + INDEX_BATCH_FILINGS])))
+            merges += self._merge(stored)
+        merges += self._merge(stored)
+        self._snapshot = _build_snapshot(self._segments, _live_filings(self._segments, stored))
+        self._stale = False
+        return len(pending), merges
+
+    def _publish(self, indexed: int) -> None:
+        """Tell app processes to reload the segments."""
+        mark_table_changed(INDEX_TABLE)
+        logger.info(f"Indexed {indexed} filings; {len(self._segments)} index segments")
+
+    def update(self) -> int:
+        """
+        Index filings added or re-stored since the last update (writers only).
+
+        Returns:
+            Number of filings indexed
+        """
+        with self._write_lock():
+            indexed, merges = self._index_pending()
+        if indexed or merges:
+            self._publish(indexed)
+        return indexed
+
+    def rebuild(self) -> int:
+        """Drop the index files and index every stored filing again (writers only)."""
+        with self._write_lock():
+            for _, path in self._segment_paths():
+                path.unlink()
+            indexed, _ = self._index_pending()
+        self._publish(indexed)
+        return indexed
+
+    def stats(self) -> Dict[str, int]:
+        """Segments, live sections and filings of the current snapshot."""
+        snapshot = self._snapshot
+        return {
+            "segments": len(snapshot.segments),
+            "sections": snapshot.live_count,
+            "filings": len(np.unique(snapshot.doc_filing[snapshot.doc_live])),
+        }
+
+    def search(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Sequence[str]]] = None,
+        limit: int = 10
+    ) -> SearchResults:
+        """
+        Rank filing sections against a query.
+
+        Sections containing any query term match. Facet counts for a field
+        apply the filters of the other fields, so each facet lists the values
+        its own filter can switch to.
+
+        Args:
+            query: Search text
+            filters: Facet field -> accepted values (as listed in the facets)
+            limit: Maximum number of hits
+
+        Returns:
+            SearchResults with the top hits (with snippets) and facet counts
+        """
+        started = time.perf_counter()
+        self.reload()
+        snapshot = self._snapshot
+        terms = list(dict.fromkeys(tokenize(query)))
+
+        scores = np.zeros(len(snapshot.doc_live))
+        for term in terms:
+            found = [segment.postings(term) for segment in snapshot.segments]
+            docs = _concat([d + base for (d, _), base in zip(found, snapshot.doc_bases)], np.int64)
+            tfs = _concat([t for _, t in found], np.int32).astype(np.float64)
+            live = snapshot.doc_live[docs]
+            docs, tfs = docs[live], tfs[live]
+            if not len(docs):
+                continue
+            idf = math.log(1 + (snapshot.live_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * snapshot.doc_length[docs] / snapshot.avg_length)
+            scores[docs] += idf * tfs * (BM25_K1 + 1) / (tfs + norm)
+        matched = scores > 0
+
+        masks = {}
+        for field, values in (filters or {}).items():
+            if field in FACET_FIELDS and values:
+                codes = np.flatnonzero(np.isin(snapshot.facet_labels[field], list(values)))
+                masks[field] = np.isin(snapshot.facet_codes[field], codes)[snapshot.doc_filing]
+
+        facets = {}
+        for field in FACET_FIELDS:
+            mask = matched.copy()
+            for other, other_mask in masks.items():
+                if other != field:
+                    mask &= other_mask
+            filings = np.unique(snapshot.doc_filing[mask])
+            counts = np.bincount(snapshot.facet_codes[field][filings], minlength=len(snapshot.facet_labels[field]))
+            order = np.lexsort((snapshot.facet_labels[field], -counts))
+            facets[field] = [(str(snapshot.facet_labels[field][i]), int(counts[i])) for i in order if counts[i]]
+
+        for mask in masks.values():
+            matched &= mask
+        candidates = np.flatnonzero(matched)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit)[:limit]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        hits = []
+        for doc in candidates.tolist():
+            segment_index = int(np.searchsorted(snapshot.doc_bases, doc, side="right")) - 1
+            segment = snapshot.segments[segment_index]
+            local = doc - int(snapshot.doc_bases[segment_index])
+            filing = int(segment.doc_filing[local])
+            accession = str(segment.filing_accession[filing])
+            seq = int(segment.doc_seq[local])
+            hits.append(FilingSearchHit(
+                accession_number=accession,
+                ticker=str(segment.filing_ticker[filing]),
+                form_type=str(segment.filing_form[filing]),
+                filing_date=segment.filing_date[filing].item(),
+                seq=seq,
+                label=str(segment.doc_label[local]),
+                score=float(scores[doc]),
+                snippet=make_snippet(load_section(accession, seq) or "", terms),
+            ))
+        return SearchResults(
+            hits=hits,
+            total=len(np.flatnonzero(matched)),
+            filing_count=len(np.unique(snapshot.doc_filing[matched])),
+            facets=facets,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+
+
+# Global search index over the filing store
+filing_index = FilingSearchIndex(Path(config.filing_store_path) / INDEX_DIR)
+
+
+def _on_table_changed(table: str, **_) -> None:
+    if table in (FILINGS_TABLE, INDEX_TABLE):
+        filing_index.invalidate()
+
+
+event_bus.subscribe(TABLE_CHANGED, _on_table_changed)
+
+
+def search_filings(
+    query: str,
+    filters: Optional[Dict[str, Sequence[str]]] = None,
+    limit: int = 10
+) -> SearchResults:
+    """Search the stored filings (see FilingSearchIndex.search)."""
+    return filing_index.search(query, filters, limit)
+
+
+def main(argv: List[str]) -> int:
+    """CLI entry point: update the search index and run a query."""
+    parser = argparse.ArgumentParser(description="Search the SEC filing store")
+    parser.add_argument("query", nargs="?", help="Search text (omit to only update the index)")
+    parser.add_argument("--company", action="append", help="Only this ticker (repeatable)")
+    parser.add_argument("--form", action="append", help="Only this form type (repeatable)")
+    parser.add_argument("--year", action="append", help="Only this filing year (repeatable)")
+    parser.add_argument("--quarter", action="append", help="Only this filing quarter, e.g. Q1 (repeatable)")
+    parser.add_argument("--limit", type=int, default=10, help="Number of hits (default 10)")
+    parser.add_argument("--rebuild", action="store_true", help="Re-index every filing")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    init_database()
+    if args.rebuild:
+        filing_index.rebuild()
+    else:
+        filing_index.update()
+    print(filing_index.stats())
+    if not args.query:
+        return 0
+
+    filters = {"company": args.company, "form_type": args.form, "year": args.year, "quarter": args.quarter}
+    results = filing_index.search(args.query, filters, args.limit)
+    print(f"{results.total} sections in {results.filing_count} filings ({results.elapsed_ms:.1f} ms)")
+    for hit in results.hits:
+        print(f"{hit.score:7.2f}  {hit.ticker} {hit.form_type} {hit.formatted_date}  {hit.label}")
+        print(f"         {hit.snippet}")
+    for field, counts in results.facets.items():
+        print(f"{field}: " + ", ".join(f"{value} ({count})" for value, count in counts[:10]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,543 @@
+"""
+SEC filing store: compressed texts on disk, section index in the database.
+
+A 10-K is 300-800 KB of text, but a reader looks at one Item at a time. At
+ingest each filing is split into its Parts/Items (split_sections), every
+section is zlib-compressed on its own and the blocks are written back to
+back into one file per filing under FILING_STORE_PATH:
+
+    <FILING_STORE_PATH>/<TICKER>/<accession_number>.<stored_at>.zsec
+
+Re-storing a filing writes a new file and switches the filing row and its
+section rows to it in one transaction before the old file is removed, so
+readers never combine offsets of one version with the bytes of another.
+
+The database keeps the filing metadata and, per section, its label and the
+byte offset and length of its block:
+
+    coreiq_sec_filings         (accession_number, ticker, form_type, filing_date,
+                                title, file_path, size, stored_size, section_count, ...)
+    coreiq_sec_filing_sections (accession_number, seq, section_key, part, label,
+                                byte_offset, byte_length, text_size)
+
+The viewer reads the table of contents (get_sections) and then only the
+block of the section being shown (load_section: one seek, one read, one
+decompress), so opening a filing costs a few KB instead of the whole text.
+
+Add filings (plain text or HTML) with:
+
+    cd app && python -m data.filing_store M 10-K 2025-03-21 0000794367-25-000012 macys-10k.htm
+"""
+import argparse
+import logging
+import os
+import re
+import sys
+import zlib
+from datetime import date, datetime, timezone
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from core.cache import cached
+from core.config import config
+from core.database import db_manager, init_database
+from data.ingest import mark_table_changed
+from data.models import FilingDocument, FilingSection
+
+logger = logging.getLogger(__name__)
+
+FILINGS_TABLE = "coreiq_sec_filings"
+SECTIONS_TABLE = "coreiq_sec_filing_sections"
+
+# Sections longer than this are split into pages at paragraph breaks (bytes)
+MAX_SECTION_BYTES = 64 * 1024
+
+# Headings followed by less text than this whose Item appears again later
+# are table-of-contents entries, not sections (characters)
+MIN_SECTION_CHARS = 300
+
+COMPRESSION_LEVEL = 6
+
+_SCHEMA = [
+    f"""CREATE TABLE IF NOT EXISTS {FILINGS_TABLE} (
+        accession_number VARCHAR(32) NOT NULL PRIMARY KEY,
+        ticker VARCHAR(16) NOT NULL,
+        cik VARCHAR(16),
+        form_type VARCHAR(16) NOT NULL,
+        filing_date DATE NOT NULL,
+        title VARCHAR(255) NOT NULL,
+        source_url VARCHAR(512),
+        file_path VARCHAR(255) NOT NULL,
+        size BIGINT NOT NULL,
+        stored_size BIGINT NOT NULL,
+        section_count INT NOT NULL,
+        stored_at DATETIME NOT NULL
+    )""",
+    f"""CREATE TABLE IF NOT EXISTS {SECTIONS_TABLE} (
+        accession_number VARCHAR(32) NOT NULL,
+        seq INT NOT NULL,
+        section_key VARCHAR(32) NOT NULL,
+        part VARCHAR(16),
+        label VARCHAR(255) NOT NULL,
+        byte_offset BIGINT NOT NULL,
+        byte_length BIGINT NOT NULL,
+        text_size BIGINT NOT NULL,
+        PRIMARY KEY (accession_number, seq)
+    )""",
+]
+
+# Secondary indexes: (name, table, columns)
+_INDEXES = [
+    ("idx_sec_filings_ticker_date", FILINGS_TABLE, "ticker, filing_date"),
+]
+
+# Titles of 10-K Items, used when a 10-K heading carries no title of its own
+ITEM_TITLES = {
+    "1": "Business", "1A": "Risk Factors", "1B": "Unresolved Staff Comments",
+    "1C": "Cybersecurity", "2": "Properties", "3": "Legal Proceedings",
+    "4": "Mine Safety Disclosures", "5": "Market for Registrant's Common Equity",
+    "6": "[Reserved]", "7": "Management's Discussion and Analysis",
+    "7A": "Quantitative and Qualitative Disclosures About Market Risk",
+    "8": "Financial Statements and Supplementary Data",
+    "9": "Changes in and Disagreements with Accountants",
+    "9A": "Controls and Procedures", "9B": "Other Information",
+    "9C": "Disclosure Regarding Foreign Jurisdictions that Prevent Inspections",
+    "10": "Directors, Executive Officers and Corporate Governance",
+    "11": "Executive Compensation", "12": "Security Ownership",
+    "13": "Certain Relationships and Related Transactions",
+    "14": "Principal Accountant Fees and Services",
+    "15": "Exhibits and Financial Statement Schedules", "16": "Form 10-K Summary",
+}
+
+# "PART II" or "Item 7A." / "ITEM 2.02" at the start of a line, then the title
+_HEADING_RE = re.compile(
+    r"^[ \t]*(?:PART[ \t]+(?P<part>IV|I{1,3})\b|ITEM[ \t]+(?P<item>\d{1,2}(?:\.\d{2})?[A-C]?)\b)"
+    r"[ \t]*[.:—–-]?[ \t]*(?P<title>[^\n]*)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Trailing dot leaders and page numbers of table-of-contents lines
+_TITLE_TAIL_RE = re.compile(r"[\s.…]*\d*\s*$")
+
+
+class Section(NamedTuple):
+    """A section of filing text produced by split_sections."""
+    key: str
+    part: Optional[str]
+    label: str
+    text: str
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the visible text of an HTML filing, one line per block element."""
+
+    _BLOCKS = {"p", "div", "br", "tr", "li", "table", "h1", "h2", "h3", "h4", "h5", "h6"}
+    _SKIPPED = {"script", "style", "head"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIPPED:
+            self._skip_depth += 1
+        elif tag in self._BLOCKS:
+            self.parts.append("\n")
+        elif tag == "td":
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIPPED:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag in self._BLOCKS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def html_to_text(markup: str) -> str:
+    """Visible text of an HTML document with block elements on their own lines."""
+    extractor = _TextExtractor()
+    extractor.feed(markup)
+    extractor.close()
+    text = "".join(extractor.parts).replace("\xa0", " ")
+    lines = (re.sub(r"[ \t]+", " ", line).strip() for line in text.splitlines())
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def _paginate(section: Section) -> List[Section]:
+    """Split a section over MAX_SECTION_BYTES into pages at paragraph breaks."""
+    if len(section.text.encode()) <= MAX_SECTION_BYTES:
+        return [section]
+    pages: List[str] = []
+    current: List[str] = []
+    current_size = 0
+    for paragraph in section.text.split("\n\n"):
+        size = len(paragraph.encode()) + 2
+        if current and current_size + size > MAX_SECTION_BYTES:
+            pages.append("\n\n".join(current))
+            current, current_size = [], 0
+        current.append(paragraph)
+        current_size += size
+    pages.append("\n\n".join(current))
+    if len(pages) == 1:
+        return [section]
+    return [
+        Section(f"{section.key}_p{i}", section.part, f"{section.label} ({i}/{len(pages)})", page)
+        for i, page in enumerate(pages, start=1)
+    ]
+
+
+def _recase(title: str) -> str:
+    """Capitalize the words of an all-caps heading title, keeping acronyms like MD&A."""
+    if not title.isupper():
+        return title
+    return " ".join(
+        word.capitalize() if re.fullmatch(r"[A-Z']+", word) else word
+        for word in title.split()
+    )
+
+
+def _section_key(part: Optional[str], number: str) -> str:
+    """Section key, e.g. "part_ii_item_1a" ("item_1a" outside any Part)."""
+    key = "item_" + number.lower().replace(".", "_")
+    return f"{part.lower().replace(' ', '_')}_{key}" if part else key
+
+
+def split_sections(text: str, form_type: Optional[str] = None) -> List[Section]:
+    """
+    Split filing text into its Parts/Items.
+
+    The text before the first Item (cover page and table of contents) is
+    the "cover" section. A PART heading starts the Item that follows it.
+    Table-of-contents lines are recognised as Item headings followed by
+    little text whose Item appears again later (in the same Part), and
+    stay in the cover.
+
+    Item labels keep the heading's own title. Only 10-K Items whose heading
+    has no title are named from ITEM_TITLES; other forms number their Items
+    differently (a 10-Q's Item 2 is MD&A).
+
+    Args:
+        text: Filing text
+        form_type: e.g. "10-K" or "10-Q"
+
+    Returns:
+        Sections in document order (a single "document" section when the
+        text has no Item headings)
+    """
+    headings = []
+    part, part_start = None, None
+    for match in _HEADING_RE.finditer(text):
+        if match.group("part"):
+            part, part_start = f"Part {match.group('part').upper()}", match.start()
+            continue
+        number = match.group("item").upper()
+        title = _TITLE_TAIL_RE.sub("", match.group("title")).strip()[:200]
+        headings.append((part_start if part_start is not None else match.start(), number, part, title))
+        part_start = None
+
+    # Drop table-of-contents entries
+    kept = []
+    for i, (start, number, heading_part, title) in enumerate(headings):
+        end = headings[i + 1][0] if i + 1 < len(headings) else len(text)
+        repeated = any(
+            later[1] == number and (later[2] == heading_part or None in (later[2], heading_part))
+            for later in headings[i + 1:]
+        )
+        if repeated and end - start < MIN_SECTION_CHARS:
+            continue
+        kept.append((start, number, heading_part, title))
+
+    if not kept:
+        return _paginate(Section("document", None, "Full Document", text.strip()))
+
+    is_10k = (form_type or "").upper().startswith("10-K")
+    sections = []
+    cover = text[:kept[0][0]].strip()
+    if cover:
+        sections.append(Section("cover", None, "Cover Page", cover))
+    for i, (start, number, heading_part, title) in enumerate(kept):
+        end = kept[i + 1][0] if i + 1 < len(kept) else len(text)
+        title = _recase(title) or (ITEM_TITLES.get(number, "") if is_10k else "")
+        label = f"Item {number}. {title}" if title else f"Item {number}"
+        key = _section_key(heading_part, number)
+        sections.extend(_paginate(Section(key, heading_part, label, text[start:end].strip())))
+    return sections
+
+
+def ensure_tables() -> None:
+    """Create the filing tables and their indexes if they are missing."""
+    for statement in _SCHEMA:
+        db_manager.execute_statement(statement)
+    for name, table, columns in _INDEXES:
+        if not db_manager.index_exists(table, name):
+            db_manager.execute_statement(f"CREATE INDEX {name} ON {table} ({columns})")
+
+
+def filing_tables_exist() -> bool:
+    """Whether the filing store tables have been created (see ensure_tables)."""
+    return db_manager.table_exists(FILINGS_TABLE) and db_manager.table_exists(SECTIONS_TABLE)
+
+
+def _store_root() -> Path:
+    return Path(config.filing_store_path)
+
+
+def _relative_path(ticker: str, accession_number: str, stored_at: datetime) -> str:
+    safe = re.sub(r"[^0-9A-Za-z-]", "_", accession_number)
+    version = stored_at.strftime("%Y%m%d%H%M%S%f")
+    return f"{re.sub(r'[^0-9A-Za-z.-]', '_', ticker.upper())}/{safe}.{version}.zsec"
+
+
+def store_filing(
+    ticker: str,
+    accession_number: str,
+    form_type: str,
+    filing_date: date,
+    text: str,
+    title: Optional[str] = None,
+    cik: Optional[str] = None,
+    source_url: Optional[str] = None
+) -> FilingDocument:
+    """
+    Split, compress and index a filing (replacing a previous copy).
+
+    Args:
+        ticker: Company ticker
+        accession_number: SEC accession number (identifies the filing)
+        form_type: e.g. "10-K"
+        filing_date: Date filed
+        text: Full filing text (see html_to_text for HTML filings)
+        title: Display title (defaults to the form's name)
+        cik: Company CIK
+        source_url: Original document URL
+
+    Returns:
+        The stored filing
+    """
+    ensure_tables()
+    sections = split_sections(text, form_type)
+
+    stored_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    previous = _query_file_path(accession_number)
+    relative = _relative_path(ticker, accession_number, stored_at)
+    target = _store_root() / relative
+    target.parent.mkdir(parents=True, exist_ok=True)
+    rows: List[Dict[str, Any]] = []
+    offset = 0
+    temporary = target.with_suffix(".tmp")
+    with open(temporary, "wb") as out:
+        for seq, section in enumerate(sections):
+            raw = section.text.encode()
+            block = zlib.compress(raw, COMPRESSION_LEVEL)
+            out.write(block)
+            rows.append({
+                "accession_number": accession_number,
+                "seq": seq,
+                "section_key": section.key,
+                "part": section.part,
+                "label": section.label[:255],
+                "byte_offset": offset,
+                "byte_length": len(block),
+                "text_size": len(raw),
+            })
+            offset += len(block)
+    os.replace(temporary, target)
+
+    filing = FilingDocument(
+        accession_number=accession_number,
+        ticker=ticker.upper(),
+        form_type=form_type,
+        filing_date=filing_date,
+        title=title or f"{form_type} Filing",
+        size=sum(row["text_size"] for row in rows),
+        stored_size=offset,
+        section_count=len(rows),
+        source_url=source_url,
+    )
+    filing_row = {
+        "accession_number": accession_number,
+        "ticker": filing.ticker,
+        "cik": cik,
+        "form_type": form_type,
+        "filing_date": filing_date,
+        "title": filing.title,
+        "source_url": source_url,
+        "file_path": relative,
+        "size": filing.size,
+        "stored_size": filing.stored_size,
+        "section_count": filing.section_count,
+        "stored_at": stored_at,
+    }
+    try:
+        db_manager.execute_transaction([
+            (f"DELETE FROM {SECTIONS_TABLE} WHERE accession_number = :accession_number",
+             {"accession_number": accession_number}),
+            (f"INSERT INTO {SECTIONS_TABLE} "
+             "(accession_number, seq, section_key, part, label, byte_offset, byte_length, text_size) "
+             "VALUES (:accession_number, :seq, :section_key, :part, :label, :byte_offset, :byte_length, :text_size)",
+             rows),
+            (db_manager.dialect.upsert(FILINGS_TABLE, list(filing_row), ["accession_number"]), filing_row),
+        ])
+    except Exception:
+        target.unlink(missing_ok=True)
+        raise
+    if previous and previous != relative:
+        (_store_root() / previous).unlink(missing_ok=True)
+    mark_table_changed(FILINGS_TABLE)
+    logger.info(
+        f"Stored {form_type} {accession_number} for {filing.ticker}: "
+        f"{len(rows)} sections, {filing.size:,} -> {filing.stored_size:,} bytes"
+    )
+    return filing
+
+
+def _to_filing(row: Dict[str, Any]) -> FilingDocument:
+    filing_date = row["filing_date"]
+    if not isinstance(filing_date, date):
+        filing_date = date.fromisoformat(str(filing_date)[:10])
+    return FilingDocument(
+        accession_number=row["accession_number"],
+        ticker=row["ticker"],
+        form_type=row["form_type"],
+        filing_date=filing_date,
+        title=row["title"],
+        size=row["size"],
+        stored_size=row["stored_size"],
+        section_count=row["section_count"],
+        source_url=row["source_url"],
+    )
+
+
+_FILING_COLUMNS = (
+    "accession_number, ticker, form_type, filing_date, title, "
+    "size, stored_size, section_count, source_url"
+)
+
+
+@cached("sec_filings", tables=(FILINGS_TABLE,))
+def get_filings(ticker: str) -> List[FilingDocument]:
+    """Stored filings of a company, newest first (empty if the store is not set up)."""
+    if not filing_tables_exist():
+        return []
+    rows = db_manager.execute_query(f"""
+        SELECT {_FILING_COLUMNS}
+        FROM {FILINGS_TABLE}
+        WHERE ticker = :ticker
+        ORDER BY filing_date DESC, accession_number
+    """, {"ticker": ticker.upper()})
+    return [_to_filing(row) for row in rows]
+
+
+def _query_sections(accession_number: str) -> List[FilingSection]:
+    rows = db_manager.execute_query(f"""
+        SELECT seq, section_key, part, label, byte_offset, byte_length, text_size
+        FROM {SECTIONS_TABLE}
+        WHERE accession_number = :accession_number
+        ORDER BY seq
+    """, {"accession_number": accession_number})
+    return [FilingSection(
+        seq=row["seq"],
+        key=row["section_key"],
+        part=row["part"],
+        label=row["label"],
+        offset=row["byte_offset"],
+        length=row["byte_length"],
+        size=row["text_size"],
+    ) for row in rows]
+
+
+@cached("sec_filing_sections", tables=(FILINGS_TABLE,))
+def get_sections(accession_number: str) -> List[FilingSection]:
+    """Table of contents of a stored filing (no text is read)."""
+    return _query_sections(accession_number)
+
+
+def _query_file_path(accession_number: str) -> Optional[str]:
+    return db_manager.execute_scalar(
+        f"SELECT file_path FROM {FILINGS_TABLE} WHERE accession_number = :accession_number",
+        {"accession_number": accession_number},
+    )
+
+
+@cached("sec_filing_path", tables=(FILINGS_TABLE,))
+def _filing_path(accession_number: str) -> Optional[str]:
+    return _query_file_path(accession_number)
+
+
+@cached("sec_filing_section_text", tables=(FILINGS_TABLE,))
+def load_section(accession_number: str, seq: int) -> Optional[str]:
+    """
+    Text of one section, read and decompressed from its block alone.
+
+    Returns:
+        The section text, or None if the filing or section is unknown
+    """
+    try:
+        return _read_section(get_sections(accession_number), _filing_path(accession_number), seq)
+    except FileNotFoundError:
+        # Re-stored by another process since the cached index was read; the
+        # old file is gone, so read the current index directly
+        return _read_section(_query_sections(accession_number), _query_file_path(accession_number), seq)
+
+
+def _read_section(sections: List[FilingSection], relative: Optional[str], seq: int) -> Optional[str]:
+    section = next((s for s in sections if s.seq == seq), None)
+    if section is None or relative is None:
+        return None
+    with open(_store_root() / relative, "rb") as source:
+        source.seek(section.offset)
+        block = source.read(section.length)
+    return zlib.decompress(block).decode()
+
+
+def read_sections(accession_number: str) -> Iterator[Tuple[FilingSection, str]]:
+    """
+    Every section of a stored filing with its text, in one pass over its file.
+
+    Nothing is cached; meant for bulk readers such as the search indexer.
+    """
+    relative = _query_file_path(accession_number)
+    if relative is None:
+        return
+    with open(_store_root() / relative, "rb") as source:
+        for section in _query_sections(accession_number):
+            source.seek(section.offset)
+            yield section, zlib.decompress(source.read(section.length)).decode()
+
+
+def main(argv: List[str]) -> int:
+    """CLI entry point: add a filing document to the store and the search index."""
+    parser = argparse.ArgumentParser(description="Add an SEC filing (text or HTML) to the filing store")
+    parser.add_argument("ticker", help="Company ticker")
+    parser.add_argument("form_type", help="Form type, e.g. 10-K")
+    parser.add_argument("filing_date", type=date.fromisoformat, help="Filing date (YYYY-MM-DD)")
+    parser.add_argument("accession_number", help="SEC accession number")
+    parser.add_argument("path", type=Path, help="Filing document (.txt, .htm or .html)")
+    parser.add_argument("--title", help="Display title (default: '<form type> Filing')")
+    parser.add_argument("--cik", help="Company CIK")
+    parser.add_argument("--source-url", help="URL of the original document")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    init_database()
+    content = args.path.read_text(encoding="utf-8", errors="replace")
+    if args.path.suffix.lower() in (".htm", ".html", ".xhtml"):
+        content = html_to_text(content)
+    store_filing(
+        args.ticker, args.accession_number, args.form_type, args.filing_date, content,
+        title=args.title, cik=args.cik, source_url=args.source_url,
+    )
+    # Imported here: data.filing_search imports this module
+    from data.filing_search import filing_index
+    filing_index.update()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
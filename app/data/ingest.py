@@ -0,0 +1,330 @@
+"""
+Incremental ingestion of coreiq table dumps and deltas.
+
+Each table has a high-water mark (the largest data_inserted_at /
+fetched_at_utc value loaded so far) kept in coreiq_ingest_watermarks. A run
+only upserts rows newer than the mark (plus rows stamped with the mark
+itself that were not loaded yet), in short executemany batches that
+each commit on their own, so a delta touches a few rows instead of
+reloading (and locking) the whole table. After a table changes its version
+is bumped and TABLE_CHANGED is published; app processes pick the new
+version up through core.database.change_watcher and drop the affected
+cache entries. Tables with a row hook also refresh their derived tables
+from the upserted rows (normalized news sentiment, latest company overview).
+
+Usage:
+    cd app
+    python -m data.ingest ../sql/coreiq_companies_*.sql
+    python -m data.ingest --full --batch-size 5000 ../sql/*.sql
+"""
+import argparse
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from core.config import config
+from core.database import WATERMARK_TABLE, db_manager, init_database
+from core.events import TABLE_CHANGED, event_bus
+from data.latest_overview import OVERVIEW_TABLE, refresh_rows
+from data.mysql_dump import InsertBatch, ensure_table, parse_dump
+from data.news_normalize import NEWS_TABLE, normalize_articles, ensure_tables as ensure_news_tables
+
+logger = logging.getLogger(__name__)
+
+# Rows per executemany call (one transaction each)
+DEFAULT_BATCH_SIZE = 1000
+
+# Change-tracking columns, in order of preference
+WATERMARK_COLUMNS = ("data_inserted_at", "fetched_at_utc")
+
+# Row identity for tables not keyed by their `id` column
+TABLE_KEYS: Dict[str, Tuple[str, ...]] = {
+    "coreiq_av_forex_daily": ("from_currency", "to_currency", "day_date"),
+}
+
+# Called with each upserted chunk of rows to maintain derived tables
+ROW_HOOKS: Dict[str, Callable[[List[Dict[str, Any]]], int]] = {
+    NEWS_TABLE: normalize_articles,
+    OVERVIEW_TABLE: refresh_rows,
+}
+
+# Called once per run, before a table's row hook first runs
+HOOK_SETUP: Dict[str, Callable[[], None]] = {
+    NEWS_TABLE: ensure_news_tables,
+}
+
+
+class IngestError(Exception):
+    """Raised when a dump cannot be applied to its target table."""
+    pass
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """How rows of a table are identified and change-tracked."""
+    name: str
+    key_columns: Tuple[str, ...]
+    watermark_column: Optional[str]
+
+
+@dataclass
+class IngestResult:
+    """Outcome of ingesting one table."""
+    table: str
+    rows_read: int = 0
+    rows_upserted: int = 0
+    high_water: Optional[str] = None
+    version: int = 0
+
+    @property
+    def rows_skipped(self) -> int:
+        return self.rows_read - self.rows_upserted
+
+
+def table_spec(table: str, columns: List[str]) -> TableSpec:
+    """Resolve the key and watermark columns of a table from its dump columns."""
+    key_columns = TABLE_KEYS.get(table, ("id",))
+    missing = [c for c in key_columns if c not in columns]
+    if missing:
+        raise IngestError(f"{table}: dump lacks key column(s) {', '.join(missing)}")
+    watermark = next((c for c in WATERMARK_COLUMNS if c in columns), None)
+    return TableSpec(table, key_columns, watermark)
+
+
+def _ensure_watermark_table() -> None:
+    """Create the watermark table on first use."""
+    db_manager.execute_statement(f"""
+        CREATE TABLE IF NOT EXISTS {WATERMARK_TABLE} (
+            table_name VARCHAR(128) PRIMARY KEY,
+            watermark_column VARCHAR(64),
+            high_water VARCHAR(32),
+            version BIGINT NOT NULL,
+            updated_at VARCHAR(19) NOT NULL
+        )
+    """)
+
+
+def _ensure_unique_key(spec: TableSpec) -> None:
+    """
+    Give embedded tables the unique index the upsert conflicts on.
+
+    MySQL tables already have their primary key; tables created from a dump
+    by mysql_dump/ensure_table do not.
+    """
+    if not config.database.is_embedded:
+        return
+    try:
+        db_manager.execute_statement(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{spec.name}_key "
+            f"ON {spec.name} ({', '.join(spec.key_columns)})"
+        )
+    except Exception as e:
+        raise IngestError(
+            f"{spec.name}: cannot index ({', '.join(spec.key_columns)}); "
+            f"remove duplicate rows first ({e})"
+        )
+
+
+def read_watermarks() -> Dict[str, Dict[str, Any]]:
+    """Return the stored watermark row of every ingested table."""
+    rows = db_manager.execute_query(
+        f"SELECT table_name, watermark_column, high_water, version FROM {WATERMARK_TABLE}"
+    )
+    return {row["table_name"]: row for row in rows}
+
+
+def _save_watermark(spec: TableSpec, high_water: Optional[str], version: int) -> None:
+    """Store a table's new high-water mark and version."""
+    columns = ["table_name", "watermark_column", "high_water", "version", "updated_at"]
+    db_manager.execute_statement(
+        db_manager.dialect.upsert(WATERMARK_TABLE, columns, ["table_name"]),
+        {
+            "table_name": spec.name,
+            "watermark_column": spec.watermark_column,
+            "high_water": high_water,
+            "version": version,
+            "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        },
+    )
+
+
+def _chunks(rows: List[Dict[str, Any]], size: int) -> Iterable[List[Dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _row_key(values: Iterable[Any]) -> Tuple[Optional[str], ...]:
+    """Compare dump and database key values as text (ids, dates, timestamps)."""
+    return tuple(None if v is None else str(v) for v in values)
+
+
+def _keys_at_high_water(spec: TableSpec, high_water: str) -> Set[Tuple[Optional[str], ...]]:
+    """Return the keys of the stored rows stamped with the high-water mark."""
+    rows = db_manager.execute_query(
+        f"SELECT {', '.join(spec.key_columns)} FROM {spec.name} "
+        f"WHERE {spec.watermark_column} = :high_water",
+        {"high_water": high_water},
+    )
+    return {_row_key(row[c] for c in spec.key_columns) for row in rows}
+
+
+def _changed_rows(
+    batch: InsertBatch,
+    spec: TableSpec,
+    high_water: Optional[str],
+    loaded: Set[Tuple[Optional[str], ...]]
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Select the rows of a batch not loaded yet.
+
+    A row is skipped when it is older than the high-water mark, or stamped
+    with the mark and its key is in `loaded` (several rows can share a
+    timestamp, and a run may have stopped between them). Rows without a
+    watermark value are always applied (the upsert is idempotent). Dump
+    timestamps are 'YYYY-MM-DD HH:MM:SS' strings, which order correctly
+    as text.
+
+    Returns:
+        Tuple of (changed rows as parameter dicts, largest watermark seen)
+    """
+    if spec.watermark_column is None:
+        return [dict(zip(batch.columns, row)) for row in batch.rows], None
+    index = batch.columns.index(spec.watermark_column)
+    key_indexes = [batch.columns.index(c) for c in spec.key_columns]
+    changed = []
+    newest = None
+    for row in batch.rows:
+        value = row[index]
+        if value is not None:
+            value = str(value)
+            newest = value if newest is None or value > newest else newest
+            if high_water is not None and value < high_water:
+                continue
+            if value == high_water and _row_key(row[i] for i in key_indexes) in loaded:
+                continue
+        changed.append(dict(zip(batch.columns, row)))
+    return changed, newest
+
+
+def ingest_batches(
+    batches: Iterable[InsertBatch],
+    full: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Dict[str, IngestResult]:
+    """
+    Upsert parsed dump rows that changed since the last run.
+
+    Args:
+        batches: Parsed INSERT statements
+        full: Ignore the high-water marks and upsert every row
+        batch_size: Rows per executemany transaction
+
+    Returns:
+        Mapping of table name to its IngestResult
+    """
+    _ensure_watermark_table()
+    watermarks = read_watermarks()
+    results: Dict[str, IngestResult] = {}
+    specs: Dict[str, TableSpec] = {}
+    loaded: Dict[str, Set[Tuple[Optional[str], ...]]] = {}
+
+    for batch in batches:
+        if not batch.rows:
+            continue
+        spec = specs.get(batch.table)
+        if spec is None:
+            spec = specs[batch.table] = table_spec(batch.table, batch.columns)
+            ensure_table(batch)
+            _ensure_unique_key(spec)
+            setup = HOOK_SETUP.get(spec.name)
+            if setup is not None:
+                setup()
+        stored = watermarks.get(spec.name, {})
+        result = results.setdefault(spec.name, IngestResult(
+            spec.name, high_water=stored.get("high_water"), version=stored.get("version") or 0
+        ))
+
+        high_water = stored.get("high_water")
+        if full or stored.get("watermark_column") != spec.watermark_column:
+            high_water = None
+        if high_water is not None and spec.name not in loaded:
+            loaded[spec.name] = _keys_at_high_water(spec, high_water)
+        rows, newest = _changed_rows(batch, spec, high_water, loaded.get(spec.name, set()))
+        query = db_manager.dialect.upsert(spec.name, batch.columns, spec.key_columns)
+        hook = ROW_HOOKS.get(spec.name)
+        for chunk in _chunks(rows, batch_size):
+            db_manager.execute_many(query, chunk)
+            if hook is not None:
+                hook(chunk)
+        result.rows_read += len(batch.rows)
+        result.rows_upserted += len(rows)
+        if newest is not None and (result.high_water is None or newest > result.high_water):
+            result.high_water = newest
+
+    for table, result in results.items():
+        if not result.rows_upserted:
+            continue
+        result.version += 1
+        _save_watermark(specs[table], result.high_water, result.version)
+        event_bus.publish(TABLE_CHANGED, table=table, version=result.version)
+    return results
+
+
+def mark_table_changed(table: str) -> int:
+    """
+    Bump a table's version and publish TABLE_CHANGED.
+
+    For writers outside ingest_batches (e.g. data.filing_store); app
+    processes drop the table's cache entries as after an ingest.
+
+    Returns:
+        The new version
+    """
+    _ensure_watermark_table()
+    stored = read_watermarks().get(table, {})
+    version = (stored.get("version") or 0) + 1
+    spec = TableSpec(table, (), stored.get("watermark_column"))
+    _save_watermark(spec, stored.get("high_water"), version)
+    event_bus.publish(TABLE_CHANGED, table=table, version=version)
+    return version
+
+
+def ingest_files(
+    paths: Iterable[Path],
+    full: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Dict[str, IngestResult]:
+    """Ingest one or more dump files as a single run (see ingest_batches)."""
+    def batches() -> Iterable[InsertBatch]:
+        for path in paths:
+            yield from parse_dump(path.read_text(encoding="utf-8"))
+    return ingest_batches(batches(), full=full, batch_size=batch_size)
+
+
+def main(argv: List[str]) -> int:
+    """CLI entry point: apply each dump or delta file given on the command line."""
+    parser = argparse.ArgumentParser(description="Incrementally load coreiq table dumps")
+    parser.add_argument("paths", nargs="+", type=Path, help="MySQL INSERT dump or delta files")
+    parser.add_argument("--full", action="store_true", help="Ignore high-water marks and upsert every row")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per transaction")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if args.batch_size < 1:
+        parser.error("--batch-size must be positive")
+
+    init_database()
+    results = ingest_files(args.paths, full=args.full, batch_size=args.batch_size)
+    for result in results.values():
+        logger.info(
+            f"{result.table}: {result.rows_upserted} upserted, {result.rows_skipped} unchanged "
+            f"(high water {result.high_water}, version {result.version})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,213 @@
+"""
+Latest company overview per ticker, materialized with typed columns.
+
+coreiq_av_company_overview keeps every fetch of a company's overview, and
+several displayed fields (revenue, EBITDA, 52-week range, ...) exist only
+inside its raw_json text. coreiq_av_company_overview_latest keeps one row
+per ticker - the newest fetch - with those raw_json fields extracted into
+typed columns, so profile pages and multi-company views read plain columns
+with no per-row json.loads and no ORDER BY ... LIMIT 1 per ticker.
+
+data.ingest refreshes the row of every ticker whose overview it upserts.
+Existing data is materialized once with:
+
+    cd app && python -m data.latest_overview
+"""
+import argparse
+import json
+import logging
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.database import db_manager, init_database
+from data.news_normalize import in_clause
+
+logger = logging.getLogger(__name__)
+
+OVERVIEW_TABLE = "coreiq_av_company_overview"
+LATEST_OVERVIEW_TABLE = "coreiq_av_company_overview_latest"
+
+# Tickers refreshed per transaction during a backfill
+BACKFILL_BATCH_SIZE = 500
+
+
+def to_float(value: Any) -> Optional[float]:
+    """Parse an overview number; NULL, 'None' and '-' become None."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_int(value: Any) -> Optional[int]:
+    """Parse an overview integer (may arrive as '123.0')."""
+    number = to_float(value)
+    return None if number is None else int(number)
+
+
+def to_text(value: Any) -> Optional[str]:
+    """Text value or None."""
+    return None if value is None else str(value)
+
+
+# Overview table columns copied to the latest table: (name, SQL type, parser)
+BASE_COLUMNS: List[Tuple[str, str, Callable[[Any], Any]]] = [
+    ("name", "VARCHAR(255)", to_text),
+    ("exchange", "VARCHAR(32)", to_text),
+    ("currency", "VARCHAR(8)", to_text),
+    ("country", "VARCHAR(64)", to_text),
+    ("sector", "VARCHAR(128)", to_text),
+    ("industry", "VARCHAR(255)", to_text),
+    ("company_description", "TEXT", to_text),
+    ("official_site", "VARCHAR(255)", to_text),
+    ("fiscal_year_end", "VARCHAR(16)", to_text),
+    ("cik", "VARCHAR(16)", to_text),
+    ("market_capitalization", "BIGINT", to_int),
+    ("pe_ratio", "DOUBLE", to_float),
+    ("eps", "DOUBLE", to_float),
+    ("dividend_yield", "DOUBLE", to_float),
+    ("analyst_target_price", "DOUBLE", to_float),
+    ("fetched_at_utc", "DATETIME", lambda value: value),
+]
+
+# raw_json fields stored as columns: (column, raw_json key, SQL type, parser)
+RAW_COLUMNS: List[Tuple[str, str, str, Callable[[Any], Any]]] = [
+    ("address", "Address", "VARCHAR(512)", to_text),
+    ("revenue_ttm", "RevenueTTM", "DOUBLE", to_float),
+    ("ebitda", "EBITDA", "DOUBLE", to_float),
+    ("profit_margin", "ProfitMargin", "DOUBLE", to_float),
+    ("operating_margin", "OperatingMarginTTM", "DOUBLE", to_float),
+    ("return_on_equity", "ReturnOnEquityTTM", "DOUBLE", to_float),
+    ("price_to_book", "PriceToBookRatio", "DOUBLE", to_float),
+    ("shares_outstanding", "SharesOutstanding", "BIGINT", to_int),
+    ("week_52_high", "52WeekHigh", "DOUBLE", to_float),
+    ("week_52_low", "52WeekLow", "DOUBLE", to_float),
+    ("dividend_per_share", "DividendPerShare", "DOUBLE", to_float),
+    ("latest_quarter", "LatestQuarter", "VARCHAR(10)", to_text),
+]
+
+LATEST_COLUMNS: List[str] = (
+    ["ticker"] + [c[0] for c in BASE_COLUMNS] + [c[0] for c in RAW_COLUMNS]
+)
+
+_SCHEMA = f"""CREATE TABLE IF NOT EXISTS {LATEST_OVERVIEW_TABLE} (
+    ticker VARCHAR(16) NOT NULL PRIMARY KEY,
+    {', '.join(f'{name} {sql_type}' for name, sql_type, _ in BASE_COLUMNS)},
+    {', '.join(f'{name} {sql_type}' for name, _, sql_type, _ in RAW_COLUMNS)}
+)"""
+
+
+def ensure_table() -> None:
+    """Create the latest-overview table if it is missing."""
+    db_manager.execute_statement(_SCHEMA)
+
+
+def latest_table_exists() -> bool:
+    """Whether the latest-overview table has been created (see ensure_table)."""
+    return db_manager.table_exists(LATEST_OVERVIEW_TABLE)
+
+
+def raw_fields(raw_json: Any) -> Dict[str, Any]:
+    """Typed RAW_COLUMNS values from an overview's raw_json text."""
+    raw: Dict[str, Any] = {}
+    if raw_json:
+        try:
+            decoded = json.loads(raw_json)
+            raw = decoded if isinstance(decoded, dict) else {}
+        except (json.JSONDecodeError, TypeError):
+            pass
+    return {column: parse(raw.get(key)) for column, key, _, parse in RAW_COLUMNS}
+
+
+def materialize(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an overview table row (with raw_json) to a latest-table row."""
+    latest = {"ticker": row["ticker"]}
+    for name, _, parse in BASE_COLUMNS:
+        latest[name] = parse(row.get(name))
+    latest.update(raw_fields(row.get("raw_json")))
+    return latest
+
+
+def latest_source_rows(tickers: Sequence[str]) -> List[Dict[str, Any]]:
+    """Newest overview table row (with raw_json) of each ticker."""
+    condition, params = in_clause("ticker", list(tickers))
+    columns = ", ".join(["ticker"] + [c[0] for c in BASE_COLUMNS] + ["raw_json"])
+    return db_manager.execute_query(f"""
+        SELECT {columns}
+        FROM (
+            SELECT o.*, ROW_NUMBER() OVER (
+                PARTITION BY ticker ORDER BY fetched_at_utc DESC
+            ) AS row_rank
+            FROM {OVERVIEW_TABLE} o
+            WHERE {condition}
+        ) ranked
+        WHERE row_rank = 1
+    """, params)
+
+
+def refresh_tickers(tickers: Sequence[str]) -> int:
+    """
+    Rebuild the latest-table rows of the given tickers from the overview table.
+
+    Returns:
+        Number of rows written
+    """
+    tickers = sorted({t for t in tickers if t})
+    if not tickers:
+        return 0
+    ensure_table()
+    rows = [materialize(row) for row in latest_source_rows(tickers)]
+    db_manager.execute_many(
+        db_manager.dialect.upsert(LATEST_OVERVIEW_TABLE, LATEST_COLUMNS, ["ticker"]),
+        rows,
+    )
+    return len(rows)
+
+
+def refresh_rows(rows: List[Dict[str, Any]]) -> int:
+    """Ingest hook: refresh the tickers of upserted overview rows."""
+    return refresh_tickers([row.get("ticker") for row in rows])
+
+
+def backfill(batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """
+    Materialize the latest overview of every ticker.
+
+    Returns:
+        Number of tickers processed
+    """
+    ensure_table()
+    processed = 0
+    last_ticker = None
+    while True:
+        query = f"SELECT DISTINCT ticker FROM {OVERVIEW_TABLE} WHERE ticker IS NOT NULL"
+        params: Dict[str, Any] = {"limit": batch_size}
+        if last_ticker is not None:
+            query += " AND ticker > :last_ticker"
+            params["last_ticker"] = last_ticker
+        tickers = [row["ticker"] for row in db_manager.execute_query(query + " ORDER BY ticker LIMIT :limit", params)]
+        if not tickers:
+            return processed
+        refresh_tickers(tickers)
+        processed += len(tickers)
+        last_ticker = tickers[-1]
+        logger.info(f"Materialized {processed} company overviews")
+
+
+def main(argv: List[str]) -> int:
+    """CLI entry point: backfill the latest-overview table."""
+    parser = argparse.ArgumentParser(description="Materialize the latest company overview per ticker")
+    parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE, help="Tickers per transaction")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    init_database()
+    count = backfill(args.batch_size)
+    logger.info(f"Backfilled {count} tickers into {LATEST_OVERVIEW_TABLE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
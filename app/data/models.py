@@ -1,21 +1,38 @@
 """
 Data models for Market Data and Newsroom pages.
+
+Row models are frozen, slotted dataclasses: repositories build hundreds to
+tens of thousands of them per query and the shared cache keeps them across
+sessions, so they carry no per-instance __dict__ and cannot be mutated in
+place by one caller under another. Price histories are PriceSeries:
+read-only NumPy columns rather than one object per bar.
 """
 from dataclasses import dataclass
 from datetime import date, datetime
+from enum import Enum
 from typing import Optional, List, Dict, Any
 
+import numpy as np
+import pandas as pd
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TickerSentiment:
     """Ticker sentiment data from news article."""
     ticker: str
-    relevance_score: str
+    relevance_score: float
     ticker_sentiment_label: str
-    ticker_sentiment_score: str
+    ticker_sentiment_score: float
+
+
+@dataclass(frozen=True, slots=True)
+class NewsTopic:
+    """Topic tagged on a news article."""
+    topic: str
+    relevance_score: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NewsArticle:
     """News article model from coreiq_av_market_news_sentiment table."""
     id: int
@@ -30,7 +47,7 @@ class NewsArticle:
     overall_sentiment_label: str
     banner_image: Optional[str]
     ticker_sentiment: List[TickerSentiment]
-    topics: List[Dict[str, str]]
+    topics: List[NewsTopic]
     category_within_source: str
     
     @property
@@ -44,13 +61,14 @@ class NewsArticle:
         return [ts.ticker for ts in self.ticker_sentiment]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Company:
     """Company model from coreiq_companies table."""
     ticker: str
     name: str
     name_coresight: Optional[str]
     exchange: Optional[str]
+    cik: Optional[str] = None
     
     @property
     def display_name(self) -> str:
@@ -60,7 +78,7 @@ class Company:
         return f"{name} ({exchange}:{self.ticker})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IncomeStatementLineItem:
     """Income statement line item for display."""
     label: str
@@ -69,30 +87,52 @@ class IncomeStatementLineItem:
     is_calculated: bool = False
 
 
-@dataclass
+class ReportPeriod(Enum):
+    """Reporting basis for financial statement views."""
+    ANNUAL = "annual"
+    QUARTERLY = "quarterly"
+    TTM = "ttm"
+    
+    @property
+    def report_type(self) -> str:
+        """report_type value stored in the statement tables (TTM is built from quarters)."""
+        return "annual" if self == ReportPeriod.ANNUAL else "quarterly"
+    
+    @property
+    def header(self) -> str:
+        """Column header prefix, e.g. '12 Months'."""
+        return {
+            ReportPeriod.ANNUAL: "12 Months",
+            ReportPeriod.QUARTERLY: "3 Months",
+            ReportPeriod.TTM: "LTM 12 Months",
+        }[self]
+
+
+@dataclass(frozen=True, slots=True)
 class FiscalPeriod:
     """Fiscal period for column headers."""
     date: date
     label: str
     
     @classmethod
-    def from_date(cls, dt: date) -> "FiscalPeriod":
+    def from_date(cls, dt: date, period: ReportPeriod = ReportPeriod.ANNUAL) -> "FiscalPeriod":
         """Create from date: '12 Months\nJan-29-2021'"""
         return cls(
             date=dt,
-            label=f"12 Months\n{dt.strftime('%b-%d-%Y')}"
+            label=f"{period.header}\n{dt.strftime('%b-%d-%Y')}"
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IncomeStatementData:
     """Complete income statement data for a company."""
     company: Company
     periods: List[FiscalPeriod]
     line_items: List[IncomeStatementLineItem]
+    period: ReportPeriod = ReportPeriod.ANNUAL
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompanyOverview:
     """Company overview data from coreiq_av_company_overview table."""
     ticker: str
@@ -162,7 +202,7 @@ class CompanyOverview:
         return cleaned
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BalanceSheetLineItem:
     """Balance sheet line item for display."""
     label: str
@@ -172,15 +212,16 @@ class BalanceSheetLineItem:
     section: str = ""  # 'assets', 'liabilities', 'equity'
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BalanceSheetData:
     """Complete balance sheet data for a company."""
     company: Company
     periods: List[FiscalPeriod]
     line_items: List[BalanceSheetLineItem]
+    period: ReportPeriod = ReportPeriod.ANNUAL
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CashFlowLineItem:
     """Cash flow statement line item for display."""
     label: str
@@ -190,15 +231,16 @@ class CashFlowLineItem:
     section: str = ""  # 'operating', 'investing', 'financing'
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CashFlowData:
     """Complete cash flow statement data for a company."""
     company: Company
     periods: List[FiscalPeriod]
     line_items: List[CashFlowLineItem]
+    period: ReportPeriod = ReportPeriod.ANNUAL
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EarningsCall:
     """Earnings call transcript model from coreiq_av_earnings_call_transcripts table."""
     id: int
@@ -287,3 +329,206 @@ class EarningsCall:
             })
         
         return sections
+
+
+@dataclass(frozen=True, slots=True)
+class MarketMetric:
+    """One OHLCV price bar (daily or intraday)."""
+    date: date
+    open_price: float
+    high_price: float
+    low_price: float
+    close_price: float
+    volume: int
+    adjusted_close: Optional[float] = None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PriceSeries:
+    """
+    Date-sorted OHLCV price history stored as columns.
+    
+    The series holds read-only views of the arrays it is given (the caller's
+    arrays stay writable, but must not be modified), so it can be shared
+    through the cache like the row models. Slicing returns views (no copy)
+    and between() finds a date range by binary search. Series compare by
+    identity; element-wise array equality has no single truth value.
+    """
+    dates: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    
+    def __post_init__(self):
+        for name in ("dates", "open", "high", "low", "close", "volume"):
+            values = np.asarray(getattr(self, name)).view()
+            if len(values) != len(self.dates):
+                raise ValueError("PriceSeries columns must have equal length")
+            values.flags.writeable = False
+            object.__setattr__(self, name, values)
+    
+    @classmethod
+    def from_arrays(
+        cls,
+        dates: Any,
+        open: Any,
+        high: Any,
+        low: Any,
+        close: Any,
+        volume: Any
+    ) -> "PriceSeries":
+        """Build a series from unsorted array-likes (copied and sorted by date)."""
+        dates = np.array(dates, dtype="datetime64[ns]")
+        order = np.argsort(dates, kind="stable")
+        return cls(
+            dates[order],
+            *(np.array(values, dtype=np.float64)[order] for values in (open, high, low, close, volume))
+        )
+    
+    @classmethod
+    def from_metrics(cls, metrics: List[MarketMetric]) -> "PriceSeries":
+        """Build a series from per-bar MarketMetric rows."""
+        return cls.from_arrays(
+            [np.datetime64(m.date, "ns") for m in metrics],
+            [m.open_price for m in metrics],
+            [m.high_price for m in metrics],
+            [m.low_price for m in metrics],
+            [m.close_price for m in metrics],
+            [m.volume for m in metrics],
+        )
+    
+    @classmethod
+    def empty(cls) -> "PriceSeries":
+        """Series without bars."""
+        return cls.from_arrays([], [], [], [], [], [])
+    
+    def __len__(self) -> int:
+        return len(self.dates)
+    
+    def __getitem__(self, index: slice) -> "PriceSeries":
+        if not isinstance(index, slice):
+            raise TypeError("PriceSeries supports slices only; use bar(i) for one bar")
+        return PriceSeries(
+            self.dates[index], self.open[index], self.high[index],
+            self.low[index], self.close[index], self.volume[index]
+        )
+    
+    def between(self, start: Optional[Any] = None, end: Optional[Any] = None) -> "PriceSeries":
+        """Bars dated within [start, end]; either bound may be None."""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, np.datetime64(start, "ns"), side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.dates, np.datetime64(end, "ns"), side="right"))
+        return self[lo:max(lo, hi)]
+    
+    def bar(self, index: int) -> MarketMetric:
+        """One bar as a MarketMetric."""
+        return MarketMetric(
+            date=self.dates[index].astype("datetime64[D]").item(),
+            open_price=float(self.open[index]),
+            high_price=float(self.high[index]),
+            low_price=float(self.low[index]),
+            close_price=float(self.close[index]),
+            volume=int(self.volume[index]),
+            adjusted_close=float(self.close[index]),
+        )
+    
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame with date, open, high, low, close and volume columns (no copy)."""
+        return pd.DataFrame({
+            "date": self.dates,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+        }, copy=False)
+
+
+class DataFrequency(Enum):
+    """Bar frequency of a price history."""
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    QUARTERLY = "quarterly"
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MarketData:
+    """Price history and valuation snapshot of one ticker."""
+    ticker: str
+    company_name: str
+    exchange: Optional[str]
+    currency: Optional[str]
+    prices: PriceSeries
+    market_cap: Optional[float] = None
+    pe_ratio: Optional[float] = None
+    
+    @property
+    def latest_price(self) -> Optional[float]:
+        """Close of the most recent bar."""
+        return float(self.prices.close[-1]) if len(self.prices) else None
+    
+    @property
+    def price_change(self) -> Optional[float]:
+        """Change of the latest close against the previous bar's close."""
+        if len(self.prices) < 2:
+            return None
+        return float(self.prices.close[-1] - self.prices.close[-2])
+    
+    @property
+    def price_change_percent(self) -> Optional[float]:
+        """price_change as a percentage of the previous close."""
+        change = self.price_change
+        if change is None or not self.prices.close[-2]:
+            return None
+        return change / float(self.prices.close[-2]) * 100
+
+
+@dataclass(frozen=True, slots=True)
+class FilingSection:
+    """One Part/Item of a stored filing and where its text sits in the filing file."""
+    seq: int
+    key: str            # e.g. "item_1a"; "cover" for the text before the first Item
+    part: Optional[str]  # e.g. "Part I"
+    label: str          # e.g. "Item 1A. Risk Factors"
+    offset: int         # Byte offset of the compressed section in the filing file
+    length: int         # Compressed size (bytes)
+    size: int           # Uncompressed text size (bytes)
+
+
+@dataclass(frozen=True, slots=True)
+class FilingDocument:
+    """SEC filing from the coreiq_sec_filings table (text kept in the filing store)."""
+    accession_number: str
+    ticker: str
+    form_type: str
+    filing_date: date
+    title: str
+    size: int           # Uncompressed text size (bytes)
+    stored_size: int    # Compressed file size (bytes)
+    section_count: int
+    source_url: Optional[str] = None
+    
+    @property
+    def formatted_date(self) -> str:
+        """Format: '2025-01-15'"""
+        return self.filing_date.isoformat()
+
+
+@dataclass(frozen=True, slots=True)
+class FilingSearchHit:
+    """A filing section matching a full-text search (see data.filing_search)."""
+    accession_number: str
+    ticker: str
+    form_type: str
+    filing_date: date
+    seq: int            # Section of the filing (see FilingSection.seq)
+    label: str          # Section label
+    score: float        # BM25 score
+    snippet: str        # HTML-escaped excerpt, query terms wrapped in <mark>
+    
+    @property
+    def formatted_date(self) -> str:
+        """Format: '2025-01-15'"""
+        return self.filing_date.isoformat()
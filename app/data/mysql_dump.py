@@ -0,0 +1,198 @@
+"""
+Loader for MySQL INSERT dumps (e.g. sql/coreiq_companies_*.sql).
+
+Parses multi-row INSERT statements without a MySQL server so the dumps can
+seed an embedded SQLite/DuckDB database for local runs, benchmarks and CI.
+Every row is inserted as-is; use data.ingest to apply dumps and deltas to a
+database that already holds the tables.
+
+Usage:
+    cd app
+    DB_BACKEND=sqlite DB_PATH=data/secfiling.db python -m data.mysql_dump ../sql/*.sql
+"""
+import logging
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from core.database import db_manager, init_database
+
+logger = logging.getLogger(__name__)
+
+_INSERT_RE = re.compile(
+    r"INSERT\s+INTO\s+`?(\w+)`?\s*\(([^)]*)\)\s*VALUES\s*",
+    re.IGNORECASE,
+)
+_NUMBER_RE = re.compile(r"-?\d+(\.\d+)?([eE][-+]?\d+)?")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(\.\d+)?$")
+_ESCAPES = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a"}
+
+
+class DumpParseError(Exception):
+    """Raised when a dump contains an INSERT statement that cannot be parsed."""
+    pass
+
+
+@dataclass
+class InsertBatch:
+    """Rows from a single INSERT statement."""
+    table: str
+    columns: List[str]
+    rows: List[Tuple[Any, ...]]
+
+
+def _parse_string(text: str, pos: int) -> Tuple[str, int]:
+    """Parse a single-quoted MySQL string literal starting at text[pos]."""
+    chars = []
+    pos += 1
+    while pos < len(text):
+        ch = text[pos]
+        if ch == "\\":
+            nxt = text[pos + 1]
+            chars.append(_ESCAPES.get(nxt, nxt))
+            pos += 2
+        elif ch == "'":
+            if text.startswith("''", pos):
+                chars.append("'")
+                pos += 2
+            else:
+                return "".join(chars), pos + 1
+        else:
+            chars.append(ch)
+            pos += 1
+    raise DumpParseError("Unterminated string literal")
+
+
+def _parse_values(text: str, pos: int) -> Tuple[List[Tuple[Any, ...]], int]:
+    """Parse the `(...), (...);` tuple list that follows VALUES."""
+    rows = []
+    row: Optional[List[Any]] = None
+    while pos < len(text):
+        ch = text[pos]
+        if ch.isspace() or ch == ",":
+            pos += 1
+        elif ch == "(":
+            row = []
+            pos += 1
+            while True:
+                while text[pos].isspace():
+                    pos += 1
+                ch = text[pos]
+                if ch == "'":
+                    value, pos = _parse_string(text, pos)
+                elif text.startswith("NULL", pos):
+                    value, pos = None, pos + 4
+                else:
+                    match = _NUMBER_RE.match(text, pos)
+                    if not match:
+                        raise DumpParseError(f"Unexpected token at offset {pos}: {text[pos:pos + 20]!r}")
+                    literal = match.group(0)
+                    value = float(literal) if match.group(1) or match.group(2) else int(literal)
+                    pos = match.end()
+                row.append(value)
+                while text[pos].isspace():
+                    pos += 1
+                if text[pos] == ",":
+                    pos += 1
+                elif text[pos] == ")":
+                    pos += 1
+                    rows.append(tuple(row))
+                    break
+                else:
+                    raise DumpParseError(f"Expected ',' or ')' at offset {pos}")
+        elif ch == ";":
+            return rows, pos + 1
+        else:
+            raise DumpParseError(f"Unexpected character {ch!r} at offset {pos}")
+    return rows, pos
+
+
+def parse_dump(text: str) -> Iterator[InsertBatch]:
+    """
+    Parse every INSERT statement in a MySQL dump.
+
+    Args:
+        text: Dump file contents
+
+    Yields:
+        InsertBatch per INSERT statement
+    """
+    pos = 0
+    while True:
+        match = _INSERT_RE.search(text, pos)
+        if not match:
+            return
+        columns = [c.strip().strip("`") for c in match.group(2).split(",")]
+        rows, pos = _parse_values(text, match.end())
+        yield InsertBatch(table=match.group(1), columns=columns, rows=rows)
+
+
+def _infer_column_type(values: List[Any]) -> str:
+    """Infer a portable SQL column type from parsed literal values."""
+    sample = [v for v in values if v is not None]
+    if not sample:
+        return "TEXT"
+    if all(isinstance(v, int) for v in sample):
+        return "BIGINT"
+    if all(isinstance(v, (int, float)) for v in sample):
+        return "DOUBLE"
+    if all(isinstance(v, str) and _DATE_RE.match(v) for v in sample):
+        return "DATE"
+    if all(isinstance(v, str) and _DATETIME_RE.match(v) for v in sample):
+        return "TIMESTAMP"
+    return "TEXT"
+
+
+def ensure_table(batch: InsertBatch) -> None:
+    """Create the target table from the batch's inferred types if it is missing."""
+    if db_manager.table_exists(batch.table):
+        return
+    column_defs = ", ".join(
+        f"{col} {_infer_column_type([row[i] for row in batch.rows])}"
+        for i, col in enumerate(batch.columns)
+    )
+    db_manager.execute_statement(f"CREATE TABLE {batch.table} ({column_defs})")
+    logger.info(f"Created table {batch.table} from dump column types")
+
+
+def load_dump(path: Path) -> Dict[str, int]:
+    """
+    Load a MySQL INSERT dump into the configured database.
+
+    Args:
+        path: Path to the .sql dump
+
+    Returns:
+        Mapping of table name to number of rows inserted
+    """
+    counts: Dict[str, int] = {}
+    for batch in parse_dump(path.read_text(encoding="utf-8")):
+        ensure_table(batch)
+        query = (
+            f"INSERT INTO {batch.table} ({', '.join(batch.columns)}) "
+            f"VALUES ({', '.join(':' + c for c in batch.columns)})"
+        )
+        db_manager.execute_many(query, [dict(zip(batch.columns, row)) for row in batch.rows])
+        counts[batch.table] = counts.get(batch.table, 0) + len(batch.rows)
+    return counts
+
+
+def main(argv: List[str]) -> int:
+    """CLI entry point: load each dump file given on the command line."""
+    logging.basicConfig(level=logging.INFO)
+    if not argv:
+        print(__doc__)
+        return 1
+    init_database()
+    for arg in argv:
+        counts = load_dump(Path(arg))
+        for table, count in counts.items():
+            logger.info(f"{arg}: loaded {count} rows into {table}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,221 @@
+"""
+Normalized ticker sentiment and topics for news articles.
+
+coreiq_av_market_news_sentiment stores each article's tagged tickers and
+topics as JSON text with string scores. At ingest time these are exploded
+into two typed child tables so the Newsroom reads them with plain SQL (no
+per-article json.loads) and ticker/topic filters and aggregations can use
+indexes:
+
+    coreiq_av_news_ticker_sentiment (news_id, ticker, relevance_score,
+                                     ticker_sentiment_score, ticker_sentiment_label)
+    coreiq_av_news_topics           (news_id, topic, relevance_score)
+
+data.ingest normalizes every news row it upserts. Existing rows are
+backfilled once with:
+
+    cd app && python -m data.news_normalize
+"""
+import argparse
+import json
+import logging
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core.database import db_manager, init_database
+
+logger = logging.getLogger(__name__)
+
+NEWS_TABLE = "coreiq_av_market_news_sentiment"
+TICKER_SENTIMENT_TABLE = "coreiq_av_news_ticker_sentiment"
+TOPICS_TABLE = "coreiq_av_news_topics"
+
+# Articles normalized per transaction during a backfill
+BACKFILL_BATCH_SIZE = 1000
+
+_SCHEMA = [
+    f"""CREATE TABLE IF NOT EXISTS {TICKER_SENTIMENT_TABLE} (
+        news_id BIGINT NOT NULL,
+        ticker VARCHAR(16) NOT NULL,
+        relevance_score DOUBLE,
+        ticker_sentiment_score DOUBLE,
+        ticker_sentiment_label VARCHAR(32),
+        PRIMARY KEY (news_id, ticker)
+    )""",
+    f"""CREATE TABLE IF NOT EXISTS {TOPICS_TABLE} (
+        news_id BIGINT NOT NULL,
+        topic VARCHAR(128) NOT NULL,
+        relevance_score DOUBLE,
+        PRIMARY KEY (news_id, topic)
+    )""",
+]
+
+# Secondary indexes: (name, table, columns)
+_INDEXES = [
+    ("idx_news_ticker_sentiment_ticker", TICKER_SENTIMENT_TABLE, "ticker, news_id"),
+    ("idx_news_topics_topic", TOPICS_TABLE, "topic, news_id"),
+]
+
+
+def ensure_tables() -> None:
+    """Create the normalized tables and their indexes if they are missing."""
+    for statement in _SCHEMA:
+        db_manager.execute_statement(statement)
+    for name, table, columns in _INDEXES:
+        if not db_manager.index_exists(table, name):
+            db_manager.execute_statement(f"CREATE INDEX {name} ON {table} ({columns})")
+
+
+def normalized_tables_exist() -> bool:
+    """Whether the normalized tables have been created (see ensure_tables)."""
+    return db_manager.table_exists(TICKER_SENTIMENT_TABLE) and db_manager.table_exists(TOPICS_TABLE)
+
+
+def _to_score(value: Any) -> Optional[float]:
+    """Parse a score that the API delivers as a string ("0.52")."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _json_list(value: Any) -> List[Dict[str, Any]]:
+    """Decode a JSON array of objects, tolerating NULL and malformed text."""
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, dict)]
+    if not value:
+        return []
+    try:
+        return _json_list(json.loads(value))
+    except (json.JSONDecodeError, TypeError):
+        return []
+
+
+def _article_field(article: Dict[str, Any], column: str, raw_key: str) -> List[Dict[str, Any]]:
+    """Read a JSON column, falling back to the same field inside raw_json."""
+    items = _json_list(article.get(column))
+    if items or not article.get("raw_json"):
+        return items
+    try:
+        raw = json.loads(article["raw_json"])
+    except (json.JSONDecodeError, TypeError):
+        return []
+    return _json_list(raw.get(raw_key)) if isinstance(raw, dict) else []
+
+
+def explode_article(article: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Convert one news row's JSON fields into child table rows.
+
+    Args:
+        article: Row with id, ticker_sentiment_json, topics_json and raw_json
+
+    Returns:
+        Tuple of (ticker sentiment rows, topic rows); duplicates are dropped
+    """
+    news_id = article["id"]
+    sentiments: Dict[str, Dict[str, Any]] = {}
+    for item in _article_field(article, "ticker_sentiment_json", "ticker_sentiment"):
+        ticker = item.get("ticker")
+        if ticker and ticker not in sentiments:
+            sentiments[ticker] = {
+                "news_id": news_id,
+                "ticker": ticker,
+                "relevance_score": _to_score(item.get("relevance_score")),
+                "ticker_sentiment_score": _to_score(item.get("ticker_sentiment_score")),
+                "ticker_sentiment_label": item.get("ticker_sentiment_label") or "Neutral",
+            }
+    topics: Dict[str, Dict[str, Any]] = {}
+    for item in _article_field(article, "topics_json", "topics"):
+        topic = item.get("topic")
+        if topic and topic not in topics:
+            topics[topic] = {
+                "news_id": news_id,
+                "topic": topic,
+                "relevance_score": _to_score(item.get("relevance_score")),
+            }
+    return list(sentiments.values()), list(topics.values())
+
+
+def in_clause(column: str, values: Sequence[Any], prefix: str = "v") -> Tuple[str, Dict[str, Any]]:
+    """Build `column IN (:v0, :v1, ...)` with its bind parameters."""
+    params = {f"{prefix}{i}": value for i, value in enumerate(values)}
+    return f"{column} IN ({', '.join(':' + name for name in params)})", params
+
+
+def normalize_articles(articles: List[Dict[str, Any]]) -> int:
+    """
+    Replace the child rows of the given news rows in one transaction.
+
+    The normalized tables must exist (call ensure_tables once per run).
+
+    Args:
+        articles: News rows as upserted (must include id and the JSON columns)
+
+    Returns:
+        Number of child rows written
+    """
+    if not articles:
+        return 0
+    condition, params = in_clause("news_id", [a["id"] for a in articles])
+    sentiment_rows: List[Dict[str, Any]] = []
+    topic_rows: List[Dict[str, Any]] = []
+    for article in articles:
+        sentiments, topics = explode_article(article)
+        sentiment_rows.extend(sentiments)
+        topic_rows.extend(topics)
+
+    db_manager.execute_transaction([
+        (f"DELETE FROM {TICKER_SENTIMENT_TABLE} WHERE {condition}", params),
+        (f"DELETE FROM {TOPICS_TABLE} WHERE {condition}", params),
+        (f"INSERT INTO {TICKER_SENTIMENT_TABLE} "
+         "(news_id, ticker, relevance_score, ticker_sentiment_score, ticker_sentiment_label) "
+         "VALUES (:news_id, :ticker, :relevance_score, :ticker_sentiment_score, :ticker_sentiment_label)",
+         sentiment_rows),
+        (f"INSERT INTO {TOPICS_TABLE} (news_id, topic, relevance_score) "
+         "VALUES (:news_id, :topic, :relevance_score)",
+         topic_rows),
+    ])
+    return len(sentiment_rows) + len(topic_rows)
+
+
+def backfill(batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """
+    Normalize every article already in the news table.
+
+    Returns:
+        Number of articles processed
+    """
+    ensure_tables()
+    processed = 0
+    last_id = None
+    while True:
+        query = f"SELECT id, ticker_sentiment_json, topics_json, raw_json FROM {NEWS_TABLE}"
+        params: Dict[str, Any] = {"limit": batch_size}
+        if last_id is not None:
+            query += " WHERE id > :last_id"
+            params["last_id"] = last_id
+        rows = db_manager.execute_query(query + " ORDER BY id LIMIT :limit", params)
+        if not rows:
+            return processed
+        normalize_articles(rows)
+        processed += len(rows)
+        last_id = rows[-1]["id"]
+        logger.info(f"Normalized {processed} articles")
+
+
+def main(argv: List[str]) -> int:
+    """CLI entry point: backfill the normalized news tables."""
+    parser = argparse.ArgumentParser(description="Backfill normalized news ticker sentiment and topics")
+    parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE, help="Articles per transaction")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    init_database()
+    count = backfill(args.batch_size)
+    logger.info(f"Backfilled {count} articles into {TICKER_SENTIMENT_TABLE} and {TOPICS_TABLE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
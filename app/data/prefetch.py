@@ -0,0 +1,150 @@
+"""
+Background prefetch of adjacent Market Data views.
+
+After a statement tab renders, the other statements and the company overview
+for the same ticker and date range are loaded on a small per-process thread
+pool so the next tab click is served from the shared cache.
+
+Concurrency is bounded by PREFETCH_MAX_WORKERS: at most that many jobs run
+(and hold a database connection) at once, at most twice that many are
+queued or running, and requests beyond that are dropped rather than queued,
+so prefetching can neither starve the connection pool nor build a backlog.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Callable, Dict, Hashable, Optional, Set, Tuple
+
+from core.cache import cache
+from core.config import config
+from data.models import ReportPeriod
+from data.repository import (
+    BalanceSheetRepository, CashFlowRepository, CompanyOverviewRepository,
+    IncomeStatementRepository
+)
+
+logger = logging.getLogger(__name__)
+
+# Queued + running jobs allowed per worker thread
+_JOBS_PER_WORKER = 2
+
+# Statement tabs and the repository call that loads each one
+STATEMENT_LOADERS: Dict[str, Callable[[str, date, date, ReportPeriod], object]] = {
+    "income_statement": IncomeStatementRepository.get_income_statement_data,
+    "balance_sheet": BalanceSheetRepository.get_balance_sheet_data,
+    "cash_flow": CashFlowRepository.get_cash_flow_data,
+}
+
+
+class Prefetcher:
+    """
+    Bounded background loader that warms the shared cache.
+
+    Jobs are deduplicated by key while in flight; when all slots are taken
+    new jobs are skipped (the page simply loads that view on demand).
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max(max_workers, 1) * _JOBS_PER_WORKER)
+        self._inflight: Set[Tuple[Hashable, ...]] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether prefetching is enabled and the cache can hold its results."""
+        return self.max_workers > 0 and cache.enabled
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the thread pool on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="prefetch"
+                )
+            return self._executor
+
+    def submit(self, key: Tuple[Hashable, ...], load: Callable[[], object]) -> bool:
+        """
+        Run load() in the background unless it is in flight or the pool is full.
+
+        Returns:
+            True if the job was scheduled
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            if key in self._inflight:
+                return False
+            if not self._slots.acquire(blocking=False):
+                return False
+            self._inflight.add(key)
+
+        def run():
+            try:
+                load()
+            except Exception as e:
+                # Prefetch is best effort; the page reports errors on demand
+                logger.debug(f"Prefetch {key} failed: {e}")
+            finally:
+                with self._lock:
+                    self._inflight.discard(key)
+                self._slots.release()
+
+        try:
+            self._get_executor().submit(run)
+        except RuntimeError:
+            # Interpreter shutting down
+            with self._lock:
+                self._inflight.discard(key)
+            self._slots.release()
+            return False
+        return True
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (pending jobs are cancelled)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global prefetcher instance
+prefetcher = Prefetcher(max_workers=config.prefetch_max_workers)
+
+
+def prefetch_adjacent_views(
+    active_tab: str,
+    ticker: str,
+    start_date: date,
+    end_date: date,
+    period: ReportPeriod
+) -> int:
+    """
+    Warm the cache for the statement tabs not being shown, plus the overview.
+
+    Args:
+        active_tab: Tab that was just rendered (skipped)
+        ticker: Company ticker
+        start_date: Selected range start
+        end_date: Selected range end
+        period: Annual, quarterly or TTM view
+
+    Returns:
+        Number of jobs scheduled
+    """
+    scheduled = 0
+    for tab, load in STATEMENT_LOADERS.items():
+        if tab == active_tab:
+            continue
+        scheduled += prefetcher.submit(
+            (tab, ticker, start_date, end_date, period),
+            lambda load=load: load(ticker, start_date, end_date, period)
+        )
+    scheduled += prefetcher.submit(
+        ("company_overview", ticker),
+        lambda: CompanyOverviewRepository.get_company_overview(ticker)
+    )
+    return scheduled
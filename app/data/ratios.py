@@ -0,0 +1,441 @@
+"""
+Derived financial ratios computed vectorially from statement matrices.
+
+Ratios are declared as formulas over named statement inputs (RATIO_INPUTS).
+Each formula is parsed once at import into a NumPy closure and evaluated over
+every period at once: a 1-D period vector for a single company, or a
+(ticker x period) grid for screens, so a 500-company screen is one array
+expression per ratio rather than per-cell Python.
+
+Formula language: input names, numbers, + - * /, unary minus, parentheses,
+and the functions prev(x) (previous period), abs(x) and nz(x) (NaN -> 0).
+Division by zero and missing inputs yield NaN.
+"""
+import ast
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.cache import cache
+from data.models import ReportPeriod
+from data.repository import BalanceSheetRepository, CashFlowRepository, IncomeStatementRepository
+from data.statement_matrix import StatementMatrix
+
+# Date bounds used when loading a company's full history
+_HISTORY_START = date(1900, 1, 1)
+_HISTORY_END = date(2100, 12, 31)
+
+# Distinguishes "not cached" from a cached value
+_MISSING = object()
+
+# Every ratio cache namespace is derived from the three statement tables
+for _namespace in ("ratios", "ratio_inputs", "ratio_screen"):
+    cache.depends_on(
+        _namespace,
+        "coreiq_av_financials_income_statement",
+        "coreiq_av_financials_balance_sheet",
+        "coreiq_av_financials_cash_flow",
+    )
+
+
+@dataclass(frozen=True)
+class RatioInput:
+    """A statement line used by ratio formulas."""
+    statement: str
+    key: str
+
+
+RATIO_INPUTS: Dict[str, RatioInput] = {
+    # Income statement (table columns)
+    "revenue": RatioInput("income_statement", "total_revenue"),
+    "cost_of_revenue": RatioInput("income_statement", "cost_of_revenue"),
+    "gross_profit": RatioInput("income_statement", "gross_profit"),
+    "operating_income": RatioInput("income_statement", "operating_income"),
+    "net_income": RatioInput("income_statement", "net_income"),
+    "interest_expense": RatioInput("income_statement", "interest_expense"),
+    "research_and_development": RatioInput("income_statement", "research_and_development"),
+    # Balance sheet (raw_json keys)
+    "total_assets": RatioInput("balance_sheet", "totalAssets"),
+    "current_assets": RatioInput("balance_sheet", "totalCurrentAssets"),
+    "current_liabilities": RatioInput("balance_sheet", "totalCurrentLiabilities"),
+    "total_liabilities": RatioInput("balance_sheet", "totalLiabilities"),
+    "equity": RatioInput("balance_sheet", "totalShareholderEquity"),
+    "inventory": RatioInput("balance_sheet", "inventory"),
+    "cash": RatioInput("balance_sheet", "cashAndCashEquivalentsAtCarryingValue"),
+    # Cash flow (raw_json keys)
+    "operating_cash_flow": RatioInput("cash_flow", "operatingCashflow"),
+    "capex": RatioInput("cash_flow", "capitalExpenditures"),
+    "dividends_paid": RatioInput("cash_flow", "dividendsPaid"),
+}
+
+_STATEMENT_REPOSITORIES = {
+    "income_statement": IncomeStatementRepository,
+    "balance_sheet": BalanceSheetRepository,
+    "cash_flow": CashFlowRepository,
+}
+
+
+class RatioUnit(Enum):
+    """How a ratio value is displayed."""
+    PERCENT = "percent"
+    MULTIPLE = "multiple"
+    CURRENCY = "currency"
+
+
+@dataclass(frozen=True)
+class RatioDefinition:
+    """A derived metric declared as a formula over RATIO_INPUTS."""
+    key: str
+    label: str
+    formula: str
+    unit: RatioUnit
+
+
+RATIOS: List[RatioDefinition] = [
+    # Profitability
+    RatioDefinition("gross_margin", "Gross Margin", "gross_profit / revenue", RatioUnit.PERCENT),
+    RatioDefinition("operating_margin", "Operating Margin", "operating_income / revenue", RatioUnit.PERCENT),
+    RatioDefinition("net_margin", "Net Margin", "net_income / revenue", RatioUnit.PERCENT),
+    RatioDefinition("rd_intensity", "R&D / Revenue", "research_and_development / revenue", RatioUnit.PERCENT),
+    RatioDefinition("return_on_equity", "Return on Equity", "net_income / equity", RatioUnit.PERCENT),
+    RatioDefinition("return_on_assets", "Return on Assets", "net_income / total_assets", RatioUnit.PERCENT),
+    # Growth (period over period)
+    RatioDefinition("revenue_growth", "Revenue Growth", "revenue / prev(revenue) - 1", RatioUnit.PERCENT),
+    RatioDefinition(
+        "net_income_growth", "Net Income Growth",
+        "(net_income - prev(net_income)) / abs(prev(net_income))", RatioUnit.PERCENT
+    ),
+    # Liquidity and leverage
+    RatioDefinition("current_ratio", "Current Ratio", "current_assets / current_liabilities", RatioUnit.MULTIPLE),
+    RatioDefinition(
+        "quick_ratio", "Quick Ratio",
+        "(current_assets - nz(inventory)) / current_liabilities", RatioUnit.MULTIPLE
+    ),
+    RatioDefinition("liabilities_to_equity", "Liabilities / Equity", "total_liabilities / equity", RatioUnit.MULTIPLE),
+    RatioDefinition("interest_coverage", "Interest Coverage", "operating_income / interest_expense", RatioUnit.MULTIPLE),
+    # Cash flow
+    RatioDefinition("free_cash_flow", "Free Cash Flow", "operating_cash_flow - abs(capex)", RatioUnit.CURRENCY),
+    RatioDefinition("fcf_margin", "FCF Margin", "(operating_cash_flow - abs(capex)) / revenue", RatioUnit.PERCENT),
+]
+
+RATIOS_BY_KEY: Dict[str, RatioDefinition] = {ratio.key: ratio for ratio in RATIOS}
+
+
+# ==================== FORMULA COMPILER ====================
+
+Evaluator = Callable[[Dict[str, np.ndarray]], np.ndarray]
+
+
+def _prev(values: np.ndarray) -> np.ndarray:
+    """Shift values one period later along the period (last) axis."""
+    shifted = np.full(np.shape(values), np.nan)
+    shifted[..., 1:] = values[..., :-1]
+    return shifted
+
+
+_BINARY_OPS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.divide,
+}
+
+_FUNCTIONS = {
+    "prev": _prev,
+    "abs": np.abs,
+    "nz": lambda values: np.nan_to_num(values, nan=0.0),
+}
+
+
+def compile_formula(formula: str) -> Tuple[Evaluator, FrozenSet[str]]:
+    """
+    Compile a ratio formula into a NumPy evaluator.
+
+    Args:
+        formula: Expression over RATIO_INPUTS names
+
+    Returns:
+        Tuple of (evaluator taking {input name: array}, input names used)
+
+    Raises:
+        ValueError: If the formula uses unknown names or unsupported syntax
+    """
+    names = set()
+
+    def build(node: ast.AST) -> Evaluator:
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+            op = _BINARY_OPS[type(node.op)]
+            left, right = build(node.left), build(node.right)
+            return lambda env: op(left(env), right(env))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            operand = build(node.operand)
+            return lambda env: np.negative(operand(env))
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            constant = float(node.value)
+            return lambda env: constant
+        if isinstance(node, ast.Name):
+            if node.id not in RATIO_INPUTS:
+                raise ValueError(f"Unknown ratio input '{node.id}' in formula: {formula}")
+            name = node.id
+            names.add(name)
+            return lambda env: env[name]
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in _FUNCTIONS
+            and len(node.args) == 1
+            and not node.keywords
+        ):
+            func = _FUNCTIONS[node.func.id]
+            argument = build(node.args[0])
+            return lambda env: func(argument(env))
+        raise ValueError(f"Unsupported syntax in formula: {formula}")
+
+    evaluator = build(ast.parse(formula, mode="eval").body)
+    return evaluator, frozenset(names)
+
+
+# Parsed once at import
+_COMPILED: Dict[str, Tuple[Evaluator, FrozenSet[str]]] = {
+    ratio.key: compile_formula(ratio.formula) for ratio in RATIOS
+}
+
+
+def _required_inputs(keys: Sequence[str]) -> List[str]:
+    """Input names needed to evaluate the given ratios."""
+    return sorted(set().union(*(_COMPILED[key][1] for key in keys)))
+
+
+def evaluate_ratios(inputs: Dict[str, np.ndarray], keys: Sequence[str]) -> Dict[str, np.ndarray]:
+    """
+    Evaluate ratios over aligned input arrays.
+
+    Args:
+        inputs: Input name -> array; all arrays share a shape whose last axis is periods
+        keys: Ratio keys to evaluate
+
+    Returns:
+        Ratio key -> array of the input shape, NaN where undefined
+    """
+    shape = np.shape(next(iter(inputs.values()))) if inputs else (0,)
+    results = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for key in keys:
+            evaluator, _ = _COMPILED[key]
+            values = np.broadcast_to(np.asarray(evaluator(inputs), dtype=float), shape)
+            values = np.where(np.isfinite(values), values, np.nan)
+            values.setflags(write=False)
+            results[key] = values
+    return results
+
+
+# ==================== SINGLE COMPANY ====================
+
+def _align(matrix: StatementMatrix, key: str, dates: List[date]) -> np.ndarray:
+    """Reindex one matrix row onto a shared date axis (NaN where absent)."""
+    positions = {d: i for i, d in enumerate(matrix.dates)}
+    index = np.array([positions.get(d, -1) for d in dates], dtype=int)
+    aligned = np.full(len(dates), np.nan)
+    found = index >= 0
+    aligned[found] = matrix.row(key)[index[found]]
+    return aligned
+
+
+def _keys_by_statement(names: Sequence[str]) -> Dict[str, List[str]]:
+    """Statement keys to load for the named inputs, per statement."""
+    keys_by_statement: Dict[str, List[str]] = {}
+    for name in names:
+        ratio_input = RATIO_INPUTS[name]
+        keys_by_statement.setdefault(ratio_input.statement, []).append(ratio_input.key)
+    return keys_by_statement
+
+
+def _align_inputs(
+    matrices: Dict[str, StatementMatrix],
+    names: Sequence[str]
+) -> Tuple[List[date], Dict[str, np.ndarray]]:
+    """Align the named inputs of one company on the union of statement dates."""
+    dates = sorted(set().union(*(matrix.dates for matrix in matrices.values())))
+    inputs = {
+        name: _align(matrices[RATIO_INPUTS[name].statement], RATIO_INPUTS[name].key, dates)
+        for name in names
+    }
+    return dates, inputs
+
+
+def _load_inputs(
+    ticker: str,
+    period: ReportPeriod,
+    start_date: date,
+    end_date: date,
+    names: Sequence[str]
+) -> Tuple[List[date], Dict[str, np.ndarray]]:
+    """Load the named inputs for a company, aligned on the union of statement dates."""
+    matrices = {
+        statement: _STATEMENT_REPOSITORIES[statement].get_statement_matrix(
+            ticker, start_date, end_date, period, keys
+        )
+        for statement, keys in _keys_by_statement(names).items()
+    }
+    return _align_inputs(matrices, names)
+
+
+def _load_histories(
+    tickers: Sequence[str],
+    period: ReportPeriod,
+    names: Sequence[str]
+) -> Dict[str, Tuple[List[date], Dict[str, np.ndarray]]]:
+    """Full input histories of many companies, with one query per statement."""
+    keys_by_statement = _keys_by_statement(names)
+    by_statement = {
+        statement: _STATEMENT_REPOSITORIES[statement].get_statement_matrices(
+            list(tickers), _HISTORY_START, _HISTORY_END, period, keys
+        )
+        for statement, keys in keys_by_statement.items()
+    }
+    empty = {
+        statement: StatementMatrix(dates=[], keys=keys, values=np.empty((len(keys), 0)))
+        for statement, keys in keys_by_statement.items()
+    }
+    return {
+        ticker: _align_inputs(
+            {statement: matrices.get(ticker, empty[statement]) for statement, matrices in by_statement.items()},
+            names,
+        )
+        for ticker in tickers
+    }
+
+
+@dataclass
+class RatioTable:
+    """Ratios for one company; each array is aligned with dates (ascending)."""
+    ticker: str
+    period: ReportPeriod
+    dates: List[date]
+    values: Dict[str, np.ndarray]
+
+
+def compute_ratios(
+    ticker: str,
+    period: ReportPeriod = ReportPeriod.ANNUAL,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    keys: Optional[Tuple[str, ...]] = None
+) -> RatioTable:
+    """
+    Compute ratios for every period of a company in one vectorized pass.
+
+    Ratios are computed over the company's full history, so growth ratios
+    have a prior value at start_date, and cached per (ticker, period, keys);
+    date ranges are sliced from the cached table. The arrays are read-only.
+
+    Args:
+        ticker: Company ticker
+        period: Annual, quarterly or TTM basis
+        start_date: First fiscal date (None = full history)
+        end_date: Last fiscal date (None = full history)
+        keys: Ratio keys to compute (None = all RATIOS)
+    """
+    keys = tuple(keys or RATIOS_BY_KEY)
+
+    def compute() -> RatioTable:
+        dates, inputs = _company_history(ticker, period, tuple(_required_inputs(keys)))
+        return RatioTable(ticker=ticker, period=period, dates=dates, values=evaluate_ratios(inputs, keys))
+
+    table = cache.get_or_compute(("ratios", ticker, period, keys), compute)
+    first = bisect_left(table.dates, start_date) if start_date else 0
+    last = bisect_right(table.dates, end_date) if end_date else len(table.dates)
+    return RatioTable(
+        ticker=ticker,
+        period=period,
+        dates=table.dates[first:last],
+        values={key: array[first:last] for key, array in table.values.items()},
+    )
+
+
+# ==================== SCREENS (MANY COMPANIES) ====================
+
+@dataclass
+class RatioScreen:
+    """
+    Ratios for many companies as (ticker x period) grids.
+
+    Columns are right-aligned on each company's own fiscal calendar: the last
+    column is every company's most recent period.
+    """
+    tickers: List[str]
+    period: ReportPeriod
+    latest_dates: List[Optional[date]]
+    values: Dict[str, np.ndarray]
+
+    def latest(self, key: str) -> np.ndarray:
+        """Most recent value of a ratio for every ticker."""
+        return self.values[key][:, -1]
+
+
+def _company_history(
+    ticker: str,
+    period: ReportPeriod,
+    names: Tuple[str, ...]
+) -> Tuple[List[date], Dict[str, np.ndarray]]:
+    """Full input history for a company, cached for reuse across screens."""
+    return cache.get_or_compute(
+        ("ratio_inputs", ticker, period, names),
+        lambda: _load_inputs(ticker, period, _HISTORY_START, _HISTORY_END, names),
+    )
+
+
+def screen_ratios(
+    tickers: Sequence[str],
+    period: ReportPeriod = ReportPeriod.ANNUAL,
+    n_periods: int = 5,
+    keys: Optional[Tuple[str, ...]] = None
+) -> RatioScreen:
+    """
+    Compute ratios for many companies at once.
+
+    Each company's recent inputs are stacked into (ticker x period) grids and
+    every ratio is evaluated once over the whole grid. Input histories not
+    yet cached are loaded together, with one query per statement.
+
+    Args:
+        tickers: Companies to screen
+        period: Annual, quarterly or TTM basis
+        n_periods: Number of most recent periods per company
+        keys: Ratio keys to compute (None = all RATIOS)
+    """
+    tickers = list(tickers)
+    keys = tuple(keys or RATIOS_BY_KEY)
+    names = tuple(_required_inputs(keys))
+
+    def compute() -> RatioScreen:
+        # One extra leading column so prev() is defined for the first kept period
+        width = n_periods + 1
+        grids = {name: np.full((len(tickers), width), np.nan) for name in names}
+        latest_dates: List[Optional[date]] = []
+        histories = {ticker: cache.get(("ratio_inputs", ticker, period, names), _MISSING) for ticker in tickers}
+        missing = [ticker for ticker, history in histories.items() if history is _MISSING]
+        if missing:
+            for ticker, history in _load_histories(missing, period, names).items():
+                cache.set(("ratio_inputs", ticker, period, names), history)
+                histories[ticker] = history
+        for row, ticker in enumerate(tickers):
+            dates, inputs = histories[ticker]
+            latest_dates.append(dates[-1] if dates else None)
+            count = min(len(dates), width)
+            if count:
+                for name in names:
+                    grids[name][row, width - count:] = inputs[name][-count:]
+        values = evaluate_ratios(grids, keys)
+        return RatioScreen(
+            tickers=tickers,
+            period=period,
+            latest_dates=latest_dates,
+            values={key: array[:, 1:] for key, array in values.items()},
+        )
+
+    return cache.get_or_compute(("ratio_screen", tuple(tickers), period, n_periods, keys), compute)
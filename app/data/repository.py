@@ -5,14 +5,42 @@ from typing import List, Optional, Tuple, Dict, Any
 from datetime import date, datetime, timedelta
 import json
 
+import numpy as np
+import pandas as pd
+
+from core.cache import cache, cached
 from core.database import db_manager
+from data.snapshot import snapshot_store
+from data.latest_overview import (
+    LATEST_COLUMNS, LATEST_OVERVIEW_TABLE, OVERVIEW_TABLE,
+    latest_source_rows, latest_table_exists, materialize, to_float, to_int
+)
+from data.news_normalize import (
+    NEWS_TABLE, TICKER_SENTIMENT_TABLE, TOPICS_TABLE,
+    explode_article, in_clause, normalized_tables_exist
+)
 from data.models import (
     Company, IncomeStatementLineItem, FiscalPeriod, IncomeStatementData,
-    NewsArticle, TickerSentiment, CompanyOverview, EarningsCall,
+    NewsArticle, NewsTopic, TickerSentiment, CompanyOverview, EarningsCall,
     BalanceSheetLineItem, BalanceSheetData,
-    CashFlowLineItem, CashFlowData
+    CashFlowLineItem, CashFlowData, ReportPeriod
+)
+from data.statement_matrix import (
+    StatementMatrix, fetch_start_date, pivot_statement, to_display_values
 )
 
+# Distinguishes "not cached" from a cached None (ticker without an overview)
+_NOT_CACHED = object()
+
+
+def _to_date(value: Any) -> Optional[date]:
+    """Normalize a DATE query result (SQLite returns aggregates as ISO strings)."""
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(str(value)[:10])
+
 
 class CompanyRepository:
     """Repository for coreiq_companies table."""
@@ -101,7 +129,7 @@ class IncomeStatementRepository:
     ]
     
     @staticmethod
-    def get_date_range(ticker: str) -> Tuple[Optional[date], Optional[date]]:
+    def get_date_range(ticker: str, period: ReportPeriod = ReportPeriod.ANNUAL) -> Tuple[Optional[date], Optional[date]]:
         """Get min and max fiscal dates for a ticker."""
         query = """
             SELECT 
@@ -109,40 +137,41 @@ class IncomeStatementRepository:
                 MAX(fiscal_date_ending) as max_date
             FROM coreiq_av_financials_income_statement
             WHERE ticker = :ticker
-              AND report_type = 'annual'
+              AND report_type = :report_type
         """
-        results = db_manager.execute_query(query, {"ticker": ticker})
+        results = db_manager.execute_query(query, {
+            "ticker": ticker,
+            "report_type": period.report_type
+        })
         if not results:
             return None, None
         row = results[0]
-        return row['min_date'], row['max_date']
+        return _to_date(row['min_date']), _to_date(row['max_date'])
     
     @staticmethod
-    def get_available_dates(ticker: str) -> List[date]:
+    def get_available_dates(ticker: str, period: ReportPeriod = ReportPeriod.ANNUAL) -> List[date]:
         """Get all available fiscal dates for dropdown."""
         query = """
             SELECT DISTINCT fiscal_date_ending
             FROM coreiq_av_financials_income_statement
             WHERE ticker = :ticker
-              AND report_type = 'annual'
+              AND report_type = :report_type
             ORDER BY fiscal_date_ending ASC
         """
-        results = db_manager.execute_query(query, {"ticker": ticker})
+        results = db_manager.execute_query(query, {
+            "ticker": ticker,
+            "report_type": period.report_type
+        })
         return [row['fiscal_date_ending'] for row in results]
     
     @staticmethod
-    def get_income_statement_data(
+    def _fetch_frame(
         ticker: str,
         start_date: date,
-        end_date: date
-    ) -> IncomeStatementData:
-        """Get income statement data for date range."""
-        # Fetch company info
-        company = CompanyRepository.get_company_by_ticker(ticker)
-        if not company:
-            raise ValueError(f"Company not found: {ticker}")
-        
-        # Fetch raw data - use DISTINCT to avoid duplicates
+        end_date: date,
+        period: ReportPeriod
+    ) -> pd.DataFrame:
+        """Fetch one company's statement columns as a frame from the OLTP table."""
         query = """
             SELECT DISTINCT fiscal_date_ending, total_revenue, cost_of_revenue, 
                    gross_profit, selling_general_and_administrative, research_and_development,
@@ -151,67 +180,191 @@ class IncomeStatementRepository:
             FROM coreiq_av_financials_income_statement
             WHERE ticker = :ticker
               AND fiscal_date_ending BETWEEN :start_date AND :end_date
-              AND report_type = 'annual'
+              AND report_type = :report_type
             ORDER BY fiscal_date_ending ASC
         """
-        results = db_manager.execute_query(query, {
+        return db_manager.execute_frame(query, {
             "ticker": ticker,
             "start_date": start_date,
-            "end_date": end_date
+            "end_date": end_date,
+            "report_type": period.report_type
         })
+    
+    @staticmethod
+    def _fetch_frames(
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+        period: ReportPeriod
+    ) -> pd.DataFrame:
+        """Fetch statement columns of many companies as one frame, from the snapshot if available."""
+        frame = snapshot_store.load_frame(
+            "income_statement", tickers, None, start_date, end_date, period.report_type
+        )
+        if frame is None:
+            condition, params = in_clause("ticker", tickers)
+            query = f"""
+                SELECT DISTINCT ticker, fiscal_date_ending, total_revenue, cost_of_revenue, 
+                       gross_profit, selling_general_and_administrative, research_and_development,
+                       depreciation_and_amortization, operating_income, interest_expense,
+                       interest_income, net_income, reported_currency
+                FROM coreiq_av_financials_income_statement
+                WHERE {condition}
+                  AND fiscal_date_ending BETWEEN :start_date AND :end_date
+                  AND report_type = :report_type
+                ORDER BY ticker, fiscal_date_ending ASC
+            """
+            frame = db_manager.execute_frame(query, {
+                **params,
+                "start_date": start_date,
+                "end_date": end_date,
+                "report_type": period.report_type
+            })
+        return frame
+    
+    @staticmethod
+    def _frame_matrix(
+        frame: pd.DataFrame,
+        start_date: date,
+        period: ReportPeriod,
+        keys: List[Optional[str]]
+    ) -> StatementMatrix:
+        """Pivot one company's statement frame into a matrix."""
+        dates, matrix = pivot_statement(
+            dates=[_to_date(d) for d in frame['fiscal_date_ending']],
+            rows=frame.reindex(columns=keys).to_numpy(dtype=float),
+            n_items=len(keys),
+            period=period,
+            start_date=start_date
+        )
+        return StatementMatrix(dates=dates, keys=keys, values=matrix)
+    
+    @staticmethod
+    def get_statement_matrix(
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        period: ReportPeriod = ReportPeriod.ANNUAL,
+        keys: Optional[List[Optional[str]]] = None
+    ) -> StatementMatrix:
+        """
+        Get income statement values as a (column x period) matrix in source units.
         
-        if not results:
+        The income statement has one table column per line item, so values
+        go straight from the query frame into the matrix without row dicts.
+        
+        Args:
+            ticker: Company ticker
+            start_date: First fiscal date to include
+            end_date: Last fiscal date to include
+            period: Annual, quarterly or TTM view
+            keys: Columns to load (default: LINE_ITEMS columns)
+        """
+        if keys is None:
+            keys = [column for _, column, _ in IncomeStatementRepository.LINE_ITEMS]
+        frame = IncomeStatementRepository._fetch_frame(
+            ticker, fetch_start_date(start_date, period), end_date, period
+        )
+        return IncomeStatementRepository._frame_matrix(frame, start_date, period, keys)
+    
+    @staticmethod
+    def get_statement_matrices(
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+        period: ReportPeriod = ReportPeriod.ANNUAL,
+        keys: Optional[List[Optional[str]]] = None
+    ) -> Dict[str, StatementMatrix]:
+        """
+        Get income statement matrices of many companies with one query.
+        
+        Args:
+            tickers: Company tickers
+            start_date: First fiscal date to include
+            end_date: Last fiscal date to include
+            period: Annual, quarterly or TTM view
+            keys: Columns to load (default: LINE_ITEMS columns)
+        
+        Returns:
+            Ticker -> matrix (see get_statement_matrix); tickers without rows are absent
+        """
+        if keys is None:
+            keys = [column for _, column, _ in IncomeStatementRepository.LINE_ITEMS]
+        if not tickers:
+            return {}
+        frame = IncomeStatementRepository._fetch_frames(
+            list(tickers), fetch_start_date(start_date, period), end_date, period
+        )
+        return {
+            ticker: IncomeStatementRepository._frame_matrix(rows, start_date, period, keys)
+            for ticker, rows in frame.groupby('ticker', sort=False)
+        }
+    
+    @staticmethod
+    @cached("income_statement", tables=("coreiq_av_financials_income_statement",))
+    def get_income_statement_data(
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        period: ReportPeriod = ReportPeriod.ANNUAL
+    ) -> IncomeStatementData:
+        """Get income statement data for date range (annual, quarterly or TTM).
+        
+        Results are shared through the process cache; do not mutate them.
+        """
+        # Fetch company info
+        company = CompanyRepository.get_company_by_ticker(ticker)
+        if not company:
+            raise ValueError(f"Company not found: {ticker}")
+        
+        matrix = IncomeStatementRepository.get_statement_matrix(ticker, start_date, end_date, period)
+        
+        if not matrix.dates:
             # Return empty structure
             return IncomeStatementData(
                 company=company,
                 periods=[],
-                line_items=[]
+                line_items=[],
+                period=period
             )
         
-        # Create periods from results
-        periods = [
-            FiscalPeriod.from_date(row['fiscal_date_ending'])
-            for row in results
-        ]
+        periods = [FiscalPeriod.from_date(d, period) for d in matrix.dates]
         
-        # Build line items
-        line_items = []
-        for label, column, is_calc in IncomeStatementRepository.LINE_ITEMS:
-            values = []
-            for row in results:
-                if column and row.get(column) is not None:
-                    # Convert to millions
-                    values.append(float(row[column]) / 1_000_000)
-                else:
-                    values.append(None)
-            
-            line_items.append(IncomeStatementLineItem(
+        # Build line items (values in millions)
+        line_items = [
+            IncomeStatementLineItem(
                 label=label,
                 key=column or label,
                 values=values,
                 is_calculated=is_calc
-            ))
+            )
+            for (label, column, is_calc), values in zip(
+                IncomeStatementRepository.LINE_ITEMS, to_display_values(matrix.values)
+            )
+        ]
         
         return IncomeStatementData(
             company=company,
             periods=periods,
-            line_items=line_items
+            line_items=line_items,
+            period=period
         )
     
     @staticmethod
-    def get_reported_currency(ticker: str, fiscal_date: date) -> str:
+    def get_reported_currency(ticker: str, fiscal_date: date, period: ReportPeriod = ReportPeriod.ANNUAL) -> str:
         """Get the reported currency for a specific fiscal period."""
         query = """
             SELECT reported_currency
             FROM coreiq_av_financials_income_statement
             WHERE ticker = :ticker
               AND fiscal_date_ending = :fiscal_date
-              AND report_type = 'annual'
+              AND report_type = :report_type
             LIMIT 1
         """
         results = db_manager.execute_query(query, {
             "ticker": ticker,
-            "fiscal_date": fiscal_date
+            "fiscal_date": fiscal_date,
+            "report_type": period.report_type
         })
         if results and results[0].get('reported_currency'):
             return results[0]['reported_currency']
@@ -222,33 +375,60 @@ class NewsRepository:
     """Repository for coreiq_av_market_news_sentiment table."""
     
     @staticmethod
-    def _parse_ticker_sentiment(ticker_sentiment_json: str) -> List[TickerSentiment]:
-        """Parse ticker_sentiment JSON string into list of TickerSentiment objects."""
-        if not ticker_sentiment_json:
-            return []
-        try:
-            data = json.loads(ticker_sentiment_json)
-            return [
-                TickerSentiment(
-                    ticker=ts.get('ticker', ''),
-                    relevance_score=ts.get('relevance_score', '0'),
-                    ticker_sentiment_label=ts.get('ticker_sentiment_label', 'Neutral'),
-                    ticker_sentiment_score=ts.get('ticker_sentiment_score', '0')
-                )
-                for ts in data
-            ]
-        except (json.JSONDecodeError, TypeError):
-            return []
+    @cached("news_schema", tables=(NEWS_TABLE,))
+    def _has_normalized_tables() -> bool:
+        """Whether ticker sentiment and topics have been normalized (see data.news_normalize)."""
+        return normalized_tables_exist()
+    
+    @staticmethod
+    def _to_ticker_sentiment(row: Dict[str, Any]) -> TickerSentiment:
+        """Build a TickerSentiment from a normalized ticker sentiment row."""
+        return TickerSentiment(
+            ticker=row['ticker'],
+            relevance_score=row['relevance_score'] or 0.0,
+            ticker_sentiment_label=row['ticker_sentiment_label'] or 'Neutral',
+            ticker_sentiment_score=row['ticker_sentiment_score'] or 0.0
+        )
     
     @staticmethod
-    def _parse_topics(topics_json: str) -> List[Dict[str, str]]:
-        """Parse topics JSON string into list of topic dictionaries."""
-        if not topics_json:
-            return []
-        try:
-            return json.loads(topics_json)
-        except (json.JSONDecodeError, TypeError):
-            return []
+    def _to_topic(row: Dict[str, Any]) -> NewsTopic:
+        """Build a NewsTopic from a normalized topic row."""
+        return NewsTopic(topic=row['topic'], relevance_score=row['relevance_score'] or 0.0)
+    
+    @staticmethod
+    def _load_normalized(
+        news_ids: List[int]
+    ) -> Tuple[Dict[int, List[TickerSentiment]], Dict[int, List[NewsTopic]]]:
+        """
+        Load ticker sentiment and topics for a page of articles (one query each).
+        
+        Returns:
+            Tuple of (sentiment by news id, topics by news id), most relevant first
+        """
+        sentiments: Dict[int, List[TickerSentiment]] = {}
+        topics: Dict[int, List[NewsTopic]] = {}
+        if not news_ids:
+            return sentiments, topics
+        condition, params = in_clause('news_id', news_ids)
+        
+        rows = db_manager.execute_query(f"""
+            SELECT news_id, ticker, relevance_score, ticker_sentiment_score, ticker_sentiment_label
+            FROM {TICKER_SENTIMENT_TABLE}
+            WHERE {condition}
+            ORDER BY news_id, relevance_score DESC
+        """, params)
+        for row in rows:
+            sentiments.setdefault(row['news_id'], []).append(NewsRepository._to_ticker_sentiment(row))
+        
+        rows = db_manager.execute_query(f"""
+            SELECT news_id, topic, relevance_score
+            FROM {TOPICS_TABLE}
+            WHERE {condition}
+            ORDER BY news_id, relevance_score DESC
+        """, params)
+        for row in rows:
+            topics.setdefault(row['news_id'], []).append(NewsRepository._to_topic(row))
+        return sentiments, topics
     
     @staticmethod
     def get_articles(
@@ -262,6 +442,11 @@ class NewsRepository:
         """
         Get news articles with optional filtering.
         
+        Ticker sentiment and topics come from the normalized child tables.
+        Articles without child rows (no child tables yet, or written outside
+        data.ingest before a backfill) are decoded from the JSON columns, and
+        the sector and company filters fall back to those columns for them.
+        
         Args:
             date_from: Start date filter
             date_to: End date filter  
@@ -270,8 +455,10 @@ class NewsRepository:
             limit: Maximum number of articles to return
             offset: Offset for pagination
         """
+        normalized = NewsRepository._has_normalized_tables()
+        
         # Build base query
-        query = """
+        query = f"""
             SELECT 
                 id,
                 title,
@@ -288,38 +475,56 @@ class NewsRepository:
                 topics_json,
                 category_within_source,
                 raw_json
-            FROM coreiq_av_market_news_sentiment
+            FROM {NEWS_TABLE} n
             WHERE 1=1
         """
         params = {}
+        dialect = db_manager.dialect
         
         # Add date filters
         if date_from:
-            query += " AND DATE(time_published_utc) >= :date_from"
+            query += f" AND {dialect.date('time_published_utc')} >= :date_from"
             params['date_from'] = date_from
         
         if date_to:
-            query += " AND DATE(time_published_utc) <= :date_to"
+            query += f" AND {dialect.date('time_published_utc')} <= :date_to"
             params['date_to'] = date_to
         
+        # Articles without child rows are matched on their JSON column
+        unnormalized = f"""NOT EXISTS (
+            SELECT 1 FROM {TICKER_SENTIMENT_TABLE} ts WHERE ts.news_id = n.id
+        ) AND NOT EXISTS (
+            SELECT 1 FROM {TOPICS_TABLE} tp WHERE tp.news_id = n.id
+        )"""
+        
         # Add sector filter - requires join with companies table
         if sector:
-            query += """ AND EXISTS (
+            json_match = f"""EXISTS (
                 SELECT 1 FROM coreiq_companies c 
                 WHERE c.primary_industry_coresight = :sector
-                AND (
-                    JSON_CONTAINS(ticker_sentiment_json, JSON_OBJECT('ticker', c.ticker))
-                    OR ticker_sentiment_json LIKE CONCAT('%"ticker": "', c.ticker, '"%')
-                )
+                AND {dialect.json_array_has_ticker('n.ticker_sentiment_json', 'c.ticker')}
             )"""
+            if normalized:
+                query += f""" AND (EXISTS (
+                    SELECT 1 FROM {TICKER_SENTIMENT_TABLE} ts
+                    JOIN coreiq_companies c ON c.ticker = ts.ticker
+                    WHERE ts.news_id = n.id
+                    AND c.primary_industry_coresight = :sector
+                ) OR ({unnormalized} AND {json_match}))"""
+            else:
+                query += f" AND {json_match}"
             params['sector'] = sector
         
         # Add company ticker filter
         if company_ticker:
-            query += """ AND (
-                JSON_CONTAINS(ticker_sentiment_json, JSON_OBJECT('ticker', :company_ticker))
-                OR ticker_sentiment_json LIKE CONCAT('%"ticker": "', :company_ticker, '"%')
-            )"""
+            json_match = dialect.json_array_has_ticker('n.ticker_sentiment_json', ':company_ticker')
+            if normalized:
+                query += f""" AND (EXISTS (
+                    SELECT 1 FROM {TICKER_SENTIMENT_TABLE} ts
+                    WHERE ts.news_id = n.id AND ts.ticker = :company_ticker
+                ) OR ({unnormalized} AND {json_match}))"""
+            else:
+                query += f" AND {json_match}"
             params['company_ticker'] = company_ticker
         
         # Order by publication date (newest first)
@@ -332,11 +537,25 @@ class NewsRepository:
         
         results = db_manager.execute_query(query, params)
         
+        sentiments: Dict[int, List[TickerSentiment]] = {}
+        topics: Dict[int, List[NewsTopic]] = {}
+        if normalized:
+            sentiments, topics = NewsRepository._load_normalized([row['id'] for row in results])
+        
         articles = []
         for row in results:
-            # Parse JSON fields
+            if row['id'] in sentiments or row['id'] in topics:
+                ticker_sentiment = sentiments.get(row['id'], [])
+                article_topics = topics.get(row['id'], [])
+            else:
+                sentiment_rows, topic_rows = explode_article(row)
+                ticker_sentiment = [NewsRepository._to_ticker_sentiment(r) for r in sentiment_rows]
+                article_topics = [NewsRepository._to_topic(r) for r in topic_rows]
+            
+            # raw_json only backfills empty columns; skip decoding it otherwise
             raw_json_data = {}
-            if row.get('raw_json'):
+            fallback_fields = ('title', 'summary', 'url', 'source', 'source_domain')
+            if row.get('raw_json') and not all(row[f] for f in fallback_fields):
                 try:
                     raw_json_data = json.loads(row['raw_json'])
                 except json.JSONDecodeError:
@@ -354,12 +573,8 @@ class NewsRepository:
                 overall_sentiment_score=float(row['overall_sentiment_score']) if row['overall_sentiment_score'] else 0.0,
                 overall_sentiment_label=row['overall_sentiment_label'] or 'Neutral',
                 banner_image=row['banner_image'],
-                ticker_sentiment=NewsRepository._parse_ticker_sentiment(
-                    row['ticker_sentiment_json'] or raw_json_data.get('ticker_sentiment', '[]')
-                ),
-                topics=NewsRepository._parse_topics(
-                    row['topics_json'] or raw_json_data.get('topics', '[]')
-                ),
+                ticker_sentiment=ticker_sentiment,
+                topics=article_topics,
                 category_within_source=row['category_within_source'] or ''
             )
             articles.append(article)
@@ -415,77 +630,17 @@ class CompanyOverviewRepository:
     """Repository for coreiq_av_company_overview table."""
     
     @staticmethod
-    def get_company_overview(ticker: str) -> Optional[CompanyOverview]:
-        """
-        Get company overview by ticker.
-        
-        Args:
-            ticker: Company ticker symbol
-            
-        Returns:
-            CompanyOverview object or None if not found
-        """
-        query = """
-            SELECT 
-                ticker,
-                name,
-                exchange,
-                currency,
-                country,
-                sector,
-                industry,
-                company_description,
-                official_site,
-                fiscal_year_end,
-                cik,
-                market_capitalization,
-                pe_ratio,
-                eps,
-                dividend_yield,
-                analyst_target_price,
-                raw_json,
-                fetched_at_utc
-            FROM coreiq_av_company_overview
-            WHERE ticker = :ticker
-            ORDER BY fetched_at_utc DESC
-            LIMIT 1
-        """
-        results = db_manager.execute_query(query, {"ticker": ticker})
-        
-        if not results:
-            return None
-        
-        row = results[0]
-        
-        # Parse raw_json for additional fields
-        raw_json_data = {}
-        if row.get('raw_json'):
-            try:
-                raw_json_data = json.loads(row['raw_json'])
-            except json.JSONDecodeError:
-                pass
-        
-        # Helper function to safely get float from various formats
-        def safe_float(value, default=None):
-            if value is None:
-                return default
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return default
-        
-        # Helper function to safely get int
-        def safe_int(value, default=None):
-            if value is None:
-                return default
-            try:
-                return int(float(value))
-            except (ValueError, TypeError):
-                return default
-        
+    @cached("overview_schema", tables=(OVERVIEW_TABLE,))
+    def _has_latest_table() -> bool:
+        """Whether the latest-overview table has been materialized (see data.latest_overview)."""
+        return latest_table_exists()
+    
+    @staticmethod
+    def _to_overview(row: Dict[str, Any]) -> CompanyOverview:
+        """Build a CompanyOverview from a latest-overview row (typed columns)."""
         return CompanyOverview(
-            ticker=row['ticker'] or ticker,
-            name=row['name'] or ticker,
+            ticker=row['ticker'],
+            name=row['name'] or row['ticker'],
             exchange=row['exchange'],
             currency=row['currency'],
             country=row['country'],
@@ -495,22 +650,21 @@ class CompanyOverviewRepository:
             official_site=row['official_site'],
             fiscal_year_end=row['fiscal_year_end'],
             cik=row['cik'],
-            market_capitalization=safe_int(row['market_capitalization']),
-            pe_ratio=safe_float(row['pe_ratio']),
-            eps=safe_float(row['eps']),
-            dividend_yield=safe_float(row['dividend_yield']),
-            analyst_target_price=safe_float(row['analyst_target_price']),
+            market_capitalization=to_int(row['market_capitalization']),
+            pe_ratio=to_float(row['pe_ratio']),
+            eps=to_float(row['eps']),
+            dividend_yield=to_float(row['dividend_yield']),
+            analyst_target_price=to_float(row['analyst_target_price']),
             fetched_at_utc=row['fetched_at_utc'],
-            # From raw_json
-            address=raw_json_data.get('Address'),
-            revenue_ttm=safe_float(raw_json_data.get('RevenueTTM')),
-            ebitda=safe_float(raw_json_data.get('EBITDA')),
-            profit_margin=safe_float(raw_json_data.get('ProfitMargin')),
-            shares_outstanding=safe_int(raw_json_data.get('SharesOutstanding')),
-            week_52_high=safe_float(raw_json_data.get('52WeekHigh')),
-            week_52_low=safe_float(raw_json_data.get('52WeekLow')),
-            dividend_per_share=safe_float(raw_json_data.get('DividendPerShare')),
-            latest_quarter=raw_json_data.get('LatestQuarter'),
+            address=row['address'],
+            revenue_ttm=row['revenue_ttm'],
+            ebitda=row['ebitda'],
+            profit_margin=row['profit_margin'],
+            shares_outstanding=to_int(row['shares_outstanding']),
+            week_52_high=row['week_52_high'],
+            week_52_low=row['week_52_low'],
+            dividend_per_share=row['dividend_per_share'],
+            latest_quarter=row['latest_quarter'],
             # Placeholder fields - not in database
             employees="N/A",
             year_founded="N/A",
@@ -522,6 +676,68 @@ class CompanyOverviewRepository:
             activity_logs="N/A"
         )
     
+    @staticmethod
+    @cached("company_overview", tables=(OVERVIEW_TABLE,))
+    def get_company_overview(ticker: str) -> Optional[CompanyOverview]:
+        """
+        Get company overview by ticker.
+        
+        Results are shared through the process cache; do not mutate them.
+        
+        Args:
+            ticker: Company ticker symbol
+            
+        Returns:
+            CompanyOverview object or None if not found
+        """
+        return CompanyOverviewRepository.get_company_overviews([ticker]).get(ticker)
+    
+    @staticmethod
+    def get_company_overviews(tickers: List[str]) -> Dict[str, CompanyOverview]:
+        """
+        Get the latest overview of many companies with one query.
+        
+        Reads the materialized latest-overview table when it exists; tickers
+        it does not hold (no table, or overviews written outside data.ingest
+        before a backfill) fall back to their newest overview row, parsing
+        raw_json. Tickers already cached by get_company_overview are not
+        queried again, and every loaded overview is cached for it.
+        
+        Args:
+            tickers: Company ticker symbols
+            
+        Returns:
+            Mapping of ticker to CompanyOverview (tickers without data are absent)
+        """
+        overviews: Dict[str, CompanyOverview] = {}
+        missing = []
+        for ticker in dict.fromkeys(tickers):
+            cached_overview = cache.get(("company_overview", ticker), _NOT_CACHED)
+            if cached_overview is _NOT_CACHED:
+                missing.append(ticker)
+            elif cached_overview is not None:
+                overviews[ticker] = cached_overview
+        if not missing:
+            return overviews
+        
+        rows = []
+        if CompanyOverviewRepository._has_latest_table():
+            condition, params = in_clause("ticker", missing)
+            rows = db_manager.execute_query(
+                f"SELECT {', '.join(LATEST_COLUMNS)} FROM {LATEST_OVERVIEW_TABLE} WHERE {condition}",
+                params
+            )
+        materialized = {row['ticker'] for row in rows}
+        unmaterialized = [t for t in missing if t not in materialized]
+        if unmaterialized:
+            rows += [materialize(row) for row in latest_source_rows(unmaterialized)]
+        
+        for row in rows:
+            overviews[row['ticker']] = CompanyOverviewRepository._to_overview(row)
+        for ticker in missing:
+            cache.set(("company_overview", ticker), overviews.get(ticker))
+        return overviews
+    
     @staticmethod
     def company_exists(ticker: str) -> bool:
         """Check if company overview exists for ticker."""
@@ -735,91 +951,52 @@ class EarningsCallRepository:
         return [row['q'] for row in results]
 
 
-class BalanceSheetRepository:
-    """Repository for coreiq_av_financials_balance_sheet table.
+class _RawJsonStatementRepository:
+    """Shared reads of the statement tables that keep their values in raw_json.
     
-    Uses raw_json column for data extraction as per manager requirements.
+    Subclasses set the source table, the snapshot table key and whether the
+    statement is a flow (TTM sums four quarters) or point-in-time balances.
     """
     
-    # Mapping of UI labels to raw_json keys
-    # Organized by section: Assets, Liabilities, Shareholders' Equity
-    # IMPORTANT: Totals come AFTER their components (at the bottom)
-    LINE_ITEMS = [
-        # ASSETS - Current
-        ("Cash & Cash Equivalents", "cashAndCashEquivalentsAtCarryingValue", False, "assets"),
-        ("Cash & Short Term Investments", "cashAndShortTermInvestments", False, "assets"),
-        ("Inventory", "inventory", False, "assets"),
-        ("Current Net Receivables", "currentNetReceivables", False, "assets"),
-        ("Other Current Assets", "otherCurrentAssets", False, "assets"),
-        ("Total Current Assets", "totalCurrentAssets", False, "assets"),
-        
-        # ASSETS - Non-Current
-        ("Property Plant & Equipment", "propertyPlantEquipment", False, "assets"),
-        ("Intangible Assets", "intangibleAssets", False, "assets"),
-        ("Intangible Assets Excl. Goodwill", "intangibleAssetsExcludingGoodwill", False, "assets"),
-        ("Goodwill", "goodwill", False, "assets"),
-        ("Long Term Investments", "longTermInvestments", False, "assets"),
-        ("Other Non-Current Assets", "otherNonCurrentAssets", False, "assets"),
-        ("Total Non-Current Assets", "totalNonCurrentAssets", False, "assets"),
-        
-        # ASSETS - Total
-        ("Total Assets", "totalAssets", False, "assets"),
-        
-        # LIABILITIES - Current
-        ("Current Accounts Payable", "currentAccountsPayable", False, "liabilities"),
-        ("Deferred Revenue", "deferredRevenue", False, "liabilities"),
-        ("Current Debt", "currentDebt", False, "liabilities"),
-        ("Short Term Debt", "shortTermDebt", False, "liabilities"),
-        ("Other Current Liabilities", "otherCurrentLiabilities", False, "liabilities"),
-        ("Total Current Liabilities", "totalCurrentLiabilities", False, "liabilities"),
-        
-        # LIABILITIES - Non-Current
-        ("Long Term Debt", "longTermDebt", False, "liabilities"),
-        ("Long Term Debt Noncurrent", "longTermDebtNoncurrent", False, "liabilities"),
-        ("Capital Lease Obligations", "capitalLeaseObligations", False, "liabilities"),
-        ("Other Non-Current Liabilities", "otherNonCurrentLiabilities", False, "liabilities"),
-        ("Total Non-Current Liabilities", "totalNonCurrentLiabilities", False, "liabilities"),
-        
-        # LIABILITIES - Total
-        ("Total Liabilities", "totalLiabilities", False, "liabilities"),
-        
-        # SHAREHOLDERS' EQUITY - Components
-        ("Common Stock", "commonStock", False, "equity"),
-        ("Retained Earnings", "retainedEarnings", False, "equity"),
-        ("Treasury Stock", "treasuryStock", False, "equity"),
-        
-        # SHAREHOLDERS' EQUITY - Total
-        ("Total Shareholder Equity", "totalShareholderEquity", False, "equity"),
-    ]
+    TABLE: str = ""
+    STATEMENT: str = ""
+    FLOW: bool = True
+    LINE_ITEMS: List[Tuple[str, str, bool, str]] = []
     
-    @staticmethod
-    def get_date_range(ticker: str) -> Tuple[Optional[date], Optional[date]]:
+    @classmethod
+    def get_date_range(cls, ticker: str, period: ReportPeriod = ReportPeriod.ANNUAL) -> Tuple[Optional[date], Optional[date]]:
         """Get min and max fiscal dates for a ticker."""
-        query = """
+        query = f"""
             SELECT 
                 MIN(fiscal_date_ending) as min_date,
                 MAX(fiscal_date_ending) as max_date
-            FROM coreiq_av_financials_balance_sheet
+            FROM {cls.TABLE}
             WHERE ticker = :ticker
-              AND report_type = 'annual'
+              AND report_type = :report_type
         """
-        results = db_manager.execute_query(query, {"ticker": ticker})
+        results = db_manager.execute_query(query, {
+            "ticker": ticker,
+            "report_type": period.report_type
+        })
         if not results:
             return None, None
         row = results[0]
-        return row['min_date'], row['max_date']
+        return _to_date(row['min_date']), _to_date(row['max_date'])
     
-    @staticmethod
-    def get_available_dates(ticker: str) -> List[date]:
+    @classmethod
+    def get_available_dates(cls, ticker: str, period: ReportPeriod = ReportPeriod.ANNUAL) -> List[date]:
         """Get all available fiscal dates for dropdown."""
-        query = """
+        query = f"""
             SELECT DISTINCT fiscal_date_ending
-            FROM coreiq_av_financials_balance_sheet
+            FROM {cls.TABLE}
             WHERE ticker = :ticker
-              AND report_type = 'annual'
+              AND report_type = :report_type
             ORDER BY fiscal_date_ending ASC
         """
-        results = db_manager.execute_query(query, {"ticker": ticker})
+        results = db_manager.execute_query(query, {
+            "ticker": ticker,
+            "report_type": period.report_type
+        })
         return [row['fiscal_date_ending'] for row in results]
     
     @staticmethod
@@ -849,110 +1026,298 @@ class BalanceSheetRepository:
                     return float(val)
                 except (ValueError, TypeError):
                     return None
-        # Try camelCase conversion for some common variations
         return None
     
-    @staticmethod
-    def get_balance_sheet_data(
+    @classmethod
+    def _fetch_rows(
+        cls,
         ticker: str,
         start_date: date,
-        end_date: date
-    ) -> BalanceSheetData:
-        """Get balance sheet data for date range using raw_json."""
-        # Fetch company info
-        company = CompanyRepository.get_company_by_ticker(ticker)
-        if not company:
-            raise ValueError(f"Company not found: {ticker}")
-        
-        # Fetch raw_json data
-        query = """
+        end_date: date,
+        period: ReportPeriod
+    ) -> List[Dict[str, Any]]:
+        """Fetch one company's statement rows from the OLTP table."""
+        query = f"""
             SELECT fiscal_date_ending, raw_json, reported_currency
-            FROM coreiq_av_financials_balance_sheet
+            FROM {cls.TABLE}
             WHERE ticker = :ticker
               AND fiscal_date_ending BETWEEN :start_date AND :end_date
-              AND report_type = 'annual'
+              AND report_type = :report_type
             ORDER BY fiscal_date_ending ASC
         """
-        results = db_manager.execute_query(query, {
+        return db_manager.execute_query(query, {
             "ticker": ticker,
             "start_date": start_date,
-            "end_date": end_date
+            "end_date": end_date,
+            "report_type": period.report_type
         })
+    
+    @classmethod
+    def _fetch_rows_by_ticker(
+        cls,
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+        period: ReportPeriod
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch statement rows of many companies grouped by ticker, from the snapshot if available."""
+        results = snapshot_store.get_statement_rows_by_ticker(
+            cls.STATEMENT, tickers, start_date, end_date, period.report_type
+        )
+        if results is None:
+            condition, params = in_clause("ticker", tickers)
+            query = f"""
+                SELECT ticker, fiscal_date_ending, raw_json, reported_currency
+                FROM {cls.TABLE}
+                WHERE {condition}
+                  AND fiscal_date_ending BETWEEN :start_date AND :end_date
+                  AND report_type = :report_type
+                ORDER BY ticker, fiscal_date_ending ASC
+            """
+            results = {}
+            for row in db_manager.execute_query(query, {
+                **params,
+                "start_date": start_date,
+                "end_date": end_date,
+                "report_type": period.report_type
+            }):
+                results.setdefault(row['ticker'], []).append(row)
+        return results
+    
+    @classmethod
+    def get_statement_matrix(
+        cls,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        period: ReportPeriod = ReportPeriod.ANNUAL,
+        keys: Optional[List[str]] = None
+    ) -> StatementMatrix:
+        """
+        Get statement values as a (raw_json key x period) matrix in source units.
         
-        if not results:
-            # Return empty structure
-            return BalanceSheetData(
-                company=company,
-                periods=[],
-                line_items=[]
-            )
+        Args:
+            ticker: Company ticker
+            start_date: First fiscal date to include
+            end_date: Last fiscal date to include
+            period: Annual, quarterly or TTM view
+            keys: raw_json keys to load (default: LINE_ITEMS keys)
+        """
+        if keys is None:
+            keys = [json_key for _, json_key, _, _ in cls.LINE_ITEMS]
+        results = cls._fetch_rows(
+            ticker, fetch_start_date(start_date, period), end_date, period
+        )
+        return cls._rows_matrix(results, start_date, period, keys)
+    
+    @classmethod
+    def get_statement_matrices(
+        cls,
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+        period: ReportPeriod = ReportPeriod.ANNUAL,
+        keys: Optional[List[str]] = None
+    ) -> Dict[str, StatementMatrix]:
+        """
+        Get statement matrices of many companies with one query.
         
-        # Create periods from results
-        periods = [
-            FiscalPeriod.from_date(row['fiscal_date_ending'])
-            for row in results
-        ]
+        Args:
+            tickers: Company tickers
+            start_date: First fiscal date to include
+            end_date: Last fiscal date to include
+            period: Annual, quarterly or TTM view
+            keys: raw_json keys to load (default: LINE_ITEMS keys)
         
-        # Parse all raw_json data
+        Returns:
+            Ticker -> matrix (see get_statement_matrix); tickers without rows are absent
+        """
+        if keys is None:
+            keys = [json_key for _, json_key, _, _ in cls.LINE_ITEMS]
+        if not tickers:
+            return {}
+        rows_by_ticker = cls._fetch_rows_by_ticker(
+            list(tickers), fetch_start_date(start_date, period), end_date, period
+        )
+        return {
+            ticker: cls._rows_matrix(rows, start_date, period, keys)
+            for ticker, rows in rows_by_ticker.items()
+        }
+    
+    @classmethod
+    def _rows_matrix(
+        cls,
+        results: List[Dict[str, Any]],
+        start_date: date,
+        period: ReportPeriod,
+        keys: List[str]
+    ) -> StatementMatrix:
+        """Pivot one company's statement rows into a matrix."""
         json_data_list = [
-            BalanceSheetRepository._parse_raw_json(row['raw_json'])
+            cls._parse_raw_json(row['raw_json'])
             for row in results
         ]
-        
-        # Build line items from raw_json
-        line_items = []
-        for label, json_key, is_calc, section in BalanceSheetRepository.LINE_ITEMS:
-            values = []
-            for json_data in json_data_list:
-                val = BalanceSheetRepository._get_nested_value(json_data, json_key)
-                if val is not None:
-                    # Convert to millions
-                    values.append(val / 1_000_000)
-                else:
-                    values.append(None)
-            
-            # Only add line item if at least one period has data
-            if any(v is not None for v in values):
-                line_items.append(BalanceSheetLineItem(
-                    label=label,
-                    key=json_key,
-                    values=values,
-                    is_calculated=is_calc,
-                    section=section
-                ))
-        
-        return BalanceSheetData(
-            company=company,
-            periods=periods,
-            line_items=line_items
+        dates, matrix = pivot_statement(
+            dates=[row['fiscal_date_ending'] for row in results],
+            rows=[
+                [cls._get_nested_value(json_data, key) for key in keys]
+                for json_data in json_data_list
+            ],
+            n_items=len(keys),
+            period=period,
+            start_date=start_date,
+            flow=cls.FLOW
         )
+        return StatementMatrix(dates=dates, keys=keys, values=matrix)
     
-    @staticmethod
-    def get_reported_currency(ticker: str, fiscal_date: date) -> str:
+    @classmethod
+    def get_reported_currency(cls, ticker: str, fiscal_date: date, period: ReportPeriod = ReportPeriod.ANNUAL) -> str:
         """Get the reported currency for a specific fiscal period."""
-        query = """
+        query = f"""
             SELECT reported_currency
-            FROM coreiq_av_financials_balance_sheet
+            FROM {cls.TABLE}
             WHERE ticker = :ticker
               AND fiscal_date_ending = :fiscal_date
-              AND report_type = 'annual'
+              AND report_type = :report_type
             LIMIT 1
         """
         results = db_manager.execute_query(query, {
             "ticker": ticker,
-            "fiscal_date": fiscal_date
+            "fiscal_date": fiscal_date,
+            "report_type": period.report_type
         })
         if results and results[0].get('reported_currency'):
             return results[0]['reported_currency']
         return "USD"  # Default fallback
 
 
-class CashFlowRepository:
+class BalanceSheetRepository(_RawJsonStatementRepository):
+    """Repository for coreiq_av_financials_balance_sheet table.
+    
+    Uses raw_json column for data extraction as per manager requirements.
+    """
+    
+    TABLE = "coreiq_av_financials_balance_sheet"
+    STATEMENT = "balance_sheet"
+    # Balances are point-in-time, so TTM keeps the quarter-end value
+    FLOW = False
+    
+    # Mapping of UI labels to raw_json keys
+    # Organized by section: Assets, Liabilities, Shareholders' Equity
+    # IMPORTANT: Totals come AFTER their components (at the bottom)
+    LINE_ITEMS = [
+        # ASSETS - Current
+        ("Cash & Cash Equivalents", "cashAndCashEquivalentsAtCarryingValue", False, "assets"),
+        ("Cash & Short Term Investments", "cashAndShortTermInvestments", False, "assets"),
+        ("Inventory", "inventory", False, "assets"),
+        ("Current Net Receivables", "currentNetReceivables", False, "assets"),
+        ("Other Current Assets", "otherCurrentAssets", False, "assets"),
+        ("Total Current Assets", "totalCurrentAssets", False, "assets"),
+        
+        # ASSETS - Non-Current
+        ("Property Plant & Equipment", "propertyPlantEquipment", False, "assets"),
+        ("Intangible Assets", "intangibleAssets", False, "assets"),
+        ("Intangible Assets Excl. Goodwill", "intangibleAssetsExcludingGoodwill", False, "assets"),
+        ("Goodwill", "goodwill", False, "assets"),
+        ("Long Term Investments", "longTermInvestments", False, "assets"),
+        ("Other Non-Current Assets", "otherNonCurrentAssets", False, "assets"),
+        ("Total Non-Current Assets", "totalNonCurrentAssets", False, "assets"),
+        
+        # ASSETS - Total
+        ("Total Assets", "totalAssets", False, "assets"),
+        
+        # LIABILITIES - Current
+        ("Current Accounts Payable", "currentAccountsPayable", False, "liabilities"),
+        ("Deferred Revenue", "deferredRevenue", False, "liabilities"),
+        ("Current Debt", "currentDebt", False, "liabilities"),
+        ("Short Term Debt", "shortTermDebt", False, "liabilities"),
+        ("Other Current Liabilities", "otherCurrentLiabilities", False, "liabilities"),
+        ("Total Current Liabilities", "totalCurrentLiabilities", False, "liabilities"),
+        
+        # LIABILITIES - Non-Current
+        ("Long Term Debt", "longTermDebt", False, "liabilities"),
+        ("Long Term Debt Noncurrent", "longTermDebtNoncurrent", False, "liabilities"),
+        ("Capital Lease Obligations", "capitalLeaseObligations", False, "liabilities"),
+        ("Other Non-Current Liabilities", "otherNonCurrentLiabilities", False, "liabilities"),
+        ("Total Non-Current Liabilities", "totalNonCurrentLiabilities", False, "liabilities"),
+        
+        # LIABILITIES - Total
+        ("Total Liabilities", "totalLiabilities", False, "liabilities"),
+        
+        # SHAREHOLDERS' EQUITY - Components
+        ("Common Stock", "commonStock", False, "equity"),
+        ("Retained Earnings", "retainedEarnings", False, "equity"),
+        ("Treasury Stock", "treasuryStock", False, "equity"),
+        
+        # SHAREHOLDERS' EQUITY - Total
+        ("Total Shareholder Equity", "totalShareholderEquity", False, "equity"),
+    ]
+    
+    @staticmethod
+    @cached("balance_sheet", tables=("coreiq_av_financials_balance_sheet",))
+    def get_balance_sheet_data(
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        period: ReportPeriod = ReportPeriod.ANNUAL
+    ) -> BalanceSheetData:
+        """Get balance sheet data for date range using raw_json (annual, quarterly or TTM).
+        
+        Results are shared through the process cache; do not mutate them.
+        """
+        # Fetch company info
+        company = CompanyRepository.get_company_by_ticker(ticker)
+        if not company:
+            raise ValueError(f"Company not found: {ticker}")
+        
+        matrix = BalanceSheetRepository.get_statement_matrix(ticker, start_date, end_date, period)
+        
+        if not matrix.dates:
+            # Return empty structure
+            return BalanceSheetData(
+                company=company,
+                periods=[],
+                line_items=[],
+                period=period
+            )
+        
+        periods = [FiscalPeriod.from_date(d, period) for d in matrix.dates]
+        
+        # Build line items (values in millions), skipping rows with no data in any period
+        has_data = ~np.isnan(matrix.values).all(axis=1)
+        line_items = [
+            BalanceSheetLineItem(
+                label=label,
+                key=json_key,
+                values=values,
+                is_calculated=is_calc,
+                section=section
+            )
+            for (label, json_key, is_calc, section), values, keep in zip(
+                BalanceSheetRepository.LINE_ITEMS, to_display_values(matrix.values), has_data
+            )
+            if keep
+        ]
+        
+        return BalanceSheetData(
+            company=company,
+            periods=periods,
+            line_items=line_items,
+            period=period
+        )
+
+
+class CashFlowRepository(_RawJsonStatementRepository):
     """Repository for coreiq_av_financials_cash_flow table.
     
     Uses raw_json column for data extraction.
     """
     
+    TABLE = "coreiq_av_financials_cash_flow"
+    STATEMENT = "cash_flow"
+    # Flow statement: TTM sums the trailing four quarters
+    FLOW = True
+    
     # Mapping of UI labels to raw_json keys
     # Organized by section: Operating, Investing, Financing
     # IMPORTANT: Totals come AFTER their components (at the bottom)
@@ -993,157 +1358,57 @@ class CashFlowRepository:
     ]
     
     @staticmethod
-    def get_date_range(ticker: str) -> Tuple[Optional[date], Optional[date]]:
-        """Get min and max fiscal dates for a ticker."""
-        query = """
-            SELECT 
-                MIN(fiscal_date_ending) as min_date,
-                MAX(fiscal_date_ending) as max_date
-            FROM coreiq_av_financials_cash_flow
-            WHERE ticker = :ticker
-              AND report_type = 'annual'
-        """
-        results = db_manager.execute_query(query, {"ticker": ticker})
-        if not results:
-            return None, None
-        row = results[0]
-        return row['min_date'], row['max_date']
-    
-    @staticmethod
-    def get_available_dates(ticker: str) -> List[date]:
-        """Get all available fiscal dates for dropdown."""
-        query = """
-            SELECT DISTINCT fiscal_date_ending
-            FROM coreiq_av_financials_cash_flow
-            WHERE ticker = :ticker
-              AND report_type = 'annual'
-            ORDER BY fiscal_date_ending ASC
-        """
-        results = db_manager.execute_query(query, {"ticker": ticker})
-        return [row['fiscal_date_ending'] for row in results]
-    
-    @staticmethod
-    def _parse_raw_json(raw_json: Any) -> Dict[str, Any]:
-        """Parse raw_json field from database."""
-        if raw_json is None:
-            return {}
-        if isinstance(raw_json, str):
-            try:
-                return json.loads(raw_json)
-            except json.JSONDecodeError:
-                return {}
-        if isinstance(raw_json, dict):
-            return raw_json
-        return {}
-    
-    @staticmethod
-    def _get_nested_value(data: Dict[str, Any], key: str) -> Optional[float]:
-        """Get value from nested dict structure."""
-        if not data:
-            return None
-        # Try direct key first
-        if key in data:
-            val = data[key]
-            if val is not None and val != "None":
-                try:
-                    return float(val)
-                except (ValueError, TypeError):
-                    return None
-        return None
-    
-    @staticmethod
+    @cached("cash_flow", tables=("coreiq_av_financials_cash_flow",))
     def get_cash_flow_data(
         ticker: str,
         start_date: date,
-        end_date: date
+        end_date: date,
+        period: ReportPeriod = ReportPeriod.ANNUAL
     ) -> CashFlowData:
-        """Get cash flow data for date range using raw_json."""
+        """Get cash flow data for date range using raw_json (annual, quarterly or TTM).
+        
+        Results are shared through the process cache; do not mutate them.
+        """
         # Fetch company info
         company = CompanyRepository.get_company_by_ticker(ticker)
         if not company:
             raise ValueError(f"Company not found: {ticker}")
         
-        # Fetch raw_json data
-        query = """
-            SELECT fiscal_date_ending, raw_json, reported_currency
-            FROM coreiq_av_financials_cash_flow
-            WHERE ticker = :ticker
-              AND fiscal_date_ending BETWEEN :start_date AND :end_date
-              AND report_type = 'annual'
-            ORDER BY fiscal_date_ending ASC
-        """
-        results = db_manager.execute_query(query, {
-            "ticker": ticker,
-            "start_date": start_date,
-            "end_date": end_date
-        })
+        matrix = CashFlowRepository.get_statement_matrix(ticker, start_date, end_date, period)
         
-        if not results:
+        if not matrix.dates:
             # Return empty structure
             return CashFlowData(
                 company=company,
                 periods=[],
-                line_items=[]
+                line_items=[],
+                period=period
             )
         
-        # Create periods from results
-        periods = [
-            FiscalPeriod.from_date(row['fiscal_date_ending'])
-            for row in results
-        ]
+        periods = [FiscalPeriod.from_date(d, period) for d in matrix.dates]
         
-        # Parse all raw_json data
-        json_data_list = [
-            CashFlowRepository._parse_raw_json(row['raw_json'])
-            for row in results
+        # Build line items (values in millions), skipping rows with no data in any period
+        has_data = ~np.isnan(matrix.values).all(axis=1)
+        line_items = [
+            CashFlowLineItem(
+                label=label,
+                key=json_key,
+                values=values,
+                is_calculated=is_calc,
+                section=section
+            )
+            for (label, json_key, is_calc, section), values, keep in zip(
+                CashFlowRepository.LINE_ITEMS, to_display_values(matrix.values), has_data
+            )
+            if keep
         ]
         
-        # Build line items from raw_json
-        line_items = []
-        for label, json_key, is_calc, section in CashFlowRepository.LINE_ITEMS:
-            values = []
-            for json_data in json_data_list:
-                val = CashFlowRepository._get_nested_value(json_data, json_key)
-                if val is not None:
-                    # Convert to millions
-                    values.append(val / 1_000_000)
-                else:
-                    values.append(None)
-            
-            # Only add line item if at least one period has data
-            if any(v is not None for v in values):
-                line_items.append(CashFlowLineItem(
-                    label=label,
-                    key=json_key,
-                    values=values,
-                    is_calculated=is_calc,
-                    section=section
-                ))
-        
         return CashFlowData(
             company=company,
             periods=periods,
-            line_items=line_items
+            line_items=line_items,
+            period=period
         )
-    
-    @staticmethod
-    def get_reported_currency(ticker: str, fiscal_date: date) -> str:
-        """Get the reported currency for a specific fiscal period."""
-        query = """
-            SELECT reported_currency
-            FROM coreiq_av_financials_cash_flow
-            WHERE ticker = :ticker
-              AND fiscal_date_ending = :fiscal_date
-              AND report_type = 'annual'
-            LIMIT 1
-        """
-        results = db_manager.execute_query(query, {
-            "ticker": ticker,
-            "fiscal_date": fiscal_date
-        })
-        if results and results[0].get('reported_currency'):
-            return results[0]['reported_currency']
-        return "USD"  # Default fallback
 
 
 class ForexRepository:
@@ -0,0 +1,94 @@
+"""
+OHLCV resampling of daily price bars.
+
+Price histories are date-sorted column arrays (PriceSeries). Weekly,
+monthly and quarterly bars are built in one pass with NumPy: each daily bar
+gets a period label, period boundaries are where the label changes, and
+np.*.reduceat aggregates every period at once (first open, highest high,
+lowest low, last close, summed volume). Date ranges are cut from the daily
+bars with PriceSeries.between(), a binary search on the sorted dates,
+before aggregating, so a bar never carries data from outside the range.
+
+The functions take plain arrays, so the dummy repository and a database-
+backed one share them; resampled_history() caches the aggregated series
+per (ticker, frequency, range) in the shared cache.
+"""
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from core.cache import cache
+from data.models import DataFrequency, PriceSeries
+
+# Period labels are calendar days
+_DAY = "datetime64[D]"
+
+# 1970-01-01 was a Thursday; shifting by 3 days makes weeks start on Monday
+_MONDAY_OFFSET = 3
+
+
+def period_start(dates: np.ndarray, frequency: DataFrequency) -> np.ndarray:
+    """
+    First calendar day of the period containing each date.
+
+    Weeks start on Monday; quarters are calendar quarters.
+    """
+    days = dates.astype(_DAY)
+    if frequency == DataFrequency.DAILY:
+        return days
+    if frequency == DataFrequency.WEEKLY:
+        weekday = (days.astype(np.int64) + _MONDAY_OFFSET) % 7
+        return days - weekday.astype("timedelta64[D]")
+    months = days.astype("datetime64[M]")
+    if frequency == DataFrequency.QUARTERLY:
+        months = months - (months.astype(np.int64) % 3).astype("timedelta64[M]")
+    return months.astype(_DAY)
+
+
+def resample(bars: PriceSeries, frequency: DataFrequency) -> PriceSeries:
+    """
+    Aggregate date-sorted daily bars to the given frequency.
+
+    Each output bar is dated at the first day of its period. Periods without
+    bars are omitted.
+    """
+    if frequency == DataFrequency.DAILY or len(bars) == 0:
+        return bars
+    labels = period_start(bars.dates, frequency)
+    starts = np.flatnonzero(np.concatenate(([True], labels[1:] != labels[:-1])))
+    ends = np.append(starts[1:], len(bars)) - 1
+    return PriceSeries(
+        dates=labels[starts].astype(bars.dates.dtype),
+        open=bars.open[starts],
+        high=np.fmax.reduceat(bars.high, starts),
+        low=np.fmin.reduceat(bars.low, starts),
+        close=bars.close[ends],
+        volume=np.add.reduceat(bars.volume, starts),
+    )
+
+
+def resampled_history(
+    ticker: str,
+    frequency: DataFrequency,
+    load_daily: Callable[[str], PriceSeries],
+    start: Optional[Any] = None,
+    end: Optional[Any] = None
+) -> PriceSeries:
+    """
+    Daily bars of a ticker within [start, end] resampled to frequency.
+
+    The daily bars are sliced to the range first, so periods cut by either
+    bound aggregate only the days inside it (still dated at their period
+    start). Results are cached per (ticker, frequency, start, end).
+
+    Args:
+        ticker: Company ticker
+        frequency: Target bar frequency
+        load_daily: Loads the ticker's full date-sorted daily bars
+        start: First day of the range (None = unbounded)
+        end: Last day of the range (None = unbounded)
+    """
+    return cache.get_or_compute(
+        ("price_history", ticker.upper(), frequency, start, end),
+        lambda: resample(load_daily(ticker).between(start, end), frequency),
+    )
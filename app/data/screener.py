@@ -0,0 +1,251 @@
+"""
+Company screener over an in-memory index of overview metrics.
+
+The latest overview of every company is loaded in one streamed query into a
+columnar ScreenerIndex: one float64 array per metric plus category codes for
+sector and exchange. The query reads the materialized latest-overview table
+when it exists (see data.latest_overview); otherwise, and for tickers it
+does not hold yet, it ranks the overview table and parses raw_json once per
+company. A screen is a few boolean masks and one argsort over those
+arrays, so a multi-criteria screen over thousands of companies takes a
+millisecond or two and issues no SQL.
+
+The index is kept in the shared cache and rebuilt after the overview table
+changes (TABLE_CHANGED from data.ingest or the change watcher).
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.cache import cached
+from core.database import db_manager
+from data.latest_overview import (
+    LATEST_OVERVIEW_TABLE, OVERVIEW_TABLE, latest_table_exists, raw_fields, to_float
+)
+
+
+@dataclass(frozen=True)
+class ScreenMetric:
+    """A numeric overview field that companies can be screened on."""
+    key: str
+    label: str
+    column: Optional[str] = None    # Column of the overview table; None for raw_json fields,
+                                    # parsed as `key` by latest_overview.raw_fields
+    unit: str = "number"            # number, currency, market_cap or percentage (stored as a fraction)
+
+
+SCREEN_METRICS: List[ScreenMetric] = [
+    ScreenMetric("market_cap", "Market Cap", column="market_capitalization", unit="market_cap"),
+    ScreenMetric("pe_ratio", "P/E Ratio", column="pe_ratio"),
+    ScreenMetric("eps", "EPS", column="eps", unit="currency"),
+    ScreenMetric("dividend_yield", "Dividend Yield", column="dividend_yield", unit="percentage"),
+    ScreenMetric("profit_margin", "Profit Margin", unit="percentage"),
+    ScreenMetric("operating_margin", "Operating Margin", unit="percentage"),
+    ScreenMetric("return_on_equity", "Return on Equity", unit="percentage"),
+    ScreenMetric("revenue_ttm", "Revenue (TTM)", unit="market_cap"),
+    ScreenMetric("ebitda", "EBITDA", unit="market_cap"),
+    ScreenMetric("price_to_book", "Price/Book"),
+    ScreenMetric("analyst_target_price", "Analyst Target", column="analyst_target_price", unit="currency"),
+]
+
+SCREEN_METRICS_BY_KEY: Dict[str, ScreenMetric] = {m.key: m for m in SCREEN_METRICS}
+
+
+@dataclass(frozen=True)
+class Criterion:
+    """Inclusive bounds on one metric; companies without a value fail it."""
+    metric: str
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class ScreenerIndex:
+    """
+    Latest overview metrics of every company, one array per field.
+
+    Rows are ordered by ticker. Sector and exchange are stored as integer
+    codes into the sectors/exchanges tuples (-1 = unknown).
+    """
+    tickers: np.ndarray
+    names: np.ndarray
+    sector_codes: np.ndarray
+    sectors: Tuple[str, ...]
+    exchange_codes: np.ndarray
+    exchanges: Tuple[str, ...]
+    metrics: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def to_frame(self, rows: np.ndarray) -> pd.DataFrame:
+        """Display rows (ticker, name, sector, exchange and every metric) in the given order."""
+        sectors = np.array(self.sectors + ("",), dtype=object)
+        exchanges = np.array(self.exchanges + ("",), dtype=object)
+        frame = {
+            "ticker": self.tickers[rows],
+            "name": self.names[rows],
+            "sector": sectors[self.sector_codes[rows]],
+            "exchange": exchanges[self.exchange_codes[rows]],
+        }
+        for key, values in self.metrics.items():
+            frame[key] = values[rows]
+        return pd.DataFrame(frame)
+
+
+def _to_float(value: Any) -> float:
+    """Parse a numeric overview value (see latest_overview.to_float); missing values become NaN."""
+    number = to_float(value)
+    return np.nan if number is None else number
+
+
+def _codes(values: List[Optional[str]]) -> Tuple[np.ndarray, Tuple[str, ...]]:
+    """Factorize labels into sorted categories and int codes (-1 for missing)."""
+    codes, categories = pd.factorize(
+        pd.Series([v or None for v in values], dtype=object), sort=True
+    )
+    return codes.astype(np.int32), tuple(categories)
+
+
+def _latest_table_records() -> Tuple[List[Dict[str, Any]], Dict[str, List[float]]]:
+    """Index rows from the materialized latest-overview table (typed columns)."""
+    columns = [m.column or m.key for m in SCREEN_METRICS]
+    query = f"""
+        SELECT ticker, name, sector, exchange, {', '.join(columns)}
+        FROM {LATEST_OVERVIEW_TABLE}
+        ORDER BY ticker
+    """
+    records = [record for batch in db_manager.stream_query(query) for record in batch.records()]
+    values = {
+        m.key: [_to_float(record[m.column or m.key]) for record in records]
+        for m in SCREEN_METRICS
+    }
+    return records, values
+
+
+def _overview_table_records(unmaterialized_only: bool = False) -> Tuple[List[Dict[str, Any]], Dict[str, List[float]]]:
+    """
+    Index rows from the newest overview row per ticker, parsing raw_json.
+
+    Args:
+        unmaterialized_only: Only tickers missing from the latest-overview table
+    """
+    columns = sorted({m.column for m in SCREEN_METRICS if m.column})
+    where = f"WHERE ticker NOT IN (SELECT ticker FROM {LATEST_OVERVIEW_TABLE})" if unmaterialized_only else ""
+    query = f"""
+        SELECT ticker, name, sector, exchange, {', '.join(columns)}, raw_json
+        FROM (
+            SELECT o.*, ROW_NUMBER() OVER (
+                PARTITION BY ticker ORDER BY fetched_at_utc DESC
+            ) AS row_rank
+            FROM {OVERVIEW_TABLE} o
+            {where}
+        ) ranked
+        WHERE row_rank = 1
+        ORDER BY ticker
+    """
+    records = [record for batch in db_manager.stream_query(query) for record in batch.records()]
+
+    values: Dict[str, List[float]] = {m.key: [] for m in SCREEN_METRICS}
+    for record in records:
+        raw = raw_fields(record.get("raw_json"))
+        for metric in SCREEN_METRICS:
+            value = record[metric.column] if metric.column else raw[metric.key]
+            values[metric.key].append(_to_float(value))
+    return records, values
+
+
+def build_index() -> ScreenerIndex:
+    """Load the latest overview of every company into a ScreenerIndex."""
+    if latest_table_exists():
+        records, values = _latest_table_records()
+        # Overviews written outside data.ingest before a backfill are not
+        # materialized yet; read those tickers from the overview table
+        extra, extra_values = _overview_table_records(unmaterialized_only=True)
+        if extra:
+            records = records + extra
+            values = {key: v + extra_values[key] for key, v in values.items()}
+            order = sorted(range(len(records)), key=lambda i: records[i]["ticker"])
+            records = [records[i] for i in order]
+            values = {key: [v[i] for i in order] for key, v in values.items()}
+    else:
+        records, values = _overview_table_records()
+
+    sector_codes, sectors = _codes([r["sector"] for r in records])
+    exchange_codes, exchanges = _codes([r["exchange"] for r in records])
+    index = ScreenerIndex(
+        tickers=np.array([r["ticker"] for r in records], dtype=object),
+        names=np.array([r["name"] or r["ticker"] for r in records], dtype=object),
+        sector_codes=sector_codes,
+        sectors=sectors,
+        exchange_codes=exchange_codes,
+        exchanges=exchanges,
+        metrics={key: np.array(v, dtype=np.float64) for key, v in values.items()},
+    )
+    # Shared through the cache: make the arrays read-only
+    for array in (index.tickers, index.names, index.sector_codes, index.exchange_codes, *index.metrics.values()):
+        array.flags.writeable = False
+    return index
+
+
+@cached("screener_index", tables=(OVERVIEW_TABLE,))
+def get_screener_index() -> ScreenerIndex:
+    """
+    The shared screener index, rebuilt after the overview table changes.
+
+    Results are shared through the process cache; do not mutate them.
+    """
+    return build_index()
+
+
+def _category_mask(codes: np.ndarray, categories: Tuple[str, ...], wanted: Sequence[str]) -> np.ndarray:
+    lookup = {name: i for i, name in enumerate(categories)}
+    return np.isin(codes, [lookup[name] for name in wanted if name in lookup])
+
+
+def screen(
+    index: ScreenerIndex,
+    criteria: Sequence[Criterion] = (),
+    sectors: Sequence[str] = (),
+    exchanges: Sequence[str] = (),
+    sort_by: str = "market_cap",
+    descending: bool = True,
+    limit: Optional[int] = None
+) -> np.ndarray:
+    """
+    Filter and sort the index.
+
+    Args:
+        index: Screener index (see get_screener_index)
+        criteria: Metric bounds, all of which must hold
+        sectors: Allowed sectors (empty = any)
+        exchanges: Allowed exchanges (empty = any)
+        sort_by: Metric key to order by; companies without a value go last
+        descending: Largest values first
+        limit: Maximum number of rows to return
+
+    Returns:
+        Matching row positions in sort order (use index.to_frame to display)
+    """
+    mask = np.ones(len(index), dtype=bool)
+    for criterion in criteria:
+        values = index.metrics[criterion.metric]
+        if criterion.minimum is not None:
+            mask &= values >= criterion.minimum
+        if criterion.maximum is not None:
+            mask &= values <= criterion.maximum
+        if criterion.minimum is None and criterion.maximum is None:
+            mask &= ~np.isnan(values)
+    if sectors:
+        mask &= _category_mask(index.sector_codes, index.sectors, sectors)
+    if exchanges:
+        mask &= _category_mask(index.exchange_codes, index.exchanges, exchanges)
+
+    rows = np.flatnonzero(mask)
+    keys = index.metrics[sort_by][rows]
+    # NaN sorts last in both directions; stable sort keeps ticker order for ties
+    order = np.argsort(-keys if descending else keys, kind="stable")
+    rows = rows[order]
+    return rows if limit is None else rows[:limit]
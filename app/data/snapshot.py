@@ -0,0 +1,404 @@
+"""
+Columnar analytical snapshot of the financial statement tables.
+
+A nightly job exports the three coreiq_av_financials_* tables into a DuckDB
+file (optionally also Parquet), flattening raw_json into one numeric column
+per key and dropping duplicate periods. Multi-ticker and cross-company loads
+(screens, ratio batches) read from the snapshot through load_frame() /
+latest_values() when SNAPSHOT_PATH is configured and the file exists, and
+fall back to the OLTP database otherwise. Single-company reads always go to
+the OLTP tables, so statements ingested after the nightly build show up
+immediately.
+
+Usage (nightly, e.g. from cron):
+    cd app && SNAPSHOT_PATH=data/financials.duckdb python -m data.snapshot
+    cd app && python -m data.snapshot --path data/financials.duckdb --parquet-dir data/parquet
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from core.config import config
+from core.database import db_manager, init_database
+
+try:
+    import duckdb
+except ImportError:  # Optional dependency, see requirements.txt
+    duckdb = None
+
+logger = logging.getLogger(__name__)
+
+# Columns kept as-is on every snapshot table; everything else is a numeric metric
+KEY_COLUMNS = ["ticker", "fiscal_date_ending", "report_type", "reported_currency"]
+
+# raw_json keys that duplicate key columns
+_RAW_JSON_SKIP_KEYS = {"fiscalDateEnding", "reportedCurrency"}
+
+
+@dataclass(frozen=True)
+class SnapshotTable:
+    """A source table exported into the snapshot."""
+    name: str
+    source_table: str
+    flatten_raw_json: bool
+    # Numeric columns of tables that are not flattened (raw_json keys are always metrics)
+    metric_columns: Tuple[str, ...] = ()
+
+
+SNAPSHOT_TABLES: Dict[str, SnapshotTable] = {
+    "income_statement": SnapshotTable(
+        "income_statement", "coreiq_av_financials_income_statement", False,
+        (
+            "total_revenue", "cost_of_revenue", "gross_profit",
+            "selling_general_and_administrative", "research_and_development",
+            "depreciation_and_amortization", "operating_income", "interest_expense",
+            "interest_income", "net_income",
+        ),
+    ),
+    "balance_sheet": SnapshotTable(
+        "balance_sheet", "coreiq_av_financials_balance_sheet", True
+    ),
+    "cash_flow": SnapshotTable(
+        "cash_flow", "coreiq_av_financials_cash_flow", True
+    ),
+}
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """Convert a raw_json value ("123", "None", 1.5) to float or None."""
+    if value is None or value == "None":
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _flatten_rows(rows: List[Dict[str, Any]], table: SnapshotTable) -> pd.DataFrame:
+    """Build one wide, numeric frame from a batch of source rows."""
+    records = []
+    metrics = set(table.metric_columns)
+    for row in rows:
+        record = {key: row.get(key) for key in KEY_COLUMNS}
+        if table.flatten_raw_json:
+            raw = row.get("raw_json")
+            if isinstance(raw, str):
+                try:
+                    raw = json.loads(raw)
+                except json.JSONDecodeError:
+                    raw = {}
+            for key, value in (raw or {}).items():
+                if key not in _RAW_JSON_SKIP_KEYS:
+                    record[key] = _to_number(value)
+                    metrics.add(key)
+        else:
+            for key, value in row.items():
+                if key not in record and key != "raw_json":
+                    record[key] = float(value) if isinstance(value, Decimal) else value
+        records.append(record)
+
+    frame = pd.DataFrame.from_records(records)
+    if frame.empty:
+        return frame
+
+    frame["fiscal_date_ending"] = pd.to_datetime(frame["fiscal_date_ending"])
+    # The staging table takes its column types from the first batch, where an
+    # all-NULL object column would become INTEGER and reject later values:
+    # such metrics are numeric, anything else (text, timestamps) is text
+    for column in frame.columns:
+        if frame[column].isna().all():
+            frame[column] = frame[column].astype("float64" if column in metrics else "string")
+    return frame
+
+
+def _append_batch(conn: Any, staging: str, frame: pd.DataFrame, created: bool) -> None:
+    """Append a flattened batch to the staging table, adding new metric columns."""
+    conn.register("source_frame", frame)
+    try:
+        if not created:
+            conn.execute(f"CREATE TABLE {staging} AS SELECT * FROM source_frame")
+            return
+        existing = {row[0] for row in conn.execute(f"DESCRIBE {staging}").fetchall()}
+        for column in frame.columns:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE {staging} ADD COLUMN {_quote(column)} DOUBLE")
+        conn.execute(f"INSERT INTO {staging} BY NAME SELECT * FROM source_frame")
+    finally:
+        conn.unregister("source_frame")
+
+
+def build_snapshot(path: str, parquet_dir: Optional[str] = None) -> Dict[str, int]:
+    """
+    Export the financial statement tables into a DuckDB snapshot.
+
+    The file is written next to the target and swapped in atomically, so
+    readers never see a half-built snapshot.
+
+    Args:
+        path: Destination DuckDB file
+        parquet_dir: Optional directory to also write one Parquet file per table
+
+    Returns:
+        Mapping of snapshot table name to row count
+    """
+    if duckdb is None:
+        raise RuntimeError("duckdb is not installed; run `pip install duckdb`")
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    if parquet_dir:
+        Path(parquet_dir).mkdir(parents=True, exist_ok=True)
+
+    counts: Dict[str, int] = {}
+    conn = duckdb.connect(str(tmp))
+    try:
+        for table in SNAPSHOT_TABLES.values():
+            # Source rows are streamed in batches into a staging table, so
+            # the export runs in constant memory regardless of table size
+            staging = f"{table.name}_staging"
+            loaded = 0
+            for batch in db_manager.stream_query(f"SELECT * FROM {table.source_table}"):
+                frame = _flatten_rows(batch.records(), table)
+                frame.insert(0, "_seq", range(loaded, loaded + len(frame)))
+                _append_batch(conn, staging, frame, created=loaded > 0)
+                loaded += len(frame)
+            if not loaded:
+                logger.warning(f"Snapshot: {table.source_table} is empty, skipping")
+                continue
+
+            # Same rule as the repositories' DISTINCT: one row per
+            # ticker/period/report type, keeping the last one read
+            conn.execute(f"""
+                CREATE TABLE {table.name} AS
+                SELECT * EXCLUDE (_seq) REPLACE (CAST(fiscal_date_ending AS DATE) AS fiscal_date_ending)
+                FROM {staging}
+                QUALIFY row_number() OVER (
+                    PARTITION BY ticker, fiscal_date_ending, report_type ORDER BY _seq DESC
+                ) = 1
+                ORDER BY ticker, fiscal_date_ending, report_type
+            """)
+            conn.execute(f"DROP TABLE {staging}")
+
+            if parquet_dir:
+                parquet_path = Path(parquet_dir) / f"{table.name}.parquet"
+                conn.execute(f"COPY {table.name} TO '{parquet_path}' (FORMAT PARQUET)")
+
+            counts[table.name] = conn.execute(f"SELECT count(*) FROM {table.name}").fetchone()[0]
+            logger.info(f"Snapshot: exported {counts[table.name]} rows from {table.source_table}")
+    finally:
+        conn.close()
+
+    os.replace(tmp, target)
+    return counts
+
+
+def _quote(identifier: str) -> str:
+    """Quote a column identifier for DuckDB (raw_json keys are camelCase)."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class SnapshotStore:
+    """
+    Read-only access to the DuckDB snapshot.
+
+    All read methods return None when the snapshot is disabled, missing or
+    lacks the table, so callers can fall back to the OLTP database.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self._path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._conn: Any = None
+        self._mtime: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        """True when duckdb is installed and the snapshot file exists."""
+        return duckdb is not None and self._path is not None and self._path.exists()
+
+    def _connect(self) -> Any:
+        """
+        Attach the snapshot file to a private in-memory instance.
+
+        duckdb.connect(path) would hand back the cached instance of the file
+        a rebuild replaced for as long as any of its cursors is still open.
+        """
+        conn = duckdb.connect()
+        path = str(self._path).replace("'", "''")
+        conn.execute(f"ATTACH '{path}' AS snapshot (READ_ONLY)")
+        return conn
+
+    def _cursor(self) -> Any:
+        """Return a per-call cursor, switching to a new file after a nightly rebuild."""
+        with self._lock:
+            mtime = self._path.stat().st_mtime
+            if self._conn is None or mtime != self._mtime:
+                # Not closed: queries still running on the old file keep its
+                # instance alive through their cursors and finish normally
+                self._conn = self._connect()
+                self._mtime = mtime
+            # Cursors are independent connections, safe to use from one thread each
+            cursor = self._conn.cursor()
+        cursor.execute("USE snapshot")
+        return cursor
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> Optional[pd.DataFrame]:
+        """Run a query against the snapshot, or return None if unavailable."""
+        if not self.enabled:
+            return None
+        try:
+            cursor = self._cursor()
+            try:
+                return cursor.execute(sql, list(params)).df()
+            finally:
+                cursor.close()
+        except duckdb.CatalogException:
+            return None
+        except duckdb.Error as e:
+            logger.warning(f"Snapshot query failed, falling back to database: {e}")
+            return None
+
+    @staticmethod
+    def _records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Convert a snapshot frame to repository-shaped rows (dates, None for NaN)."""
+        frame = frame.copy()
+        if "fiscal_date_ending" in frame:
+            frame["fiscal_date_ending"] = frame["fiscal_date_ending"].dt.date
+        frame = frame.astype(object).where(frame.notna(), None)
+        return frame.to_dict("records")
+
+    def get_statement_rows_by_ticker(
+        self,
+        statement: str,
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+        report_type: str = "annual"
+    ) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Get statement rows of many companies with one query.
+
+        Rows are shaped like the OLTP query results; flattened tables carry
+        their metrics under a dict-valued raw_json key, which the
+        repositories' _parse_raw_json accepts as-is.
+
+        Returns:
+            Ticker -> rows, ascending; tickers without rows are absent
+        """
+        spec = SNAPSHOT_TABLES[statement]
+        frame = self.load_frame(statement, tickers, None, start_date, end_date, report_type)
+        if frame is None:
+            return None
+        by_ticker: Dict[str, List[Dict[str, Any]]] = {}
+        for row in self._records(frame):
+            by_ticker.setdefault(row["ticker"], []).append(row)
+        return {ticker: self._statement_rows(spec, rows) for ticker, rows in by_ticker.items()}
+
+    @staticmethod
+    def _statement_rows(spec: SnapshotTable, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Nest the metrics of flattened tables under raw_json, like the OLTP rows."""
+        if not spec.flatten_raw_json:
+            return rows
+        return [
+            {
+                "fiscal_date_ending": row["fiscal_date_ending"],
+                "reported_currency": row["reported_currency"],
+                "raw_json": {k: v for k, v in row.items() if k not in KEY_COLUMNS},
+            }
+            for row in rows
+        ]
+
+    def load_frame(
+        self,
+        statement: str,
+        tickers: Optional[List[str]] = None,
+        columns: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        report_type: str = "annual"
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load a multi-ticker statement frame for vectorized analysis.
+
+        Args:
+            statement: Snapshot table key (see SNAPSHOT_TABLES)
+            tickers: Restrict to these tickers (None = all companies)
+            columns: Metric columns to load (None = all)
+            start_date: Optional inclusive lower fiscal date bound
+            end_date: Optional inclusive upper fiscal date bound
+            report_type: 'annual' or 'quarterly'
+        """
+        table = SNAPSHOT_TABLES[statement].name
+        select = "*" if columns is None else ", ".join(
+            ["ticker", "fiscal_date_ending", "reported_currency"] + [_quote(c) for c in columns]
+        )
+        sql = f"SELECT {select} FROM {table} WHERE report_type = ?"
+        params: List[Any] = [report_type]
+        if tickers is not None:
+            sql += " AND list_contains(?, ticker)"
+            params.append(list(tickers))
+        if start_date:
+            sql += " AND fiscal_date_ending >= ?"
+            params.append(start_date)
+        if end_date:
+            sql += " AND fiscal_date_ending <= ?"
+            params.append(end_date)
+        return self._query(sql + " ORDER BY ticker, fiscal_date_ending", params)
+
+    def latest_values(
+        self,
+        statement: str,
+        columns: List[str],
+        tickers: Optional[List[str]] = None,
+        report_type: str = "annual"
+    ) -> Optional[pd.DataFrame]:
+        """Get each company's most recent period for the given metric columns."""
+        table = SNAPSHOT_TABLES[statement].name
+        sql = (
+            f"SELECT ticker, fiscal_date_ending, reported_currency, "
+            f"{', '.join(_quote(c) for c in columns)} "
+            f"FROM {table} WHERE report_type = ?"
+        )
+        params: List[Any] = [report_type]
+        if tickers is not None:
+            sql += " AND list_contains(?, ticker)"
+            params.append(list(tickers))
+        sql += " QUALIFY row_number() OVER (PARTITION BY ticker ORDER BY fiscal_date_ending DESC) = 1"
+        return self._query(sql + " ORDER BY ticker", params)
+
+
+# Global snapshot store (disabled unless SNAPSHOT_PATH is set)
+snapshot_store = SnapshotStore(config.snapshot_path)
+
+
+def main(argv: List[str]) -> int:
+    """CLI entry point for the nightly snapshot job."""
+    parser = argparse.ArgumentParser(description="Build the financial statements snapshot")
+    parser.add_argument("--path", default=config.snapshot_path, help="DuckDB output file (default: SNAPSHOT_PATH)")
+    parser.add_argument("--parquet-dir", help="Also write one Parquet file per table here")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if not args.path:
+        parser.error("no snapshot path: pass --path or set SNAPSHOT_PATH")
+
+    init_database()
+    counts = build_snapshot(args.path, args.parquet_dir)
+    logger.info(f"Snapshot written to {args.path}: {counts}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
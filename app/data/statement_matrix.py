@@ -0,0 +1,153 @@
+"""
+NumPy helpers for pivoting financial statement rows into period matrices.
+
+Statement rows arrive one per fiscal period. They are pivoted once into a
+(line item x period) float matrix with NaN for missing values, and annual,
+quarterly and TTM views are derived from that matrix with array operations
+instead of per-cell Python loops.
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from data.models import ReportPeriod
+
+# Trailing twelve months = four consecutive quarters
+TTM_WINDOW = 4
+
+# First and fourth quarter-ends of a TTM window are ~9 months apart; the
+# tolerance covers 52/53-week fiscal calendars without bridging a missing quarter
+_TTM_MIN_SPAN_DAYS = 250
+_TTM_MAX_SPAN_DAYS = 300
+
+# Source values are in units; the statements display millions
+DISPLAY_SCALE = 1_000_000
+
+
+@dataclass
+class StatementMatrix:
+    """Statement values as a (key x period) matrix in source units."""
+    dates: List[date]
+    keys: List[Optional[str]]
+    values: np.ndarray
+    
+    def row(self, key: str) -> np.ndarray:
+        """Values of one key across all periods."""
+        return self.values[self.keys.index(key)]
+
+
+def fetch_start_date(start_date: date, period: ReportPeriod) -> date:
+    """First fiscal date to fetch so the first TTM column in range is computable."""
+    if period == ReportPeriod.TTM:
+        return start_date - timedelta(days=_TTM_MAX_SPAN_DAYS)
+    return start_date
+
+
+def build_matrix(rows: Sequence[Sequence[Any]], n_items: int) -> np.ndarray:
+    """
+    Pivot per-period value rows into a (line item x period) matrix.
+
+    Args:
+        rows: One sequence of line item values per period (None = missing),
+              or a (period x line item) array
+        n_items: Number of line items (matrix height when there are no rows)
+
+    Returns:
+        Float matrix with NaN for missing values
+    """
+    if len(rows) == 0:
+        return np.empty((n_items, 0))
+    return np.array(rows, dtype=float).T
+
+
+def rolling_sum(matrix: np.ndarray, window: int = TTM_WINDOW) -> np.ndarray:
+    """
+    Rolling sum across periods via cumulative sums.
+
+    A column is NaN unless all `window` values ending at it are present, so
+    a missing quarter never produces an understated TTM figure.
+    """
+    n_items, n_periods = matrix.shape
+    result = np.full(matrix.shape, np.nan)
+    if n_periods < window:
+        return result
+
+    present = ~np.isnan(matrix)
+    zeros = np.zeros((n_items, 1))
+    sums = np.concatenate([zeros, np.cumsum(np.where(present, matrix, 0.0), axis=1)], axis=1)
+    counts = np.concatenate([zeros, np.cumsum(present, axis=1)], axis=1)
+
+    window_sums = sums[:, window:] - sums[:, :-window]
+    window_counts = counts[:, window:] - counts[:, :-window]
+    result[:, window - 1:] = np.where(window_counts == window, window_sums, np.nan)
+    return result
+
+
+def consecutive_quarter_mask(dates: Sequence[date]) -> np.ndarray:
+    """True for periods that close a run of four consecutive quarters."""
+    valid = np.zeros(len(dates), dtype=bool)
+    if len(dates) < TTM_WINDOW:
+        return valid
+    ordinals = np.array([d.toordinal() for d in dates])
+    spans = ordinals[TTM_WINDOW - 1:] - ordinals[:1 - TTM_WINDOW]
+    valid[TTM_WINDOW - 1:] = (spans >= _TTM_MIN_SPAN_DAYS) & (spans <= _TTM_MAX_SPAN_DAYS)
+    return valid
+
+
+def to_ttm(matrix: np.ndarray, dates: Sequence[date], flow: bool = True) -> np.ndarray:
+    """
+    Convert a quarterly matrix to trailing-twelve-month values.
+
+    Args:
+        matrix: Quarterly (line item x period) matrix, ascending dates
+        dates: Fiscal date of each column
+        flow: True for flow statements (income, cash flow) which are summed
+              over four quarters; False for point-in-time balances, which
+              keep the quarter-end value
+
+    Returns:
+        TTM matrix aligned with the input columns
+    """
+    if not flow:
+        return matrix.copy()
+    result = rolling_sum(matrix)
+    result[:, ~consecutive_quarter_mask(dates)] = np.nan
+    return result
+
+
+def pivot_statement(
+    dates: List[date],
+    rows: Sequence[Sequence[Any]],
+    n_items: int,
+    period: ReportPeriod,
+    start_date: date,
+    flow: bool = True
+) -> Tuple[List[date], np.ndarray]:
+    """
+    Pivot statement rows and apply the requested period view.
+
+    Args:
+        dates: Fiscal date of each row, ascending
+        rows: Line item values per row
+        n_items: Number of line items
+        period: Annual, quarterly or TTM view
+        start_date: First fiscal date to keep (earlier rows are TTM lookback)
+        flow: Whether the statement is a flow statement (see to_ttm)
+
+    Returns:
+        Tuple of (kept period dates, line item x period matrix)
+    """
+    matrix = build_matrix(rows, n_items)
+    if period == ReportPeriod.TTM:
+        matrix = to_ttm(matrix, dates, flow)
+    keep = np.array([d >= start_date for d in dates], dtype=bool)
+    kept_dates = [d for d, k in zip(dates, keep) if k]
+    return kept_dates, matrix[:, keep]
+
+
+def to_display_values(matrix: np.ndarray, scale: float = DISPLAY_SCALE) -> List[List[Optional[float]]]:
+    """Scale to millions and convert to nested lists with None for missing values."""
+    scaled = matrix / scale
+    return np.where(np.isnan(scaled), None, scaled).tolist()
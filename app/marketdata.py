@@ -28,9 +28,10 @@ sys.path.insert(0, str(Path(__file__).parent))
 from components.styles import hide_sidebar, set_page_layout
 hide_sidebar()
 
-from components.navigation import render_header, render_coresight_footer
+from components.navigation import Page, render_header, render_coresight_footer
 from components.styles import render_styles
 from utils.local_storage import init_local_storage, local_storage
+from utils.browser_storage import hydrate_from_browser, persist_to_browser
 from core.database import init_database
 
 # Import page content
@@ -40,6 +41,7 @@ from pages.market_data import render_page as render_market_data_content
 def initialize_app():
     """Initialize application state and dependencies."""
     init_local_storage()
+    hydrate_from_browser()
     init_database()
 
 
@@ -82,13 +84,16 @@ def main():
     
     # Render Header (shared component from components/navigation.py)
     # This renders: Logo, Market Data (active), Newsroom (link), Contact Us button
-    render_header(full_width=True)
+    render_header(Page.MARKET_DATA, full_width=True)
     
     # Render Market Data page content
     render_market_data_content()
     
     # Render Footer (shared component from components/navigation.py)
     render_coresight_footer(full_width=True, stick_to_bottom=True)
+    
+    # Save changed preferences in the browser for the next visit
+    persist_to_browser()
 
 
 if __name__ == "__main__":
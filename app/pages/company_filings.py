@@ -1,10 +1,11 @@
 """
 Company Filing Documents Page - Coresight Research
 ==================================================
-SEC filing documents viewer with metric search and document display.
+SEC filing documents viewer with full-text filing search and document display.
 Matches Figma design with Streamlit native components + custom styling.
 """
 import streamlit as st
+from html import escape
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
@@ -25,7 +26,10 @@ from components.styles import hide_sidebar, set_page_layout
 hide_sidebar()
 
 from components.styles import render_styles
-from components.navigation import render_header, render_coresight_footer
+from components.assets import render_css
+from components.navigation import Page, render_header, render_coresight_footer
+from data.filing_search import FACET_FIELDS, SearchResults, filing_index, search_filings
+from data.models import FilingSearchHit
 
 
 # =============================================================================
@@ -68,6 +72,16 @@ COMPANIES = [
 
 DOCUMENT_TYPES = ["10-K", "10-Q", "8-K", "DEF 14A", "S-1"]
 
+# Full-text search results listed in the sidebar
+FILING_SEARCH_RESULTS = 20
+
+FACET_LABELS = {
+    "company": "Company",
+    "form_type": "Document Type",
+    "year": "Year",
+    "quarter": "Quarter",
+}
+
 FILING_METRICS = [
     FilingMetric("Revenue", "$416.16B", "Income Statement", "10-K", "2025"),
     FilingMetric("Cost of Goods Sold", "$20.16B", "Income Statement", "10-K", "2025", is_viewing=True),
@@ -294,6 +308,20 @@ def get_filings_css() -> str:
         color: #888888;
     }
     
+    .filing-snippet {
+        font-family: 'Roboto', sans-serif;
+        font-size: 12px;
+        line-height: 1.5;
+        color: #555555;
+        margin-bottom: 6px;
+    }
+    
+    .filing-snippet mark {
+        background: #FDECEC;
+        color: #D62E2F;
+        padding: 0 1px;
+    }
+    
     .metric-meta-dot {
         width: 3px;
         height: 3px;
@@ -505,6 +533,41 @@ def render_search_sidebar(metrics: List[FilingMetric], search_term: str, show_co
     return f'<div class="search-sidebar"><div class="search-header">{search_icon}<span class="search-title">Search Metrics</span></div><div class="metrics-list">{metrics_html}</div></div>'
 
 
+def render_search_hit(hit: FilingSearchHit) -> str:
+    """Render a full-text search hit with its snippet."""
+    return f'<div class="metric-card"><div class="metric-info"><div class="metric-name">{escape(hit.label)}</div><div class="filing-snippet">{hit.snippet}</div><div class="metric-meta"><span>{escape(hit.ticker)}</span><span class="metric-meta-dot"></span><span>{escape(hit.form_type)}</span><span class="metric-meta-dot"></span><span>{hit.formatted_date}</span></div></div></div>'
+
+
+def render_filing_results(results: SearchResults) -> str:
+    """Render the full-text search results sidebar."""
+    hits_html = "".join(render_search_hit(hit) for hit in results.hits)
+    if not hits_html:
+        hits_html = '<div class="metrics-count">No filings match the search</div>'
+    
+    search_icon = '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="#D62E2F" stroke-width="2"><circle cx="11" cy="11" r="8"/><line x1="21" y1="21" x2="16.65" y2="16.65"/></svg>'
+    
+    return f'<div class="search-sidebar"><div class="search-header">{search_icon}<span class="search-title">Search Filings</span></div><div class="metrics-list">{hits_html}</div></div>'
+
+
+def facet_filters() -> Dict[str, List[str]]:
+    """Facet values selected in the refine controls."""
+    return {field: st.session_state.get(f"cf_facet_{field}", []) for field in FACET_FIELDS}
+
+
+def render_facet_filters(results: SearchResults, filters: Dict[str, List[str]]):
+    """Refine controls listing each facet value with its number of matching filings."""
+    with st.expander("Refine results", expanded=any(filters.values())):
+        for field in FACET_FIELDS:
+            counts = dict(results.facets[field])
+            options = list(counts) + [v for v in filters[field] if v not in counts]
+            st.multiselect(
+                FACET_LABELS[field],
+                options=options,
+                format_func=lambda v, counts=counts: f"{v} ({counts.get(v, 0)})",
+                key=f"cf_facet_{field}",
+            )
+
+
 def render_document_viewer(document: Optional[FilingDocument]) -> str:
     """Render the document viewer area."""
     # Download icon SVG (inline)
@@ -545,10 +608,10 @@ def main():
     )
     
     # Render Header
-    render_header(full_width=True)
+    render_header(Page.COMPANY_FILINGS, full_width=True)
     
     # Inject custom CSS
-    st.markdown(get_filings_css(), unsafe_allow_html=True)
+    render_css("filings", get_filings_css())
     
     # Page container
     st.markdown('<div class="filings-page-container">', unsafe_allow_html=True)
@@ -623,13 +686,22 @@ def main():
         )
         st.session_state.cf_search = search_term
         
-        # Show count text
-        filtered_count = len([m for m in FILING_METRICS if search_term.lower() in m.name.lower() or not search_term])
-        st.markdown(f'<div style="font-family: Roboto, sans-serif; font-size: 12px; color: #888888; margin: 4px 0 12px 4px;">Showing {filtered_count} metrics</div>', unsafe_allow_html=True)
-        
-        # Render search sidebar with metrics - includes Search Metrics header
-        sidebar_html = render_search_sidebar(FILING_METRICS, search_term)
-        st.markdown(sidebar_html, unsafe_allow_html=True)
+        # Full-text search once filings are indexed, otherwise the metric list
+        filing_index.reload()
+        if search_term and filing_index.stats()["sections"]:
+            filters = facet_filters()
+            results = search_filings(search_term, filters, limit=FILING_SEARCH_RESULTS)
+            st.markdown(f'<div style="font-family: Roboto, sans-serif; font-size: 12px; color: #888888; margin: 4px 0 12px 4px;">{results.total} sections in {results.filing_count} filings ({results.elapsed_ms:.0f} ms)</div>', unsafe_allow_html=True)
+            render_facet_filters(results, filters)
+            st.markdown(render_filing_results(results), unsafe_allow_html=True)
+        else:
+            # Show count text
+            filtered_count = len([m for m in FILING_METRICS if search_term.lower() in m.name.lower() or not search_term])
+            st.markdown(f'<div style="font-family: Roboto, sans-serif; font-size: 12px; color: #888888; margin: 4px 0 12px 4px;">Showing {filtered_count} metrics</div>', unsafe_allow_html=True)
+            
+            # Render search sidebar with metrics - includes Search Metrics header
+            sidebar_html = render_search_sidebar(FILING_METRICS, search_term)
+            st.markdown(sidebar_html, unsafe_allow_html=True)
     
     with right_col:
         # Create document object
@@ -23,7 +23,8 @@ from components.styles import hide_sidebar, set_page_layout
 hide_sidebar()
 
 from components.styles import render_styles, COLORS, TYPOGRAPHY, SPACING
-from components.navigation import render_header, render_coresight_footer, render_company_header
+from components.assets import render_css
+from components.navigation import Page, render_header, render_coresight_footer, render_company_header
 from components.toolbar import inject_toolbar
 from data.models import CompanyOverview
 from data.repository import CompanyOverviewRepository
@@ -305,7 +306,7 @@ def main():
     )
     
     # Render Header
-    render_header(full_width=True)
+    render_header(Page.COMPANY_PROFILE, full_width=True)
     
     # Get ticker from URL query params or default to M (Macy's)
     query_params = st.query_params
@@ -319,7 +320,7 @@ def main():
         st.stop()
     
     # Inject custom CSS
-    st.markdown(get_company_css(), unsafe_allow_html=True)
+    render_css("company", get_company_css())
     
     # Page content container
     st.markdown('<div class="company-profile-container">', unsafe_allow_html=True)
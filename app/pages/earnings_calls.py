@@ -25,7 +25,8 @@ from components.styles import hide_sidebar, set_page_layout
 hide_sidebar()
 
 from components.styles import render_styles, COLORS, TYPOGRAPHY, SPACING
-from components.navigation import render_header, render_coresight_footer
+from components.assets import render_css
+from components.navigation import Page, render_header, render_coresight_footer
 from data.repository import EarningsCallRepository
 from core.database import init_database
 
@@ -456,46 +457,14 @@ def render_empty_state() -> str:
     """
 
 
-# =============================================================================
-# MAIN PAGE
-# =============================================================================
-
-def main():
-    """Earnings calls page entry point using native Streamlit components."""
-    # Initialize
-    init_database()
-    
-    # Render global styles
-    render_styles()
-    
-    # Set layout
-    set_page_layout(
-        header_full_width=True,
-        footer_full_width=True,
-        body_padding="0",
-        max_content_width="1440px",
-        remove_top_padding=True,
-        footer_at_bottom=True
-    )
-    
-    # Render Header
-    render_header(full_width=True)
-    
-    # Inject custom CSS
-    st.markdown(get_earnings_css(), unsafe_allow_html=True)
-    
-    # Page container
-    st.markdown('<div class="earnings-page-container">', unsafe_allow_html=True)
-    st.markdown('<div class="earnings-content-wrapper">', unsafe_allow_html=True)
-    
-    # Get data for dropdowns
-    companies = EarningsCallRepository.get_companies_with_earnings()
-    company_options = [(c['ticker'], f"{c['name']} ({c['ticker']})") for c in companies]
-    
-    if not company_options:
-        st.error("No earnings call data available.")
-        st.stop()
+@st.fragment
+def render_transcript_panel(company_options: List[Tuple[str, str]]):
+    """
+    Render the title/filter row and the transcript card.
     
+    Runs as a fragment so a company, year or quarter change reruns only
+    this panel instead of the header, CSS and footer.
+    """
     # Initialize session state for filters
     if 'ec_company' not in st.session_state:
         st.session_state.ec_company = company_options[0][0]
@@ -587,6 +556,50 @@ def main():
         card_html = render_empty_state()
     
     st.markdown(card_html, unsafe_allow_html=True)
+
+
+# =============================================================================
+# MAIN PAGE
+# =============================================================================
+
+def main():
+    """Earnings calls page entry point using native Streamlit components."""
+    # Initialize
+    init_database()
+    
+    # Render global styles
+    render_styles()
+    
+    # Set layout
+    set_page_layout(
+        header_full_width=True,
+        footer_full_width=True,
+        body_padding="0",
+        max_content_width="1440px",
+        remove_top_padding=True,
+        footer_at_bottom=True
+    )
+    
+    # Render Header
+    render_header(Page.EARNINGS_CALLS, full_width=True)
+    
+    # Inject custom CSS
+    render_css("earnings", get_earnings_css())
+    
+    # Page container
+    st.markdown('<div class="earnings-page-container">', unsafe_allow_html=True)
+    st.markdown('<div class="earnings-content-wrapper">', unsafe_allow_html=True)
+    
+    # Get data for dropdowns
+    companies = EarningsCallRepository.get_companies_with_earnings()
+    company_options = [(c['ticker'], f"{c['name']} ({c['ticker']})") for c in companies]
+    
+    if not company_options:
+        st.error("No earnings call data available.")
+        st.stop()
+    
+    # Filters and transcript rerun on their own (see render_transcript_panel)
+    render_transcript_panel(company_options)
     
     # Close containers
     st.markdown('</div>', unsafe_allow_html=True)  # content-wrapper
@@ -15,7 +15,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from components.styles import hide_sidebar, render_styles
-from components.navigation import render_header, render_coresight_footer
+from components.navigation import Page, render_header, render_coresight_footer
 
 hide_sidebar()
 
@@ -101,7 +101,7 @@ def main():
     """, unsafe_allow_html=True)
     
     render_styles()
-    render_header(full_width=True)
+    render_header(Page.HOME, full_width=True)
     
     # Main title
     st.markdown('<h1 class="main-title">CORESIGHT MARKET DATA</h1>', unsafe_allow_html=True)
@@ -3,19 +3,26 @@ Market Data Page - PIXEL PERFECT FIGMA MATCH
 ============================================
 Based on detailed wireframe analysis
 """
+import numpy as np
 import streamlit as st
 from datetime import date
 from typing import Optional, List
 
 from components.styles import render_styles, COLORS
 from components.toolbar import inject_toolbar
-from data.repository import CompanyRepository, IncomeStatementRepository, BalanceSheetRepository
-from data.models import IncomeStatementData, Company, BalanceSheetData
+from components.company_picker import company_options, render_company_search
+from data.company_search import get_company_search_index
+from data.repository import IncomeStatementRepository, BalanceSheetRepository, CashFlowRepository
+from data.models import IncomeStatementData, Company, BalanceSheetData, ReportPeriod, FiscalPeriod
+from data.prefetch import prefetch_adjacent_views
+from data.ratios import RATIOS, RatioUnit, compute_ratios
 from utils.local_storage import (
     get_marketdata_company, set_marketdata_company,
     get_marketdata_tab, set_marketdata_tab,
-    get_marketdata_date_range, set_marketdata_date_range
+    get_marketdata_date_range, set_marketdata_date_range,
+    get_marketdata_report_period, set_marketdata_report_period
 )
+from utils.browser_storage import persist_to_browser
 
 
 def format_value(value: Optional[float], conversion_rate: float = 1.0) -> str:
@@ -73,6 +80,51 @@ def get_conversion_rate(from_currency: str, to_currency: str) -> float:
     return ForexRepository.get_conversion_rate(from_currency, to_currency)
 
 
+CURRENCIES = ["USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY", "INR"]
+
+
+def _on_currency_change(key: str):
+    """Widget callback: store the selected target currency."""
+    st.session_state.target_currency = st.session_state[key]
+
+
+def render_currency_conversion(reported_currency: str, key: str):
+    """
+    Render the currency conversion selector below a statement table.
+    
+    The selector lives inside the statement panel fragment, so a change
+    reruns only the panel and the table is re-rendered in the new currency.
+    """
+    # ==================== CURRENCY CONVERSION - LEFT SIDE ONLY ====================
+    st.html('<div class="currency-section"><div class="currency-label">Currency Conversion</div>')
+    
+    c1, c2, c3, c4 = st.columns([1.5, 0.3, 1.5, 6])
+    
+    with c1:
+        st.html(f'<div class="currency-box">{reported_currency}</div>')
+    
+    with c2:
+        st.html('<div class="currency-arrow">→</div>')
+    
+    with c3:
+        # Widgets of other tabs may hold a stale selection; follow the shared state
+        st.session_state[key] = st.session_state.target_currency
+        st.selectbox(
+            "To",
+            options=CURRENCIES,
+            label_visibility="collapsed",
+            key=key,
+            on_change=_on_currency_change,
+            args=(key,)
+        )
+    
+    st.html('</div>')
+    
+    if st.session_state.target_currency != reported_currency:
+        rate = get_conversion_rate(reported_currency, st.session_state.target_currency)
+        st.caption(f"Converted at 1 {reported_currency} = {rate:.4f} {st.session_state.target_currency}")
+
+
 def is_balance_sheet_bold_row(label: str) -> bool:
     """Check if balance sheet row should be bold (subtotal/total rows)."""
     bold_labels = {
@@ -109,32 +161,103 @@ def get_balance_sheet_indent_level(label: str) -> int:
         return 0
 
 
-def render_balance_sheet(ticker: str, start_date: date, end_date: date, conversion_rate: float, reported_currency: str, sort_ascending: bool = True):
+def render_income_statement(ticker: str, start_date: date, end_date: date, conversion_rate: float, reported_currency: str, sort_ascending: bool = True, period: ReportPeriod = ReportPeriod.ANNUAL):
+    """Render the income statement table."""
+    try:
+        data = IncomeStatementRepository.get_income_statement_data(ticker, start_date, end_date, period)
+        
+        # Apply sorting based on user selection; data is shared through the
+        # cache, so reverse local copies instead of mutating it
+        periods = data.periods if sort_ascending else data.periods[::-1]
+        
+        if periods and data.line_items:
+            # Build table HTML
+            html = '<div class="table-container"><div class="table-scroll"><table class="data-table"><thead>'
+            
+            # Header row - with grey separator
+            html += '<tr class="row-grey-separator"><th>For Fiscal Period Ending<span class="header-subtext">Millions of trading currency, except per share items.</span></th>'
+            for fiscal_period in periods:
+                lines = fiscal_period.label.split('\n')
+                if len(lines) >= 2:
+                    period_text = lines[0]
+                    date_text = lines[1]
+                else:
+                    period_text = ""
+                    date_text = fiscal_period.label
+                
+                html += f'<th class="data-col"><span class="period-label">{period_text}</span><span class="period-date">{date_text}</span></th>'
+            html += '</tr></thead><tbody>'
+            
+            # Data rows with currency conversion applied
+            prev_item_label = None
+            for i, item in enumerate(data.line_items):
+                indent = get_indent_level(item.label)
+                is_bold = is_bold_row(item.label)
+                needs_grey_sep = has_grey_separator(item.label)
+                
+                # Check if NEXT row needs underline, if so add it to THIS row
+                next_item = data.line_items[i + 1] if i + 1 < len(data.line_items) else None
+                needs_underline = has_underline(next_item.label) if next_item else False
+                
+                # Build row classes
+                row_classes = []
+                if is_bold:
+                    row_classes.append("row-bold")
+                if needs_underline:
+                    row_classes.append("row-underline-black")
+                if needs_grey_sep:
+                    row_classes.append("row-grey-separator")
+                
+                row_class_str = ' '.join(row_classes) if row_classes else ''
+                
+                html += f'<tr class="{row_class_str}">'
+                
+                # First column - label with proper indentation
+                html += f'<td class="indent-{indent}">{item.label}</td>'
+                
+                # Data columns with converted values
+                values = item.values if sort_ascending else item.values[::-1]
+                for val in values:
+                    formatted = format_value(val, conversion_rate)
+                    html += f'<td class="data-cell">{formatted}</td>'
+                
+                html += '</tr>'
+            
+            html += '</tbody></table></div></div>'
+            st.html(html)
+            
+            render_currency_conversion(reported_currency, key="currency_to")
+            
+        else:
+            st.info("No data available")
+            
+    except Exception as e:
+        st.error(f"Error: {e}")
+
+
+def render_balance_sheet(ticker: str, start_date: date, end_date: date, conversion_rate: float, reported_currency: str, sort_ascending: bool = True, period: ReportPeriod = ReportPeriod.ANNUAL):
     """Render the balance sheet table."""
     try:
-        data = BalanceSheetRepository.get_balance_sheet_data(ticker, start_date, end_date)
+        data = BalanceSheetRepository.get_balance_sheet_data(ticker, start_date, end_date, period)
         
-        # Apply sorting based on user selection
-        if not sort_ascending:
-            # Reverse the periods and corresponding values
-            data.periods = list(reversed(data.periods))
-            for item in data.line_items:
-                item.values = list(reversed(item.values))
+        # Apply sorting based on user selection; data is shared through the
+        # cache, so reverse local copies instead of mutating it
+        periods = data.periods if sort_ascending else data.periods[::-1]
         
-        if data.periods and data.line_items:
+        if periods and data.line_items:
             # Build table HTML
             html = '<div class="table-container"><div class="table-scroll"><table class="data-table"><thead>'
             
             # Header row
             html += '<tr class="row-grey-separator"><th>For Fiscal Period Ending<span class="header-subtext">Millions of trading currency, except per share items.</span></th>'
-            for period in data.periods:
-                lines = period.label.split('\n')
+            for fiscal_period in periods:
+                lines = fiscal_period.label.split('\n')
                 if len(lines) >= 2:
                     period_text = lines[0]
                     date_text = lines[1]
                 else:
                     period_text = ""
-                    date_text = period.label
+                    date_text = fiscal_period.label
                 
                 html += f'<th class="data-col"><span class="period-label">{period_text}</span><span class="period-date">{date_text}</span></th>'
             html += '</tr></thead><tbody>'
@@ -170,7 +293,8 @@ def render_balance_sheet(ticker: str, start_date: date, end_date: date, conversi
                 html += f'<td class="indent-{indent}">{display_label}</td>'
                 
                 # Data columns with converted values
-                for val in item.values:
+                values = item.values if sort_ascending else item.values[::-1]
+                for val in values:
                     formatted = format_value(val, conversion_rate)
                     html += f'<td class="data-cell">{formatted}</td>'
                 
@@ -179,38 +303,7 @@ def render_balance_sheet(ticker: str, start_date: date, end_date: date, conversi
             html += '</tbody></table></div></div>'
             st.html(html)
             
-            # ==================== CURRENCY CONVERSION - LEFT SIDE ONLY ====================
-            st.html('<div class="currency-section"><div class="currency-label">Currency Conversion</div>')
-            
-            c1, c2, c3, c4 = st.columns([1.5, 0.3, 1.5, 6])
-            
-            with c1:
-                st.html(f'<div class="currency-box">{reported_currency}</div>')
-            
-            with c2:
-                st.html('<div class="currency-arrow">→</div>')
-            
-            with c3:
-                currencies = ["USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY", "INR"]
-                default_index = currencies.index(st.session_state.target_currency)
-                
-                target = st.selectbox(
-                    "To",
-                    options=currencies,
-                    index=default_index,
-                    label_visibility="collapsed",
-                    key="currency_to_balance"
-                )
-                
-                if target != st.session_state.target_currency:
-                    st.session_state.target_currency = target
-                    st.rerun()
-            
-            st.html('</div>')
-            
-            if st.session_state.target_currency != reported_currency:
-                rate = get_conversion_rate(reported_currency, st.session_state.target_currency)
-                st.caption(f"Converted at 1 {reported_currency} = {rate:.4f} {st.session_state.target_currency}")
+            render_currency_conversion(reported_currency, key="currency_to_balance")
                 
         else:
             st.info("No balance sheet data available for the selected date range")
@@ -255,34 +348,29 @@ def has_cash_flow_grey_separator(label: str) -> bool:
     return label.strip() in grey_after
 
 
-def render_cash_flow(ticker: str, start_date: date, end_date: date, conversion_rate: float, reported_currency: str, sort_ascending: bool = True):
+def render_cash_flow(ticker: str, start_date: date, end_date: date, conversion_rate: float, reported_currency: str, sort_ascending: bool = True, period: ReportPeriod = ReportPeriod.ANNUAL):
     """Render the cash flow statement table."""
     try:
-        from data.repository import CashFlowRepository
+        data = CashFlowRepository.get_cash_flow_data(ticker, start_date, end_date, period)
         
-        data = CashFlowRepository.get_cash_flow_data(ticker, start_date, end_date)
+        # Apply sorting based on user selection; data is shared through the
+        # cache, so reverse local copies instead of mutating it
+        periods = data.periods if sort_ascending else data.periods[::-1]
         
-        # Apply sorting based on user selection
-        if not sort_ascending:
-            # Reverse the periods and corresponding values
-            data.periods = list(reversed(data.periods))
-            for item in data.line_items:
-                item.values = list(reversed(item.values))
-        
-        if data.periods and data.line_items:
+        if periods and data.line_items:
             # Build table HTML
             html = '<div class="table-container"><div class="table-scroll"><table class="data-table"><thead>'
             
             # Header row
             html += '<tr class="row-grey-separator"><th>For Fiscal Period Ending<span class="header-subtext">Millions of trading currency, except per share items.</span></th>'
-            for period in data.periods:
-                lines = period.label.split('\n')
+            for fiscal_period in periods:
+                lines = fiscal_period.label.split('\n')
                 if len(lines) >= 2:
                     period_text = lines[0]
                     date_text = lines[1]
                 else:
                     period_text = ""
-                    date_text = period.label
+                    date_text = fiscal_period.label
                 
                 html += f'<th class="data-col"><span class="period-label">{period_text}</span><span class="period-date">{date_text}</span></th>'
             html += '</tr></thead><tbody>'
@@ -315,7 +403,8 @@ def render_cash_flow(ticker: str, start_date: date, end_date: date, conversion_r
                 html += f'<td class="indent-{indent}">{display_label}</td>'
                 
                 # Data columns with converted values
-                for val in item.values:
+                values = item.values if sort_ascending else item.values[::-1]
+                for val in values:
                     formatted = format_value(val, conversion_rate)
                     html += f'<td class="data-cell">{formatted}</td>'
                 
@@ -324,38 +413,7 @@ def render_cash_flow(ticker: str, start_date: date, end_date: date, conversion_r
             html += '</tbody></table></div></div>'
             st.html(html)
             
-            # ==================== CURRENCY CONVERSION - LEFT SIDE ONLY ====================
-            st.html('<div class="currency-section"><div class="currency-label">Currency Conversion</div>')
-            
-            c1, c2, c3, c4 = st.columns([1.5, 0.3, 1.5, 6])
-            
-            with c1:
-                st.html(f'<div class="currency-box">{reported_currency}</div>')
-            
-            with c2:
-                st.html('<div class="currency-arrow">→</div>')
-            
-            with c3:
-                currencies = ["USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY", "INR"]
-                default_index = currencies.index(st.session_state.target_currency)
-                
-                target = st.selectbox(
-                    "To",
-                    options=currencies,
-                    index=default_index,
-                    label_visibility="collapsed",
-                    key="currency_to_cashflow"
-                )
-                
-                if target != st.session_state.target_currency:
-                    st.session_state.target_currency = target
-                    st.rerun()
-            
-            st.html('</div>')
-            
-            if st.session_state.target_currency != reported_currency:
-                rate = get_conversion_rate(reported_currency, st.session_state.target_currency)
-                st.caption(f"Converted at 1 {reported_currency} = {rate:.4f} {st.session_state.target_currency}")
+            render_currency_conversion(reported_currency, key="currency_to_cashflow")
                 
         else:
             st.info("No cash flow data available for the selected date range")
@@ -364,24 +422,243 @@ def render_cash_flow(ticker: str, start_date: date, end_date: date, conversion_r
         st.error(f"Error loading cash flow statement: {e}")
 
 
+def format_ratio(value: float, unit: RatioUnit, conversion_rate: float = 1.0) -> str:
+    """Format a ratio value for its display unit."""
+    if np.isnan(value):
+        return "-"
+    if unit == RatioUnit.PERCENT:
+        return f"{value * 100:,.1f}%"
+    if unit == RatioUnit.MULTIPLE:
+        return f"{value:,.2f}x"
+    return format_value(value / 1_000_000, conversion_rate)
+
+
+def render_key_stats(ticker: str, start_date: date, end_date: date, conversion_rate: float, sort_ascending: bool = True, period: ReportPeriod = ReportPeriod.ANNUAL):
+    """Render derived ratios (margins, growth, liquidity, cash flow) for every period."""
+    try:
+        table = compute_ratios(ticker, period, start_date, end_date)
+        
+        if not table.dates:
+            st.info("No key stats available for the selected date range")
+            return
+        
+        # Column order for display; cached arrays are never modified
+        order = list(range(len(table.dates)))
+        if not sort_ascending:
+            order.reverse()
+        
+        html = '<div class="table-container"><div class="table-scroll"><table class="data-table"><thead>'
+        html += '<tr class="row-grey-separator"><th>For Fiscal Period Ending<span class="header-subtext">Ratios; currency items in millions of trading currency.</span></th>'
+        for i in order:
+            period_text, date_text = FiscalPeriod.from_date(table.dates[i], period).label.split('\n')
+            html += f'<th class="data-col"><span class="period-label">{period_text}</span><span class="period-date">{date_text}</span></th>'
+        html += '</tr></thead><tbody>'
+        
+        for ratio in RATIOS:
+            values = table.values[ratio.key]
+            html += f'<tr><td class="indent-0">{ratio.label}</td>'
+            for i in order:
+                html += f'<td class="data-cell">{format_ratio(values[i], ratio.unit, conversion_rate)}</td>'
+            html += '</tr>'
+        
+        html += '</tbody></table></div></div>'
+        st.html(html)
+        
+    except Exception as e:
+        st.error(f"Error loading key stats: {e}")
+
+
+PERIOD_LABELS = {
+    ReportPeriod.ANNUAL: "Annual",
+    ReportPeriod.QUARTERLY: "Quarterly",
+    ReportPeriod.TTM: "TTM",
+}
+
+
+def get_report_period() -> ReportPeriod:
+    """Stored reporting period (annual / quarterly / trailing twelve months)."""
+    stored_period = get_marketdata_report_period()
+    return ReportPeriod(stored_period) if stored_period in [
+        p.value for p in ReportPeriod
+    ] else ReportPeriod.ANNUAL
+
+
+def get_statement_repository(selected_tab: str):
+    """Repository whose dates and currency drive the filters of a tab."""
+    if selected_tab == "balance_sheet":
+        return BalanceSheetRepository
+    if selected_tab == "cash_flow":
+        return CashFlowRepository
+    return IncomeStatementRepository
+
+
+def reset_date_filters():
+    """Drop the date widget state so the widgets follow the stored range."""
+    st.session_state.pop("start_dt", None)
+    st.session_state.pop("end_dt", None)
+
+
+def _on_period_change(selected_tab: str, ticker: str):
+    """Widget callback: store the period and reset the range to its history."""
+    new_period = st.session_state.report_period_select
+    set_marketdata_report_period(new_period.value)
+    # Quarterly history has its own date list; reset the range to match
+    new_min, new_max = get_statement_repository(selected_tab).get_date_range(ticker, new_period)
+    if new_min and new_max:
+        set_marketdata_date_range(new_min.isoformat(), new_max.isoformat())
+    reset_date_filters()
+
+
+def _on_date_change(date_values: dict):
+    """Widget callback: store the selected date range if it is valid."""
+    new_start_date = date_values[st.session_state.start_dt]
+    new_end_date = date_values[st.session_state.end_dt]
+    if new_start_date <= new_end_date:
+        set_marketdata_date_range(new_start_date.isoformat(), new_end_date.isoformat())
+
+
+def _on_sort_change():
+    """Widget callback: store the selected sort order."""
+    st.session_state.sort_order = st.session_state.sort_order_select
+
+
+@st.fragment
+def render_statement_panel(selected_tab: str, selected_ticker: str):
+    """
+    Render the filter row and the statement table for the selected tab.
+    
+    Runs as a fragment: period, date, sort and currency changes rerun only
+    this panel, not the header, toolbar, company selector and footer.
+    Filter widgets update stored state through callbacks before the
+    fragment reruns, so no explicit st.rerun() is needed; the panel then
+    writes the changed preferences to the browser itself.
+    """
+    report_period = get_report_period()
+    repository = get_statement_repository(selected_tab)
+    min_date, max_date = repository.get_date_range(selected_ticker, report_period)
+    available_dates = repository.get_available_dates(selected_ticker, report_period)
+    
+    stored_start, stored_end = get_marketdata_date_range()
+    start_date = date.fromisoformat(stored_start) if stored_start else min_date
+    end_date = date.fromisoformat(stored_end) if stored_end else max_date
+    
+    # Get currency from database based on tab
+    reported_currency = repository.get_reported_currency(
+        selected_ticker, end_date, report_period
+    ) or "USD"
+    
+    # Initialize session state for target currency if not exists
+    if 'target_currency' not in st.session_state:
+        st.session_state.target_currency = "USD"
+    
+    # Get conversion rate
+    conversion_rate = get_conversion_rate(reported_currency, st.session_state.target_currency)
+    
+    # ==================== FILTER ROW - DATES & SORT ====================
+    # Initialize sort state
+    if 'sort_order' not in st.session_state:
+        st.session_state.sort_order = "Earliest"
+    
+    date_options = [d.strftime("%B %Y") for d in available_dates]
+    date_values = {d.strftime("%B %Y"): d for d in available_dates}
+    
+    curr_start = start_date.strftime("%B %Y")
+    start_idx = date_options.index(curr_start) if curr_start in date_options else 0
+    
+    curr_end = end_date.strftime("%B %Y")
+    end_idx = date_options.index(curr_end) if curr_end in date_options else len(date_options) - 1
+    
+    # Create columns: [spacer, Period, Start Date, End Date, Sort]
+    # Wider columns to prevent text truncation - adjusted ratios for proper display
+    f1, f5, f2, f3, f4 = st.columns([2.5, 1.5, 2, 2, 1.5])
+    
+    with f5:
+        st.html('<div class="filter-label">Period</div>')
+        st.selectbox(
+            "Period",
+            options=list(PERIOD_LABELS.keys()),
+            index=list(PERIOD_LABELS.keys()).index(report_period),
+            format_func=PERIOD_LABELS.get,
+            label_visibility="collapsed",
+            key="report_period_select",
+            on_change=_on_period_change,
+            args=(selected_tab, selected_ticker)
+        )
+    
+    with f2:
+        st.html('<div class="filter-label">Start Date</div>')
+        new_start_label = st.selectbox(
+            "Start",
+            options=date_options,
+            index=start_idx,
+            label_visibility="collapsed",
+            key="start_dt",
+            on_change=_on_date_change,
+            args=(date_values,)
+        )
+    
+    with f3:
+        st.html('<div class="filter-label">End Date</div>')
+        new_end_label = st.selectbox(
+            "End",
+            options=date_options,
+            index=end_idx,
+            label_visibility="collapsed",
+            key="end_dt",
+            on_change=_on_date_change,
+            args=(date_values,)
+        )
+    
+    with f4:
+        st.html('<div class="filter-label">Sort</div>')
+        st.selectbox(
+            "Sort",
+            options=["Earliest", "Latest"],
+            index=0 if st.session_state.sort_order == "Earliest" else 1,
+            label_visibility="collapsed",
+            key="sort_order_select",
+            on_change=_on_sort_change
+        )
+    
+    new_start_date = date_values.get(new_start_label, start_date)
+    new_end_date = date_values.get(new_end_label, end_date)
+    if new_start_date > new_end_date:
+        st.error("Start date must be before end date")
+    
+    # ==================== TABLE WITH CURRENCY CONVERSION ====================
+    # Apply sort order to data
+    sort_ascending = st.session_state.sort_order == "Earliest"
+    
+    if selected_tab == "balance_sheet":
+        render_balance_sheet(selected_ticker, start_date, end_date, conversion_rate, reported_currency, sort_ascending, report_period)
+    elif selected_tab == "cash_flow":
+        render_cash_flow(selected_ticker, start_date, end_date, conversion_rate, reported_currency, sort_ascending, report_period)
+    elif selected_tab == "key_stats":
+        render_key_stats(selected_ticker, start_date, end_date, conversion_rate, sort_ascending, report_period)
+    elif selected_tab == "income_statement":
+        render_income_statement(selected_ticker, start_date, end_date, conversion_rate, reported_currency, sort_ascending, report_period)
+    elif selected_tab == "company_profile":
+        st.info("Company Profile")
+        st.markdown(f'<a href="http://localhost:8504/company_profile?ticker={selected_ticker}" target="_blank">View Profile</a>', unsafe_allow_html=True)
+    
+    # Warm the cache for the tabs the user is likely to open next
+    prefetch_adjacent_views(selected_tab, selected_ticker, start_date, end_date, report_period)
+    
+    # Fragment reruns skip the end of main(); save period and date changes here
+    persist_to_browser()
+
+
 def render_page():
     """Main render function - PIXEL PERFECT FIGMA MATCH."""
     
     # Get data first
-    companies = CompanyRepository.get_companies_by_source()
-    if not companies:
+    companies = get_company_search_index("SEC")
+    if not len(companies):
         st.error("No companies found")
         return
     
-    stored_ticker = get_marketdata_company()
-    selected_ticker = stored_ticker if stored_ticker and any(
-        c.ticker == stored_ticker for c in companies
-    ) else companies[0].ticker
-    
-    selected_company = next(
-        (c for c in companies if c.ticker == selected_ticker),
-        companies[0]
-    )
+    selected_company = companies.get(get_marketdata_company()) or companies.companies[0]
+    selected_ticker = selected_company.ticker
     
     # Check for URL query param tab first, then fall back to stored tab
     query_tab = st.query_params.get("tab")
@@ -393,43 +670,8 @@ def render_page():
         "income_statement", "balance_sheet", "cash_flow", "key_stats", "company_profile"
     ] else "income_statement")
     
-    # Get dates based on selected tab
-    if selected_tab == "balance_sheet":
-        min_date, max_date = BalanceSheetRepository.get_date_range(selected_ticker)
-        available_dates = BalanceSheetRepository.get_available_dates(selected_ticker)
-    elif selected_tab == "cash_flow":
-        from data.repository import CashFlowRepository
-        min_date, max_date = CashFlowRepository.get_date_range(selected_ticker)
-        available_dates = CashFlowRepository.get_available_dates(selected_ticker)
-    else:
-        min_date, max_date = IncomeStatementRepository.get_date_range(selected_ticker)
-        available_dates = IncomeStatementRepository.get_available_dates(selected_ticker)
-    
-    stored_start, stored_end = get_marketdata_date_range()
-    start_date = date.fromisoformat(stored_start) if stored_start else min_date
-    end_date = date.fromisoformat(stored_end) if stored_end else max_date
-    
-    # Get currency from database based on tab
-    if selected_tab == "balance_sheet":
-        reported_currency = BalanceSheetRepository.get_reported_currency(
-            selected_ticker, end_date
-        ) or "USD"
-    elif selected_tab == "cash_flow":
-        from data.repository import CashFlowRepository
-        reported_currency = CashFlowRepository.get_reported_currency(
-            selected_ticker, end_date
-        ) or "USD"
-    else:
-        reported_currency = IncomeStatementRepository.get_reported_currency(
-            selected_ticker, end_date
-        ) or "USD"
-    
-    # Initialize session state for target currency if not exists
-    if 'target_currency' not in st.session_state:
-        st.session_state.target_currency = "USD"
-    
-    # Get conversion rate
-    conversion_rate = get_conversion_rate(reported_currency, st.session_state.target_currency)
+    # Reporting period (annual / quarterly / trailing twelve months)
+    report_period = get_report_period()
     
     # ==================== GLOBAL CSS - PIXEL PERFECT FIGMA SPECS ====================
     st.html("""
@@ -879,8 +1121,10 @@ def render_page():
     st.html(f'<div class="page-title">CORESIGHT MARKET DATA</div>')
     
     # Company selector - custom HTML with Streamlit selectbox overlay
-    company_options = {c.display_name: c.ticker for c in companies}
-    current_display = selected_company.display_name
+    # offering the current company and the top matches of the search box
+    ticker_options, format_company = company_options(
+        selected_ticker, "company_search_marketdata", source="SEC"
+    )
     
     # Custom HTML display
     st.html(f"""
@@ -941,21 +1185,22 @@ def render_page():
     """)
     
     # Streamlit selectbox positioned over the custom display (invisible but functional)
-    new_display = st.selectbox(
+    new_ticker = st.selectbox(
         "Company",
-        options=list(company_options.keys()),
-        index=list(company_options.keys()).index(current_display),
+        options=ticker_options,
+        index=0,
+        format_func=format_company,
         label_visibility="collapsed",
         key="company_sel_marketdata"
     )
-    
-    new_ticker = company_options[new_display]
+    render_company_search("company_search_marketdata", len(ticker_options))
     
     if new_ticker != selected_ticker:
         set_marketdata_company(new_ticker)
-        new_min, new_max = IncomeStatementRepository.get_date_range(new_ticker)
+        new_min, new_max = IncomeStatementRepository.get_date_range(new_ticker, report_period)
         if new_min and new_max:
             set_marketdata_date_range(new_min.isoformat(), new_max.isoformat())
+        reset_date_filters()
         st.rerun()
     
     # ==================== TOOLBAR ====================
@@ -982,187 +1227,5 @@ def render_page():
     #             set_marketdata_tab(tab_key)
     #             st.rerun()
     
-    # ==================== FILTER ROW - DATES & SORT ====================
-    # Initialize sort state
-    if 'sort_order' not in st.session_state:
-        st.session_state.sort_order = "Earliest"
-    
-    date_options = [d.strftime("%B %Y") for d in available_dates]
-    date_values = {d.strftime("%B %Y"): d for d in available_dates}
-    
-    curr_start = start_date.strftime("%B %Y")
-    start_idx = date_options.index(curr_start) if curr_start in date_options else 0
-    
-    curr_end = end_date.strftime("%B %Y")
-    end_idx = date_options.index(curr_end) if curr_end in date_options else len(date_options) - 1
-    
-    # Create columns: [spacer, Start Date, End Date, Sort]
-    # Wider columns to prevent text truncation - adjusted ratios for proper display
-    f1, f2, f3, f4 = st.columns([4, 2, 2, 1.5])
-    
-    with f2:
-        st.html('<div class="filter-label">Start Date</div>')
-        new_start_label = st.selectbox(
-            "Start",
-            options=date_options,
-            index=start_idx,
-            label_visibility="collapsed",
-            key="start_dt"
-        )
-        new_start_date = date_values.get(new_start_label, start_date)
-    
-    with f3:
-        st.html('<div class="filter-label">End Date</div>')
-        new_end_label = st.selectbox(
-            "End",
-            options=date_options,
-            index=end_idx,
-            label_visibility="collapsed",
-            key="end_dt"
-        )
-        new_end_date = date_values.get(new_end_label, end_date)
-    
-    with f4:
-        st.html('<div class="filter-label">Sort</div>')
-        new_sort_order = st.selectbox(
-            "Sort",
-            options=["Earliest", "Latest"],
-            index=0 if st.session_state.sort_order == "Earliest" else 1,
-            label_visibility="collapsed",
-            key="sort_order_select"
-        )
-    
-    # Update states if changed
-    date_changed = new_start_date != start_date or new_end_date != end_date
-    sort_changed = new_sort_order != st.session_state.sort_order
-    
-    if date_changed:
-        if new_start_date > new_end_date:
-            st.error("Start date must be before end date")
-        else:
-            set_marketdata_date_range(new_start_date.isoformat(), new_end_date.isoformat())
-            if sort_changed:
-                st.session_state.sort_order = new_sort_order
-            st.rerun()
-    elif sort_changed:
-        st.session_state.sort_order = new_sort_order
-        st.rerun()
-    
-    # ==================== TABLE WITH CURRENCY CONVERSION ====================
-    # Apply sort order to data
-    sort_ascending = st.session_state.sort_order == "Earliest"
-    
-    if selected_tab == "balance_sheet":
-        render_balance_sheet(selected_ticker, start_date, end_date, conversion_rate, reported_currency, sort_ascending)
-    elif selected_tab == "cash_flow":
-        render_cash_flow(selected_ticker, start_date, end_date, conversion_rate, reported_currency, sort_ascending)
-    elif selected_tab in ["income_statement", "key_stats"]:
-        try:
-            data = IncomeStatementRepository.get_income_statement_data(
-                selected_ticker, start_date, end_date
-            )
-            
-            # Apply sorting based on user selection
-            if not sort_ascending:
-                # Reverse the periods and corresponding values
-                data.periods = list(reversed(data.periods))
-                for item in data.line_items:
-                    item.values = list(reversed(item.values))
-            
-            if data.periods and data.line_items:
-                # Build table HTML
-                html = '<div class="table-container"><div class="table-scroll"><table class="data-table"><thead>'
-                
-                # Header row - with grey separator
-                html += '<tr class="row-grey-separator"><th>For Fiscal Period Ending<span class="header-subtext">Millions of trading currency, except per share items.</span></th>'
-                for period in data.periods:
-                    lines = period.label.split('\n')
-                    if len(lines) >= 2:
-                        period_text = lines[0]
-                        date_text = lines[1]
-                    else:
-                        period_text = ""
-                        date_text = period.label
-                    
-                    html += f'<th class="data-col"><span class="period-label">{period_text}</span><span class="period-date">{date_text}</span></th>'
-                html += '</tr></thead><tbody>'
-                
-                # Data rows with currency conversion applied
-                prev_item_label = None
-                for i, item in enumerate(data.line_items):
-                    indent = get_indent_level(item.label)
-                    is_bold = is_bold_row(item.label)
-                    needs_grey_sep = has_grey_separator(item.label)
-                    
-                    # Check if NEXT row needs underline, if so add it to THIS row
-                    next_item = data.line_items[i + 1] if i + 1 < len(data.line_items) else None
-                    needs_underline = has_underline(next_item.label) if next_item else False
-                    
-                    # Build row classes
-                    row_classes = []
-                    if is_bold:
-                        row_classes.append("row-bold")
-                    if needs_underline:
-                        row_classes.append("row-underline-black")
-                    if needs_grey_sep:
-                        row_classes.append("row-grey-separator")
-                    
-                    row_class_str = ' '.join(row_classes) if row_classes else ''
-                    
-                    html += f'<tr class="{row_class_str}">'
-                    
-                    # First column - label with proper indentation
-                    html += f'<td class="indent-{indent}">{item.label}</td>'
-                    
-                    # Data columns with converted values
-                    for val in item.values:
-                        formatted = format_value(val, conversion_rate)
-                        html += f'<td class="data-cell">{formatted}</td>'
-                    
-                    html += '</tr>'
-                
-                html += '</tbody></table></div></div>'
-                st.html(html)
-                
-                # ==================== CURRENCY CONVERSION - LEFT SIDE ONLY ====================
-                st.html('<div class="currency-section"><div class="currency-label">Currency Conversion</div>')
-                
-                c1, c2, c3, c4 = st.columns([1.5, 0.3, 1.5, 6])
-                
-                with c1:
-                    st.html(f'<div class="currency-box">{reported_currency}</div>')
-                
-                with c2:
-                    st.html('<div class="currency-arrow">→</div>')
-                
-                with c3:
-                    currencies = ["USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY", "INR"]
-                    default_index = currencies.index("USD")
-                    
-                    target = st.selectbox(
-                        "To",
-                        options=currencies,
-                        index=default_index,
-                        label_visibility="collapsed",
-                        key="currency_to"
-                    )
-                    
-                    if target != st.session_state.target_currency:
-                        st.session_state.target_currency = target
-                        st.rerun()
-                
-                st.html('</div>')
-                
-                if st.session_state.target_currency != reported_currency:
-                    rate = get_conversion_rate(reported_currency, st.session_state.target_currency)
-                    st.caption(f"Converted at 1 {reported_currency} = {rate:.4f} {st.session_state.target_currency}")
-                
-            else:
-                st.info("No data available")
-                
-        except Exception as e:
-            st.error(f"Error: {e}")
-    
-    elif selected_tab == "company_profile":
-        st.info("Company Profile")
-        st.markdown(f'<a href="http://localhost:8504/company_profile?ticker={selected_ticker}" target="_blank">View Profile</a>', unsafe_allow_html=True)
+    # ==================== FILTERS & TABLE (FRAGMENT) ====================
+    render_statement_panel(selected_tab, selected_ticker)
@@ -5,7 +5,7 @@ Financial news feed with filtering and sentiment analysis.
 """
 import streamlit as st
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # MUST be first Streamlit command
 st.set_page_config(
@@ -24,9 +24,11 @@ from components.styles import hide_sidebar, set_page_layout
 hide_sidebar()
 
 from components.styles import render_styles, COLORS, TYPOGRAPHY, SPACING
-from components.navigation import render_header, render_coresight_footer
+from components.assets import render_css
+from components.navigation import Page, render_header, render_coresight_footer
 from data.models import NewsArticle, TickerSentiment
 from data.repository import NewsRepository
+from core.cache import cached
 from core.database import init_database
 
 # Initialize
@@ -35,14 +37,16 @@ def initialize_app():
     init_database()
 
 
+@cached("news_company_names", tables=("coreiq_companies",))
 def get_company_name_map() -> dict:
-    """Get mapping of ticker to company name."""
-    if 'company_name_map' not in st.session_state:
-        companies = NewsRepository.get_companies()
-        st.session_state.company_name_map = {
-            c['ticker']: c['name'] for c in companies
-        }
-    return st.session_state.company_name_map
+    """
+    Get mapping of ticker to company name.
+    
+    One map is shared by all sessions through the process cache (instead of
+    a copy in every session's state); do not mutate it.
+    """
+    companies = NewsRepository.get_companies()
+    return {c['ticker']: c['name'] for c in companies}
 
 
 def format_company_display(ticker: str, company_map: dict) -> str:
@@ -104,7 +108,7 @@ def render_news_card(article: NewsArticle, company_map: dict):
         for ts in article.ticker_sentiment:
             company_name = format_company_display(ts.ticker, company_map)
             # Create tooltip content
-            tooltip_text = f"Relevance: {float(ts.relevance_score)*100:.1f}% | Sentiment: {ts.ticker_sentiment_label} ({float(ts.ticker_sentiment_score):.2f})"
+            tooltip_text = f"Relevance: {ts.relevance_score*100:.1f}% | Sentiment: {ts.ticker_sentiment_label} ({ts.ticker_sentiment_score:.2f})"
             # Company link with custom tooltip - links to company profile page
             company_html = f'<a href="http://localhost:8504/company_profile?ticker={ts.ticker}" class="company-link" title="{tooltip_text}">{company_name}</a>'
             companies_parts.append(company_html)
@@ -266,64 +270,20 @@ def get_news_css() -> str:
     """
 
 
-def main():
-    """Newsroom page entry point."""
-    # Initialize
-    initialize_app()
-    
-    # Render global styles
-    render_styles()
-    
-    # Set layout
-    set_page_layout(
-        header_full_width=True,
-        footer_full_width=True,
-        body_padding="0 20px",
-        max_content_width="1350px",
-        remove_top_padding=True,
-        footer_at_bottom=True
-    )
-    
-    # Render Header
-    render_header(full_width=True)
-    
-    # Page Title
-    st.markdown("""
-    <div style="margin: 24px 0;">
-        <div style="font-family: 'Montserrat', sans-serif; font-weight: 700; font-size: 24px; color: #d62e2f; letter-spacing: 1px;">CORESIGHT MARKET DATA</div>
-        <div style="font-family: 'Montserrat', sans-serif; font-weight: 700; font-size: 28px; color: #323232;">News Results</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Initialize session state for filters
-    if 'date_from' not in st.session_state:
-        st.session_state.date_from = date.today() - timedelta(days=7)
-    if 'date_to' not in st.session_state:
-        st.session_state.date_to = date.today()
-    
-    # Get filter options
-    sectors = ['All'] + NewsRepository.get_sectors()
-    companies = [{'ticker': 'All', 'name': 'All Companies'}] + NewsRepository.get_companies()
-    
-    # Filters row at the top
-    st.markdown("""
-    <style>
-    .filter-container {
-        background: #f8f9fa;
-        padding: 20px;
-        border-radius: 8px;
-        margin-bottom: 24px;
-    }
-    .filter-title {
-        font-family: 'Montserrat', sans-serif;
-        font-weight: 600;
-        font-size: 16px;
-        color: #323232;
-        margin-bottom: 12px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+def _apply_date_filters():
+    """Button callback: keep the selected date range across reruns."""
+    st.session_state.date_from = st.session_state.news_date_from
+    st.session_state.date_to = st.session_state.news_date_to
+
+
+@st.fragment
+def render_news_panel(sectors: List[str], companies: List[Dict]):
+    """
+    Render the filter row and the matching article cards.
     
+    Runs as a fragment so filter changes rerun only the filters and the
+    article list instead of the header, CSS and footer.
+    """
     with st.container():
         # Date range filter
         col1, col2, col3 = st.columns([2, 2, 1])
@@ -334,7 +294,8 @@ def main():
                 "From date",
                 value=st.session_state.date_from,
                 max_value=date.today(),
-                label_visibility="collapsed"
+                label_visibility="collapsed",
+                key="news_date_from"
             )
         
         with col2:
@@ -343,7 +304,8 @@ def main():
                 "To date",
                 value=st.session_state.date_to,
                 max_value=date.today(),
-                label_visibility="collapsed"
+                label_visibility="collapsed",
+                key="news_date_to"
             )
         
         with col3:
@@ -373,10 +335,7 @@ def main():
         
         with col5:
             st.markdown("&nbsp;")
-            if st.button("Apply Filters", type="primary", use_container_width=True):
-                st.session_state.date_from = date_from
-                st.session_state.date_to = date_to
-                st.rerun()
+            st.button("Apply Filters", type="primary", use_container_width=True, on_click=_apply_date_filters)
     
     # Prepare filters for query
     query_sector = None if selected_sector == 'All' else selected_sector
@@ -401,7 +360,7 @@ def main():
     # Render articles
     if articles:
         # Render custom CSS first
-        st.markdown(get_news_css(), unsafe_allow_html=True)
+        render_css("news", get_news_css())
         
         # Render each article card
         for article in articles:
@@ -410,6 +369,68 @@ def main():
         
     else:
         st.info("No news articles found for the selected filters.")
+
+
+def main():
+    """Newsroom page entry point."""
+    # Initialize
+    initialize_app()
+    
+    # Render global styles
+    render_styles()
+    
+    # Set layout
+    set_page_layout(
+        header_full_width=True,
+        footer_full_width=True,
+        body_padding="0 20px",
+        max_content_width="1350px",
+        remove_top_padding=True,
+        footer_at_bottom=True
+    )
+    
+    # Render Header
+    render_header(Page.NEWSROOM, full_width=True)
+    
+    # Page Title
+    st.markdown("""
+    <div style="margin: 24px 0;">
+        <div style="font-family: 'Montserrat', sans-serif; font-weight: 700; font-size: 24px; color: #d62e2f; letter-spacing: 1px;">CORESIGHT MARKET DATA</div>
+        <div style="font-family: 'Montserrat', sans-serif; font-weight: 700; font-size: 28px; color: #323232;">News Results</div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Initialize session state for filters
+    if 'date_from' not in st.session_state:
+        st.session_state.date_from = date.today() - timedelta(days=7)
+    if 'date_to' not in st.session_state:
+        st.session_state.date_to = date.today()
+    
+    # Get filter options
+    sectors = ['All'] + NewsRepository.get_sectors()
+    companies = [{'ticker': 'All', 'name': 'All Companies'}] + NewsRepository.get_companies()
+    
+    # Filters row at the top
+    st.markdown("""
+    <style>
+    .filter-container {
+        background: #f8f9fa;
+        padding: 20px;
+        border-radius: 8px;
+        margin-bottom: 24px;
+    }
+    .filter-title {
+        font-family: 'Montserrat', sans-serif;
+        font-weight: 600;
+        font-size: 16px;
+        color: #323232;
+        margin-bottom: 12px;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    # Filters and article list rerun on their own (see render_news_panel)
+    render_news_panel(sectors, companies)
     
     # Render Footer
     render_coresight_footer(full_width=True, stick_to_bottom=True)
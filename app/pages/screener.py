@@ -0,0 +1,109 @@
+"""
+Company Screener Page
+=====================
+Filter and sort every company by overview metrics, sector and exchange.
+
+Screens run against the in-memory index from data/screener.py; changing a
+filter reruns only the screener fragment and issues no SQL.
+"""
+import time
+from typing import List
+
+import streamlit as st
+
+from data.screener import (
+    SCREEN_METRICS, SCREEN_METRICS_BY_KEY, Criterion, get_screener_index, screen
+)
+
+# Rows rendered in the results table (the count shows the full match total)
+MAX_RESULT_ROWS = 500
+
+# Bounds are entered in display units: percentages in %, large amounts in $M
+_INPUT_SCALE = {"percentage": 0.01, "market_cap": 1_000_000}
+_INPUT_SUFFIX = {"percentage": " (%)", "market_cap": " ($M)"}
+
+# st.column_config number formats per metric unit
+_COLUMN_FORMAT = {
+    "number": "%.2f",
+    "currency": "$%.2f",
+    "percentage": "%.2f%%",
+    "market_cap": "compact",
+}
+
+
+def render_criteria() -> List[Criterion]:
+    """Min/max inputs for each metric the user chose to screen on."""
+    chosen = st.multiselect(
+        "Screen on",
+        options=[m.key for m in SCREEN_METRICS],
+        format_func=lambda key: SCREEN_METRICS_BY_KEY[key].label,
+        key="screener_metrics",
+    )
+    criteria = []
+    for key in chosen:
+        metric = SCREEN_METRICS_BY_KEY[key]
+        scale = _INPUT_SCALE.get(metric.unit, 1)
+        label = metric.label + _INPUT_SUFFIX.get(metric.unit, "")
+        col_min, col_max = st.columns(2)
+        with col_min:
+            minimum = st.number_input(f"Min {label}", value=None, key=f"screener_min_{key}")
+        with col_max:
+            maximum = st.number_input(f"Max {label}", value=None, key=f"screener_max_{key}")
+        criteria.append(Criterion(
+            key,
+            None if minimum is None else minimum * scale,
+            None if maximum is None else maximum * scale,
+        ))
+    return criteria
+
+
+@st.fragment
+def render_screener():
+    """Filters and results; reruns on its own when a filter changes."""
+    index = get_screener_index()
+    if not len(index):
+        st.info("No company overview data available.")
+        return
+
+    col_sector, col_exchange, col_sort, col_order = st.columns([3, 2, 2, 1])
+    with col_sector:
+        sectors = st.multiselect("Sector", options=list(index.sectors), key="screener_sectors")
+    with col_exchange:
+        exchanges = st.multiselect("Exchange", options=list(index.exchanges), key="screener_exchanges")
+    with col_sort:
+        sort_by = st.selectbox(
+            "Sort by",
+            options=[m.key for m in SCREEN_METRICS],
+            format_func=lambda key: SCREEN_METRICS_BY_KEY[key].label,
+            key="screener_sort",
+        )
+    with col_order:
+        descending = st.toggle("Descending", value=True, key="screener_descending")
+
+    criteria = render_criteria()
+
+    started = time.perf_counter()
+    rows = screen(index, criteria, sectors, exchanges, sort_by, descending)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    st.caption(f"{len(rows):,} of {len(index):,} companies · screened in {elapsed_ms:.1f} ms")
+
+    results = index.to_frame(rows[:MAX_RESULT_ROWS])
+    column_config = {
+        "ticker": st.column_config.TextColumn("Ticker"),
+        "name": st.column_config.TextColumn("Company"),
+        "sector": st.column_config.TextColumn("Sector"),
+        "exchange": st.column_config.TextColumn("Exchange"),
+    }
+    for metric in SCREEN_METRICS:
+        if metric.unit == "percentage":
+            results[metric.key] = results[metric.key] * 100
+        column_config[metric.key] = st.column_config.NumberColumn(
+            metric.label, format=_COLUMN_FORMAT[metric.unit]
+        )
+    st.dataframe(results, column_config=column_config, hide_index=True, use_container_width=True)
+
+
+def render_page():
+    """Company screener page content."""
+    st.markdown("## Company Screener")
+    render_screener()
@@ -5,6 +5,7 @@ Company filing documents page with document list and viewer.
 Matches Figma design exactly.
 """
 import streamlit as st
+from html import escape
 from typing import Optional, List, Dict
 from datetime import datetime
 
@@ -25,8 +26,11 @@ from components.styles import hide_sidebar, set_page_layout
 hide_sidebar()
 
 from components.styles import render_styles, COLORS, TYPOGRAPHY, SPACING
-from components.navigation import render_header, render_coresight_footer, render_company_header
+from components.assets import render_css
+from components.navigation import Page, render_header, render_coresight_footer, render_company_header
 from data.repository import CompanyRepository
+from data.filing_store import get_filings, get_sections, load_section
+from data.models import FilingDocument
 from core.database import init_database
 
 
@@ -465,14 +469,14 @@ def render_document_list(documents: List[Dict], selected_id: Optional[int]) -> s
         status_class = "status-available" if doc["status"] == "Available" else "status-processing"
         
         html += f'''
-        <div class="document-item {active_class}" data-id="{doc['id']}">
+        <div class="document-item {active_class}" data-id="{escape(str(doc['id']))}">
             <div class="document-item-header">
-                <div class="document-title">{doc['title']}</div>
-                <div class="document-date">{doc['date']}</div>
+                <div class="document-title">{escape(doc['title'])}</div>
+                <div class="document-date">{escape(doc['date'])}</div>
             </div>
             <div>
-                <span class="document-type">{doc['type']}</span>
-                <span class="document-status {status_class}">{doc['status']}</span>
+                <span class="document-type">{escape(doc['type'])}</span>
+                <span class="document-status {status_class}">{escape(doc['status'])}</span>
             </div>
         </div>
         '''
@@ -489,8 +493,8 @@ def render_document_viewer(document: Optional[Dict], content: str) -> str:
     if document:
         html += f'''
         <div class="viewer-header">
-            <div class="viewer-title">{document['title']}</div>
-            <a href="{document['url']}" class="download-btn" download>
+            <div class="viewer-title">{escape(document['title'])}</div>
+            <a href="{escape(document['url'], quote=True)}" class="download-btn" download>
                 <svg width="16" height="16" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
                     <path d="M12 15V3M12 15L8 11M12 15L16 11M3 15V19C3 20.1046 3.89543 21 5 21H19C20.1046 21 21 20.1046 21 19V15" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
                 </svg>
@@ -512,6 +516,55 @@ def render_document_viewer(document: Optional[Dict], content: str) -> str:
     return html
 
 
+def filing_list_items(filings: List[FilingDocument]) -> List[Dict]:
+    """Stored filings as document list entries."""
+    return [{
+        "id": f.accession_number,
+        "title": f.title,
+        "date": f.formatted_date,
+        "type": f.form_type,
+        "status": "Available",
+        "url": f.source_url if f.source_url and f.source_url.startswith(("http://", "https://")) else "#",
+    } for f in filings]
+
+
+def render_section_text(text: str) -> str:
+    """Escape section text for the pre-wrap viewer, keeping it on one markdown line."""
+    return escape(text).replace("\n", "&#10;")
+
+
+def select_stored_section(filings: List[FilingDocument]) -> tuple:
+    """
+    Document and section pickers for stored filings.
+    
+    Only the table of contents of the selected filing and the text of the
+    selected section are loaded.
+    
+    Returns:
+        Tuple of (selected filing accession number, escaped section text)
+    """
+    by_id = {f.accession_number: f for f in filings}
+    col_doc, col_section = st.columns([1, 1])
+    with col_doc:
+        accession = st.selectbox(
+            "Document",
+            options=list(by_id),
+            format_func=lambda a: f"{by_id[a].form_type} · {by_id[a].formatted_date} · {by_id[a].title}",
+            key="filing_document",
+        )
+    toc = get_sections(accession)
+    labels = {s.seq: f"{s.label} ({s.size / 1024:,.0f} KB)" for s in toc}
+    with col_section:
+        seq = st.selectbox(
+            "Section",
+            options=list(labels),
+            format_func=labels.get,
+            key=f"filing_section_{accession}",
+        )
+    text = load_section(accession, seq) if seq is not None else None
+    return accession, render_section_text(text or "")
+
+
 def render_tabs(active_tab: str = "documents") -> str:
     """Render the tab navigation - matches Figma exactly."""
     tabs = [
@@ -549,10 +602,10 @@ def main():
     )
     
     # Render Header
-    render_header(full_width=True)
+    render_header(Page.SEC_FILING, full_width=True)
     
     # Inject custom CSS
-    st.markdown(get_sec_filing_css(), unsafe_allow_html=True)
+    render_css("sec-filing", get_sec_filing_css())
     
     # Page content container
     st.markdown('<div class="sec-filing-container">', unsafe_allow_html=True)
@@ -563,13 +616,21 @@ def main():
     # Tab navigation
     st.markdown(render_tabs(active_tab="documents"), unsafe_allow_html=True)
     
-    # Get selected document from session state
-    if 'selected_document_id' not in st.session_state:
-        st.session_state.selected_document_id = 1
+    # Stored filings of the company (mock documents until some are added)
+    filings = get_filings(st.query_params.get("ticker", "M"))
+    if filings:
+        documents = filing_list_items(filings)
+        st.session_state.selected_document_id, content = select_stored_section(filings)
+    else:
+        documents = MOCK_FILINGS
+        content = MOCK_DOCUMENT_CONTENT
+        # Get selected document from session state
+        if 'selected_document_id' not in st.session_state:
+            st.session_state.selected_document_id = 1
     
     # Find selected document
     selected_doc = next(
-        (d for d in MOCK_FILINGS if d["id"] == st.session_state.selected_document_id),
+        (d for d in documents if d["id"] == st.session_state.selected_document_id),
         None
     )
     
@@ -577,10 +638,10 @@ def main():
     st.markdown('<div class="sec-filing-layout">', unsafe_allow_html=True)
     
     # Document list sidebar
-    st.markdown(render_document_list(MOCK_FILINGS, st.session_state.selected_document_id), unsafe_allow_html=True)
+    st.markdown(render_document_list(documents, st.session_state.selected_document_id), unsafe_allow_html=True)
     
     # Document viewer
-    st.markdown(render_document_viewer(selected_doc, MOCK_DOCUMENT_CONTENT), unsafe_allow_html=True)
+    st.markdown(render_document_viewer(selected_doc, content), unsafe_allow_html=True)
     
     st.markdown('</div>', unsafe_allow_html=True)  # Close layout
     
@@ -23,7 +23,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from components.styles import hide_sidebar, set_page_layout
 hide_sidebar()
 
-from components.navigation import render_header, render_coresight_footer
+from components.navigation import Page, render_header, render_coresight_footer
 from components.styles import render_styles
 from utils.local_storage import init_local_storage
 from core.database import init_database
@@ -66,7 +66,7 @@ def main():
     """, unsafe_allow_html=True)
     
     # Render Header
-    render_header(full_width=True)
+    render_header(Page.SEC_FILING, full_width=True)
     
     # Render SEC Filing page content
     render_sec_filing_content()
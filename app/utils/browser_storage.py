@@ -0,0 +1,141 @@
+"""
+Browser-side persistence of user preferences.
+
+LocalStorageManager values live in the server-side session store and are
+lost when the session ends. The preferences in PERSISTED_KEYS are also kept
+in the browser: in localStorage (the durable copy) and in a cookie mirroring
+it. Cookies travel with the initial page request, so hydrate_from_browser()
+restores them from st.context.cookies before anything renders - a fresh
+visit needs no default render followed by a restore rerun.
+
+Writes go through an invisible iframe script emitted only when a
+persisted value changed. If the cookie is gone but localStorage still holds
+the preferences (cookie cleared or expired), the component restores the
+cookie and reloads the page once.
+"""
+import json
+import logging
+from typing import Dict
+from urllib.parse import unquote
+
+import streamlit as st
+from streamlit.components.v1 import html
+
+from utils.local_storage import StorageKey, local_storage
+from utils.session_store import session_store
+
+logger = logging.getLogger(__name__)
+
+# localStorage key and cookie name of the persisted preferences
+BROWSER_KEY = "coresight_prefs"
+
+# Cookie lifetime (seconds); refreshed on every write
+COOKIE_MAX_AGE = 365 * 24 * 3600
+
+# Preferences restored on a fresh visit (string values only)
+PERSISTED_KEYS = (
+    StorageKey.MARKETDATA_SELECTED_SOURCE,
+    StorageKey.MARKETDATA_SELECTED_COMPANY,
+    StorageKey.MARKETDATA_SELECTED_TAB,
+    StorageKey.MARKETDATA_DATE_START,
+    StorageKey.MARKETDATA_DATE_END,
+    StorageKey.MARKETDATA_REPORT_PERIOD,
+)
+
+# Session store keys: preferences last written to the browser / hydration done
+_SYNCED_KEY = "browser_synced"
+_HYDRATED_KEY = "browser_hydrated"
+
+_PERSISTED_NAMES = {key.value for key in PERSISTED_KEYS}
+
+_SYNC_SCRIPT = """
+<script>
+(function() {
+    const key = %(key)s;
+    const payload = %(payload)s;
+    const w = window.parent;
+    let stored = {};
+    try { stored = JSON.parse(w.localStorage.getItem(key) || "{}"); } catch (e) {}
+    const hadCookie = w.document.cookie.split("; ").some(c => c.startsWith(key + "="));
+    const value = JSON.stringify(Object.assign({}, stored, payload));
+    w.localStorage.setItem(key, value);
+    w.document.cookie = key + "=" + encodeURIComponent(value)
+        + "; path=/; max-age=%(max_age)d; SameSite=Lax";
+    const restored = Object.keys(stored).some(k => !(k in payload));
+    if (!hadCookie && restored && !w.sessionStorage.getItem(key + "_restored")) {
+        w.sessionStorage.setItem(key + "_restored", "1");
+        w.location.reload();
+    }
+})();
+</script>
+"""
+
+
+def _cookie_preferences() -> Dict[str, str]:
+    """Persisted preferences sent with the page request (empty if none)."""
+    raw = st.context.cookies.get(BROWSER_KEY)
+    if not raw or not isinstance(raw, str):
+        return {}
+    try:
+        data = json.loads(unquote(raw))
+    except json.JSONDecodeError:
+        logger.warning("Ignoring malformed preferences cookie")
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {k: v for k, v in data.items() if k in _PERSISTED_NAMES and isinstance(v, str)}
+
+
+def _run_script(markup: str) -> None:
+    """Run a script in the page through an invisible iframe."""
+    if hasattr(st, "iframe"):
+        st.iframe(markup, height=1)
+    else:  # Streamlit releases before st.iframe
+        html(markup, height=0)
+
+
+def _current_preferences() -> Dict[str, str]:
+    """Persisted preferences as currently stored for this session."""
+    current = {}
+    for key in PERSISTED_KEYS:
+        value = local_storage.get(key, validate_type=str)
+        if value is not None:
+            current[key.value] = value
+    return current
+
+
+def hydrate_from_browser() -> None:
+    """
+    Restore persisted preferences from the request cookie (once per session).
+
+    Values already set in this session (e.g. from query parameters) win.
+    Call this before the page reads its preferences.
+    """
+    if session_store.get(_HYDRATED_KEY):
+        return
+    if BROWSER_KEY in st.context.cookies:
+        preferences = _cookie_preferences()
+        for name, value in preferences.items():
+            if local_storage.get(name) is None:
+                local_storage.set(name, value)
+        session_store.set(_SYNCED_KEY, preferences)
+    # Without the cookie nothing counts as synced, so the first
+    # persist_to_browser() runs and can restore it from localStorage
+    session_store.set(_HYDRATED_KEY, True)
+
+
+def persist_to_browser() -> None:
+    """
+    Write changed preferences to browser localStorage and the cookie.
+
+    Call this at the end of a page run and of fragments whose widgets
+    change preferences; it renders nothing when the browser already holds
+    the current values.
+    """
+    current = _current_preferences()
+    synced = session_store.get(_SYNCED_KEY)
+    if current == synced:
+        return
+    payload = json.dumps(current).replace("</", "<\\/")
+    _run_script(_SYNC_SCRIPT % {"key": json.dumps(BROWSER_KEY), "payload": payload, "max_age": COOKIE_MAX_AGE})
+    session_store.set(_SYNCED_KEY, current)
@@ -1,16 +1,17 @@
 """
 Local storage utility for persisting user state across sessions.
-Uses streamlit-local-storage for client-side persistence.
+Values are kept per session in the server-side session store
+(utils/session_store.py), encoded with their types.
 """
-import json
 import logging
 from typing import Any, Optional, Dict, Callable
 from dataclasses import dataclass, asdict
-from datetime import datetime, date
 from enum import Enum
 
 import streamlit as st
 
+from utils.session_store import session_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +29,7 @@ class StorageKey(Enum):
     MARKETDATA_SELECTED_TAB = "marketdata_selected_tab"
     MARKETDATA_DATE_START = "marketdata_date_start"
     MARKETDATA_DATE_END = "marketdata_date_end"
+    MARKETDATA_REPORT_PERIOD = "marketdata_report_period"
 
 
 @dataclass
@@ -49,24 +51,10 @@ class LocalStorageManager:
     """
     Global utility for managing local storage operations.
     Provides safe get/set/update operations with type validation.
-    """
-    
-    def __init__(self):
-        self._cache: Dict[str, Any] = {}
-        self._initialized = False
     
-    def _get_from_st_state(self, key: str) -> Optional[Any]:
-        """Retrieve value from streamlit session state."""
-        storage_key = f"ls_{key}"
-        if storage_key in st.session_state:
-            return st.session_state[storage_key]
-        return None
-    
-    def _set_to_st_state(self, key: str, value: Any) -> None:
-        """Store value in streamlit session state."""
-        storage_key = f"ls_{key}"
-        st.session_state[storage_key] = value
-        self._cache[key] = value
+    Holds no state itself: values live in the current session's namespace
+    of the session store, so one instance serves every session.
+    """
     
     def get(
         self, 
@@ -88,14 +76,9 @@ class LocalStorageManager:
         key_str = key.value if isinstance(key, StorageKey) else key
         
         try:
-            # Check cache first
-            if key_str in self._cache:
-                value = self._cache[key_str]
-            else:
-                value = self._get_from_st_state(key_str)
-                if value is None:
-                    return default
-                self._cache[key_str] = value
+            value = session_store.get(f"ls_{key_str}")
+            if value is None:
+                return default
             
             # Type validation
             if validate_type is not None and value is not None:
@@ -129,15 +112,12 @@ class LocalStorageManager:
         key_str = key.value if isinstance(key, StorageKey) else key
         
         try:
-            # Serialize if needed
+            # Serialize if needed (other values are stored with their types)
             if serializer is not None:
                 value = serializer(value)
-            elif isinstance(value, (datetime, date)):
-                value = value.isoformat()
-            elif isinstance(value, (dict, list)):
-                value = json.dumps(value)
             
-            self._set_to_st_state(key_str, value)
+            if not session_store.set(f"ls_{key_str}", value):
+                return False
             logger.debug(f"Stored value for key: {key_str}")
             return True
             
@@ -179,11 +159,7 @@ class LocalStorageManager:
         key_str = key.value if isinstance(key, StorageKey) else key
         
         try:
-            storage_key = f"ls_{key_str}"
-            if storage_key in st.session_state:
-                del st.session_state[storage_key]
-            if key_str in self._cache:
-                del self._cache[key_str]
+            session_store.delete(f"ls_{key_str}")
             return True
         except Exception as e:
             logger.error(f"Error deleting local storage key {key_str}: {e}")
@@ -192,10 +168,9 @@ class LocalStorageManager:
     def clear(self) -> bool:
         """Clear all local storage data."""
         try:
-            keys_to_remove = [k for k in st.session_state.keys() if k.startswith("ls_")]
-            for key in keys_to_remove:
-                del st.session_state[key]
-            self._cache.clear()
+            for key in session_store.keys():
+                if key.startswith("ls_"):
+                    session_store.delete(key)
             return True
         except Exception as e:
             logger.error(f"Error clearing local storage: {e}")
@@ -203,13 +178,7 @@ class LocalStorageManager:
     
     def get_filter_state(self) -> UserFilterState:
         """Get user's filter state from local storage."""
-        data = self.get(StorageKey.FILTER_STATE, {})
-        if isinstance(data, str):
-            try:
-                data = json.loads(data)
-            except json.JSONDecodeError:
-                data = {}
-        return UserFilterState.from_dict(data)
+        return UserFilterState.from_dict(self.get(StorageKey.FILTER_STATE, {}, validate_type=dict))
     
     def save_filter_state(self, state: UserFilterState) -> bool:
         """Save user's filter state to local storage."""
@@ -319,3 +288,13 @@ def set_marketdata_date_range(start: str, end: str) -> bool:
     success_start = local_storage.set(StorageKey.MARKETDATA_DATE_START, start)
     success_end = local_storage.set(StorageKey.MARKETDATA_DATE_END, end)
     return success_start and success_end
+
+
+def get_marketdata_report_period() -> str:
+    """Get reporting period (annual, quarterly, ttm) for market data."""
+    return local_storage.get(StorageKey.MARKETDATA_REPORT_PERIOD, "annual")
+
+
+def set_marketdata_report_period(period: str) -> bool:
+    """Save reporting period for market data."""
+    return local_storage.set(StorageKey.MARKETDATA_REPORT_PERIOD, period)
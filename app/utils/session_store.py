@@ -0,0 +1,252 @@
+"""
+Server-side per-session state store with compact serialization.
+
+Each Streamlit session (browser tab) gets its own namespace, keyed by the
+session id of the running script, so sessions never see each other's values.
+Values are stored encoded - with msgpack when it is installed, otherwise as
+compact JSON - which makes the memory held per session measurable: every
+session has a byte budget (SESSION_STORE_MAX_BYTES) and writes that would
+exceed it are refused. Sessions idle for longer than SESSION_TIMEOUT are
+evicted by a periodic sweep, so memory stays bounded by the number of
+active users.
+
+Supported values: None, bool, int, float, str, bytes, list/tuple, dict with
+str keys, date and datetime (tuples come back as lists).
+"""
+import json
+import logging
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from core.config import config
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency, see requirements.txt
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds between sweeps for idle sessions
+SWEEP_INTERVAL = 60
+
+# Session id used outside a Streamlit script run (CLI, tests, bare mode)
+DEFAULT_SESSION = ""
+
+# msgpack extension types
+_EXT_DATE = 1
+_EXT_DATETIME = 2
+
+# JSON type tags
+_JSON_DATE = "__date__"
+_JSON_DATETIME = "__datetime__"
+_JSON_BYTES = "__bytes__"
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    raise TypeError(f"Cannot store value of type {type(value).__name__}")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_JSON_DATETIME: value.isoformat()}
+    if isinstance(value, date):
+        return {_JSON_DATE: value.isoformat()}
+    if isinstance(value, bytes):
+        return {_JSON_BYTES: value.hex()}
+    raise TypeError(f"Cannot store value of type {type(value).__name__}")
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if _JSON_DATETIME in obj:
+            return datetime.fromisoformat(obj[_JSON_DATETIME])
+        if _JSON_DATE in obj:
+            return date.fromisoformat(obj[_JSON_DATE])
+        if _JSON_BYTES in obj:
+            return bytes.fromhex(obj[_JSON_BYTES])
+    return obj
+
+
+def encode(value: Any) -> bytes:
+    """Serialize a value (msgpack if installed, else compact JSON)."""
+    if msgpack is not None:
+        return msgpack.packb(value, default=_msgpack_default, use_bin_type=True)
+    return json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+
+
+def decode(data: bytes) -> Any:
+    """Inverse of encode()."""
+    if msgpack is not None:
+        return msgpack.unpackb(data, ext_hook=_msgpack_ext_hook, raw=False)
+    return json.loads(data, object_hook=_json_object_hook)
+
+
+def current_session_id() -> str:
+    """Id of the Streamlit session running this script (DEFAULT_SESSION outside one)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+        if ctx is not None:
+            return ctx.session_id
+    except ImportError:
+        pass
+    return DEFAULT_SESSION
+
+
+class _Session:
+    """Encoded values of one session and their total size."""
+    __slots__ = ("values", "size", "last_access")
+
+    def __init__(self):
+        self.values: Dict[str, bytes] = {}
+        self.size = 0
+        self.last_access = time.monotonic()
+
+
+class SessionStore:
+    """
+    Thread-safe store of encoded values, isolated per session.
+
+    Methods act on the current Streamlit session unless a session_id is given.
+    """
+
+    def __init__(self, max_session_bytes: int, idle_timeout: int, sweep_interval: int = SWEEP_INTERVAL):
+        self.max_session_bytes = max_session_bytes
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self._sessions: Dict[str, _Session] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+    def _session(self, session_id: Optional[str], create: bool) -> Optional[_Session]:
+        """Session entry (caller holds the lock); touches its last access time."""
+        session_id = current_session_id() if session_id is None else session_id
+        session = self._sessions.get(session_id)
+        if session is None and create:
+            session = self._sessions[session_id] = _Session()
+        if session is not None:
+            session.last_access = time.monotonic()
+        return session
+
+    def _maybe_sweep(self) -> None:
+        if time.monotonic() - self._last_sweep >= self.sweep_interval:
+            self.evict_idle()
+
+    def get(self, key: str, default: Any = None, session_id: Optional[str] = None) -> Any:
+        """Stored value of key, or default if missing."""
+        self._maybe_sweep()
+        with self._lock:
+            session = self._session(session_id, create=False)
+            data = None if session is None else session.values.get(key)
+        return default if data is None else decode(data)
+
+    def set(self, key: str, value: Any, session_id: Optional[str] = None) -> bool:
+        """
+        Store a value.
+
+        Returns:
+            False if the value cannot be encoded or would push the session
+            over its byte budget (the previous value is kept)
+        """
+        self._maybe_sweep()
+        try:
+            data = encode(value)
+        except (TypeError, ValueError, OverflowError) as e:
+            logger.warning(f"Cannot store session key {key}: {e}")
+            return False
+        with self._lock:
+            session = self._session(session_id, create=True)
+            previous = session.values.get(key)
+            delta = len(data) - (0 if previous is None else len(previous))
+            if previous is None:
+                delta += len(key)
+            if session.size + delta > self.max_session_bytes:
+                logger.warning(
+                    f"Session store budget exceeded storing {key} "
+                    f"({session.size + delta} > {self.max_session_bytes} bytes)"
+                )
+                return False
+            session.values[key] = data
+            session.size += delta
+        return True
+
+    def delete(self, key: str, session_id: Optional[str] = None) -> bool:
+        """Remove a key; returns whether it existed."""
+        with self._lock:
+            session = self._session(session_id, create=False)
+            if session is None or key not in session.values:
+                return False
+            session.size -= len(key) + len(session.values.pop(key))
+        return True
+
+    def keys(self, session_id: Optional[str] = None) -> List[str]:
+        """Keys stored for a session."""
+        with self._lock:
+            session = self._session(session_id, create=False)
+            return [] if session is None else list(session.values)
+
+    def clear(self, session_id: Optional[str] = None) -> int:
+        """
+        Drop all values of a session.
+
+        Returns:
+            Number of keys dropped
+        """
+        session_id = current_session_id() if session_id is None else session_id
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        return 0 if session is None else len(session.values)
+
+    def session_size(self, session_id: Optional[str] = None) -> int:
+        """Bytes held for a session (encoded values plus keys)."""
+        with self._lock:
+            session = self._session(session_id, create=False)
+            return 0 if session is None else session.size
+
+    def evict_idle(self) -> int:
+        """
+        Drop sessions not accessed for idle_timeout seconds.
+
+        Returns:
+            Number of sessions evicted
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._last_sweep = now
+            idle = [
+                session_id for session_id, session in self._sessions.items()
+                if now - session.last_access > self.idle_timeout
+            ]
+            for session_id in idle:
+                del self._sessions[session_id]
+        if idle:
+            logger.debug(f"Evicted {len(idle)} idle sessions from the session store")
+        return len(idle)
+
+    def stats(self) -> Dict[str, int]:
+        """Number of sessions and total bytes held."""
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "bytes": sum(s.size for s in self._sessions.values()),
+                "max_session_bytes": self.max_session_bytes,
+            }
+
+
+# Global session store instance
+session_store = SessionStore(config.session_store_max_bytes, config.session_timeout)
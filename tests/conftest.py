@@ -0,0 +1,43 @@
+"""
+Shared pytest fixtures.
+
+Tests run against a throwaway SQLite database and filing store; the app
+directory is put on sys.path the way the Streamlit entry points do.
+"""
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_TMP = tempfile.mkdtemp(prefix="coresight-tests-")
+os.environ.update(
+    DB_BACKEND="sqlite",
+    DB_PATH=os.path.join(_TMP, "test.db"),
+    FILING_STORE_PATH=os.path.join(_TMP, "filings"),
+    SNAPSHOT_PATH=os.path.join(_TMP, "snapshot.duckdb"),
+    CHANGE_POLL_INTERVAL="0",
+    DEBUG="false",
+)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+
+@pytest.fixture
+def db():
+    """Connected database manager; every table and stored filing is dropped afterwards."""
+    from core.cache import cache
+    from core.database import db_manager, init_database
+
+    init_database()
+    cache.invalidate()
+    yield db_manager
+    tables = db_manager.execute_query("SELECT name FROM sqlite_master WHERE type = 'table'")
+    for row in tables:
+        db_manager.execute_statement(f"DROP TABLE IF EXISTS {row['name']}")
+    shutil.rmtree(os.environ["FILING_STORE_PATH"], ignore_errors=True)
+    # Pooled SQLite connections keep the schema they last saw; an upsert
+    # prepared on one would not see a unique index created on another
+    db_manager._engine.dispose()
+    cache.invalidate()
@@ -0,0 +1,26 @@
+"""Self-hosted images and their data-URI fallback (components.assets)."""
+import base64
+from io import BytesIO
+
+from PIL import Image
+
+from components.assets import MAX_INLINE_BYTES, VARIANT_SCALE, image_url, write_image
+
+
+def _width(data: bytes) -> int:
+    with Image.open(BytesIO(data)) as image:
+        return image.width
+
+
+def test_logo_variants_are_published_at_display_size(tmp_path):
+    relative = write_image("coresight-logo-header", tmp_path)
+    assert _width((tmp_path / relative).read_bytes()) == 132 * VARIANT_SCALE
+
+
+def test_data_uri_fallback_is_capped():
+    # Static serving is off outside a configured server
+    header = image_url("coresight-logo-header")
+    assert header.startswith("data:image/png;base64,")
+    data = base64.b64decode(header.split(",", 1)[1])
+    assert len(data) <= MAX_INLINE_BYTES and _width(data) == 132
+    assert image_url("coresight-logo") == ""
@@ -0,0 +1,49 @@
+"""Browser persistence of preferences changed inside fragments (utils.browser_storage)."""
+from datetime import date
+
+from streamlit.testing.v1 import AppTest
+
+from data.models import ReportPeriod
+
+
+def _statement_panel_app():
+    """Only the statement panel fragment, without the page's main()."""
+    import streamlit as st
+
+    from core.database import init_database
+    from pages.market_data import render_statement_panel
+    from utils.browser_storage import _SYNCED_KEY, hydrate_from_browser
+    from utils.session_store import session_store
+
+    init_database()
+    hydrate_from_browser()
+    render_statement_panel("income_statement", "AAA")
+    st.session_state.synced = session_store.get(_SYNCED_KEY)
+
+
+def test_statement_panel_persists_period_change(db):
+    db.execute_statement("""CREATE TABLE coreiq_av_financials_income_statement (
+        id INTEGER, ticker TEXT, fiscal_date_ending DATE, report_type TEXT,
+        reported_currency TEXT, total_revenue DOUBLE, net_income DOUBLE, raw_json TEXT
+    )""")
+    rows = [
+        {"id": i, "ticker": "AAA", "fiscal_date_ending": date(year, month, 28),
+         "report_type": report_type, "total_revenue": 1e9, "net_income": 1e8}
+        for i, (year, month, report_type) in enumerate(
+            [(2023, 12, "annual"), (2024, 12, "annual"), (2024, 3, "quarterly"), (2024, 6, "quarterly")]
+        )
+    ]
+    db.execute_many(
+        "INSERT INTO coreiq_av_financials_income_statement "
+        "(id, ticker, fiscal_date_ending, report_type, reported_currency, total_revenue, net_income) "
+        "VALUES (:id, :ticker, :fiscal_date_ending, :report_type, 'USD', :total_revenue, :net_income)",
+        rows,
+    )
+
+    at = AppTest.from_function(_statement_panel_app, default_timeout=30).run()
+    assert not at.exception
+    period = at.selectbox(key="report_period_select")
+    period.set_value(ReportPeriod.QUARTERLY).run()
+    assert not at.exception
+    assert at.session_state.synced["marketdata_report_period"] == "quarterly"
+    assert at.session_state.synced["marketdata_date_start"] == "2024-03-28"
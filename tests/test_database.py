@@ -0,0 +1,15 @@
+"""Query helpers of the database manager (core.database)."""
+
+
+def test_execute_arrow_keeps_column_types(db):
+    db.execute_statement("CREATE TABLE prices (ticker TEXT, close DOUBLE, volume INTEGER)")
+    db.execute_many(
+        "INSERT INTO prices (ticker, close, volume) VALUES (:ticker, :close, :volume)",
+        [{"ticker": "AAA", "close": 10.5, "volume": 100}, {"ticker": "BBB", "close": None, "volume": 200}],
+    )
+
+    table = db.execute_arrow("SELECT ticker, close, volume FROM prices WHERE volume > :v ORDER BY ticker", {"v": 0})
+    assert table.column_names == ["ticker", "close", "volume"]
+    assert str(table.schema.field("close").type) == "double"
+    assert str(table.schema.field("volume").type) == "int64"
+    assert table.to_pydict() == {"ticker": ["AAA", "BBB"], "close": [10.5, None], "volume": [100, 200]}
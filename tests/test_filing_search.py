@@ -0,0 +1,24 @@
+"""Full-text filing search: app processes read, writers index (data.filing_search)."""
+from datetime import date
+
+from data.filing_search import FilingSearchIndex
+from data.filing_store import store_filing
+
+
+def test_app_reads_segments_written_by_writer(db, tmp_path):
+    text = "\n".join(["Item 1. Business", "Our supply chain spans Asia. " * 20, "Item 2. Properties", "Stores. " * 20])
+    store_filing("M", "0000794367-25-000012", "10-K", date(2025, 3, 21), text)
+
+    app = FilingSearchIndex(tmp_path)
+    assert app.search("supply chain").total == 0
+    assert not list(tmp_path.iterdir())  # searching never writes
+
+    writer = FilingSearchIndex(tmp_path)
+    assert writer.update() == 1
+    assert writer.update() == 0
+    assert app.search("supply chain").total == 0  # Not reloaded before a change is seen
+
+    app.invalidate()
+    results = app.search("supply chain")
+    assert [(hit.ticker, hit.seq) for hit in results.hits] == [("M", 0)]
+    assert "<mark>supply</mark>" in results.hits[0].snippet
@@ -0,0 +1,54 @@
+"""Filing store: section splitting and re-storing filings (data.filing_store)."""
+from datetime import date
+
+from data import filing_store
+from data.filing_store import get_sections, load_section, split_sections, store_filing
+
+FILLER = "Lorem ipsum dolor sit amet. " * 20
+
+
+def test_10q_items_keep_their_titles_and_parts():
+    text = "\n".join([
+        "QUARTERLY REPORT",
+        "PART I - FINANCIAL INFORMATION",
+        "Item 1. Financial Statements", FILLER,
+        "Item 2. MD&A", FILLER,
+        "PART II - OTHER INFORMATION",
+        "Item 1. LEGAL PROCEEDINGS", FILLER,
+        "Item 2. Unregistered Sales of Equity Securities", FILLER,
+    ])
+    sections = split_sections(text, "10-Q")
+    assert [(s.key, s.label) for s in sections] == [
+        ("cover", "Cover Page"),
+        ("part_i_item_1", "Item 1. Financial Statements"),
+        ("part_i_item_2", "Item 2. MD&A"),
+        ("part_ii_item_1", "Item 1. Legal Proceedings"),
+        ("part_ii_item_2", "Item 2. Unregistered Sales of Equity Securities"),
+    ]
+
+
+def test_10k_untitled_items_are_named():
+    text = "\n".join(["Item 7.", FILLER, "Item 7A. MARKET RISK", FILLER])
+    assert [s.label for s in split_sections(text, "10-K")] == [
+        "Item 7. Management's Discussion and Analysis",
+        "Item 7A. Market Risk",
+    ]
+    assert [s.label for s in split_sections(text, "8-K")] == ["Item 7", "Item 7A. Market Risk"]
+
+
+def test_restore_with_stale_cached_index(db, monkeypatch):
+    first = "\n".join(["Item 1. Business", "First version. " * 40, "Item 2. Properties", "Stores. " * 40])
+    second = "\n".join(["Item 1. Business", "Second version, longer. " * 80, "Item 2. Properties", "Malls. " * 40])
+    store_filing("M", "0000794367-25-000012", "10-K", date(2025, 3, 21), first)
+    assert load_section("0000794367-25-000012", 0).startswith("Item 1. Business\nFirst version.")
+
+    # Another process re-stores the filing; this one keeps its cached index
+    monkeypatch.setattr(filing_store, "mark_table_changed", lambda table: 0)
+    store_filing("M", "0000794367-25-000012", "10-K", date(2025, 3, 21), second)
+    stale = get_sections("0000794367-25-000012")
+    assert stale[0].length != filing_store._query_sections("0000794367-25-000012")[0].length
+
+    # Not cached yet: the stale offsets point into a file that no longer exists
+    assert load_section("0000794367-25-000012", 1) == "Item 2. Properties\n" + ("Malls. " * 40).strip()
+    files = list((filing_store._store_root() / "M").glob("*.zsec"))
+    assert [f.name for f in files] == [filing_store._query_file_path("0000794367-25-000012").split("/")[1]]
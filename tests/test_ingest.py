@@ -0,0 +1,31 @@
+"""Incremental ingest around the high-water mark."""
+from data.ingest import ingest_batches
+from data.mysql_dump import InsertBatch
+
+TABLE = "coreiq_companies"
+COLUMNS = ["id", "ticker", "data_inserted_at"]
+
+
+def _ingest(*rows):
+    return ingest_batches([InsertBatch(TABLE, COLUMNS, list(rows))])[TABLE]
+
+
+def _tickers(db):
+    return [row["ticker"] for row in db.execute_query(f"SELECT ticker FROM {TABLE} ORDER BY id")]
+
+
+def test_rows_sharing_the_high_water_timestamp_are_loaded(db):
+    _ingest((1, "AAPL", "2025-01-01 10:00:00"))
+    # Loaded by a later run with the same timestamp as the mark
+    result = _ingest((1, "AAPL", "2025-01-01 10:00:00"), (2, "MSFT", "2025-01-01 10:00:00"))
+
+    assert result.rows_upserted == 1
+    assert _tickers(db) == ["AAPL", "MSFT"]
+
+
+def test_rerun_without_new_rows_keeps_the_version(db):
+    first = _ingest((1, "AAPL", "2025-01-01 10:00:00"), (2, "MSFT", "2025-01-01 09:00:00"))
+    again = _ingest((1, "AAPL", "2025-01-01 10:00:00"), (2, "MSFT", "2025-01-01 09:00:00"))
+
+    assert again.rows_upserted == 0
+    assert again.version == first.version
@@ -0,0 +1,72 @@
+"""Reads of the materialized latest-overview table (data.latest_overview)."""
+import json
+
+import numpy as np
+
+from data.latest_overview import OVERVIEW_TABLE, refresh_tickers
+from data.repository import CompanyOverviewRepository
+from data.screener import build_index
+
+
+def _create_overviews(db, rows):
+    db.execute_statement(f"""CREATE TABLE {OVERVIEW_TABLE} (
+        id INTEGER PRIMARY KEY, ticker TEXT, name TEXT, exchange TEXT, currency TEXT,
+        country TEXT, sector TEXT, industry TEXT, company_description TEXT,
+        official_site TEXT, fiscal_year_end TEXT, cik TEXT, market_capitalization BIGINT,
+        pe_ratio TEXT, eps TEXT, dividend_yield TEXT, analyst_target_price TEXT,
+        raw_json TEXT, fetched_at_utc TEXT
+    )""")
+    db.execute_many(
+        f"INSERT INTO {OVERVIEW_TABLE} (ticker, name, sector, exchange, pe_ratio, raw_json, fetched_at_utc) "
+        "VALUES (:ticker, :name, :sector, :exchange, :pe_ratio, :raw_json, :fetched_at_utc)",
+        rows,
+    )
+
+
+def _overview(ticker, revenue, fetched_at="2025-01-02 00:00:00"):
+    return {
+        "ticker": ticker,
+        "name": f"{ticker} Inc.",
+        "sector": "TECHNOLOGY",
+        "exchange": "NASDAQ",
+        "pe_ratio": "20.5",
+        "raw_json": json.dumps({"RevenueTTM": str(revenue)}),
+        "fetched_at_utc": fetched_at,
+    }
+
+
+def test_partially_materialized_overviews(db):
+    _create_overviews(db, [_overview("AAPL", 100), _overview("MSFT", 200)])
+    # The ingest hook materialized AAPL only; MSFT was loaded outside data.ingest
+    refresh_tickers(["AAPL"])
+
+    overviews = CompanyOverviewRepository.get_company_overviews(["AAPL", "MSFT"])
+    assert set(overviews) == {"AAPL", "MSFT"}
+    assert overviews["MSFT"].revenue_ttm == 200.0
+    assert overviews["MSFT"].pe_ratio == 20.5
+
+    index = build_index()
+    assert list(index.tickers) == ["AAPL", "MSFT"]
+    assert list(index.metrics["revenue_ttm"]) == [100.0, 200.0]
+    assert list(index.metrics["pe_ratio"]) == [20.5, 20.5]
+
+
+def test_materialized_overview_is_read_from_latest_table(db):
+    _create_overviews(db, [_overview("AAPL", 100), _overview("AAPL", 150, "2025-02-01 00:00:00")])
+    refresh_tickers(["AAPL"])
+
+    assert CompanyOverviewRepository.get_company_overview("AAPL").revenue_ttm == 150.0
+    assert list(build_index().metrics["revenue_ttm"]) == [150.0]
+
+
+def test_screener_index_skips_raw_json_that_is_not_an_object(db):
+    rows = [_overview("AAPL", 100), _overview("MSFT", 200), _overview("NVDA", 300)]
+    rows[1]["raw_json"] = "[]"
+    rows[2]["raw_json"] = "5"
+    _create_overviews(db, rows)
+
+    index = build_index()
+    assert list(index.tickers) == ["AAPL", "MSFT", "NVDA"]
+    assert index.metrics["revenue_ttm"][0] == 100
+    assert np.isnan(index.metrics["revenue_ttm"][1:]).all()
+    assert (index.metrics["pe_ratio"] == 20.5).all()
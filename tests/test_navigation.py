@@ -0,0 +1,15 @@
+"""Header navigation (components.navigation)."""
+import re
+
+from components.navigation import Page, _build_header_html
+
+
+def _nav_links(page):
+    return dict(re.findall(r'<a href="[^"]*/(\w+)" class="(\w*)">', _build_header_html(page)))
+
+
+def test_screener_is_in_the_header():
+    assert _nav_links(Page.SCREENER) == {
+        "marketdata": "", "companyscreener": "active", "earningscalls": "", "newsroom": "",
+    }
+    assert _nav_links(Page.MARKET_DATA)["companyscreener"] == ""
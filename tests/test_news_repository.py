@@ -0,0 +1,87 @@
+"""NewsRepository reads over normalized and not yet normalized articles."""
+import json
+
+import pytest
+
+from core.database import DatabaseQueryError
+from data.news_normalize import (
+    NEWS_TABLE, TICKER_SENTIMENT_TABLE, TOPICS_TABLE, ensure_tables, normalize_articles
+)
+from data.repository import NewsRepository
+
+
+def _article(news_id, tickers, topics, published):
+    return {
+        "id": news_id,
+        "title": f"Article {news_id}",
+        "summary": "Summary",
+        "url": f"https://example.com/{news_id}",
+        "source_name": "Example",
+        "source_domain": "example.com",
+        "time_published_utc": published,
+        "ticker_sentiment_json": json.dumps([
+            {"ticker": t, "relevance_score": "0.5", "ticker_sentiment_score": "0.1",
+             "ticker_sentiment_label": "Neutral"} for t in tickers
+        ]),
+        "topics_json": json.dumps([{"topic": t, "relevance_score": "0.9"} for t in topics]),
+    }
+
+
+def _setup(db):
+    db.execute_statement(f"""CREATE TABLE {NEWS_TABLE} (
+        id INTEGER PRIMARY KEY, title TEXT, summary TEXT, url TEXT, source_name TEXT,
+        source_domain TEXT, time_published_utc TIMESTAMP, time_published_raw TEXT,
+        overall_sentiment_score DOUBLE, overall_sentiment_label TEXT, banner_image TEXT,
+        ticker_sentiment_json TEXT, topics_json TEXT, category_within_source TEXT, raw_json TEXT
+    )""")
+    db.execute_statement(
+        "CREATE TABLE coreiq_companies (ticker TEXT, name TEXT, primary_industry_coresight TEXT)"
+    )
+    db.execute_many(
+        "INSERT INTO coreiq_companies (ticker, name, primary_industry_coresight) "
+        "VALUES (:ticker, :name, :sector)",
+        [{"ticker": "WMT", "name": "Walmart", "sector": "Mass Merchants"},
+         {"ticker": "NKE", "name": "Nike", "sector": "Apparel"}],
+    )
+    articles = [
+        _article(1, ["WMT"], ["Retail & Wholesale"], "2025-01-01 10:00:00"),
+        _article(2, ["WMT", "NKE"], ["Earnings"], "2025-01-02 10:00:00"),
+    ]
+    db.execute_many(
+        f"INSERT INTO {NEWS_TABLE} (id, title, summary, url, source_name, source_domain, "
+        "time_published_utc, ticker_sentiment_json, topics_json) VALUES (:id, :title, :summary, "
+        ":url, :source_name, :source_domain, :time_published_utc, :ticker_sentiment_json, :topics_json)",
+        articles,
+    )
+    # Article 1 went through data.ingest; article 2 was loaded by another writer
+    ensure_tables()
+    normalize_articles(articles[:1])
+
+
+def test_articles_without_child_rows_keep_tickers_and_topics(db):
+    _setup(db)
+
+    articles = {a.id: a for a in NewsRepository.get_articles()}
+    assert [t.ticker for t in articles[1].ticker_sentiment] == ["WMT"]
+    assert sorted(t.ticker for t in articles[2].ticker_sentiment) == ["NKE", "WMT"]
+    assert [t.topic for t in articles[2].topics] == ["Earnings"]
+
+
+def test_filters_match_articles_without_child_rows(db):
+    _setup(db)
+
+    assert [a.id for a in NewsRepository.get_articles(company_ticker="WMT")] == [2, 1]
+    assert [a.id for a in NewsRepository.get_articles(company_ticker="NKE")] == [2]
+    assert [a.id for a in NewsRepository.get_articles(sector="Apparel")] == [2]
+    assert [a.id for a in NewsRepository.get_articles(sector="Mass Merchants")] == [2, 1]
+
+
+def test_failed_normalization_keeps_previous_child_rows(db):
+    _setup(db)
+    db.execute_statement(f"DROP TABLE {TOPICS_TABLE}")
+    article = _article(1, ["NKE"], ["Earnings"], "2025-01-01 10:00:00")
+
+    with pytest.raises(DatabaseQueryError):
+        normalize_articles([article])
+    rows = db.execute_query(f"SELECT ticker FROM {TICKER_SENTIMENT_TABLE} WHERE news_id = 1")
+    assert [row["ticker"] for row in rows] == ["WMT"]
@@ -0,0 +1,46 @@
+"""Generated price histories and their resampling (data.dummy_data, data.resampling)."""
+import numpy as np
+
+from data.dummy_data import MarketDataRepository, generate_market_data
+from data.models import DataFrequency, PriceSeries
+
+
+def test_price_history_frequencies():
+    daily = MarketDataRepository.get_price_history("AAPL")
+    assert len(daily) == len(MarketDataRepository.get_market_data("AAPL").prices)
+
+    for frequency in (DataFrequency.WEEKLY, DataFrequency.MONTHLY, DataFrequency.QUARTERLY):
+        bars = MarketDataRepository.get_price_history("AAPL", frequency=frequency)
+        assert 0 < len(bars) < len(daily)
+        assert bars.volume.sum() == daily.volume.sum()
+        assert bars.high.max() == daily.high.max()
+
+
+def test_generate_market_data():
+    data = generate_market_data("ZZZZ", days=30)
+    assert data.company_name == "Company ZZZZ"
+    assert len(data.prices) == 30
+    assert data.latest_price == data.prices.close[-1]
+
+
+def test_price_history_range_clips_partial_periods():
+    daily = MarketDataRepository.get_price_history("MSFT")
+    date_from = daily.bar(40).date
+    date_to = daily.bar(len(daily) - 40).date
+    in_range = daily.between(date_from, date_to)
+
+    monthly = MarketDataRepository.get_price_history("MSFT", date_from, date_to, DataFrequency.MONTHLY)
+    # The first and last months are cut by the range but still aggregated
+    assert monthly.volume.sum() == in_range.volume.sum()
+    assert monthly.open[0] == in_range.open[0]
+    assert monthly.close[-1] == in_range.close[-1]
+    assert monthly.high.max() == in_range.high.max()
+
+
+def test_price_series_leaves_caller_arrays_writable():
+    dates = np.array(["2024-01-02", "2024-01-03"], dtype="datetime64[ns]")
+    close = np.array([10.0, 11.0])
+    series = PriceSeries(dates, close, close, close, close, np.array([5.0, 6.0]))
+    assert close.flags.writeable and dates.flags.writeable
+    assert not series.close.flags.writeable
+    assert series != PriceSeries.from_arrays(dates, close, close, close, close, [5.0, 6.0])
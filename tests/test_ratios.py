@@ -0,0 +1,75 @@
+"""Ratio tables and multi-company screens (data.ratios)."""
+import json
+from datetime import date
+
+import numpy as np
+
+from core.database import db_manager
+from data.models import ReportPeriod
+from data.ratios import compute_ratios, screen_ratios
+
+TICKERS = ["AAA", "BBB", "CCC"]
+
+
+def _seed_statements(db):
+    db.execute_statement("""CREATE TABLE coreiq_av_financials_income_statement (
+        id INTEGER, ticker TEXT, fiscal_date_ending DATE, report_type TEXT, reported_currency TEXT,
+        total_revenue DOUBLE, cost_of_revenue DOUBLE, gross_profit DOUBLE,
+        selling_general_and_administrative DOUBLE, research_and_development DOUBLE,
+        depreciation_and_amortization DOUBLE, operating_income DOUBLE, interest_expense DOUBLE,
+        interest_income DOUBLE, net_income DOUBLE, raw_json TEXT
+    )""")
+    for table in ("balance_sheet", "cash_flow"):
+        db.execute_statement(f"""CREATE TABLE coreiq_av_financials_{table} (
+            id INTEGER, ticker TEXT, fiscal_date_ending DATE, report_type TEXT,
+            reported_currency TEXT, raw_json TEXT
+        )""")
+    income, balances = [], []
+    for t, ticker in enumerate(TICKERS):
+        for year in range(2020, 2025):
+            fiscal = date(year, 12, 31)
+            revenue = 1000.0 * (t + 1) * (year - 2018)
+            income.append({"ticker": ticker, "fiscal_date_ending": fiscal, "total_revenue": revenue,
+                           "gross_profit": revenue / 2, "net_income": revenue / 10})
+            balances.append({"ticker": ticker, "fiscal_date_ending": fiscal, "raw_json": json.dumps({
+                "totalAssets": str(revenue * 3), "totalShareholderEquity": str(revenue),
+                "operatingCashflow": str(revenue / 5),
+            })})
+    db.execute_many(
+        "INSERT INTO coreiq_av_financials_income_statement "
+        "(ticker, fiscal_date_ending, report_type, reported_currency, total_revenue, gross_profit, net_income) "
+        "VALUES (:ticker, :fiscal_date_ending, 'annual', 'USD', :total_revenue, :gross_profit, :net_income)",
+        income,
+    )
+    for table in ("balance_sheet", "cash_flow"):
+        db.execute_many(
+            f"INSERT INTO coreiq_av_financials_{table} "
+            "(ticker, fiscal_date_ending, report_type, reported_currency, raw_json) "
+            "VALUES (:ticker, :fiscal_date_ending, 'annual', 'USD', :raw_json)",
+            balances,
+        )
+
+
+def test_screen_loads_all_tickers_per_statement(db, monkeypatch):
+    _seed_statements(db)
+    calls = []
+    for name in ("execute_query", "execute_frame"):
+        original = getattr(db_manager, name)
+        monkeypatch.setattr(db_manager, name, lambda *a, _f=original, **k: calls.append(a[0]) or _f(*a, **k))
+
+    screen = screen_ratios(TICKERS, n_periods=3)
+    statement_queries = [sql for sql in calls if "coreiq_av_financials_" in sql]
+    assert len(statement_queries) <= 3
+
+    for row, ticker in enumerate(TICKERS):
+        table = compute_ratios(ticker)
+        assert screen.latest_dates[row] == date(2024, 12, 31)
+        for key, values in screen.values.items():
+            np.testing.assert_array_equal(values[row], table.values[key][-3:])
+
+
+def test_ratio_range_keeps_prior_period_for_growth(db):
+    _seed_statements(db)
+    table = compute_ratios("AAA", ReportPeriod.ANNUAL, date(2022, 1, 1), date(2023, 12, 31))
+    assert table.dates == [date(2022, 12, 31), date(2023, 12, 31)]
+    np.testing.assert_allclose(table.values["revenue_growth"], [4 / 3 - 1, 5 / 4 - 1])
@@ -0,0 +1,28 @@
+"""HTML of the SEC filing document list and viewer (pages.sec_filing)."""
+from datetime import date
+
+from data.models import FilingDocument
+from pages.sec_filing import filing_list_items, render_document_list, render_document_viewer
+
+
+def _filing(title, source_url):
+    return FilingDocument(
+        accession_number="0000320193-24-000123", ticker="AAPL", form_type="10-K",
+        filing_date=date(2024, 11, 1), title=title, size=100, stored_size=40,
+        section_count=1, source_url=source_url,
+    )
+
+
+def test_stored_titles_and_urls_are_escaped():
+    [document] = filing_list_items([_filing('<img src=x onerror="alert(1)">', 'https://x/"><b>')])
+
+    listing = render_document_list([document], document["id"])
+    viewer = render_document_viewer(document, "")
+    assert "<img" not in listing and "<img" not in viewer
+    assert "&lt;img src=x onerror=&quot;alert(1)&quot;&gt;" in viewer
+    assert 'href="https://x/&quot;&gt;&lt;b&gt;"' in viewer
+
+
+def test_only_web_source_urls_are_linked():
+    [document] = filing_list_items([_filing("Annual report", "javascript:alert(1)")])
+    assert document["url"] == "#"
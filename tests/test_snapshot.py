@@ -0,0 +1,116 @@
+"""Flattening statement rows for the columnar snapshot (data.snapshot)."""
+import os
+from datetime import date
+from functools import partial
+
+import duckdb
+import pytest
+
+from data.repository import IncomeStatementRepository
+from data.snapshot import SNAPSHOT_TABLES, SnapshotStore, _flatten_rows, build_snapshot
+
+
+def test_null_columns_are_typed_by_kind():
+    rows = [{
+        "id": 1, "ticker": "AAA", "fiscal_date_ending": date(2024, 12, 31), "report_type": "annual",
+        "reported_currency": None, "total_revenue": 10.0, "net_income": None,
+        "source": None, "fetched_at_utc": None, "raw_json": "{}",
+    }]
+    frame = _flatten_rows(rows, SNAPSHOT_TABLES["income_statement"])
+    assert frame["net_income"].dtype == "float64"
+    assert frame["source"].dtype == "string"
+    assert frame["fetched_at_utc"].dtype == "string"
+    assert frame["reported_currency"].dtype == "string"
+
+
+def test_raw_json_keys_are_metrics():
+    rows = [{
+        "ticker": "AAA", "fiscal_date_ending": "2024-12-31", "report_type": "annual",
+        "reported_currency": "USD", "raw_json": '{"totalAssets": "None", "inventory": "5"}',
+    }]
+    frame = _flatten_rows(rows, SNAPSHOT_TABLES["balance_sheet"])
+    assert frame["totalAssets"].dtype == "float64"
+    assert frame["inventory"].tolist() == [5.0]
+
+
+def _create_statement_tables(db):
+    metrics = ", ".join(f"{c} DOUBLE" for c in SNAPSHOT_TABLES["income_statement"].metric_columns)
+    db.execute_statement(f"""CREATE TABLE coreiq_av_financials_income_statement (
+        id INTEGER, ticker TEXT, fiscal_date_ending DATE, report_type TEXT,
+        reported_currency TEXT, {metrics}, raw_json TEXT
+    )""")
+    for statement in ("balance_sheet", "cash_flow"):
+        db.execute_statement(f"""CREATE TABLE coreiq_av_financials_{statement} (
+            ticker TEXT, fiscal_date_ending DATE, report_type TEXT,
+            reported_currency TEXT, raw_json TEXT
+        )""")
+
+
+def _insert_income_rows(db, rows):
+    db.execute_many(
+        "INSERT INTO coreiq_av_financials_income_statement (id, ticker, fiscal_date_ending, "
+        "report_type, reported_currency, total_revenue) VALUES (:id, 'AAA', :day, 'annual', "
+        ":currency, 1.0)",
+        rows,
+    )
+
+
+def test_text_column_null_in_first_batch(db, monkeypatch, tmp_path):
+    _create_statement_tables(db)
+    _insert_income_rows(db, [
+        {"id": 1, "day": date(2023, 12, 31), "currency": None},
+        {"id": 2, "day": date(2024, 12, 31), "currency": "USD"},
+    ])
+    # One row per batch, so the first batch alone decides the column types
+    monkeypatch.setattr(db, "stream_query", partial(type(db).stream_query, db, batch_size=1))
+
+    path = tmp_path / "snapshot.duckdb"
+    assert build_snapshot(str(path)) == {"income_statement": 2}
+    conn = duckdb.connect(str(path), read_only=True)
+    try:
+        rows = conn.execute(
+            "SELECT reported_currency FROM income_statement ORDER BY fiscal_date_ending"
+        ).fetchall()
+    finally:
+        conn.close()
+    assert rows == [(None,), ("USD",)]
+
+
+@pytest.fixture
+def snapshot_file():
+    path = os.environ["SNAPSHOT_PATH"]
+    yield path
+    os.remove(path)
+
+
+def test_single_company_reads_see_rows_added_after_the_build(db, snapshot_file):
+    _create_statement_tables(db)
+    _insert_income_rows(db, [{"id": 1, "day": date(2023, 12, 31), "currency": "USD"}])
+    build_snapshot(snapshot_file)
+    # Ingested after the nightly build
+    _insert_income_rows(db, [{"id": 2, "day": date(2024, 12, 31), "currency": "USD"}])
+
+    assert IncomeStatementRepository.get_available_dates("AAA") == [
+        date(2023, 12, 31), date(2024, 12, 31)
+    ]
+    matrix = IncomeStatementRepository.get_statement_matrix(
+        "AAA", date(2023, 1, 1), date(2024, 12, 31), keys=["total_revenue"]
+    )
+    assert matrix.dates == [date(2023, 12, 31), date(2024, 12, 31)]
+
+
+def test_rebuild_leaves_running_queries_on_the_old_file(db, tmp_path):
+    _create_statement_tables(db)
+    _insert_income_rows(db, [{"id": 1, "day": date(2023, 12, 31), "currency": "USD"}])
+    path = tmp_path / "snapshot.duckdb"
+    build_snapshot(str(path))
+    store = SnapshotStore(str(path))
+    running = store._cursor()
+
+    _insert_income_rows(db, [{"id": 2, "day": date(2024, 12, 31), "currency": "USD"}])
+    build_snapshot(str(path))
+    os.utime(path, (0, 0))
+
+    assert len(store.load_frame("income_statement", ["AAA"])) == 2
+    assert running.execute("SELECT count(*) FROM income_statement").fetchone() == (1,)
+    running.close()
@@ -0,0 +1,45 @@
+"""Statement repositories that read raw_json (balance sheet and cash flow)."""
+import json
+from datetime import date
+
+from data.models import ReportPeriod
+from data.repository import BalanceSheetRepository, CashFlowRepository
+
+QUARTERS = [date(2024, 3, 31), date(2024, 6, 30), date(2024, 9, 30), date(2024, 12, 31)]
+
+
+def _seed(db):
+    for table, currency in (("balance_sheet", "USD"), ("cash_flow", "EUR")):
+        db.execute_statement(f"""CREATE TABLE coreiq_av_financials_{table} (
+            ticker TEXT, fiscal_date_ending DATE, report_type TEXT,
+            reported_currency TEXT, raw_json TEXT
+        )""")
+        db.execute_many(
+            f"INSERT INTO coreiq_av_financials_{table} "
+            "(ticker, fiscal_date_ending, report_type, reported_currency, raw_json) "
+            f"VALUES ('AAA', :day, 'quarterly', '{currency}', :raw_json)",
+            [{"day": day, "raw_json": json.dumps({"cashAndCashEquivalentsAtCarryingValue": str(i + 1),
+                                                  "operatingCashflow": str(i + 1)})}
+             for i, day in enumerate(QUARTERS)],
+        )
+
+
+def test_each_repository_reads_its_own_table(db):
+    _seed(db)
+
+    assert BalanceSheetRepository.get_reported_currency("AAA", QUARTERS[0], ReportPeriod.QUARTERLY) == "USD"
+    assert CashFlowRepository.get_reported_currency("AAA", QUARTERS[0], ReportPeriod.QUARTERLY) == "EUR"
+    assert CashFlowRepository.get_available_dates("AAA", ReportPeriod.QUARTERLY) == QUARTERS
+
+
+def test_ttm_sums_flows_and_keeps_balances(db):
+    _seed(db)
+
+    balances = BalanceSheetRepository.get_statement_matrix(
+        "AAA", QUARTERS[-1], QUARTERS[-1], ReportPeriod.TTM, ["cashAndCashEquivalentsAtCarryingValue"]
+    )
+    flows = CashFlowRepository.get_statement_matrices(
+        ["AAA"], QUARTERS[-1], QUARTERS[-1], ReportPeriod.TTM, ["operatingCashflow"]
+    )["AAA"]
+    assert balances.values.tolist() == [[4.0]]
+    assert flows.values.tolist() == [[10.0]]